@@ -22,6 +22,9 @@ DEFAULT_INTERVAL = "Daily"
 DEFAULT_CHART_TYPE = "Candles"
 DEFAULT_SCALE = "Logarithmic"
 CANDLE_BAR_WIDTH = 0.6
+LIVE_CHART_FRAME_MS = 250  # Minimum interval between live WebSocket chart redraws
+ORDER_BOOK_FRAME_MS = 100  # Interval between order book snapshots from the depth stream
+ORDER_BOOK_LEVELS = 500  # Price levels per side published to the order book panel
 
 # Data fetching
 DEFAULT_PERIOD = "max"
@@ -36,6 +39,20 @@ POLYGON_RATE_LIMIT_PERIOD = 60  # seconds
 POLYGON_MAX_HISTORY_YEARS = 5  # Polygon plan limit
 POLYGON_MAX_HISTORY_DAYS = 1825  # 5 years in days
 POLYGON_BATCH_CONCURRENCY = 100  # Concurrent workers for batch fetching
+POLYGON_GROUPED_MAX_DAYS = 20  # Stale trading days above which per-ticker fetches are used
+POLYGON_GROUPED_MIN_TICKERS = 25  # Tickers needing a day before it is fetched grouped
+
+# In-memory data cache (shared LRU for prices, portfolio and benchmark returns)
+MEMORY_CACHE_MAX_MB = 1536  # Byte budget before least-recently-used eviction
+
+# Background prefetch (warms the memory cache with recently used tickers)
+PREFETCH_ENABLED = True
+PREFETCH_RECENT_TICKERS = 20  # Recent chart tickers remembered and warmed
+PREFETCH_MAX_PORTFOLIOS = 3  # Most recently used portfolios whose holdings are warmed
+PREFETCH_MAX_MB = 256  # Cap on data loaded into memory per prefetch run
+PREFETCH_MAX_WORKERS = 4  # Concurrent network refreshes of stale tickers
+PREFETCH_STARTUP_DELAY_MS = 3000  # Delay after startup before the first run
+PREFETCH_IDLE_SECONDS = 300  # Idle time (and minimum spacing) before re-running
 
 # Yahoo Finance Configuration (for backfill and crypto)
 YAHOO_HISTORICAL_START = "1970-01-01"  # Earliest date to try fetching
@@ -156,6 +173,7 @@ PRICE_FORMAT_ONE = 1
 # Equation parser settings
 EQUATION_OPERATORS = {"+", "-", "*", "/"}
 EQUATION_PREFIX = "="
+EQUATION_COMPILE_CACHE_SIZE = 256  # Compiled expressions kept (LRU)
 
 # Error messages
 ERROR_EMPTY_TICKER = "Ticker is empty."
@@ -8,6 +8,7 @@ from app.core.theme_manager import ThemeManager
 from app.core.config import DEFAULT_THEME
 from app.services.favorites_service import FavoritesService
 from app.services.preferences_service import PreferencesService
+from app.services.prefetch_service import PrefetchScheduler
 
 
 # Lazy factory functions - modules are imported only when first opened
@@ -129,6 +130,11 @@ def main() -> int:
     # DO NOT use showMaximized() - it locks geometry and prevents restore button from working
     hub.show()
     hub.maximize_on_startup()
+
+    # Warm the memory cache with recent chart tickers, portfolio holdings and
+    # benchmarks in the background (at startup and after idle periods)
+    prefetch_scheduler = PrefetchScheduler(hub)
+    prefetch_scheduler.start()
     return app.exec()
 
 
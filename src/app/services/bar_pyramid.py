@@ -0,0 +1,247 @@
+"""
+Bar pyramid - weekly/monthly/yearly OHLCV kept alongside daily data.
+
+Resampling the full daily history on every interval switch is wasteful:
+only the trailing bucket of a coarse interval can change when new daily
+bars arrive. A BarPyramid builds each coarse level once (on first use) and
+afterwards re-aggregates only the buckets touched by new or updated daily
+rows.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Level -> pandas resample rule
+PYRAMID_LEVELS = {
+    "weekly": "W",
+    "monthly": "ME",
+    "yearly": "YE",
+}
+
+# Interval key (lowercase) -> pyramid level
+_INTERVAL_LEVELS = {
+    "weekly": "weekly",
+    "1wk": "weekly",
+    "monthly": "monthly",
+    "1mo": "monthly",
+    "yearly": "yearly",
+    "1y": "yearly",
+}
+
+
+def level_for_interval(interval: str) -> Optional[str]:
+    """
+    Map a chart/data interval to a pyramid level.
+
+    Args:
+        interval: Interval (e.g., "Weekly", "1mo", "daily")
+
+    Returns:
+        "weekly", "monthly" or "yearly", or None for daily/unknown intervals
+    """
+    return _INTERVAL_LEVELS.get((interval or "").strip().lower())
+
+
+def resample_ohlcv(df: "pd.DataFrame", level: str) -> "pd.DataFrame":
+    """
+    Aggregate daily OHLCV rows into one pyramid level.
+
+    Args:
+        df: DataFrame with daily OHLCV data
+        level: "weekly", "monthly" or "yearly"
+
+    Returns:
+        Resampled DataFrame (empty buckets dropped)
+    """
+    ohlc = {
+        "Open": "first",
+        "High": "max",
+        "Low": "min",
+        "Close": "last",
+    }
+    if "Volume" in df.columns:
+        ohlc["Volume"] = "sum"
+
+    return df.resample(PYRAMID_LEVELS[level]).agg(ohlc).dropna(how="any")
+
+
+class BarPyramid:
+    """
+    Coarse OHLCV levels for one ticker, maintained incrementally.
+
+    Levels are built lazily from the daily data passed to get(). Later calls
+    compare the daily data with what the pyramid was built from: if it only
+    gained or changed trailing rows, just the affected buckets are
+    re-aggregated; anything else (backfill, split adjustment) rebuilds the
+    levels.
+
+    The pyramid also keeps the daily rows of the open (trailing) buckets so
+    live daily bars can be applied without the full daily history.
+    """
+
+    def __init__(self):
+        self._levels: Dict[str, "pd.DataFrame"] = {}
+        self._tail: Optional["pd.DataFrame"] = None
+        # Signature of the daily data the levels were built from
+        self._base_first = None
+        self._base_last = None
+        self._base_len = 0
+        self._base_check: Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the levels and daily tail."""
+        frames = list(self._levels.values())
+        if self._tail is not None:
+            frames.append(self._tail)
+        return int(sum(f.memory_usage(index=True).sum() for f in frames))
+
+    def levels(self) -> Tuple[str, ...]:
+        """Levels built so far."""
+        with self._lock:
+            return tuple(self._levels)
+
+    def get(self, level: str, daily: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Get a coarse level for the given daily data.
+
+        Args:
+            level: "weekly", "monthly" or "yearly"
+            daily: Current daily OHLCV data for the ticker
+
+        Returns:
+            Copy of the level's DataFrame
+        """
+        with self._lock:
+            self._sync(daily)
+            if level not in self._levels:
+                self._levels[level] = resample_ohlcv(daily, level)
+                self._update_tail(daily)
+            return self._levels[level].copy()
+
+    def apply_daily_bar(
+        self, level: str, bar: Dict[str, Any]
+    ) -> Optional[Tuple["pd.DataFrame", bool]]:
+        """
+        Merge a live daily bar into the trailing buckets.
+
+        Args:
+            level: Level to return after the update
+            bar: Dict with Open, High, Low, Close, Volume and Date
+
+        Returns:
+            (copy of the level's DataFrame, True if a new bucket was started),
+            or None if the level is not built or the bar is older than the data
+        """
+        import pandas as pd
+
+        with self._lock:
+            if level not in self._levels or self._tail is None or self._tail.empty:
+                return None
+
+            bar_ts = pd.Timestamp(bar.get("Date") or pd.Timestamp.now()).normalize()
+            if self._tail.index.tz is not None and bar_ts.tz is None:
+                bar_ts = bar_ts.tz_localize(self._tail.index.tz)
+            last_ts = self._tail.index[-1]
+            if bar_ts < last_ts:
+                return None
+
+            values = {col: bar.get(col, 0) for col in self._tail.columns}
+            if bar_ts == last_ts:
+                tail = self._tail.copy()
+                tail.iloc[-1] = [values[col] for col in tail.columns]
+            else:
+                tail = pd.concat([self._tail, pd.DataFrame([values], index=[bar_ts])])
+                self._base_len += 1
+            self._base_last = bar_ts
+            self._base_check = _close_before_last(tail)
+            self._tail = tail
+
+            before = len(self._levels[level])
+            for name in self._levels:
+                self._rebuild_from(name, tail, bar_ts)
+            self._update_tail(tail)
+
+            result = self._levels[level]
+            return result.copy(), len(result) > before
+
+    def _sync(self, daily: "pd.DataFrame") -> None:
+        """Bring built levels up to date with `daily` (lock must be held)."""
+        if daily.empty:
+            self._levels.clear()
+            self._tail = None
+        elif self._levels:
+            if self._extends_base(daily):
+                if (
+                    len(daily) != self._base_len
+                    or daily.index[-1] != self._base_last
+                    or not daily.iloc[-1].equals(self._tail.iloc[-1])
+                ):
+                    for name in self._levels:
+                        self._rebuild_from(name, daily, self._base_last)
+                    self._update_tail(daily)
+            else:
+                for name in self._levels:
+                    self._levels[name] = resample_ohlcv(daily, name)
+                self._update_tail(daily)
+
+        if daily.empty:
+            self._base_first = self._base_last = None
+            self._base_len = 0
+            self._base_check = None
+        else:
+            self._base_first = daily.index[0]
+            self._base_last = daily.index[-1]
+            self._base_len = len(daily)
+            self._base_check = _close_before_last(daily)
+
+    def _extends_base(self, daily: "pd.DataFrame") -> bool:
+        """Whether `daily` equals the base data up to its last row, plus new rows."""
+        if self._tail is None or daily.index[0] != self._base_first:
+            return False
+        if daily.index.searchsorted(self._base_last, side="right") != self._base_len:
+            return False
+        if self._base_len >= 2:
+            close = daily["Close"].iat[self._base_len - 2]
+            if close != self._base_check:
+                return False
+        return True
+
+    def _rebuild_from(self, level: str, daily: "pd.DataFrame", since) -> None:
+        """Re-aggregate the buckets from the one containing `since` onward."""
+        import pandas as pd
+
+        frame = self._levels[level]
+        pos = frame.index.searchsorted(since.normalize(), side="left")
+        head = frame.iloc[:pos]
+        if head.empty:
+            self._levels[level] = resample_ohlcv(daily, level)
+            return
+        start = daily.index.searchsorted(head.index[-1], side="right")
+        self._levels[level] = pd.concat([head, resample_ohlcv(daily.iloc[start:], level)])
+
+    def _update_tail(self, daily: "pd.DataFrame") -> None:
+        """Keep the daily rows of every level's trailing bucket."""
+        cut = None
+        for frame in self._levels.values():
+            if len(frame) < 2:
+                self._tail = daily.copy()
+                return
+            if cut is None or frame.index[-2] < cut:
+                cut = frame.index[-2]
+        start = 0 if cut is None else daily.index.searchsorted(cut, side="right")
+        self._tail = daily.iloc[start:].copy()
+
+
+def _close_before_last(df: "pd.DataFrame") -> Optional[float]:
+    """Close of the second-to-last row (the last one that is final)."""
+    if len(df) < 2:
+        return None
+    return df["Close"].iat[-2]
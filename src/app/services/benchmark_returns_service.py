@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
+from app.services.memory_cache import get_memory_cache
+
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -29,7 +31,7 @@ class BenchmarkReturnsService:
     """
 
     _CACHE_DIR = Path.home() / ".quant_terminal" / "cache" / "benchmark"
-    _memory_cache: Dict[str, "pd.DataFrame"] = {}
+    _MEMORY_NAMESPACE = "benchmark"  # Shared LRU namespace, key "{ETF}:{TICKER}"
     _cache_lock = threading.Lock()
 
     @classmethod
@@ -59,6 +61,7 @@ class BenchmarkReturnsService:
 
         etf_dir = cls._get_etf_cache_dir(etf_symbol)
         results: Dict[str, pd.Series] = {}
+        memory_cache = get_memory_cache()
 
         # Classify tickers into cache status
         need_fetch: List[str] = []
@@ -69,12 +72,10 @@ class BenchmarkReturnsService:
 
             # Check memory cache first
             cache_key = f"{etf_symbol}:{ticker}"
-            with cls._cache_lock:
-                if cache_key in cls._memory_cache:
-                    cached = cls._memory_cache[cache_key]
-                    if cls._is_cache_current(cached):
-                        results[ticker] = cached["return"]
-                        continue
+            cached = memory_cache.get(cls._MEMORY_NAMESPACE, cache_key)
+            if cached is not None and cls._is_cache_current(cached):
+                results[ticker] = cached["return"]
+                continue
 
             # Check disk cache
             if cache_path.exists():
@@ -86,8 +87,7 @@ class BenchmarkReturnsService:
                             # Cache is current, use it
                             results[ticker] = cached_df["return"]
                             # Store in memory cache
-                            with cls._cache_lock:
-                                cls._memory_cache[cache_key] = cached_df
+                            memory_cache.put(cls._MEMORY_NAMESPACE, cache_key, cached_df)
                             continue
                         else:
                             # Cache exists but needs update
@@ -121,8 +121,7 @@ class BenchmarkReturnsService:
                         if not cached_df.empty:
                             results[ticker] = cached_df["return"]
                             cache_key = f"{etf_symbol}:{ticker}"
-                            with cls._cache_lock:
-                                cls._memory_cache[cache_key] = cached_df
+                            memory_cache.put(cls._MEMORY_NAMESPACE, cache_key, cached_df)
                     except Exception as e:
                         print(f"[BenchmarkReturns] Error reading {ticker}: {e}")
 
@@ -178,16 +177,27 @@ class BenchmarkReturnsService:
         total = len(date_ranges)
         print(f"[BenchmarkReturns] Fetching {total} tickers...")
 
-        # Fetch in batches using Polygon
+        # Full histories need per-ticker range requests; incremental updates
+        # go through grouped-daily bars (one request per missing day)
+        price_data: Dict[str, "pd.DataFrame"] = {}
         try:
-            price_data = PolygonDataService.fetch_batch_date_range(
-                list(date_ranges.keys()),
-                date_ranges,
-                progress_callback,
-            )
+            if need_fetch:
+                price_data.update(
+                    PolygonDataService.fetch_batch_date_range(
+                        need_fetch,
+                        {t: date_ranges[t] for t in need_fetch},
+                        progress_callback,
+                    )
+                )
+            if need_update:
+                price_data.update(
+                    PolygonDataService.fetch_batch_incremental(
+                        {t: date_ranges[t] for t in need_update},
+                        progress_callback,
+                    )
+                )
         except Exception as e:
             print(f"[BenchmarkReturns] Batch fetch error: {e}")
-            price_data = {}
 
         # Process and cache each ticker
         etf_dir = cls._get_etf_cache_dir(etf_symbol)
@@ -274,11 +284,14 @@ class BenchmarkReturnsService:
                     print(f"Cleared benchmark cache for {etf_symbol}")
 
                 # Clear memory cache for this ETF
+                memory_cache = get_memory_cache()
                 keys_to_remove = [
-                    k for k in cls._memory_cache.keys() if k.startswith(f"{etf_symbol}:")
+                    k
+                    for k in memory_cache.keys(cls._MEMORY_NAMESPACE)
+                    if k.startswith(f"{etf_symbol}:")
                 ]
                 for key in keys_to_remove:
-                    del cls._memory_cache[key]
+                    memory_cache.pop(cls._MEMORY_NAMESPACE, key)
             else:
                 # Clear all
                 if cls._CACHE_DIR.exists():
@@ -288,7 +301,7 @@ class BenchmarkReturnsService:
                                 cache_file.unlink()
                     print("Cleared all benchmark caches")
 
-                cls._memory_cache.clear()
+                get_memory_cache().clear(cls._MEMORY_NAMESPACE)
 
     @classmethod
     def get_cache_info(cls, etf_symbol: str) -> Dict:
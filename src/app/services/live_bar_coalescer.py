@@ -0,0 +1,123 @@
+"""
+Live bar coalescer for WebSocket minute bars.
+
+Buffers minute bars arriving on the WebSocket thread, aggregates them into
+daily bars off the GUI thread, and hands the GUI at most one batch per frame
+budget containing only the latest daily bar per ticker.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.services.live_bar_aggregator import LiveBarAggregator
+
+
+class LiveBarCoalescer(QObject):
+    """
+    Coalesces live minute bars into throttled per-ticker daily bar updates.
+
+    submit() is thread-safe and does the aggregation on the caller's thread
+    (normally the WebSocket thread). Bars for the same ticker overwrite each
+    other until the next flush, so a burst of ticks costs the GUI thread a
+    single update per ticker. Flushes are scheduled on the GUI thread no more
+    often than once per frame budget, and only while bars are pending.
+
+    Usage:
+        coalescer = LiveBarCoalescer(frame_ms=250, parent=self)
+        coalescer.bars_ready.connect(on_bars_ready)
+        ws.bar_received.connect(coalescer.submit, Qt.DirectConnection)
+    """
+
+    # {ticker: daily bar dict (Open, High, Low, Close, Volume, Date)}
+    bars_ready = Signal(object)
+
+    # Internal: pending bars appeared (queued to the GUI thread)
+    _pending = Signal()
+
+    def __init__(self, frame_ms: int = 250, parent=None):
+        super().__init__(parent)
+        self._frame_ms = max(0, int(frame_ms))
+        self._lock = threading.Lock()
+        self._aggregators: Dict[str, LiveBarAggregator] = {}
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._last_flush = 0.0
+        self._flush_scheduled = False
+
+        self._pending.connect(self._schedule_flush)
+
+    @property
+    def frame_ms(self) -> int:
+        return self._frame_ms
+
+    def set_frame_budget(self, frame_ms: int) -> None:
+        """Set the minimum interval between flushes in milliseconds."""
+        self._frame_ms = max(0, int(frame_ms))
+
+    def submit(self, ticker: str, bar_data: Dict[str, Any]) -> None:
+        """
+        Add a minute bar (safe to call from any thread).
+
+        Args:
+            ticker: Ticker symbol the bar is for
+            bar_data: Dict with keys: open, high, low, close, volume, start_ts
+        """
+        key = ticker.upper()
+        with self._lock:
+            aggregator = self._aggregators.get(key)
+            if aggregator is None:
+                aggregator = self._aggregators[key] = LiveBarAggregator()
+            daily_bar = aggregator.add_minute_bar(bar_data)
+
+            was_clean = not self._dirty
+            self._dirty[key] = daily_bar
+
+        # Wake the GUI thread once per batch, not once per bar
+        if was_clean:
+            self._pending.emit()
+
+    def reset(self, ticker: Optional[str] = None) -> None:
+        """
+        Drop aggregation state and pending bars.
+
+        Args:
+            ticker: Ticker to reset, or None to reset all
+        """
+        with self._lock:
+            if ticker is None:
+                self._aggregators.clear()
+                self._dirty.clear()
+            else:
+                self._aggregators.pop(ticker.upper(), None)
+                self._dirty.pop(ticker.upper(), None)
+
+    def flush(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Take all pending bars now.
+
+        Returns:
+            Dict mapping ticker to its latest aggregated daily bar
+        """
+        with self._lock:
+            bars, self._dirty = self._dirty, {}
+        self._last_flush = time.monotonic()
+        return bars
+
+    def _schedule_flush(self) -> None:
+        """Schedule the next flush within the frame budget (GUI thread)."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+        delay = max(0, int(self._frame_ms - elapsed_ms))
+        QTimer.singleShot(delay, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        self._flush_scheduled = False
+        bars = self.flush()
+        if bars:
+            self.bars_ready.emit(bars)
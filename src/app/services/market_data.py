@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from app.core.config import (
     INTERVAL_MAP,
@@ -57,6 +56,15 @@ from app.services.yahoo_finance_service import YahooFinanceService
 # Import backfill tracker (prevents repeat Yahoo calls)
 from app.services.backfill_tracker import BackfillTracker
 
+# Import shared byte-budgeted LRU (replaces the unbounded per-service dicts)
+from app.services.memory_cache import get_memory_cache
+
+# Import latest-quote store (last close/live price without loading history)
+from app.services.quote_store import Quote, QuoteStore
+
+# Import weekly/monthly/yearly bar pyramids (incremental resampling)
+from app.services.bar_pyramid import BarPyramid, level_for_interval, resample_ohlcv
+
 # Import crypto detection utility
 from app.utils.market_hours import is_crypto_ticker
 
@@ -88,9 +96,12 @@ def _check_data_source_version() -> None:
     _VERSION_FILE.write_text(_DATA_SOURCE_VERSION)
 
 # In-memory session cache to avoid repeated parquet reads
-# Key: ticker (uppercase), Value: DataFrame
-_memory_cache: Dict[str, Any] = {}
-_memory_cache_lock = threading.Lock()
+# Lives in the shared LRU under this namespace; key: ticker (uppercase)
+_MEMORY_NAMESPACE = "prices"
+_memory_cache = get_memory_cache()
+
+# Coarse-interval pyramids live next to the daily data; key: ticker (uppercase)
+_PYRAMID_NAMESPACE = "pyramids"
 
 # Live bar cache for today's partial data (stocks only)
 # Key: ticker, Value: {"df": DataFrame, "timestamp": float}
@@ -101,14 +112,95 @@ _LIVE_BAR_REFRESH_SECONDS = 900  # 15 minutes
 
 def _get_from_memory_cache(ticker: str) -> Optional["pd.DataFrame"]:
     """Get DataFrame from memory cache (thread-safe)."""
-    with _memory_cache_lock:
-        return _memory_cache.get(ticker)
+    return _memory_cache.get(_MEMORY_NAMESPACE, ticker)
 
 
 def _set_memory_cache(ticker: str, df: "pd.DataFrame") -> None:
     """Set DataFrame in memory cache (thread-safe)."""
-    with _memory_cache_lock:
-        _memory_cache[ticker] = df
+    _memory_cache.put(_MEMORY_NAMESPACE, ticker, df)
+
+
+def pin_tickers(tickers: List[str]) -> None:
+    """
+    Pin tickers in the memory cache so LRU eviction never drops them.
+
+    Replaces any previous pins, so pass the full set each time (e.g. the
+    active chart ticker, or [] to release it).
+
+    Args:
+        tickers: Ticker symbols to keep resident
+    """
+    _memory_cache.set_pinned(
+        _MEMORY_NAMESPACE, [t.strip().upper() for t in tickers if t]
+    )
+
+
+def get_memory_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss/eviction counters and byte usage of the shared memory cache.
+
+    Returns:
+        Dict from MemoryCache.stats()
+    """
+    return _memory_cache.stats()
+
+
+def warm_memory_cache(tickers: List[str], max_bytes: int) -> Dict[str, Any]:
+    """
+    Load cached tickers from parquet into the memory cache (no network I/O).
+
+    Tickers are warmed in the given order (highest priority first) until
+    `max_bytes` of new data has been loaded. Tickers already in memory cost
+    nothing; tickers without a parquet cache are skipped.
+
+    Args:
+        tickers: Ticker symbols, highest priority first
+        max_bytes: Budget for newly loaded data
+
+    Returns:
+        Dict with:
+        - "warmed": tickers loaded from disk into memory
+        - "resident": tickers that were already in memory
+        - "stale": warmed or resident tickers whose data is not current
+        - "bytes": bytes of newly loaded data
+    """
+    from app.services.memory_cache import estimate_nbytes
+
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    warmed: List[str] = []
+    resident: List[str] = []
+    stale: List[str] = []
+    used = 0
+
+    to_load = []
+    for ticker in tickers:
+        if _memory_cache.contains(_MEMORY_NAMESPACE, ticker):
+            resident.append(ticker)
+            df = _memory_cache.get(_MEMORY_NAMESPACE, ticker)
+            if df is not None and not _cache.is_cache_current(ticker, df):
+                stale.append(ticker)
+        elif _cache.has_cache(ticker):
+            to_load.append(ticker)
+
+    # Read in small chunks so the budget stops the disk reads early
+    chunk_size = 25
+    for start in range(0, len(to_load), chunk_size):
+        chunk = to_load[start:start + chunk_size]
+        frames = _cache.get_cached_data_batch(chunk)
+        for ticker in chunk:
+            df = frames.get(ticker)
+            if df is None or df.empty:
+                continue
+            nbytes = estimate_nbytes(df)
+            if used + nbytes > max_bytes:
+                return {"warmed": warmed, "resident": resident, "stale": stale, "bytes": used}
+            _set_memory_cache(ticker, df)
+            used += nbytes
+            warmed.append(ticker)
+            if not _cache.is_cache_current(ticker, df):
+                stale.append(ticker)
+
+    return {"warmed": warmed, "resident": resident, "stale": stale, "bytes": used}
 
 
 def _get_live_bar(ticker: str) -> Optional["pd.DataFrame"]:
@@ -470,24 +562,35 @@ def classify_tickers(
         TickerGroup.NEED_POLYGON_UPDATE: [],
     }
 
-    for ticker in tickers:
-        ticker = ticker.strip().upper()
+    tickers = [t.strip().upper() for t in tickers]
 
-        # Check memory cache first
+    # Memory cache first; everything else is read from disk in one batch
+    memory_hits: Dict[str, "pd.DataFrame"] = {}
+    for ticker in tickers:
         df = _get_from_memory_cache(ticker)
         if df is not None and not df.empty and _cache.is_cache_current(ticker):
+            memory_hits[ticker] = df
+
+    disk_frames = _cache.get_cached_data_batch(
+        [t for t in tickers if t not in memory_hits and _cache.has_cache(t)]
+    )
+
+    for ticker in tickers:
+        if ticker in memory_hits:
             groups[TickerGroup.CACHE_CURRENT].append(
-                TickerClassification(TickerGroup.CACHE_CURRENT, ticker, df)
+                TickerClassification(
+                    TickerGroup.CACHE_CURRENT, ticker, memory_hits[ticker]
+                )
             )
             continue
 
         # Check disk cache
-        has_parquet = _cache.has_cache(ticker)
+        has_parquet = ticker in disk_frames
         is_yahoo_backfilled = BackfillTracker.is_yahoo_backfilled(ticker)
 
         if not has_parquet or not is_yahoo_backfilled:
             # Need full Yahoo backfill
-            cached_df = _cache.get_cached_data(ticker) if has_parquet else None
+            cached_df = disk_frames.get(ticker)
             groups[TickerGroup.NEED_YAHOO_BACKFILL].append(
                 TickerClassification(
                     TickerGroup.NEED_YAHOO_BACKFILL, ticker, cached_df
@@ -495,9 +598,9 @@ def classify_tickers(
             )
         else:
             # Has parquet and yahoo_backfilled - check if current
-            cached_df = _cache.get_cached_data(ticker)
+            cached_df = disk_frames[ticker]
             if cached_df is not None and not cached_df.empty:
-                if _cache.is_cache_current(ticker):
+                if _cache.is_cache_current(ticker, cached_df):
                     groups[TickerGroup.CACHE_CURRENT].append(
                         TickerClassification(
                             TickerGroup.CACHE_CURRENT, ticker, cached_df
@@ -538,7 +641,7 @@ def fetch_price_history_batch(
     Classifies tickers into groups and processes each group optimally:
     - Group A (Cache Current): Direct parquet reads
     - Group B (Need Yahoo Backfill): Single batch yf.download()
-    - Group C (Need Polygon Update): Parallel Polygon incremental fetches
+    - Group C (Need Polygon Update): Grouped-daily Polygon incremental update
 
     Args:
         tickers: List of ticker symbols
@@ -560,6 +663,7 @@ def fetch_price_history_batch(
     print(f"\n=== Batch fetching {total} tickers ===")
 
     results: Dict[str, pd.DataFrame] = {}
+    to_save: Dict[str, pd.DataFrame] = {}
 
     # Phase 1: Classification
     if progress_callback:
@@ -610,7 +714,7 @@ def fetch_price_history_batch(
                 BackfillTracker.mark_yahoo_backfilled(ticker)
 
                 # Save to caches
-                _cache.save_to_cache(ticker, df)
+                to_save[ticker] = df
                 _set_memory_cache(ticker, df)
 
                 results[ticker] = df
@@ -627,7 +731,7 @@ def fetch_price_history_batch(
                             df = _prepend_btc_historical(df)
 
                         # Save but DON'T mark yahoo_backfilled
-                        _cache.save_to_cache(ticker, df)
+                        to_save[ticker] = df
                         _set_memory_cache(ticker, df)
                         results[ticker] = df
                         print(f"  {ticker}: Polygon fallback succeeded")
@@ -645,8 +749,8 @@ def fetch_price_history_batch(
             if progress_callback:
                 progress_callback(completed, poly_total, ticker, "polygon")
 
-        polygon_results = PolygonDataService.fetch_batch_date_range(
-            [c.ticker for c in group_c],
+        # Grouped-daily bars: one request per missing day for all tickers
+        polygon_results = PolygonDataService.fetch_batch_incremental(
             date_ranges,
             polygon_progress,
         )
@@ -663,7 +767,7 @@ def fetch_price_history_batch(
                 combined.sort_index(inplace=True)
 
                 # Save updated data
-                _cache.save_to_cache(ticker, combined)
+                to_save[ticker] = combined
                 _set_memory_cache(ticker, combined)
                 results[ticker] = combined
             else:
@@ -671,6 +775,10 @@ def fetch_price_history_batch(
                 results[ticker] = cached_df
                 _set_memory_cache(ticker, cached_df)
 
+    # Write all fetched tickers in one pass (one rewrite per store bucket)
+    if to_save:
+        _cache.save_many_to_cache(to_save, verbose=False)
+
     print(f"\n=== Batch complete: {len(results)}/{total} tickers loaded ===\n")
     return results
 
@@ -687,9 +795,10 @@ def fetch_price_history_batch_polygon_first(
 
     Strategy:
     1. Check cache first - return cached data if current
-    2. Fetch from Polygon (100 concurrent) for uncached/stale tickers
-    3. Yahoo fallback for Polygon failures only
-    4. Save all fetched data to cache
+    2. Stale cached tickers: append missing days via grouped-daily bars
+    3. Fetch full history from Polygon (100 concurrent) for uncached tickers
+    4. Yahoo fallback for Polygon failures only
+    5. Save all fetched data to cache
 
     Args:
         tickers: List of ticker symbols
@@ -711,10 +820,11 @@ def fetch_price_history_batch_polygon_first(
 
     results: Dict[str, pd.DataFrame] = {}
 
-    # Phase 1: Check cache for all tickers (optimized with parallel reads)
+    # Phase 1: Check cache for all tickers (memory, then one batched disk read)
     cached_tickers: List[str] = []
     need_fetch: List[str] = []
     need_disk_check: List[str] = []
+    stale_frames: Dict[str, pd.DataFrame] = {}
 
     print(f"[Cache] Checking {total} tickers...")
 
@@ -729,55 +839,76 @@ def fetch_price_history_batch_polygon_first(
         else:
             need_fetch.append(ticker)
 
-    # Second pass: parallel disk cache reads
+    # Second pass: batched disk cache read (each store bucket opened once)
     if need_disk_check:
-        def _check_disk_cache(ticker: str):
-            df = _cache.get_cached_data(ticker)
-            if df is not None and not df.empty and _cache.is_cache_current(ticker, df):
-                return ticker, df, True  # cached and current
-            return ticker, df, False  # needs fetch (even if df exists but stale)
-
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            disk_results = list(executor.map(_check_disk_cache, need_disk_check))
+        disk_frames = _cache.get_cached_data_batch(need_disk_check)
 
-        for ticker, df, is_current in disk_results:
-            if is_current and df is not None:
+        for ticker in need_disk_check:
+            df = disk_frames.get(ticker)
+            if df is not None and not df.empty and _cache.is_cache_current(ticker, df):
                 _set_memory_cache(ticker, df)
                 results[ticker] = df
                 cached_tickers.append(ticker)
+            elif df is not None and not df.empty:
+                stale_frames[ticker] = df
             else:
                 need_fetch.append(ticker)
 
-    print(f"[Cache] {len(cached_tickers)} current, {len(need_fetch)} need fetch")
+    print(
+        f"[Cache] {len(cached_tickers)} current, {len(stale_frames)} stale, "
+        f"{len(need_fetch)} need fetch"
+    )
 
-    if not need_fetch:
+    if not need_fetch and not stale_frames:
         print(f"=== Batch Complete: {len(results)}/{total} tickers loaded (all from cache) ===\n")
         return results
 
-    # Phase 2: Fetch from Polygon (primary source)
-    polygon_results, failed_tickers = PolygonDataService.fetch_batch_full_history(
-        need_fetch, max_workers=max_workers
-    )
+    to_save: Dict[str, pd.DataFrame] = {}
 
-    # Process successful Polygon results (parallel cache writes)
-    def _save_polygon_ticker(item):
-        ticker, df = item
+    # Phase 2: Append missing days to stale tickers (grouped-daily bars)
+    if stale_frames:
+        from datetime import datetime, timedelta
+
+        to_date = datetime.now().strftime("%Y-%m-%d")
+        date_ranges = {
+            ticker: (
+                (df.index.max().date() + timedelta(days=1)).strftime("%Y-%m-%d"),
+                to_date,
+            )
+            for ticker, df in stale_frames.items()
+        }
+        updates = PolygonDataService.fetch_batch_incremental(date_ranges)
+
+        for ticker, cached_df in stale_frames.items():
+            new_df = updates.get(ticker)
+            if new_df is not None and not new_df.empty:
+                combined = pd.concat([cached_df, new_df])
+                combined = combined[~combined.index.duplicated(keep="last")]
+                combined.sort_index(inplace=True)
+                to_save[ticker] = combined
+            else:
+                combined = cached_df
+            _set_memory_cache(ticker, combined)
+            results[ticker] = combined
+
+    # Phase 3: Fetch full history from Polygon (primary source)
+    if need_fetch:
+        polygon_results, failed_tickers = PolygonDataService.fetch_batch_full_history(
+            need_fetch, max_workers=max_workers
+        )
+    else:
+        polygon_results, failed_tickers = {}, []
+
+    # Process successful Polygon results (single batched cache write)
+    for ticker, df in polygon_results.items():
         if df is not None and not df.empty:
             df.index = pd.to_datetime(df.index)
             df.sort_index(inplace=True)
-            _cache.save_to_cache(ticker, df)
-            return ticker, df
-        return ticker, None
-
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        saved_items = list(executor.map(_save_polygon_ticker, polygon_results.items()))
-
-    for ticker, df in saved_items:
-        if df is not None:
+            to_save[ticker] = df
             _set_memory_cache(ticker, df)
             results[ticker] = df
 
-    # Phase 3: Yahoo fallback for failed tickers
+    # Phase 4: Yahoo fallback for failed tickers
     if failed_tickers:
         print(f"[Yahoo Fallback] Fetching {len(failed_tickers)} failed tickers...")
 
@@ -788,22 +919,12 @@ def fetch_price_history_batch_polygon_first(
             failed_tickers, yahoo_progress
         )
 
-        # Parallel cache writes for Yahoo results
-        def _save_yahoo_ticker(item):
-            ticker, df = item
+        for ticker, df in yahoo_results.items():
             if df is not None and not df.empty:
                 df.index = pd.to_datetime(df.index)
                 df.sort_index(inplace=True)
                 BackfillTracker.mark_yahoo_backfilled(ticker)
-                _cache.save_to_cache(ticker, df)
-                return ticker, df
-            return ticker, None
-
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            yahoo_saved = list(executor.map(_save_yahoo_ticker, yahoo_results.items()))
-
-        for ticker, df in yahoo_saved:
-            if df is not None:
+                to_save[ticker] = df
                 _set_memory_cache(ticker, df)
                 results[ticker] = df
 
@@ -811,10 +932,51 @@ def fetch_price_history_batch_polygon_first(
         yahoo_failed_count = len(yahoo_failed)
         print(f"[Yahoo Fallback] Complete: {yahoo_succeeded} succeeded, {yahoo_failed_count} failed")
 
+    if to_save:
+        _cache.save_many_to_cache(to_save, verbose=False)
+
     print(f"=== Batch Complete: {len(results)}/{total} tickers loaded ===\n")
     return results
 
 
+def fetch_close_panel_polygon_first(
+    tickers: List[str],
+    start: Optional[str] = None,
+    max_workers: int = POLYGON_BATCH_CONCURRENCY,
+) -> "pd.DataFrame":
+    """
+    Fetch an aligned dates x tickers Close matrix for a large universe.
+
+    Tickers whose cache is stale or missing are brought up to date with
+    fetch_price_history_batch_polygon_first; the whole universe is then read
+    from the store in one pruned pass (Close column, dates >= start) instead
+    of deserializing every ticker's full OHLCV history.
+
+    Args:
+        tickers: List of ticker symbols
+        start: Optional first date (YYYY-MM-DD, inclusive)
+        max_workers: Polygon concurrent workers (default from config)
+
+    Returns:
+        Wide DataFrame of closes indexed by date; tickers without data are omitted
+    """
+    import pandas as pd
+
+    if not tickers:
+        return pd.DataFrame()
+
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers))
+
+    # Freshness comes from the store index (no parquet reads)
+    outdated = [t for t in tickers if not _cache.is_cache_current(t)]
+    if outdated:
+        fetch_price_history_batch_polygon_first(outdated, max_workers=max_workers)
+
+    panel = _cache.get_cached_panel(tickers, "Close", start=start)
+    print(f"[Cache] Close panel: {panel.shape[1]}/{len(tickers)} tickers, {panel.shape[0]} dates")
+    return panel
+
+
 def fetch_price_history(
     ticker: str,
     period: str = DEFAULT_PERIOD,
@@ -881,7 +1043,7 @@ def fetch_price_history(
         df_with_live = _append_live_data(data)
         if needs_daily:
             return df_with_live
-        return _resample_data(df_with_live, interval_key)
+        return _resample_cached(ticker, df_with_live, interval_key)
 
     # LEVEL 1: Check memory cache first (instant, no disk I/O)
     df = _get_from_memory_cache(ticker)
@@ -999,6 +1161,56 @@ def fetch_price_history(
         raise ValueError(ERROR_NO_DATA.format(ticker=ticker))
 
 
+def get_latest_quotes(tickers: List[str], max_workers: int = 10) -> Dict[str, Quote]:
+    """
+    Get the latest daily close (and live price, if any) for many tickers.
+
+    Served from the QuoteStore when the ticker's cached bars are current
+    (an index-only check). Other tickers go through fetch_price_history in
+    parallel, which brings their cache, and with it their quote, up to date.
+
+    Args:
+        tickers: Ticker symbols
+        max_workers: Parallel history fetches for stale/missing quotes
+
+    Returns:
+        Dict mapping ticker (as given) -> Quote, for tickers with data
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    quotes = QuoteStore.get_quotes(tickers)
+    stale = [
+        t for t in dict.fromkeys(tickers)
+        if t not in quotes or quotes[t].close is None or not _cache.is_cache_current(t.strip().upper())
+    ]
+    if not stale:
+        return quotes
+
+    def refresh(ticker: str) -> Optional[Quote]:
+        try:
+            # skip_live_bar=True: the quote's close is the last daily bar
+            df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
+        except Exception as e:
+            print(f"Error fetching price for {ticker}: {e}")
+            return None
+        quote = QuoteStore.get_quote(ticker)
+        if df is not None and not df.empty:
+            last_date = df.index[-1].strftime("%Y-%m-%d")
+            if quote is None or quote.date != last_date:
+                # Bars were current but never recorded (e.g. cached before the store existed)
+                QuoteStore.record_bars({ticker: df})
+                quote = QuoteStore.get_quote(ticker)
+        return quote
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(stale)))) as executor:
+        for ticker, quote in zip(stale, executor.map(refresh, stale)):
+            if quote is not None:
+                quotes[ticker] = quote
+            else:
+                quotes.pop(ticker, None)
+    return quotes
+
+
 def _resample_data(df: "pd.DataFrame", interval_key: str) -> "pd.DataFrame":
     """
     Resample daily data to the requested interval.
@@ -1008,41 +1220,84 @@ def _resample_data(df: "pd.DataFrame", interval_key: str) -> "pd.DataFrame":
         interval_key: Interval key (e.g., "weekly", "monthly", "yearly")
 
     Returns:
-        Resampled DataFrame
+        Resampled DataFrame (daily data as-is for daily/unknown intervals)
     """
-    if interval_key in ["1d", "daily"]:
+    level = level_for_interval(interval_key)
+    if level is None:
         return df
-    
-    # Define resampling rules
-    resample_rules = {
-        "weekly": "W",
-        "1wk": "W",
-        "monthly": "ME",
-        "1mo": "ME",
-        "yearly": "YE",
-        "1y": "YE",
-    }
-    
-    resample_freq = resample_rules.get(interval_key)
-    
-    if resample_freq is None:
-        # Unknown interval, return daily data
+    return resample_ohlcv(df, level)
+
+
+def _resample_cached(ticker: str, df: "pd.DataFrame", interval_key: str) -> "pd.DataFrame":
+    """
+    Resample daily data through the ticker's bar pyramid.
+
+    The first request for a level resamples the full history; later requests
+    only re-aggregate the buckets touched by new or changed daily rows.
+
+    Args:
+        ticker: Ticker symbol (uppercase)
+        df: Current daily OHLCV data for the ticker
+        interval_key: Interval key (e.g., "weekly", "monthly", "yearly")
+
+    Returns:
+        Resampled DataFrame (daily data as-is for daily/unknown intervals)
+    """
+    level = level_for_interval(interval_key)
+    if level is None:
         return df
-    
-    # OHLCV aggregation
-    ohlc = {
-        "Open": "first",
-        "High": "max",
-        "Low": "min",
-        "Close": "last",
-    }
-    if "Volume" in df.columns:
-        ohlc["Volume"] = "sum"
-    
-    # Resample
-    df_resampled = df.resample(resample_freq).agg(ohlc).dropna(how="any")
-    
-    return df_resampled
+
+    pyramid = _memory_cache.get(_PYRAMID_NAMESPACE, ticker)
+    if pyramid is None:
+        pyramid = BarPyramid()
+    result = pyramid.get(level, df)
+    # Re-insert so the cache re-accounts the pyramid's size
+    _memory_cache.put(_PYRAMID_NAMESPACE, ticker, pyramid)
+    return result
+
+
+def apply_live_bar_to_pyramid(
+    ticker: str, bar: Dict[str, Any], interval: str
+) -> Optional[Tuple["pd.DataFrame", bool]]:
+    """
+    Merge a live daily bar into a ticker's weekly/monthly/yearly bars.
+
+    Only the trailing bucket of each built level is re-aggregated.
+
+    Args:
+        ticker: Ticker symbol
+        bar: Dict with Open, High, Low, Close, Volume and Date
+        interval: Chart interval to return (e.g., "Weekly")
+
+    Returns:
+        (resampled DataFrame, True if a new bucket was started), or None if
+        no pyramid is cached for the ticker/interval
+    """
+    level = level_for_interval(interval)
+    if level is None:
+        return None
+    key = ticker.strip().upper()
+    pyramid = _memory_cache.get(_PYRAMID_NAMESPACE, key)
+    if pyramid is None:
+        return None
+    result = pyramid.apply_daily_bar(level, bar)
+    # Re-insert so the cache re-accounts the pyramid's size
+    _memory_cache.put(_PYRAMID_NAMESPACE, key, pyramid)
+    return result
+
+
+def resample_price_history(df: "pd.DataFrame", interval: str) -> "pd.DataFrame":
+    """
+    Resample daily OHLCV data to a chart interval.
+
+    Args:
+        df: DataFrame with daily OHLCV data
+        interval: Interval (e.g., "Daily", "weekly", "1mo")
+
+    Returns:
+        Resampled DataFrame (the input itself for daily intervals)
+    """
+    return _resample_data(df, (interval or "1d").strip().lower())
 
 
 def clear_cache(ticker: str | None = None) -> None:
@@ -1055,11 +1310,12 @@ def clear_cache(ticker: str | None = None) -> None:
         ticker: Ticker symbol to clear, or None to clear all
     """
     # Clear memory cache
-    with _memory_cache_lock:
-        if ticker:
-            _memory_cache.pop(ticker.upper(), None)
-        else:
-            _memory_cache.clear()
+    if ticker:
+        _memory_cache.pop(_MEMORY_NAMESPACE, ticker.upper())
+        _memory_cache.pop(_PYRAMID_NAMESPACE, ticker.upper())
+    else:
+        _memory_cache.clear(_MEMORY_NAMESPACE)
+        _memory_cache.clear(_PYRAMID_NAMESPACE)
 
     # Clear disk cache
     _cache.clear_cache(ticker)
@@ -1112,7 +1368,7 @@ def fetch_price_history_yahoo(
         if _cache.is_cache_current(ticker):
             if needs_daily:
                 return df
-            return _resample_data(df, interval_key)
+            return _resample_cached(ticker, df, interval_key)
 
     # LEVEL 2: Check if parquet exists
     if _cache.has_cache(ticker):
@@ -1137,7 +1393,7 @@ def fetch_price_history_yahoo(
 
             if needs_daily:
                 return df
-            return _resample_data(df, interval_key)
+            return _resample_cached(ticker, df, interval_key)
 
     # LEVEL 3: Fresh fetch from Yahoo Finance (no parquet exists)
     print(f"Fresh fetch for {ticker} from Yahoo Finance...")
@@ -1155,7 +1411,42 @@ def fetch_price_history_yahoo(
 
     if needs_daily:
         return df
-    return _resample_data(df, interval_key)
+    return _resample_cached(ticker, df, interval_key)
+
+
+def peek_price_history_yahoo(
+    ticker: str,
+    interval: str = "1d",
+) -> Optional["pd.DataFrame"]:
+    """
+    Get whatever price history is cached for a ticker, without any network I/O.
+
+    Used by the chart module to render immediately while
+    fetch_price_history_yahoo refreshes the data in the background. The
+    result may be stale (not backfilled or missing recent days).
+
+    Args:
+        ticker: Ticker symbol (e.g., "BTC-USD", "AAPL")
+        interval: Data interval (e.g., "1d", "daily", "weekly")
+
+    Returns:
+        Cached DataFrame (resampled to interval), or None if nothing is cached
+    """
+    ticker = ticker.strip().upper()
+    if not ticker:
+        return None
+
+    interval_key = (interval or "1d").strip().lower()
+
+    df = _get_from_memory_cache(ticker)
+    if (df is None or df.empty) and _cache.has_cache(ticker):
+        df = _cache.get_cached_data(ticker)
+    if df is None or df.empty:
+        return None
+
+    if interval_key in ["daily", "1d"]:
+        return df
+    return _resample_cached(ticker, df, interval_key)
 
 
 def _perform_yahoo_backfill(ticker: str, existing_df: "pd.DataFrame") -> "pd.DataFrame":
@@ -1,19 +1,52 @@
 from __future__ import annotations
 
-import pandas as pd
+import json
+import os
+import threading
+import zlib
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.services.quote_store import QuoteStore
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 class MarketDataCache:
     """
-    Cache manager for market data using parquet format.
-    Stores daily OHLCV data to speed up subsequent requests and enable offline usage.
+    Cache manager for market data using a partitioned columnar parquet store.
+
+    All tickers live in one long-format dataset (Ticker, Date, OHLCV) split into
+    hash buckets under ~/.quant_terminal/cache/prices/. A small JSON index maps
+    each ticker to its bucket and first/last cached date, so freshness checks
+    never touch the parquet files and multi-ticker loads open each bucket once.
+
+    Legacy one-file-per-ticker caches (~/.quant_terminal/cache/{TICKER}.parquet)
+    are migrated into the store automatically on first access.
     """
 
     # Cache directory
     _CACHE_DIR = Path.home() / ".quant_terminal" / "cache"
 
+    # Partitioned price store
+    _STORE_DIR = _CACHE_DIR / "prices"
+    _INDEX_FILE = _STORE_DIR / "index.json"
+
+    # Number of hash buckets (more buckets = cheaper single-ticker rewrites,
+    # fewer buckets = fewer files opened for a full-universe panel read)
+    _NUM_BUCKETS = 128
+
+    # Rows per parquet row group (small enough for ticker-level pruning)
+    _ROW_GROUP_SIZE = 16384
+
+    # Schema
+    _PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
     # Windows reserved filenames (case-insensitive)
     # These cannot be used as filenames on Windows
     _WINDOWS_RESERVED = {
@@ -26,19 +59,41 @@ class MarketDataCache:
         """Initialize the cache manager and create cache directory if needed."""
         self._ensure_cache_dir()
 
+        # ticker -> {"bucket": int, "first": "YYYY-MM-DD", "last": "YYYY-MM-DD", "rows": int}
+        self._index: Optional[Dict[str, dict]] = None
+        self._index_lock = threading.RLock()
+        self._bucket_locks = [threading.Lock() for _ in range(self._NUM_BUCKETS)]
+        self._migration_lock = threading.Lock()
+        self._migrated = False
+
     def _ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist."""
         self._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._STORE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # =========================================================================
+    # Store layout helpers
+    # =========================================================================
+
+    def _get_bucket(self, ticker: str) -> int:
+        """Stable hash bucket for a ticker (crc32, independent of PYTHONHASHSEED)."""
+        return zlib.crc32(ticker.upper().encode("utf-8")) % self._NUM_BUCKETS
+
+    def _get_bucket_path(self, bucket: int) -> Path:
+        """Get the parquet file path for a bucket."""
+        return self._STORE_DIR / f"bucket_{bucket:03d}.parquet"
 
     def _get_cache_path(self, ticker: str) -> Path:
         """
-        Get the cache file path for a ticker.
+        Get the legacy (one-file-per-ticker) cache path for a ticker.
+
+        Only used to migrate caches written by older versions.
 
         Args:
             ticker: Ticker symbol (e.g., "BTC-USD")
 
         Returns:
-            Path to the cache file
+            Path to the legacy cache file
         """
         # Sanitize ticker for filename (replace problematic characters)
         safe_ticker = ticker.replace("/", "_").replace("\\", "_")
@@ -48,44 +103,454 @@ class MarketDataCache:
             safe_ticker = f"_{safe_ticker}_"
 
         return self._CACHE_DIR / f"{safe_ticker}.parquet"
-    
+
+    def _ticker_from_legacy_path(self, path: Path) -> str:
+        """Recover the ticker symbol from a legacy cache filename."""
+        name = path.stem
+        if name.startswith("_") and name.endswith("_") and name[1:-1].upper() in self._WINDOWS_RESERVED:
+            name = name[1:-1]
+        return name.upper()
+
+    # =========================================================================
+    # Index management
+    # =========================================================================
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Load the ticker index from disk (cached in memory after first load)."""
+        with self._index_lock:
+            if self._index is not None:
+                return self._index
+
+            if self._INDEX_FILE.exists():
+                try:
+                    with open(self._INDEX_FILE, "r", encoding="utf-8") as f:
+                        self._index = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"Warning: Could not load price store index: {e}")
+                    self._index = self._rebuild_index()
+            else:
+                self._index = self._rebuild_index()
+
+            return self._index
+
+    def _save_index(self) -> None:
+        """Persist the ticker index atomically."""
+        with self._index_lock:
+            if self._index is None:
+                return
+            tmp_path = self._INDEX_FILE.with_suffix(".json.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._index, f)
+                os.replace(tmp_path, self._INDEX_FILE)
+            except IOError as e:
+                print(f"Warning: Could not save price store index: {e}")
+
+    def _rebuild_index(self) -> Dict[str, dict]:
+        """
+        Rebuild the ticker index by scanning bucket files.
+
+        Only needed if the index file is missing or corrupted while bucket
+        files exist. Reads just the Ticker and Date columns.
+        """
+        import pyarrow.parquet as pq
+
+        index: Dict[str, dict] = {}
+        for bucket in range(self._NUM_BUCKETS):
+            path = self._get_bucket_path(bucket)
+            if not path.exists():
+                continue
+            try:
+                table = pq.read_table(path, columns=["Ticker", "Date"])
+            except Exception as e:
+                print(f"Warning: Could not read price bucket {bucket}: {e}")
+                continue
+            if table.num_rows == 0:
+                continue
+            stats = table.to_pandas().groupby("Ticker")["Date"].agg(["min", "max", "size"])
+            for ticker, row in stats.iterrows():
+                index[ticker] = self._make_index_entry(bucket, row["min"], row["max"], int(row["size"]))
+        return index
+
+    @staticmethod
+    def _make_index_entry(bucket: int, first, last, rows: int) -> dict:
+        """Build an index entry for a ticker."""
+        return {
+            "bucket": bucket,
+            "first": pd.Timestamp(first).strftime("%Y-%m-%d"),
+            "last": pd.Timestamp(last).strftime("%Y-%m-%d"),
+            "rows": rows,
+        }
+
+    # =========================================================================
+    # Bucket I/O
+    # =========================================================================
+
+    def _read_bucket(
+        self,
+        bucket: int,
+        tickers: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+    ) -> "pa.Table | None":
+        """
+        Read rows from one bucket in long format with column and row pruning.
+
+        Args:
+            bucket: Bucket number
+            tickers: Tickers to keep (None = all tickers in the bucket)
+            columns: Price columns to read (None = all OHLCV columns)
+            start: Optional first date (inclusive)
+            end: Optional last date (inclusive)
+
+        Returns:
+            Arrow table with Ticker, Date and the requested columns, sorted by
+            (Ticker, Date), or None if the bucket doesn't exist
+        """
+        import pyarrow.parquet as pq
+
+        path = self._get_bucket_path(bucket)
+        if not path.exists():
+            return None
+
+        filters = []
+        if tickers is not None:
+            filters.append(("Ticker", "in", list(tickers)))
+        if start is not None:
+            filters.append(("Date", ">=", start.to_pydatetime()))
+        if end is not None:
+            filters.append(("Date", "<=", end.to_pydatetime()))
+
+        read_columns = None
+        if columns is not None:
+            read_columns = ["Ticker", "Date"] + [c for c in columns if c in self._PRICE_COLUMNS]
+
+        return pq.read_table(
+            path, columns=read_columns, filters=filters or None, read_dictionary=["Ticker"]
+        )
+
+    def _write_bucket(self, bucket: int, table: "pa.Table") -> None:
+        """
+        Atomically replace a bucket file with the given long-format rows.
+
+        Caller must hold the bucket lock.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self._get_bucket_path(bucket)
+        if table.num_rows == 0:
+            if path.exists():
+                path.unlink()
+            return
+
+        # Tables read back from disk carry a dictionary-encoded Ticker column
+        ticker_pos = table.schema.get_field_index("Ticker")
+        if pa.types.is_dictionary(table.schema.field(ticker_pos).type):
+            table = table.set_column(ticker_pos, "Ticker", table["Ticker"].cast(pa.string()))
+
+        # Keep each ticker contiguous so row-group statistics prune by ticker
+        table = table.sort_by([("Ticker", "ascending"), ("Date", "ascending")])
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path, row_group_size=self._ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+
+    def _to_table(self, ticker: str, df: pd.DataFrame) -> "pa.Table":
+        """Convert a single-ticker OHLCV frame to long-format store rows."""
+        import pyarrow as pa
+
+        df = self._normalize_frame(df)
+        n = len(df)
+        arrays = {
+            "Ticker": pa.array([ticker] * n, type=pa.string()),
+            "Date": pa.array(df.index.values.astype("datetime64[ns]"), type=pa.timestamp("ns")),
+        }
+        for col in self._PRICE_COLUMNS:
+            if col in df.columns:
+                values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                values = np.full(n, np.nan)
+            arrays[col] = pa.array(values, type=pa.float64())
+        return pa.table(arrays)
+
+    @staticmethod
+    def _table_arrays(table: "pa.Table", columns: List[str]):
+        """
+        Unpack a long-format table into NumPy arrays.
+
+        Returns:
+            (ticker_codes, ticker_labels, dates, values) where ticker_codes
+            index into ticker_labels and values is a rows x columns matrix
+        """
+        tickers = table.column("Ticker").combine_chunks()
+        if hasattr(tickers, "indices"):
+            codes = tickers.indices.to_numpy(zero_copy_only=False)
+            labels = tickers.dictionary.to_pylist()
+        else:
+            codes, labels = pd.factorize(tickers.to_numpy(zero_copy_only=False))
+            labels = list(labels)
+
+        dates = table.column("Date").to_numpy().astype("datetime64[ns]")
+        values = np.empty((table.num_rows, len(columns)))
+        for i, col in enumerate(columns):
+            if col in table.column_names:
+                values[:, i] = table.column(col).to_numpy()
+            else:
+                values[:, i] = np.nan
+        return codes, labels, dates, values
+
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Ensure a tz-naive, sorted, de-duplicated DatetimeIndex."""
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df = df.copy()
+            df.index = pd.to_datetime(df.index)
+        if df.index.tz is not None:
+            df = df.copy()
+            df.index = df.index.tz_localize(None)
+        df = df[~df.index.duplicated(keep="last")]
+        return df.sort_index()
+
+    # =========================================================================
+    # Legacy migration
+    # =========================================================================
+
+    def _ensure_migrated(self) -> None:
+        """Migrate legacy per-ticker parquet files once per process."""
+        if self._migrated:
+            return
+        with self._migration_lock:
+            if self._migrated:
+                return
+            self.migrate_legacy_cache()
+            self._migrated = True
+
+    def migrate_legacy_cache(self, chunk_size: int = 500) -> int:
+        """
+        Import legacy ~/.quant_terminal/cache/{TICKER}.parquet files into the store.
+
+        Files are read in chunks, written bucket-by-bucket and deleted once
+        their data is safely in the store. Files that fail to read or write
+        are kept and retried on the next call. Safe to call repeatedly.
+
+        Args:
+            chunk_size: Number of legacy files to import per write pass
+
+        Returns:
+            Number of tickers migrated
+        """
+        legacy_files = sorted(self._CACHE_DIR.glob("*.parquet"))
+        if not legacy_files:
+            return 0
+
+        print(f"Migrating {len(legacy_files)} cached tickers to columnar price store...")
+        migrated = 0
+
+        for i in range(0, len(legacy_files), chunk_size):
+            chunk = legacy_files[i:i + chunk_size]
+            frames: Dict[str, pd.DataFrame] = {}
+            paths: Dict[str, Path] = {}
+            done: List[Path] = []  # Safe to delete
+            for path in chunk:
+                ticker = self._ticker_from_legacy_path(path)
+                try:
+                    df = pd.read_parquet(path)
+                except Exception as e:
+                    print(f"Warning: Could not migrate {path.name}: {e}")
+                    continue
+                if df.empty:
+                    done.append(path)
+                else:
+                    frames[ticker] = df
+                    paths[ticker] = path
+
+            # Existing store data wins over legacy files for the same ticker
+            index = self._load_index()
+            done.extend(paths[t] for t in frames if t in index)
+            frames = {t: df for t, df in frames.items() if t not in index}
+            if frames:
+                written = self.save_many_to_cache(frames, verbose=False)
+                done.extend(paths[t] for t in written)
+                migrated += len(written)
+
+            for path in done:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+        print(f"Migrated {migrated} tickers to {self._STORE_DIR}")
+        return migrated
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
     def has_cache(self, ticker: str) -> bool:
         """
-        Check if a cache file exists for this ticker.
-        
+        Check if cached data exists for this ticker.
+
         Args:
             ticker: Ticker symbol
-        
+
         Returns:
             True if cache exists, False otherwise
         """
-        return self._get_cache_path(ticker).exists()
-    
+        self._ensure_migrated()
+        return ticker.upper() in self._load_index()
+
     def get_cached_data(self, ticker: str) -> pd.DataFrame | None:
         """
         Load cached data for a ticker.
-        
+
         Args:
             ticker: Ticker symbol
-        
+
         Returns:
             DataFrame with cached OHLCV data, or None if not found
         """
-        cache_path = self._get_cache_path(ticker)
-        
-        if not cache_path.exists():
-            return None
-        
-        try:
-            df = pd.read_parquet(cache_path)
-            # Ensure index is DatetimeIndex
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
-            return df
-        except Exception as e:
-            print(f"Error reading cache for {ticker}: {e}")
-            return None
-    
+        return self.get_cached_data_batch([ticker]).get(ticker.upper())
+
+    def get_cached_data_batch(self, tickers: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Load cached data for many tickers, opening each bucket at most once.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Dict mapping ticker -> OHLCV DataFrame (missing tickers omitted)
+        """
+        self._ensure_migrated()
+        index = self._load_index()
+
+        by_bucket: Dict[int, List[str]] = {}
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            entry = index.get(ticker)
+            if entry is not None:
+                by_bucket.setdefault(entry["bucket"], []).append(ticker)
+
+        columns = self._PRICE_COLUMNS
+        results: Dict[str, pd.DataFrame] = {}
+        for bucket, bucket_tickers in by_bucket.items():
+            try:
+                table = self._read_bucket(bucket, tickers=bucket_tickers)
+            except Exception as e:
+                print(f"Error reading cache for {', '.join(bucket_tickers)}: {e}")
+                continue
+            if table is None or table.num_rows == 0:
+                continue
+
+            codes, labels, dates, values = self._table_arrays(table, columns)
+
+            # Rows are sorted by ticker, so each ticker is one contiguous slice
+            bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]))
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                block = values[lo:hi]
+                # Drop columns this ticker never had (e.g. Volume for some indices)
+                keep = ~np.isnan(block).all(axis=0)
+                results[labels[codes[lo]]] = pd.DataFrame(
+                    block[:, keep],
+                    index=pd.DatetimeIndex(dates[lo:hi], name="Date"),
+                    columns=[c for c, k in zip(columns, keep) if k],
+                )
+
+        return results
+
+    def get_cached_panel(
+        self,
+        tickers: Iterable[str],
+        columns: str | List[str] = "Close",
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load an aligned wide matrix (dates x tickers) in one pass over the store.
+
+        Only the requested columns and date range are read from disk.
+
+        Args:
+            tickers: Ticker symbols
+            columns: A single column name (e.g. "Close") for a flat
+                     dates x tickers frame, or a list (e.g. ["Close", "Volume"])
+                     for a frame with (column, ticker) MultiIndex columns
+            start: Optional first date (inclusive)
+            end: Optional last date (inclusive)
+
+        Returns:
+            Wide DataFrame indexed by date; tickers without cache are omitted
+        """
+        self._ensure_migrated()
+        index = self._load_index()
+
+        single = isinstance(columns, str)
+        value_cols = [columns] if single else [c for c in columns if c in self._PRICE_COLUMNS]
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        by_bucket: Dict[int, List[str]] = {}
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            entry = index.get(ticker)
+            if entry is None:
+                continue
+            # Skip tickers whose cached range can't overlap the request
+            if start_ts is not None and pd.Timestamp(entry["last"]) < start_ts.normalize():
+                continue
+            if end_ts is not None and pd.Timestamp(entry["first"]) > end_ts:
+                continue
+            by_bucket.setdefault(entry["bucket"], []).append(ticker)
+
+        # Read each bucket and map its local ticker codes to panel columns
+        panel_tickers: List[str] = []
+        positions: Dict[str, int] = {}
+        parts = []
+        for bucket, bucket_tickers in by_bucket.items():
+            try:
+                table = self._read_bucket(bucket, bucket_tickers, value_cols, start_ts, end_ts)
+            except Exception as e:
+                print(f"Error reading price bucket {bucket}: {e}")
+                continue
+            if table is None or table.num_rows == 0:
+                continue
+
+            codes, labels, dates, values = self._table_arrays(table, value_cols)
+            # The dictionary may still list tickers the filter removed
+            present = np.bincount(codes, minlength=len(labels)) > 0
+            local_to_panel = np.zeros(len(labels), dtype=np.int64)
+            for i in np.flatnonzero(present):
+                label = labels[i]
+                if label not in positions:
+                    positions[label] = len(panel_tickers)
+                    panel_tickers.append(label)
+                local_to_panel[i] = positions[label]
+            parts.append((local_to_panel[codes], dates, values))
+
+        if not parts:
+            return pd.DataFrame()
+
+        # Scatter all rows into one dates x tickers matrix per column
+        col_idx = np.concatenate([p[0] for p in parts])
+        all_dates = np.concatenate([p[1] for p in parts])
+        all_values = np.concatenate([p[2] for p in parts])
+        # Hash-factorize then sort the (small) set of unique dates
+        date_codes, unique_dates = pd.factorize(all_dates)
+        date_order = np.argsort(unique_dates)
+        rank = np.empty_like(date_order)
+        rank[date_order] = np.arange(len(date_order))
+        row_idx = rank[date_codes]
+        dates_index = pd.DatetimeIndex(np.asarray(unique_dates)[date_order], name="Date")
+
+        frames = {}
+        for i, col in enumerate(value_cols):
+            matrix = np.full((len(dates_index), len(panel_tickers)), np.nan)
+            matrix[row_idx, col_idx] = all_values[:, i]
+            frames[col] = pd.DataFrame(matrix, index=dates_index, columns=panel_tickers)
+
+        if single:
+            return frames[value_cols[0]]
+        return pd.concat(frames, axis=1)
+
     def is_cache_current(self, ticker: str, df: "pd.DataFrame | None" = None) -> bool:
         """
         Check if cached data is current (no new data expected).
@@ -100,22 +565,24 @@ class MarketDataCache:
 
         Args:
             ticker: Ticker symbol
-            df: Optional pre-loaded DataFrame to avoid redundant parquet reads
+            df: Optional pre-loaded DataFrame; if omitted the last date comes
+                from the store index (no parquet read)
 
         Returns:
             True if cache is current, False otherwise
         """
         from app.utils.market_hours import is_crypto_ticker, is_stock_cache_current
 
-        # Use provided DataFrame or load from cache
-        if df is None:
-            df = self.get_cached_data(ticker)
-
-        if df is None or df.empty:
-            return False
-
-        # Get the last date in cache
-        last_date = df.index.max().date()
+        # Use provided DataFrame or the index
+        if df is not None:
+            if df.empty:
+                return False
+            last_date = df.index.max().date()
+        else:
+            last = self.get_last_cached_date(ticker)
+            if last is None:
+                return False
+            last_date = last.date()
 
         # Crypto trades 24/7, but daily bars are only complete at end of day
         # So cache is current if we have yesterday's data (today's bar isn't complete yet)
@@ -126,28 +593,27 @@ class MarketDataCache:
 
         # Stocks - use market-aware check
         return is_stock_cache_current(last_date)
-    
+
     def get_last_cached_date(self, ticker: str) -> pd.Timestamp | None:
         """
         Get the last date in cached data.
-        
+
         Args:
             ticker: Ticker symbol
-        
+
         Returns:
             Last cached date, or None if no cache
         """
-        df = self.get_cached_data(ticker)
-        
-        if df is None or df.empty:
+        self._ensure_migrated()
+        entry = self._load_index().get(ticker.upper())
+        if entry is None:
             return None
-        
-        return df.index.max()
-    
+        return pd.Timestamp(entry["last"])
+
     def save_to_cache(self, ticker: str, df: pd.DataFrame) -> None:
         """
         Save data to cache.
-        
+
         Args:
             ticker: Ticker symbol
             df: DataFrame with OHLCV data (must have DatetimeIndex)
@@ -155,72 +621,137 @@ class MarketDataCache:
         if df is None or df.empty:
             print(f"Warning: Attempted to cache empty data for {ticker}")
             return
-        
-        cache_path = self._get_cache_path(ticker)
-        
-        try:
-            # Ensure index is DatetimeIndex
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
-            
-            # Sort by date
-            df = df.sort_index()
-            
-            # Save to parquet
-            df.to_parquet(cache_path)
-            
-            last_date = df.index.max().strftime("%Y-%m-%d")
-            print(f"Cached {ticker} data (last date: {last_date})")
-            
-        except Exception as e:
-            print(f"Error saving cache for {ticker}: {e}")
-    
+
+        self.save_many_to_cache({ticker: df})
+
+    def save_many_to_cache(self, frames: Dict[str, pd.DataFrame], verbose: bool = True) -> List[str]:
+        """
+        Save data for many tickers, rewriting each affected bucket only once.
+
+        Each ticker's cached history is replaced by the given frame.
+
+        Args:
+            frames: Dict mapping ticker -> DataFrame with OHLCV data
+            verbose: Print a line per cached ticker
+
+        Returns:
+            Tickers (uppercase) whose data was written; tickers in a bucket
+            that failed to write are left out
+        """
+        self._ensure_cache_dir()
+
+        by_bucket: Dict[int, Dict[str, pd.DataFrame]] = {}
+        for ticker, df in frames.items():
+            if df is None or df.empty:
+                continue
+            ticker = ticker.upper()
+            by_bucket.setdefault(self._get_bucket(ticker), {})[ticker] = df
+
+        index = self._load_index()
+        written: Dict[str, pd.DataFrame] = {}
+
+        for bucket, bucket_frames in by_bucket.items():
+            try:
+                import pyarrow as pa
+                import pyarrow.compute as pc
+
+                tables = [self._to_table(t, df) for t, df in bucket_frames.items()]
+                with self._bucket_locks[bucket]:
+                    existing = self._read_bucket(bucket)
+                    if existing is not None and existing.num_rows > 0:
+                        existing = existing.cast(tables[0].schema)
+                        keep = pc.invert(pc.is_in(existing["Ticker"], pa.array(list(bucket_frames))))
+                        tables.insert(0, existing.filter(keep))
+                    self._write_bucket(bucket, pa.concat_tables(tables))
+
+                with self._index_lock:
+                    for ticker, table in zip(bucket_frames, tables[-len(bucket_frames):]):
+                        dates = table.column("Date")
+                        index[ticker] = self._make_index_entry(
+                            bucket, pc.min(dates).as_py(), pc.max(dates).as_py(), table.num_rows
+                        )
+            except Exception as e:
+                print(f"Error saving cache for {', '.join(bucket_frames)}: {e}")
+                continue
+
+            written.update(bucket_frames)
+            if verbose:
+                for ticker in bucket_frames:
+                    print(f"Cached {ticker} data (last date: {index[ticker]['last']})")
+
+        self._save_index()
+        QuoteStore.record_bars(written)
+        return list(written)
+
     def clear_cache(self, ticker: str | None = None) -> None:
         """
         Clear cache for a specific ticker or all tickers.
-        
+
         Args:
             ticker: Ticker symbol to clear, or None to clear all
         """
         if ticker:
-            cache_path = self._get_cache_path(ticker)
-            if cache_path.exists():
-                cache_path.unlink()
+            ticker = ticker.upper()
+            index = self._load_index()
+            entry = index.get(ticker)
+            if entry is not None:
+                bucket = entry["bucket"]
+                with self._bucket_locks[bucket]:
+                    import pyarrow as pa
+                    import pyarrow.compute as pc
+
+                    existing = self._read_bucket(bucket)
+                    if existing is not None:
+                        keep = pc.not_equal(existing["Ticker"].cast(pa.string()), ticker)
+                        self._write_bucket(bucket, existing.filter(keep))
+                with self._index_lock:
+                    index.pop(ticker, None)
+                self._save_index()
                 print(f"Cleared cache for {ticker}")
+            QuoteStore.remove(ticker)
+
+            legacy_path = self._get_cache_path(ticker)
+            if legacy_path.exists():
+                legacy_path.unlink()
         else:
-            # Clear all cache files
+            # Clear all buckets, the index and any legacy per-ticker files
+            for bucket in range(self._NUM_BUCKETS):
+                with self._bucket_locks[bucket]:
+                    path = self._get_bucket_path(bucket)
+                    if path.exists():
+                        path.unlink()
             for cache_file in self._CACHE_DIR.glob("*.parquet"):
                 cache_file.unlink()
+            with self._index_lock:
+                self._index = {}
+            self._save_index()
+            QuoteStore.remove()
             print("Cleared all cache files")
-    
+
     def get_cache_info(self, ticker: str) -> dict:
         """
         Get information about cached data.
-        
+
         Args:
             ticker: Ticker symbol
-        
+
         Returns:
             Dict with cache info (exists, last_date, is_current, num_records)
         """
-        exists = self.has_cache(ticker)
-        
-        if not exists:
+        self._ensure_migrated()
+        entry = self._load_index().get(ticker.upper())
+
+        if entry is None:
             return {
                 "exists": False,
                 "last_date": None,
                 "is_current": False,
                 "num_records": 0,
             }
-        
-        df = self.get_cached_data(ticker)
-        last_date = df.index.max() if df is not None and not df.empty else None
-        is_current = self.is_cache_current(ticker)
-        num_records = len(df) if df is not None else 0
-        
+
         return {
-            "exists": exists,
-            "last_date": last_date,
-            "is_current": is_current,
-            "num_records": num_records,
-        }
\ No newline at end of file
+            "exists": True,
+            "last_date": pd.Timestamp(entry["last"]),
+            "is_current": self.is_cache_current(ticker),
+            "num_records": entry["rows"],
+        }
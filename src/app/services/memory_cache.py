@@ -0,0 +1,256 @@
+"""Memory Cache - Bounded, byte-accounted LRU shared by data services.
+
+Used by market_data, ReturnsDataService and BenchmarkReturnsService for their
+in-memory DataFrame caches. Every entry is charged its real memory footprint
+(``memory_usage(deep=True)`` for pandas objects) against a single process-wide budget, and the least recently used
+unpinned entries are evicted once the budget is exceeded.
+
+Entries are grouped by namespace ("prices", "returns", "benchmark", ...) so
+each service can clear its own data without touching the others.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_CacheKey = Tuple[str, Hashable]
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value: DataFrame, Series, ndarray, or any Python object
+
+    Returns:
+        Approximate size in bytes
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True, deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except Exception:
+            pass
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    return sys.getsizeof(value)
+
+
+class MemoryCache:
+    """
+    Thread-safe LRU cache with a byte budget.
+
+    Features:
+    - Byte accounting: each entry is sized once on insert
+    - LRU eviction: oldest unpinned entries evicted when over budget
+    - Pinning: pinned keys are never evicted (e.g. active chart ticker)
+    - Counters: hits, misses and evictions, overall and per namespace
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[_CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._pinned: set = set()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it most recently used.
+
+        Args:
+            namespace: Cache namespace (e.g. "prices")
+            key: Key within the namespace
+
+        Returns:
+            Cached value, or default if missing
+        """
+        cache_key = (namespace, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._count(namespace, "misses")
+                return default
+            self._entries.move_to_end(cache_key)
+            self._count(namespace, "hits")
+            return entry[0]
+
+    def contains(self, namespace: str, key: Hashable) -> bool:
+        """Check for a key without touching LRU order or counters."""
+        with self._lock:
+            return (namespace, key) in self._entries
+
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        Insert or replace a value, evicting LRU entries if over budget.
+
+        Args:
+            namespace: Cache namespace
+            key: Key within the namespace
+            value: Value to cache (sized via estimate_nbytes)
+        """
+        nbytes = estimate_nbytes(value)
+        cache_key = (namespace, key)
+        with self._lock:
+            old = self._entries.pop(cache_key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[cache_key] = (value, nbytes)
+            self._total_bytes += nbytes
+            self._evict_to_budget()
+
+    def pop(self, namespace: str, key: Hashable) -> Any:
+        """Remove and return a value (None if missing)."""
+        with self._lock:
+            entry = self._entries.pop((namespace, key), None)
+            if entry is None:
+                return None
+            self._total_bytes -= entry[1]
+            return entry[0]
+
+    def keys(self, namespace: str) -> List[Hashable]:
+        """Get all keys currently cached in a namespace."""
+        with self._lock:
+            return [k for (ns, k) in self._entries if ns == namespace]
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Clear cached entries.
+
+        Args:
+            namespace: Namespace to clear, or None to clear everything
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                self._total_bytes -= self._entries.pop(cache_key)[1]
+
+    # ------------------------------------------------------------------
+    # Pinning
+    # ------------------------------------------------------------------
+
+    def pin(self, namespace: str, key: Hashable) -> None:
+        """Exempt a key from eviction (may be pinned before it is cached)."""
+        with self._lock:
+            self._pinned.add((namespace, key))
+
+    def unpin(self, namespace: str, key: Hashable) -> None:
+        """Make a pinned key evictable again."""
+        with self._lock:
+            self._pinned.discard((namespace, key))
+            self._evict_to_budget()
+
+    def set_pinned(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        """
+        Replace all pins in a namespace with the given keys.
+
+        Args:
+            namespace: Cache namespace
+            keys: Keys to pin (previous pins in the namespace are released)
+        """
+        with self._lock:
+            self._pinned = {k for k in self._pinned if k[0] != namespace}
+            self._pinned.update((namespace, key) for key in keys)
+            self._evict_to_budget()
+
+    # ------------------------------------------------------------------
+    # Budget and statistics
+    # ------------------------------------------------------------------
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting immediately if now over it."""
+        with self._lock:
+            self._max_bytes = max(0, int(max_bytes))
+            self._evict_to_budget()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, bytes, max_bytes, hits, misses, evictions and a
+            per-namespace breakdown under "namespaces"
+        """
+        with self._lock:
+            namespaces: Dict[str, Dict[str, int]] = {}
+            for (ns, _), (_, nbytes) in self._entries.items():
+                info = namespaces.setdefault(ns, {"entries": 0, "bytes": 0})
+                info["entries"] += 1
+                info["bytes"] += nbytes
+            for ns, counters in self._stats.items():
+                namespaces.setdefault(ns, {"entries": 0, "bytes": 0}).update(counters)
+
+            totals = {"hits": 0, "misses": 0, "evictions": 0}
+            for counters in self._stats.values():
+                for name in totals:
+                    totals[name] += counters.get(name, 0)
+
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "pinned": len(self._pinned),
+                **totals,
+                "namespaces": namespaces,
+            }
+
+    def _count(self, namespace: str, counter: str) -> None:
+        """Increment a per-namespace counter (lock must be held)."""
+        counters = self._stats.setdefault(
+            namespace, {"hits": 0, "misses": 0, "evictions": 0}
+        )
+        counters[counter] += 1
+
+    def _evict_to_budget(self) -> None:
+        """Evict LRU unpinned entries until within budget (lock must be held)."""
+        if self._total_bytes <= self._max_bytes:
+            return
+        for cache_key in list(self._entries):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if cache_key in self._pinned:
+                continue
+            self._total_bytes -= self._entries.pop(cache_key)[1]
+            self._count(cache_key[0], "evictions")
+
+
+_shared_cache: Optional[MemoryCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_memory_cache() -> MemoryCache:
+    """
+    Get the process-wide memory cache shared by all data services.
+
+    The budget comes from MEMORY_CACHE_MAX_MB in app.core.config.
+
+    Returns:
+        Shared MemoryCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                from app.core.config import MEMORY_CACHE_MAX_MB
+
+                _shared_cache = MemoryCache(MEMORY_CACHE_MAX_MB * 1024 * 1024)
+    return _shared_cache
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 from app.core.config import (
     POLYGON_BASE_URL,
     POLYGON_BATCH_CONCURRENCY,
+    POLYGON_GROUPED_MAX_DAYS,
+    POLYGON_GROUPED_MIN_TICKERS,
     POLYGON_RATE_LIMIT_CALLS,
     POLYGON_RATE_LIMIT_ENABLED,
     POLYGON_RATE_LIMIT_PERIOD,
@@ -40,9 +42,11 @@ class PolygonDataService:
     - Ticker format conversion (Yahoo format -> Polygon format)
     - Retry logic with exponential backoff
     - Returns DataFrame compatible with existing interface
+    - Grouped-daily bulk updates (one request per day for all US stocks)
     """
 
     _api_key: Optional[str] = None
+    _base_url: str = POLYGON_BASE_URL
     _session: Optional["requests.Session"] = None
     _session_lock = threading.Lock()
 
@@ -76,6 +80,17 @@ class PolygonDataService:
 
         return cls._session
 
+    @classmethod
+    def set_base_url(cls, base_url: Optional[str] = None) -> None:
+        """
+        Point all requests at a different API host (e.g. a local HTTP stub).
+
+        Args:
+            base_url: Base URL without trailing slash, or None to restore
+                POLYGON_BASE_URL
+        """
+        cls._base_url = (base_url or POLYGON_BASE_URL).rstrip("/")
+
     @classmethod
     def _load_api_key(cls) -> Optional[str]:
         """Load API key from environment or .env file."""
@@ -123,6 +138,16 @@ class PolygonDataService:
         # Stocks: unchanged
         return ticker
 
+    @classmethod
+    def _to_yahoo_ticker(cls, polygon_ticker: str) -> str:
+        """
+        Convert Polygon stock ticker format back to Yahoo Finance format.
+
+        Only stock tickers appear in grouped-daily responses, so the only
+        conversion needed is share classes: BRK.B -> BRK-B.
+        """
+        return polygon_ticker.replace(".", "-")
+
     @classmethod
     def _wait_for_rate_limit(cls) -> None:
         """Implement rate limiting for Polygon API (only if enabled)."""
@@ -240,7 +265,7 @@ class PolygonDataService:
 
         # Build URL
         url = (
-            f"{POLYGON_BASE_URL}/v2/aggs/ticker/{polygon_ticker}"
+            f"{cls._base_url}/v2/aggs/ticker/{polygon_ticker}"
             f"/range/1/{timespan}/{from_date}/{to_date}"
         )
         params = {
@@ -361,7 +386,7 @@ class PolygonDataService:
 
         # Build URL for daily data
         url = (
-            f"{POLYGON_BASE_URL}/v2/aggs/ticker/{polygon_ticker}"
+            f"{cls._base_url}/v2/aggs/ticker/{polygon_ticker}"
             f"/range/1/day/{from_date}/{to_date}"
         )
         params = {
@@ -502,6 +527,247 @@ class PolygonDataService:
         )
         return results
 
+    @classmethod
+    def fetch_grouped_daily(cls, date: str) -> "pd.DataFrame":
+        """
+        Fetch one day's bars for every US stock in a single request.
+
+        Uses the grouped-daily endpoint
+        (/v2/aggs/grouped/locale/us/market/stocks/{date}).
+
+        Args:
+            date: Trading date (YYYY-MM-DD)
+
+        Returns:
+            DataFrame with a Ticker column (Yahoo format) and OHLCV columns,
+            indexed by Date. Grouped bars are stamped at the session close,
+            so the index is reset to the session's New York midnight (as UTC),
+            matching the per-ticker range endpoint's timestamps.
+            Empty if the market was closed or the day has no data yet.
+
+        Raises:
+            ValueError: If API key not configured or the API returns an error
+            RuntimeError: If API request fails after retries
+        """
+        import pandas as pd
+        import requests  # For exception types
+
+        from app.utils.market_hours import NYSE_TZ
+
+        api_key = cls._load_api_key()
+        if not api_key or api_key == "your_api_key_here":
+            raise ValueError(
+                "POLYGON_API_KEY not found or not configured. "
+                "Please create a .env file with POLYGON_API_KEY=your_key"
+            )
+
+        url = f"{cls._base_url}/v2/aggs/grouped/locale/us/market/stocks/{date}"
+        params = {
+            "adjusted": "true",
+            "apiKey": api_key,
+        }
+
+        # Rate limiting
+        cls._wait_for_rate_limit()
+
+        # Make request with retry logic
+        max_retries = 3
+        session = cls._get_session()
+        for attempt in range(max_retries):
+            try:
+                response = session.get(url, params=params, timeout=60)
+                response.raise_for_status()
+                data = response.json()
+
+                # Check for API errors
+                if data.get("status") == "ERROR":
+                    error_msg = data.get("error", "Unknown API error")
+                    raise ValueError(f"Polygon API error: {error_msg}")
+
+                break
+            except requests.RequestException as e:
+                if attempt == max_retries - 1:
+                    raise RuntimeError(
+                        f"Polygon API request failed after {max_retries} attempts: {e}"
+                    )
+                wait = 2**attempt
+                print(f"Polygon request failed, retrying in {wait}s... ({e})")
+                time.sleep(wait)
+
+        results = data.get("results") or []
+        if not results:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(results)
+        df = df.rename(
+            columns={
+                "T": "Ticker",
+                "o": "Open",
+                "h": "High",
+                "l": "Low",
+                "c": "Close",
+                "v": "Volume",
+                "t": "timestamp",
+            }
+        )
+        df["Ticker"] = df["Ticker"].map(cls._to_yahoo_ticker)
+
+        # Range bars are stamped at New York midnight of the session (t in UTC);
+        # grouped bars at the session close. Re-stamp to the range convention.
+        session_start = (
+            pd.Timestamp(date).tz_localize(NYSE_TZ).tz_convert("UTC").tz_localize(None)
+        )
+        df["Date"] = session_start
+        df.set_index("Date", inplace=True)
+
+        standard_cols = ["Ticker", "Open", "High", "Low", "Close", "Volume"]
+        return df[[c for c in standard_cols if c in df.columns]]
+
+    @classmethod
+    def fetch_batch_incremental(
+        cls,
+        date_ranges: dict[str, tuple[str, str]],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> dict[str, "pd.DataFrame"]:
+        """
+        Fetch incremental updates for many tickers via grouped-daily bars.
+
+        Drop-in replacement for fetch_batch_date_range when most tickers are
+        only a few days stale: instead of one range request per ticker, each
+        missing trading day is fetched once for the whole US market and the
+        bars are sliced out per ticker. Falls back to per-ticker range
+        requests (fetch_batch_date_range) for:
+        - crypto and index tickers (not in the stocks grouped response)
+        - tickers stale for more than POLYGON_GROUPED_MAX_DAYS trading days
+        - days needed by fewer than POLYGON_GROUPED_MIN_TICKERS tickers
+        - tickers absent from every grouped response, or needing a day whose
+          grouped request failed
+
+        Args:
+            date_ranges: Dict mapping ticker -> (from_date, to_date)
+            progress_callback: Optional callback(completed, total, current)
+
+        Returns:
+            Dict mapping ticker -> DataFrame with new data (OHLCV)
+        """
+        import numpy as np
+        import pandas as pd
+
+        from app.utils.market_hours import is_nyse_trading_day
+
+        if not date_ranges:
+            return {}
+
+        # Trading days each ticker is missing (most tickers share one range)
+        needed_days: dict[str, list[str]] = {}
+        fallback: list[str] = []
+        range_days: dict[tuple[str, str], list[str]] = {}
+        for ticker, (from_date, to_date) in date_ranges.items():
+            if not from_date or not to_date:
+                continue
+            polygon_ticker = cls._convert_ticker(ticker)
+            if polygon_ticker.startswith(("X:", "I:")):
+                fallback.append(ticker)
+                continue
+            days = range_days.get((from_date, to_date))
+            if days is None:
+                days = [
+                    d.strftime("%Y-%m-%d")
+                    for d in pd.date_range(from_date, to_date, freq="D")
+                    if is_nyse_trading_day(d.date())
+                ]
+                range_days[(from_date, to_date)] = days
+            if len(days) > POLYGON_GROUPED_MAX_DAYS:
+                fallback.append(ticker)
+            elif days:
+                needed_days[ticker] = days
+
+        # Only use grouped requests for days shared by enough tickers
+        day_counts: dict[str, int] = {}
+        for days in needed_days.values():
+            for day in days:
+                day_counts[day] = day_counts.get(day, 0) + 1
+        grouped_days = sorted(
+            day for day, count in day_counts.items()
+            if count >= POLYGON_GROUPED_MIN_TICKERS
+        )
+        grouped_set = set(grouped_days)
+        for ticker in list(needed_days):
+            if not grouped_set.issuperset(needed_days[ticker]):
+                fallback.append(ticker)
+                del needed_days[ticker]
+
+        print(
+            f"[Polygon Grouped] {len(needed_days)} tickers via {len(grouped_days)} "
+            f"grouped requests, {len(fallback)} via per-ticker requests"
+        )
+
+        # Fetch grouped days in parallel (a handful of large responses)
+        day_frames: dict[str, pd.DataFrame] = {}
+        failed_days: set[str] = set()
+        if grouped_days:
+            with ThreadPoolExecutor(max_workers=min(8, len(grouped_days))) as executor:
+                futures = {
+                    executor.submit(cls.fetch_grouped_daily, day): day
+                    for day in grouped_days
+                }
+                for completed_count, future in enumerate(as_completed(futures), 1):
+                    day = futures[future]
+                    try:
+                        day_frames[day] = future.result()
+                    except Exception as e:
+                        print(f"  grouped {day}: FAILED ({e})")
+                        failed_days.add(day)
+                    if progress_callback:
+                        progress_callback(completed_count, len(grouped_days), day)
+
+        results: dict[str, pd.DataFrame] = {}
+        seen: set[str] = set()
+        frames = [df for df in day_frames.values() if not df.empty]
+        if frames and needed_days:
+            bars = pd.concat(frames)
+            seen = set(bars["Ticker"].unique())
+            bars = bars[bars["Ticker"].isin(needed_days.keys())]
+
+            # Keep each ticker's own requested range (vectorized), then split
+            # the ticker-sorted frame at group boundaries
+            dates = bars.index.normalize()
+            from_dates = pd.to_datetime(bars["Ticker"].map(lambda t: date_ranges[t][0]))
+            to_dates = pd.to_datetime(bars["Ticker"].map(lambda t: date_ranges[t][1]))
+            in_range = (dates >= from_dates.to_numpy()) & (dates <= to_dates.to_numpy())
+            bars = bars[in_range]
+            bars = bars.iloc[np.lexsort((bars.index.to_numpy(), bars["Ticker"].to_numpy()))]
+
+            ohlcv = [c for c in bars.columns if c != "Ticker"]
+            symbols = bars["Ticker"].to_numpy()
+            bounds = np.concatenate(
+                [[0], np.flatnonzero(symbols[1:] != symbols[:-1]) + 1, [len(symbols)]]
+            )
+            values = bars[ohlcv]
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                if stop > start:
+                    results[symbols[start]] = values.iloc[start:stop]
+
+        # Days with an empty response (holiday, not yet closed) have no data
+        # for anyone; only symbols missing from a populated day fall back.
+        populated_days = {day for day, df in day_frames.items() if not df.empty}
+        for ticker, days in needed_days.items():
+            if failed_days.intersection(days) or (
+                ticker not in seen and populated_days.intersection(days)
+            ):
+                fallback.append(ticker)
+
+        if fallback:
+            fallback_results = cls.fetch_batch_date_range(
+                fallback,
+                {t: date_ranges[t] for t in fallback},
+                progress_callback,
+            )
+            results.update(fallback_results)
+
+        print(f"[Polygon Grouped] Complete: {len(results)} tickers with updates")
+        return results
+
     @classmethod
     def fetch_batch_full_history(
         cls,
@@ -584,7 +850,7 @@ class PolygonDataService:
 
             # Build URL for daily data
             url = (
-                f"{POLYGON_BASE_URL}/v2/aggs/ticker/{polygon_ticker}"
+                f"{cls._base_url}/v2/aggs/ticker/{polygon_ticker}"
                 f"/range/1/day/{from_date}/{to_date}"
             )
             params = {
@@ -727,7 +993,7 @@ class PolygonDataService:
         cls._wait_for_rate_limit()
 
         # Fetch stock snapshot
-        url = f"{POLYGON_BASE_URL}/v2/snapshot/locale/us/markets/stocks/tickers/{polygon_ticker}"
+        url = f"{cls._base_url}/v2/snapshot/locale/us/markets/stocks/tickers/{polygon_ticker}"
         params = {"apiKey": api_key}
 
         try:
@@ -7,7 +7,6 @@ to provide computed properties like holdings.
 
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from app.ui.modules.portfolio_construction.services.portfolio_persistence import (
@@ -96,9 +95,6 @@ class PortfolioDataService:
     All methods return immutable dataclasses.
     """
 
-    # Portfolios directory (same as PortfolioPersistence)
-    _PORTFOLIOS_DIR = Path.home() / ".quant_terminal" / "portfolios"
-
     @classmethod
     def list_portfolios(cls) -> List[str]:
         """
@@ -245,7 +241,8 @@ class PortfolioDataService:
         """
         Get the last modified timestamp for a portfolio.
 
-        Useful for cache invalidation.
+        Covers the portfolio's manifest, snapshot and journal. Useful for
+        cache invalidation.
 
         Args:
             name: Portfolio name
@@ -253,11 +250,4 @@ class PortfolioDataService:
         Returns:
             datetime of last modification, or None if not found
         """
-        path = cls._PORTFOLIOS_DIR / f"{name}.json"
-        if not path.exists():
-            return None
-
-        try:
-            return datetime.fromtimestamp(path.stat().st_mtime)
-        except OSError:
-            return None
+        return PortfolioPersistence.get_modified_time(name)
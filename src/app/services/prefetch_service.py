@@ -0,0 +1,317 @@
+"""
+Prefetch Service - warm-starts the memory cache with likely-needed tickers.
+
+At startup and after idle periods, loads the user's recent chart tickers,
+holdings of recently used portfolios and configured benchmark ETFs from
+parquet into the shared memory cache (bounded by PREFETCH_MAX_MB), then
+refreshes stale ones over the network at low priority. Switching between
+frequently watched tickers then hits memory instead of disk or network.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QCursor, QGuiApplication
+
+from app.core.config import (
+    PREFETCH_ENABLED,
+    PREFETCH_IDLE_SECONDS,
+    PREFETCH_MAX_MB,
+    PREFETCH_MAX_PORTFOLIOS,
+    PREFETCH_MAX_WORKERS,
+    PREFETCH_RECENT_TICKERS,
+    PREFETCH_STARTUP_DELAY_MS,
+)
+
+
+class PrefetchService:
+    """
+    Background cache warming for recently used tickers.
+
+    Only one run is active at a time. Disk warming is budgeted by
+    PREFETCH_MAX_MB (and never exceeds the free memory cache budget, so it
+    cannot evict data the user is working with); network refreshes run in
+    small batches with PREFETCH_MAX_WORKERS workers and stop on cancel().
+    """
+
+    # Recently viewed chart tickers, most recent first
+    _RECENT_PATH = Path.home() / ".quant_terminal" / "recent_chart_tickers.json"
+    _recent: Optional[List[str]] = None
+    _recent_lock = threading.Lock()
+
+    # Module settings files that name benchmark ETFs
+    _SETTINGS_DIR = Path.home() / ".quant_terminal"
+
+    # Tickers per network refresh batch (cancellation is checked between)
+    _REFRESH_BATCH = 25
+
+    _thread: Optional[threading.Thread] = None
+    _cancel_event = threading.Event()
+    _run_lock = threading.Lock()
+    _last_run: float = 0.0
+
+    # ------------------------------------------------------------------
+    # Recent chart tickers
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def record_chart_ticker(cls, ticker: str) -> None:
+        """
+        Record a ticker viewed in the chart module (moves it to the front).
+
+        Args:
+            ticker: Ticker symbol (equations should not be recorded)
+        """
+        ticker = (ticker or "").strip().upper()
+        if not ticker:
+            return
+
+        with cls._recent_lock:
+            recent = [t for t in cls._load_recent() if t != ticker]
+            recent.insert(0, ticker)
+            cls._recent = recent[:PREFETCH_RECENT_TICKERS]
+            try:
+                cls._RECENT_PATH.parent.mkdir(parents=True, exist_ok=True)
+                with open(cls._RECENT_PATH, "w") as f:
+                    json.dump({"tickers": cls._recent}, f, indent=2)
+            except IOError as e:
+                print(f"[Prefetch] Error saving recent tickers: {e}")
+
+    @classmethod
+    def get_recent_chart_tickers(cls) -> List[str]:
+        """Get recently viewed chart tickers, most recent first."""
+        with cls._recent_lock:
+            return list(cls._load_recent())
+
+    @classmethod
+    def _load_recent(cls) -> List[str]:
+        """Load the recent ticker list from disk once (lock must be held)."""
+        if cls._recent is None:
+            cls._recent = []
+            if cls._RECENT_PATH.exists():
+                try:
+                    with open(cls._RECENT_PATH, "r") as f:
+                        cls._recent = list(json.load(f).get("tickers", []))
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"[Prefetch] Error loading recent tickers: {e}")
+        return cls._recent
+
+    # ------------------------------------------------------------------
+    # Ticker selection
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def collect_tickers(cls) -> List[str]:
+        """
+        Get tickers to prefetch, highest priority first.
+
+        Order: recent chart tickers, holdings of the most recently used
+        portfolios, then benchmark ETFs from module settings.
+
+        Returns:
+            Unique uppercase ticker symbols
+        """
+        tickers = list(cls.get_recent_chart_tickers())
+
+        try:
+            from app.services.portfolio_data_service import PortfolioDataService
+
+            for name in PortfolioDataService.list_portfolios_by_recent()[:PREFETCH_MAX_PORTFOLIOS]:
+                tickers.extend(PortfolioDataService.get_tickers(name))
+        except Exception as e:
+            print(f"[Prefetch] Could not read portfolios: {e}")
+
+        tickers.extend(cls._configured_benchmarks())
+
+        return list(dict.fromkeys(
+            t.strip().upper() for t in tickers if t and t.strip() and t != "FREE CASH"
+        ))
+
+    @classmethod
+    def _configured_benchmarks(cls) -> List[str]:
+        """Benchmark ETFs named in the risk analytics and Monte Carlo settings."""
+        benchmarks = []
+        sources = [
+            ("risk_analytics_settings.json", "default_benchmark", "SPY"),
+            ("monte_carlo_settings.json", "benchmark", ""),
+        ]
+        for filename, key, default in sources:
+            value = default
+            path = cls._SETTINGS_DIR / filename
+            if path.exists():
+                try:
+                    with open(path, "r") as f:
+                        settings = json.load(f)
+                    if settings.get("benchmark_is_portfolio"):
+                        continue
+                    value = settings.get(key, default)
+                except (json.JSONDecodeError, IOError):
+                    pass
+            if isinstance(value, str) and value.strip():
+                benchmarks.append(value)
+        return benchmarks
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def start(cls, refresh: bool = True) -> bool:
+        """
+        Start a prefetch run in the background.
+
+        Args:
+            refresh: Also refresh stale tickers over the network
+
+        Returns:
+            True if a run was started, False if one is already running
+        """
+        with cls._run_lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return False
+            cls._cancel_event.clear()
+            cls._last_run = time.monotonic()
+            cls._thread = threading.Thread(
+                target=cls._run, args=(refresh,), name="prefetch", daemon=True
+            )
+            cls._thread.start()
+            return True
+
+    @classmethod
+    def cancel(cls) -> None:
+        """Stop the current run after its current batch."""
+        cls._cancel_event.set()
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._thread is not None and cls._thread.is_alive()
+
+    @classmethod
+    def seconds_since_last_run(cls) -> float:
+        """Seconds since the last run started (inf if never run)."""
+        if not cls._last_run:
+            return float("inf")
+        return time.monotonic() - cls._last_run
+
+    @classmethod
+    def _run(cls, refresh: bool) -> None:
+        from app.services.market_data import get_memory_cache_stats, warm_memory_cache
+
+        try:
+            started = time.perf_counter()
+            tickers = cls.collect_tickers()
+            if not tickers:
+                return
+
+            # Never push the shared cache over budget (that would evict data
+            # the user is working with)
+            stats = get_memory_cache_stats()
+            free_bytes = max(0, stats["max_bytes"] - stats["bytes"])
+            budget = min(PREFETCH_MAX_MB * 1024 * 1024, free_bytes)
+
+            warm = warm_memory_cache(tickers, budget)
+            print(
+                f"[Prefetch] Warmed {len(warm['warmed'])} tickers from disk "
+                f"({warm['bytes'] / 1024 / 1024:.1f} MB, {len(warm['resident'])} already in memory) "
+                f"in {time.perf_counter() - started:.2f}s"
+            )
+
+            if refresh and warm["stale"] and not cls._cancel_event.is_set():
+                cls._refresh_stale(warm["stale"])
+        except Exception as e:
+            print(f"[Prefetch] Run failed: {e}")
+
+    @classmethod
+    def _refresh_stale(cls, stale: List[str]) -> None:
+        """
+        Bring stale tickers up to date over the network.
+
+        Chart tickers go through the chart's Yahoo path (one at a time);
+        holdings and benchmarks go through the Polygon-first batch path in
+        small batches with limited concurrency.
+        """
+        from app.services.market_data import (
+            fetch_price_history_batch_polygon_first,
+            fetch_price_history_yahoo,
+        )
+
+        recent = set(cls.get_recent_chart_tickers())
+        chart_tickers = [t for t in stale if t in recent]
+        other_tickers = [t for t in stale if t not in recent]
+
+        refreshed = 0
+        for ticker in chart_tickers:
+            if cls._cancel_event.is_set():
+                return
+            try:
+                fetch_price_history_yahoo(ticker, period="max", interval="1d")
+                refreshed += 1
+            except Exception as e:
+                print(f"[Prefetch] Refresh failed for {ticker}: {e}")
+
+        for start in range(0, len(other_tickers), cls._REFRESH_BATCH):
+            if cls._cancel_event.is_set():
+                return
+            batch = other_tickers[start:start + cls._REFRESH_BATCH]
+            try:
+                results = fetch_price_history_batch_polygon_first(
+                    batch, max_workers=PREFETCH_MAX_WORKERS
+                )
+                refreshed += len(results)
+            except Exception as e:
+                print(f"[Prefetch] Batch refresh failed: {e}")
+
+        print(f"[Prefetch] Refreshed {refreshed}/{len(stale)} stale tickers")
+
+
+class PrefetchScheduler(QObject):
+    """
+    Triggers prefetch runs at startup and after idle periods.
+
+    Idle means the mouse cursor has not moved, or the application has been
+    in the background, for PREFETCH_IDLE_SECONDS. Polling the cursor once a
+    minute avoids an application-wide event filter on the GUI thread.
+    """
+
+    _CHECK_INTERVAL_MS = 60_000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_cursor = None
+        self._idle_since = time.monotonic()
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._check_idle)
+
+    def start(self) -> None:
+        """Schedule the startup run and begin idle checks."""
+        if not PREFETCH_ENABLED:
+            return
+        QTimer.singleShot(PREFETCH_STARTUP_DELAY_MS, lambda: PrefetchService.start())
+        self._timer.start(self._CHECK_INTERVAL_MS)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        PrefetchService.cancel()
+
+    def _check_idle(self) -> None:
+        now = time.monotonic()
+        cursor = QCursor.pos()
+        inactive = QGuiApplication.applicationState() != Qt.ApplicationActive
+
+        if cursor != self._last_cursor and not inactive:
+            self._last_cursor = cursor
+            self._idle_since = now
+            return
+
+        if (
+            now - self._idle_since >= PREFETCH_IDLE_SECONDS
+            and PrefetchService.seconds_since_last_run() >= PREFETCH_IDLE_SECONDS
+        ):
+            PrefetchService.start()
@@ -0,0 +1,200 @@
+"""
+Price lookup - vectorized as-of closes for (ticker, date) pairs.
+
+Scanning a price DataFrame with df.index[df.index <= date] per lookup is
+O(history) each time. CloseArrays keeps a ticker's daily dates and closes
+as sorted NumPy arrays (cached next to the daily data), so any number of
+dates resolve with one np.searchsorted call per ticker.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
+
+from app.services.memory_cache import get_memory_cache
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+# Daily close arrays; key: ticker (uppercase)
+_ARRAYS_NAMESPACE = "close_arrays"
+_memory_cache = get_memory_cache()
+
+
+class CloseArrays:
+    """Sorted daily dates (datetime64[ns]) and closes (float64) of one ticker."""
+
+    __slots__ = ("dates", "closes", "signature")
+
+    def __init__(self, dates: "np.ndarray", closes: "np.ndarray", signature: Tuple):
+        self.dates = dates
+        self.closes = closes
+        self.signature = signature
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.closes.nbytes
+
+    @staticmethod
+    def signature_of(df: "pd.DataFrame") -> Tuple:
+        """O(1) fingerprint of a daily DataFrame (changes on backfill/append/update)."""
+        return (len(df), df.index[0], df.index[-1], df["Close"].iloc[-1])
+
+    @classmethod
+    def from_frame(cls, df: "pd.DataFrame") -> "CloseArrays":
+        import numpy as np
+
+        dates = df.index.values.astype("datetime64[ns]")
+        closes = df["Close"].to_numpy(dtype=np.float64)
+        if len(dates) > 1 and not (dates[1:] > dates[:-1]).all():
+            order = np.argsort(dates, kind="stable")
+            dates, closes = dates[order], closes[order]
+        return cls(dates, closes, cls.signature_of(df))
+
+
+@dataclass
+class AsOfResult:
+    """
+    As-of lookup results, aligned with the input pairs.
+
+    Attributes:
+        close: Close on the date or the last trading day before it
+            (NaN if there is none)
+        exact: Whether the ticker has a bar on the date itself
+        first_date: Ticker's first available date (NaT if no data)
+        last_date: Ticker's last available date (NaT if no data)
+    """
+
+    close: "np.ndarray"
+    exact: "np.ndarray"
+    first_date: "np.ndarray"
+    last_date: "np.ndarray"
+
+
+def get_close_arrays(ticker: str) -> Optional[CloseArrays]:
+    """
+    Get a ticker's daily close arrays, rebuilding them if the daily data changed.
+
+    Args:
+        ticker: Ticker symbol
+
+    Returns:
+        CloseArrays, or None if no price history is available
+    """
+    from app.services.market_data import fetch_price_history
+
+    ticker = ticker.strip().upper()
+    # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
+    df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
+    if df is None or df.empty:
+        return None
+
+    arrays = _memory_cache.get(_ARRAYS_NAMESPACE, ticker)
+    if arrays is None or arrays.signature != CloseArrays.signature_of(df):
+        arrays = CloseArrays.from_frame(df)
+        _memory_cache.put(_ARRAYS_NAMESPACE, ticker, arrays)
+    return arrays
+
+
+def lookup_closes_asof(
+    tickers: Sequence[str],
+    dates: Sequence,
+    max_workers: int = 10,
+) -> AsOfResult:
+    """
+    Resolve closes for (ticker, date) pairs in one vectorized pass.
+
+    Each distinct ticker's history is fetched once (in parallel); all of its
+    dates are then located with a single np.searchsorted.
+
+    Args:
+        tickers: Ticker symbol per pair
+        dates: Date per pair (ISO strings, datetimes or datetime64)
+        max_workers: Parallel history fetches
+
+    Returns:
+        AsOfResult aligned with the input pairs. Pairs with an unparseable
+        date or a ticker without data get NaN/False/NaT.
+    """
+    import numpy as np
+    import pandas as pd
+
+    tickers = np.asarray([str(t).strip().upper() for t in tickers], dtype=object)
+    targets = pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce").to_numpy(
+        dtype="datetime64[ns]"
+    )
+    if len(tickers) != len(targets):
+        raise ValueError("tickers and dates must have the same length")
+
+    n = len(tickers)
+    result = AsOfResult(
+        close=np.full(n, np.nan),
+        exact=np.zeros(n, dtype=bool),
+        first_date=np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]"),
+        last_date=np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]"),
+    )
+    if n == 0:
+        return result
+
+    unique_tickers, inverse = np.unique(tickers, return_inverse=True)
+
+    def fetch(ticker: str) -> Optional[CloseArrays]:
+        try:
+            return get_close_arrays(ticker)
+        except Exception as e:
+            print(f"Error fetching historical prices for {ticker}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_tickers)))) as executor:
+        arrays_by_ticker = list(executor.map(fetch, unique_tickers))
+
+    # Group pair positions by ticker: one contiguous slice of `order` per ticker
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(len(unique_tickers) + 1))
+
+    for i, arrays in enumerate(arrays_by_ticker):
+        if arrays is None:
+            continue
+        rows = order[bounds[i]:bounds[i + 1]]
+        target = targets[rows]
+
+        # Last bar on or before each date
+        pos = np.searchsorted(arrays.dates, target, side="right") - 1
+        found = (pos >= 0) & ~np.isnat(target)
+        safe = np.where(found, pos, 0)
+
+        result.close[rows] = np.where(found, arrays.closes[safe], np.nan)
+        result.exact[rows] = found & (arrays.dates[safe] == target)
+        result.first_date[rows] = arrays.dates[0]
+        result.last_date[rows] = arrays.dates[-1]
+
+    return result
+
+
+def lookup_close_map(
+    ticker_dates: Sequence[Tuple[str, str]],
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    As-of closes for (ticker, date_str) pairs as a nested dict.
+
+    Args:
+        ticker_dates: List of (ticker, date_str) tuples
+
+    Returns:
+        Dict of ticker -> {date_str -> close or None}, keyed by the tickers
+        and date strings as given
+    """
+    results: Dict[str, Dict[str, Optional[float]]] = {}
+    if not ticker_dates:
+        return results
+
+    tickers, dates = zip(*ticker_dates)
+    closes = lookup_closes_asof(tickers, dates).close
+    for ticker, date_str, close in zip(tickers, dates, closes.tolist()):
+        results.setdefault(ticker, {})[date_str] = None if math.isnan(close) else close
+    return results
@@ -0,0 +1,209 @@
+"""Quote Store - Latest close/live price per ticker, persisted next to the price cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class Quote:
+    """
+    Latest known prices of one ticker.
+
+    Attributes:
+        close: Close of the last cached daily bar
+        prev_close: Close of the bar before it
+        date: Date of the last cached daily bar (YYYY-MM-DD)
+        price: Most recent price (live price, or close if none arrived since)
+        timestamp: When price was recorded (epoch seconds)
+        source: Where price came from ("bars" or "live")
+    """
+
+    close: Optional[float] = None
+    prev_close: Optional[float] = None
+    date: Optional[str] = None
+    price: Optional[float] = None
+    timestamp: float = 0.0
+    source: str = "bars"
+
+    def session_close(self, today: str) -> Optional[float]:
+        """
+        Close of the last completed session before today.
+
+        Args:
+            today: Today's date (YYYY-MM-DD)
+
+        Returns:
+            The last bar's close, or the one before it if the last bar is today's
+        """
+        if self.date is not None and self.date >= today:
+            return self.prev_close
+        return self.close
+
+
+class QuoteStore:
+    """
+    Persistent ticker -> Quote table.
+
+    Updated whenever daily bars are written to the price cache and whenever
+    live prices arrive, so "latest price" reads never deserialize OHLCV
+    history. Stored as one small JSON file in the cache directory.
+
+    Thread-safe for concurrent read/write operations.
+    """
+
+    _STORE_FILE = Path.home() / ".quant_terminal" / "cache" / "quotes.json"
+    _lock = threading.RLock()
+    _quotes: Optional[Dict[str, Quote]] = None
+
+    @classmethod
+    def _load(cls) -> Dict[str, Quote]:
+        """Load quotes from disk (lazy loading, called once per session)."""
+        if cls._quotes is not None:
+            return cls._quotes
+
+        with cls._lock:
+            if cls._quotes is not None:
+                return cls._quotes
+
+            quotes: Dict[str, Quote] = {}
+            if cls._STORE_FILE.exists():
+                try:
+                    with open(cls._STORE_FILE, "r", encoding="utf-8") as f:
+                        for ticker, fields in json.load(f).items():
+                            quotes[ticker] = Quote(**fields)
+                except (json.JSONDecodeError, IOError, TypeError) as e:
+                    print(f"Warning: Could not load quote store: {e}")
+                    quotes = {}
+
+            cls._quotes = quotes
+            return cls._quotes
+
+    @classmethod
+    def _save(cls) -> None:
+        """Persist quotes atomically (caller holds _lock)."""
+        if cls._quotes is None:
+            return
+
+        cls._STORE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cls._STORE_FILE.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {ticker: asdict(q) for ticker, q in cls._quotes.items()},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, cls._STORE_FILE)
+        except IOError as e:
+            print(f"Warning: Could not save quote store: {e}")
+
+    @classmethod
+    def get_quotes(cls, tickers: Iterable[str]) -> Dict[str, Quote]:
+        """
+        Get stored quotes for many tickers.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Dict mapping ticker (as given) -> Quote, for tickers with a quote
+        """
+        quotes = cls._load()
+        result = {}
+        for ticker in tickers:
+            quote = quotes.get(ticker.strip().upper())
+            if quote is not None:
+                result[ticker] = quote
+        return result
+
+    @classmethod
+    def get_quote(cls, ticker: str) -> Optional[Quote]:
+        """Get the stored quote for a ticker, or None."""
+        return cls._load().get(ticker.strip().upper())
+
+    @classmethod
+    def record_bars(cls, frames: Dict[str, "pd.DataFrame"]) -> None:
+        """
+        Record the last two daily closes of newly cached bars.
+
+        A live price newer than the last bar is kept.
+
+        Args:
+            frames: Dict mapping ticker -> daily OHLCV DataFrame
+        """
+        now = time.time()
+        with cls._lock:
+            quotes = cls._load()
+            for ticker, df in frames.items():
+                if df is None or df.empty or "Close" not in df.columns:
+                    continue
+                closes = df["Close"].dropna()
+                if closes.empty:
+                    continue
+
+                ticker = ticker.strip().upper()
+                close = float(closes.iloc[-1])
+                prev_close = float(closes.iloc[-2]) if len(closes) > 1 else None
+                date = closes.index[-1].strftime("%Y-%m-%d")
+
+                old = quotes.get(ticker)
+                if (
+                    old is not None
+                    and old.source == "live"
+                    and datetime.fromtimestamp(old.timestamp).strftime("%Y-%m-%d") > date
+                ):
+                    # Live price is from a later session than these bars
+                    quotes[ticker] = replace(old, close=close, prev_close=prev_close, date=date)
+                else:
+                    quotes[ticker] = Quote(close, prev_close, date, close, now, "bars")
+            cls._save()
+
+    @classmethod
+    def record_live(cls, prices: Dict[str, float]) -> None:
+        """
+        Record live prices.
+
+        Args:
+            prices: Dict mapping ticker -> latest price
+        """
+        if not prices:
+            return
+
+        now = time.time()
+        with cls._lock:
+            quotes = cls._load()
+            for ticker, price in prices.items():
+                if price is None:
+                    continue
+                ticker = ticker.strip().upper()
+                old = quotes.get(ticker) or Quote()
+                quotes[ticker] = replace(old, price=float(price), timestamp=now, source="live")
+            cls._save()
+
+    @classmethod
+    def remove(cls, ticker: Optional[str] = None) -> None:
+        """
+        Drop the quote for a ticker, or all quotes.
+
+        Args:
+            ticker: Ticker symbol, or None to clear the store
+        """
+        with cls._lock:
+            quotes = cls._load()
+            if ticker:
+                if quotes.pop(ticker.strip().upper(), None) is None:
+                    return
+            else:
+                quotes.clear()
+            cls._save()
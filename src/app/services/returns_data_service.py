@@ -7,14 +7,20 @@ for analysis modules like Risk Analysis, Monte Carlo, and Return Distributions.
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
 
 from app.services.market_data import fetch_price_history
+from app.services.memory_cache import get_memory_cache
 from app.services.portfolio_data_service import PortfolioDataService
+from app.utils.return_kernels import (
+    drawdown_episodes,
+    rolling_compound_returns,
+    time_under_water,
+)
 
 
 class ReturnsDataService:
@@ -31,9 +37,23 @@ class ReturnsDataService:
     _CACHE_DIR = Path.home() / ".quant_terminal" / "cache" / "returns"
     _cache_lock = threading.Lock()
 
-    # In-memory cache for session performance
-    _memory_cache: Dict[str, Any] = {}
-    _memory_cache_timestamps: Dict[str, datetime] = {}
+    # In-memory cache for session performance (shared byte-budgeted LRU)
+    _MEMORY_NAMESPACE = "returns"
+
+    # Memoized position history per (portfolio, include_cash):
+    # {"mtime": datetime, "deltas": DataFrame, "positions": DataFrame}
+    _position_memo: Dict[Tuple[str, bool], Dict[str, Any]] = {}
+    # Memo keys whose portfolio was saved since -> earliest affected date
+    # (None = unknown, diff the deltas)
+    _position_dirty: Dict[Tuple[str, bool], Optional[str]] = {}
+    _position_lock = threading.Lock()
+
+    # Derived analytics (weights, portfolio returns, drawdowns) live in the
+    # shared LRU keyed by (portfolio, mtime, day, *params); per-key locks stop
+    # concurrent callers from computing the same full-range series twice
+    _ANALYTICS_NAMESPACE = "analytics"
+    _analytics_lock = threading.Lock()
+    _analytics_key_locks: Dict[Tuple, Any] = {}
 
     @classmethod
     def _ensure_cache_dir(cls) -> None:
@@ -101,9 +121,10 @@ class ReturnsDataService:
 
         with cls._cache_lock:
             # Check memory cache first
-            if portfolio_name in cls._memory_cache:
+            memory_cache = get_memory_cache()
+            df = memory_cache.get(cls._MEMORY_NAMESPACE, portfolio_name)
+            if df is not None:
                 if cls._is_cache_valid(portfolio_name):
-                    df = cls._memory_cache[portfolio_name]
                     return cls._filter_date_range(df, start_date, end_date)
 
             # Check disk cache
@@ -111,7 +132,7 @@ class ReturnsDataService:
                 cache_path = cls._get_cache_path(portfolio_name)
                 try:
                     df = pd.read_parquet(cache_path)
-                    cls._memory_cache[portfolio_name] = df
+                    memory_cache.put(cls._MEMORY_NAMESPACE, portfolio_name, df)
                     return cls._filter_date_range(df, start_date, end_date)
                 except Exception:
                     pass  # Cache corrupted, will recompute
@@ -129,7 +150,7 @@ class ReturnsDataService:
                 print(f"Warning: Could not cache returns for {portfolio_name}: {e}")
 
             # Cache in memory
-            cls._memory_cache[portfolio_name] = df
+            memory_cache.put(cls._MEMORY_NAMESPACE, portfolio_name, df)
 
             return cls._filter_date_range(df, start_date, end_date)
 
@@ -208,6 +229,66 @@ class ReturnsDataService:
 
         return result
 
+    @classmethod
+    def _memoized(
+        cls,
+        portfolio_name: str,
+        params: Tuple,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return a memoized analytics result, computing it on first request.
+
+        The key includes the portfolio file mtime and today's date, so saving
+        the portfolio or rolling over to a new day naturally misses. Callers
+        receive a copy and may mutate it freely.
+
+        Args:
+            portfolio_name: Name of the portfolio
+            params: Call parameters identifying the result
+            compute: Zero-argument function producing the result
+
+        Returns:
+            Copy of the cached Series/DataFrame
+        """
+        key = (
+            portfolio_name,
+            PortfolioDataService.get_portfolio_modified_time(portfolio_name),
+            datetime.now().date(),
+        ) + params
+        cache = get_memory_cache()
+
+        with cls._analytics_lock:
+            key_lock = cls._analytics_key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                value = cache.get(cls._ANALYTICS_NAMESPACE, key)
+                if value is None:
+                    value = compute()
+                    cache.put(cls._ANALYTICS_NAMESPACE, key, value)
+        finally:
+            with cls._analytics_lock:
+                # A later caller may have installed a fresh lock for this key
+                if cls._analytics_key_locks.get(key) is key_lock:
+                    del cls._analytics_key_locks[key]
+
+        return value.copy()
+
+    @classmethod
+    def _is_full_range_window(cls, end_date: Optional[str]) -> bool:
+        """
+        Check whether a window can be served by slicing the full-range series.
+
+        Windows ending after today cannot: positions are carried forward to
+        the requested end date, which the cached series does not cover.
+        """
+        import pandas as pd
+
+        if not end_date:
+            return True
+        return pd.to_datetime(end_date) <= pd.Timestamp.now().normalize()
+
     @classmethod
     def get_portfolio_returns(
         cls,
@@ -286,7 +367,7 @@ class ReturnsDataService:
         return cumulative
 
     @classmethod
-    def invalidate_cache(cls, portfolio_name: str) -> None:
+    def invalidate_cache(cls, portfolio_name: str, since: Optional[str] = None) -> None:
         """
         Invalidate cache for a portfolio.
 
@@ -294,10 +375,27 @@ class ReturnsDataService:
 
         Args:
             portfolio_name: Name of the portfolio
-        """
+            since: Earliest transaction date (YYYY-MM-DD) the modification
+                affects, if known. Position history is then patched from that
+                date without diffing the full transaction deltas.
+        """
+        # Position history is patched from the first changed date on next access
+        with cls._position_lock:
+            for key in ((portfolio_name, True), (portfolio_name, False)):
+                if key in cls._position_dirty:
+                    pending = cls._position_dirty[key]
+                    since_key = None if pending is None or since is None else min(pending, since)
+                else:
+                    since_key = since
+                cls._position_dirty[key] = since_key
+
         with cls._cache_lock:
             # Clear memory cache
-            cls._memory_cache.pop(portfolio_name, None)
+            memory_cache = get_memory_cache()
+            memory_cache.pop(cls._MEMORY_NAMESPACE, portfolio_name)
+            for key in memory_cache.keys(cls._ANALYTICS_NAMESPACE):
+                if key[0] == portfolio_name:
+                    memory_cache.pop(cls._ANALYTICS_NAMESPACE, key)
 
             # Delete disk cache
             cache_path = cls._get_cache_path(portfolio_name)
@@ -310,8 +408,13 @@ class ReturnsDataService:
     @classmethod
     def invalidate_all_caches(cls) -> None:
         """Clear all cached returns."""
+        with cls._position_lock:
+            cls._position_memo.clear()
+            cls._position_dirty.clear()
+
         with cls._cache_lock:
-            cls._memory_cache.clear()
+            get_memory_cache().clear(cls._MEMORY_NAMESPACE)
+            get_memory_cache().clear(cls._ANALYTICS_NAMESPACE)
 
             if cls._CACHE_DIR.exists():
                 for cache_file in cls._CACHE_DIR.glob("*_returns.parquet"):
@@ -417,81 +520,156 @@ class ReturnsDataService:
         """
         import pandas as pd
 
-        transactions = PortfolioDataService.get_transactions(portfolio_name)
-        if not transactions:
-            return pd.DataFrame()
-
-        # Filter transactions by ticker inclusion
-        if not include_cash:
-            transactions = [t for t in transactions if t.ticker.upper() != "FREE CASH"]
+        # Determine end date for position history
+        if end_date:
+            last_date = pd.to_datetime(end_date)
+        else:
+            last_date = pd.Timestamp.now().normalize()
 
-        if not transactions:
+        positions = cls._get_memoized_positions(portfolio_name, include_cash, last_date)
+        if positions is None:
             return pd.DataFrame()
 
-        # Sort transactions by date and sequence
-        transactions = sorted(transactions, key=lambda t: (t.date, t.sequence))
+        positions = positions.loc[:last_date]
 
-        # Get all unique tickers
-        tickers = list(set(t.ticker for t in transactions))
+        # Apply start_date filter
+        if start_date:
+            positions = positions[positions.index >= pd.to_datetime(start_date)]
 
-        # Build position changes by date
-        # Dict of date -> Dict of ticker -> quantity change
-        position_changes: Dict[str, Dict[str, float]] = {}
+        return positions.copy()
 
-        for tx in transactions:
-            date = tx.date
-            ticker = tx.ticker
+    @classmethod
+    def _build_position_deltas(
+        cls, portfolio_name: str, include_cash: bool
+    ) -> "pd.DataFrame":
+        """
+        Net quantity change per (transaction date, ticker).
 
-            if date not in position_changes:
-                position_changes[date] = {}
+        Returns:
+            DataFrame indexed by transaction date (sorted) with one column per
+            ticker; Buy adds quantity and Sell subtracts it
+        """
+        import numpy as np
+        import pandas as pd
 
-            if ticker not in position_changes[date]:
-                position_changes[date][ticker] = 0.0
+        transactions = PortfolioDataService.get_transactions(portfolio_name)
 
-            # Buy increases position, Sell decreases
-            if tx.transaction_type == "Buy":
-                position_changes[date][ticker] += tx.quantity
-            else:  # Sell
-                position_changes[date][ticker] -= tx.quantity
+        # Filter transactions by ticker inclusion
+        if not include_cash:
+            transactions = [t for t in transactions if t.ticker.upper() != "FREE CASH"]
 
-        # Get date range
-        transaction_dates = sorted(position_changes.keys())
-        if not transaction_dates:
+        if not transactions:
             return pd.DataFrame()
 
-        first_tx_date = pd.to_datetime(transaction_dates[0])
+        signed = np.array([t.quantity for t in transactions], dtype=float)
+        signed[[t.transaction_type != "Buy" for t in transactions]] *= -1
 
-        # Determine end date for position history
-        if end_date:
-            last_date = pd.to_datetime(end_date)
-        else:
-            last_date = pd.Timestamp.now().normalize()
-
-        # Create date range (trading days approximation - all calendar days for simplicity)
-        all_dates = pd.date_range(start=first_tx_date, end=last_date, freq="D")
+        changes = pd.DataFrame({
+            "date": pd.to_datetime([t.date for t in transactions]),
+            "ticker": [t.ticker for t in transactions],
+            "quantity": signed,
+        })
+        deltas = changes.groupby(["date", "ticker"])["quantity"].sum().unstack(fill_value=0.0)
+        deltas.columns.name = None
+        return deltas
 
-        # Build cumulative positions
-        positions = pd.DataFrame(0.0, index=all_dates, columns=tickers)
+    @classmethod
+    def _get_memoized_positions(
+        cls,
+        portfolio_name: str,
+        include_cash: bool,
+        last_date: "pd.Timestamp",
+    ) -> Optional["pd.DataFrame"]:
+        """
+        Get position history from the first transaction through last_date.
 
-        current_position = {ticker: 0.0 for ticker in tickers}
+        Positions are a cumulative sum of per-day transaction deltas over a
+        calendar-day index. The result is memoized per portfolio; after a save
+        the new deltas are diffed against the memo and only rows from the
+        first changed date onward are recomputed. Requests beyond the memo's
+        end date extend it the same way.
 
-        for date in all_dates:
-            date_str = date.strftime("%Y-%m-%d")
+        Returns:
+            Position DataFrame (may extend past last_date), or None if the
+            portfolio has no transactions
+        """
+        import pandas as pd
 
-            # Apply any position changes for this date
-            if date_str in position_changes:
-                for ticker, change in position_changes[date_str].items():
-                    current_position[ticker] += change
+        key = (portfolio_name, include_cash)
+        mtime = PortfolioDataService.get_portfolio_modified_time(portfolio_name)
 
-            # Record position for this date
-            for ticker in tickers:
-                positions.loc[date, ticker] = current_position[ticker]
+        with cls._position_lock:
+            memo = cls._position_memo.get(key)
+            dirty = key in cls._position_dirty
+            dirty_since = cls._position_dirty.get(key)
 
-        # Apply start_date filter
-        if start_date:
-            positions = positions[positions.index >= pd.to_datetime(start_date)]
+            if memo is not None and not dirty and memo["mtime"] == mtime:
+                deltas = memo["deltas"]
+            else:
+                deltas = cls._build_position_deltas(portfolio_name, include_cash)
+
+            if deltas.empty:
+                cls._position_memo.pop(key, None)
+                cls._position_dirty.pop(key, None)
+                return None
+
+            first_date = deltas.index[0]
+            end = max(last_date, memo["positions"].index[-1]) if memo else last_date
+            if end < first_date:
+                # Requested window ends before the first transaction
+                return pd.DataFrame(0.0, index=pd.DatetimeIndex([]), columns=deltas.columns)
+
+            # Earliest date whose positions must be recomputed
+            recompute_from = first_date
+            base = None
+            if memo is not None and memo["positions"].index[0] == first_date:
+                old = memo["deltas"]
+                if dirty_since is not None:
+                    # Saved with a known earliest date: no need to diff
+                    changed_dates = pd.DatetimeIndex([max(pd.Timestamp(dirty_since), first_date)])
+                elif deltas is not old:
+                    union = old.index.union(deltas.index)
+                    cols = old.columns.union(deltas.columns)
+                    changed = (
+                        old.reindex(index=union, columns=cols, fill_value=0.0)
+                        .ne(deltas.reindex(index=union, columns=cols, fill_value=0.0))
+                        .any(axis=1)
+                    )
+                    changed_dates = union[changed.to_numpy()]
+                else:
+                    changed_dates = deltas.index[:0]
+
+                memo_end = memo["positions"].index[-1]
+                recompute_from = memo_end + pd.Timedelta(days=1)
+                if len(changed_dates):
+                    recompute_from = min(recompute_from, changed_dates[0])
+
+                if recompute_from > end:
+                    memo["mtime"] = mtime
+                    memo["deltas"] = deltas
+                    cls._position_dirty.pop(key, None)
+                    return memo["positions"]
+
+                if recompute_from > first_date:
+                    base = memo["positions"].loc[: recompute_from - pd.Timedelta(days=1)]
+                    base = base.reindex(columns=deltas.columns, fill_value=0.0)
+
+            # Scatter deltas onto the calendar-day index and cumulate
+            all_dates = pd.date_range(start=recompute_from, end=end, freq="D")
+            tail = deltas.reindex(all_dates, fill_value=0.0).cumsum()
+            if base is not None and not base.empty:
+                tail += base.iloc[-1]
+                positions = pd.concat([base, tail])
+            else:
+                positions = tail
 
-        return positions
+            cls._position_memo[key] = {
+                "mtime": mtime,
+                "deltas": deltas,
+                "positions": positions,
+            }
+            cls._position_dirty.pop(key, None)
+            return positions
 
     @classmethod
     def get_daily_weights(
@@ -519,6 +697,27 @@ class ReturnsDataService:
             - Columns: ticker symbols
             - Values: weights (0.0 to 1.0, summing to ~1.0 per row)
         """
+        if not cls._is_full_range_window(end_date):
+            return cls._compute_daily_weights(
+                portfolio_name, start_date, end_date, include_cash
+            )
+
+        weights = cls._memoized(
+            portfolio_name,
+            ("weights", include_cash),
+            lambda: cls._compute_daily_weights(portfolio_name, None, None, include_cash),
+        )
+        return cls._filter_date_range(weights, start_date, end_date)
+
+    @classmethod
+    def _compute_daily_weights(
+        cls,
+        portfolio_name: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        include_cash: bool,
+    ) -> "pd.DataFrame":
+        """Compute daily weights (uncached). See get_daily_weights."""
         import numpy as np
         import pandas as pd
 
@@ -604,6 +803,35 @@ class ReturnsDataService:
         Returns:
             Series of portfolio returns at the specified interval
         """
+        if not cls._is_full_range_window(end_date):
+            returns = cls._compute_time_varying_returns(
+                portfolio_name, start_date, end_date, include_cash
+            )
+        else:
+            daily = cls._memoized(
+                portfolio_name,
+                ("portfolio_returns", include_cash),
+                lambda: cls._compute_time_varying_returns(
+                    portfolio_name, None, None, include_cash
+                ),
+            )
+            returns = cls._filter_date_range(daily, start_date, end_date)
+
+        # Resample if needed
+        if interval.lower() != "daily":
+            returns = cls._resample_returns(returns, interval)
+
+        return returns
+
+    @classmethod
+    def _compute_time_varying_returns(
+        cls,
+        portfolio_name: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        include_cash: bool,
+    ) -> "pd.Series":
+        """Compute daily time-varying-weight returns (uncached)."""
         import pandas as pd
 
         # Get time-varying weights
@@ -666,10 +894,6 @@ class ReturnsDataService:
                 ticker_weights = weights[ticker]
                 portfolio_returns += ticker_weights * ticker_returns
 
-        # Resample if needed
-        if interval.lower() != "daily":
-            portfolio_returns = cls._resample_returns(portfolio_returns, interval)
-
         return portfolio_returns
 
     @classmethod
@@ -699,10 +923,7 @@ class ReturnsDataService:
             return returns
 
         # Geometric linking: (1 + r1) * (1 + r2) * ... - 1
-        def compound_returns(r):
-            return (1 + r).prod() - 1
-
-        return returns.resample(rule).apply(compound_returns)
+        return (1 + returns).resample(rule).prod() - 1
 
     @classmethod
     def calculate_cash_drag(
@@ -834,6 +1055,26 @@ class ReturnsDataService:
             "count": len(clean_returns),
         }
 
+    @classmethod
+    def get_drawdown_episodes(
+        cls, returns: Union["pd.Series", "pd.DataFrame"]
+    ) -> "pd.DataFrame":
+        """
+        List drawdown episodes for one returns series or a T x N returns matrix.
+
+        All columns are handled in a single vectorized pass, so a universe of
+        tickers can be ranked by worst depth or longest time under water with
+        e.g. ``episodes.groupby("ticker")["duration"].max()``.
+
+        Args:
+            returns: Series or DataFrame of returns (as decimals)
+
+        Returns:
+            DataFrame with columns ticker, start, trough, recovery (NaT if
+            still under water), depth and duration (periods under water)
+        """
+        return drawdown_episodes(returns)
+
     @classmethod
     def get_portfolio_volatility(
         cls,
@@ -934,24 +1175,32 @@ class ReturnsDataService:
         """
         import pandas as pd
 
-        # Get daily portfolio returns
-        returns = cls.get_time_varying_portfolio_returns(
-            portfolio_name, start_date, end_date, include_cash, interval="daily"
-        )
+        def compute() -> "pd.Series":
+            # Get daily portfolio returns
+            returns = cls.get_time_varying_portfolio_returns(
+                portfolio_name, start_date, end_date, include_cash, interval="daily"
+            )
 
-        if returns.empty:
-            return pd.Series(dtype=float)
+            if returns.empty:
+                return pd.Series(dtype=float)
 
-        # Calculate cumulative returns (wealth index)
-        cumulative = (1 + returns).cumprod()
+            # Calculate cumulative returns (wealth index)
+            cumulative = (1 + returns).cumprod()
 
-        # Calculate running maximum
-        running_max = cumulative.cummax()
+            # Calculate running maximum
+            running_max = cumulative.cummax()
 
-        # Drawdown = current / peak - 1
-        drawdowns = cumulative / running_max - 1
+            # Drawdown = current / peak - 1
+            return cumulative / running_max - 1
 
-        return drawdowns
+        if not cls._is_full_range_window(end_date):
+            return compute()
+
+        return cls._memoized(
+            portfolio_name,
+            ("drawdowns", start_date, end_date, include_cash),
+            compute,
+        )
 
     @classmethod
     def get_rolling_returns(
@@ -987,12 +1236,7 @@ class ReturnsDataService:
 
         # Calculate rolling compounded returns
         # (1 + r1) * (1 + r2) * ... * (1 + rn) - 1
-        def compound_return(window):
-            return (1 + window).prod() - 1
-
-        rolling_returns = returns.rolling(window=window_days).apply(
-            compound_return, raw=False
-        )
+        rolling_returns = rolling_compound_returns(returns, window_days)
 
         return rolling_returns.dropna()
 
@@ -1026,24 +1270,7 @@ class ReturnsDataService:
         if returns.empty:
             return pd.Series(dtype=float)
 
-        # Calculate cumulative returns (wealth index)
-        cumulative = (1 + returns).cumprod()
-
-        # Calculate running maximum
-        running_max = cumulative.cummax()
-
-        # Track days under water
-        days_under_water = pd.Series(0, index=cumulative.index, dtype=int)
-
-        current_underwater_days = 0
-        for i, (cum, peak) in enumerate(zip(cumulative, running_max)):
-            if cum < peak:
-                current_underwater_days += 1
-            else:
-                current_underwater_days = 0
-            days_under_water.iloc[i] = current_underwater_days
-
-        return days_under_water
+        return time_under_water(returns)
 
     # =========================================================================
     # Single Ticker Returns (for benchmark comparisons)
@@ -1222,12 +1449,8 @@ class ReturnsDataService:
             return pd.Series(dtype=float)
 
         # Calculate rolling compounded returns
-        def compound_return(window):
-            return (1 + window).prod() - 1
-
-        rolling_returns = returns.rolling(window=window_days).apply(
-            compound_return, raw=False
-        )
+        # (1 + r1) * (1 + r2) * ... * (1 + rn) - 1
+        rolling_returns = rolling_compound_returns(returns, window_days)
 
         return rolling_returns.dropna()
 
@@ -1256,24 +1479,7 @@ class ReturnsDataService:
         if returns.empty:
             return pd.Series(dtype=float)
 
-        # Calculate cumulative returns (wealth index)
-        cumulative = (1 + returns).cumprod()
-
-        # Calculate running maximum
-        running_max = cumulative.cummax()
-
-        # Track days under water
-        days_under_water = pd.Series(0, index=cumulative.index, dtype=int)
-
-        current_underwater_days = 0
-        for i, (cum, peak) in enumerate(zip(cumulative, running_max)):
-            if cum < peak:
-                current_underwater_days += 1
-            else:
-                current_underwater_days = 0
-            days_under_water.iloc[i] = current_underwater_days
-
-        return days_under_water
+        return time_under_water(returns)
 
     # =========================================================================
     # Risk-Adjusted Performance Metrics
@@ -1673,16 +1879,14 @@ class ReturnsDataService:
         if returns.index.max() >= today:
             return returns  # Already have today's data
 
-        # Get yesterday's close (last value in the price series)
-        # We need to fetch the actual close price, not the return
-        from app.services.market_data import fetch_price_history
+        # Get yesterday's close from the latest-quote store (no history load)
+        from app.services.market_data import get_latest_quotes
 
-        df = fetch_price_history(ticker, period="5d", interval="1d", skip_live_bar=True)
-        if df is None or df.empty or len(df) < 2:
+        quote = get_latest_quotes([ticker]).get(ticker)
+        yesterday_close = quote.session_close(today.strftime("%Y-%m-%d")) if quote else None
+        if not yesterday_close:
             return returns
 
-        yesterday_close = df["Close"].iloc[-1]
-
         # Fetch live price
         from app.services.yahoo_finance_service import YahooFinanceService
 
@@ -1727,7 +1931,7 @@ class ReturnsDataService:
         import pandas as pd
         from app.utils.market_hours import is_crypto_ticker, is_market_open_extended
         from app.services.yahoo_finance_service import YahooFinanceService
-        from app.services.market_data import fetch_price_history
+        from app.services.market_data import get_latest_quotes
 
         if returns is None or returns.empty:
             return returns
@@ -1764,12 +1968,13 @@ class ReturnsDataService:
         if not live_prices:
             return returns
 
-        # Get yesterday's closes for eligible tickers
+        # Get yesterday's closes for eligible tickers (latest-quote store, bulk)
+        today_str = today.strftime("%Y-%m-%d")
         yesterday_closes = {}
-        for ticker in eligible_tickers:
-            df = fetch_price_history(ticker, period="5d", interval="1d", skip_live_bar=True)
-            if df is not None and not df.empty:
-                yesterday_closes[ticker] = df["Close"].iloc[-1]
+        for ticker, quote in get_latest_quotes(eligible_tickers).items():
+            close = quote.session_close(today_str)
+            if close:
+                yesterday_closes[ticker] = close
 
         # Calculate weighted portfolio return for today
         portfolio_return = 0.0
@@ -58,10 +58,10 @@ class ThemeStylesheetService:
 
     @classmethod
     def get_table_stylesheet(cls, theme: str) -> str:
-        """Get QTableWidget stylesheet for a theme."""
+        """Get table view stylesheet for a theme (QTableView selectors also match QTableWidget)."""
         c = cls.get_colors(theme)
         return f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {c['bg']};
                 alternate-background-color: {c['bg_alt']};
                 color: {c['text']};
@@ -69,10 +69,10 @@ class ThemeStylesheetService:
                 border: 1px solid {c['border']};
                 font-size: 14px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px 8px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {c['accent']};
                 color: {c['text_on_accent']};
             }}
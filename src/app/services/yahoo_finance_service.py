@@ -476,6 +476,10 @@ class YahooFinanceService:
                     except Exception:
                         pass  # Skip failed tickers silently
 
+            # Keep the latest-quote table current for live return appends
+            from app.services.quote_store import QuoteStore
+            QuoteStore.record_live(prices)
+
             return prices
 
         except Exception as e:
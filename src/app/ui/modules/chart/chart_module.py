@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import QCoreApplication, Qt, Signal, QTimer
 
 from app.ui.modules.chart.widgets import (
     PriceChart,
@@ -24,9 +24,10 @@ from app.ui.modules.chart.widgets import (
 from app.ui.modules.chart.widgets.depth_chart import OrderBookPanel
 from app.ui.modules.chart.widgets import EditPluginAppearanceDialog
 from app.ui.widgets.common import CustomMessageBox
-from app.services.market_data import fetch_price_history, fetch_price_history_yahoo
+from app.services.market_data import apply_live_bar_to_pyramid, pin_tickers
 from app.services.massive_websocket import MassiveWebSocketService
-from app.services.live_bar_aggregator import LiveBarAggregator
+from app.services.prefetch_service import PrefetchService
+from app.services.live_bar_coalescer import LiveBarCoalescer
 from app.services.yahoo_finance_service import YahooFinanceService
 from app.utils.market_hours import is_crypto_ticker, is_market_open_extended
 from .services import (
@@ -34,7 +35,9 @@ from .services import (
     IndicatorService,
     ChartSettingsManager,
     ChartThemeService,
-    BinanceOrderBook
+    BinanceOrderBook,
+    ChartDataLoader,
+    ChartLoadResult,
 )
 from app.core.theme_manager import ThemeManager
 from app.core.config import (
@@ -45,6 +48,7 @@ from app.core.config import (
     CHART_INTERVALS,
     CHART_TYPES,
     CHART_SCALES,
+    LIVE_CHART_FRAME_MS,
 )
 from app.ui.widgets.common.lazy_theme_mixin import LazyThemeMixin
 
@@ -70,6 +74,16 @@ class ChartModule(LazyThemeMixin, QWidget):
         self._theme_dirty = False  # For lazy theme application
         self._indicator_init_started = False  # Track background init
         self.equation_parser = TickerEquationParser()
+
+        # Background ticker/equation loading (latest request wins)
+        self._data_loader = ChartDataLoader(self.equation_parser, parent=self)
+        self._data_loader.data_loaded.connect(self._on_chart_data_loaded)
+        self._data_loader.load_failed.connect(self._on_chart_load_failed)
+
+        # Pool threads share the equation parser: drain them before exit
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._shutdown_data_loader)
         self.indicator_service = IndicatorService()
 
         # Initialize chart settings manager
@@ -77,9 +91,14 @@ class ChartModule(LazyThemeMixin, QWidget):
 
         # WebSocket live updates (for stocks)
         self._ws_service: MassiveWebSocketService | None = None
-        self._live_aggregator = LiveBarAggregator()
+        self._live_coalescer = LiveBarCoalescer(frame_ms=LIVE_CHART_FRAME_MS, parent=self)
+        self._live_coalescer.bars_ready.connect(self._on_live_bars_ready)
         self._live_updates_enabled = True  # Can be toggled by user
 
+        # Incremental indicator state for this chart's series (seeded by
+        # render_from_cache, advanced by live bars)
+        self._indicator_streams: dict = {}
+
         # Crypto polling timer (Yahoo Finance updates ~every minute)
         self._crypto_poll_timer: QTimer | None = None
         self._CRYPTO_POLL_INTERVAL_MS = 60000  # 1 minute
@@ -574,7 +593,7 @@ class ChartModule(LazyThemeMixin, QWidget):
             indicators = {}
             if self.state["indicators"]:
                 indicators = IndicatorService.calculate_multiple(
-                    self.state["df"], self.state["indicators"]
+                    self.state["df"], self.state["indicators"], self._indicator_streams
                 )
             
             # Render chart with indicators
@@ -589,62 +608,77 @@ class ChartModule(LazyThemeMixin, QWidget):
             CustomMessageBox.critical(self.theme_manager, self, "Render Error", str(e))
 
     def load_ticker_max(self, ticker: str) -> None:
-        """Load max history for a ticker or evaluate an equation."""
+        """
+        Load max history for a ticker or evaluate an equation.
+
+        The load runs in the background (ChartDataLoader); a newer call
+        supersedes any load still in flight. Cached data is rendered as soon
+        as it is read, and refreshed data replaces it when it arrives.
+        """
         ticker = (ticker or "").strip()
         if not ticker:
             return
 
-        interval = self.current_interval()
+        self._data_loader.load(ticker, self.current_interval())
 
-        try:
-            # Check if this is an equation
-            if self.equation_parser.is_equation(ticker):
-                # Parse and evaluate equation
-                df, description = self.equation_parser.parse_and_evaluate(
-                    ticker, period="max", interval=interval
-                )
-                display_name = description
-            else:
-                # Regular ticker - use Yahoo Finance exclusively for chart module
-                ticker = ticker.upper()
-                df = fetch_price_history_yahoo(ticker, period="max", interval=interval)
-                display_name = ticker
+    def _on_chart_data_loaded(self, result: ChartLoadResult) -> None:
+        """Apply data from the current background load."""
+        df = result.df
+        display_name = result.display_name
 
+        # Background refresh of the ticker already on screen: swap the data
+        # and re-render (set_prices keeps the visible date window)
+        if (
+            result.is_refresh
+            and self.state.get("ticker") == display_name
+            and self.state.get("interval") == result.interval
+        ):
             self.state["df"] = df
-            self.state["ticker"] = display_name
-            self.state["interval"] = interval
+            self.render_from_cache()
+            return
 
-            # Check if this ticker is supported on Binance
-            is_binance = BinanceOrderBook.is_binance_ticker(display_name)
+        if not result.is_equation:
+            # Keep the active chart ticker resident in the memory cache and
+            # remember it for background prefetching
+            pin_tickers([display_name])
+            PrefetchService.record_chart_ticker(display_name)
 
-            # Enable/disable the depth button
-            self.controls.set_depth_enabled(is_binance)
-            self.controls.set_depth_visible(is_binance)
+        self.state["df"] = df
+        self.state["ticker"] = display_name
+        self.state["interval"] = result.interval
 
-            if is_binance:
-                self.controls.set_depth_text("Depth")
+        # Check if this ticker is supported on Binance
+        is_binance = BinanceOrderBook.is_binance_ticker(display_name)
 
-                # If depth panel is already visible, update it
-                if self.depth_panel.isVisible():
-                    self.depth_panel.set_ticker(display_name)
-            else:
-                self.controls.set_depth_text("Depth")
+        # Enable/disable the depth button
+        self.controls.set_depth_enabled(is_binance)
+        self.controls.set_depth_visible(is_binance)
 
-                # Hide depth panel if it was visible
-                if self.depth_panel.isVisible():
-                    self.controls.set_depth_checked(False)
-                    self.depth_panel.setVisible(False)
-                    self.depth_panel.stop_updates()
+        if is_binance:
+            self.controls.set_depth_text("Depth")
 
-            self.render_from_cache()
+            # If depth panel is already visible, update it
+            if self.depth_panel.isVisible():
+                self.depth_panel.set_ticker(display_name)
+        else:
+            self.controls.set_depth_text("Depth")
 
-            # Start live updates for this ticker (WebSocket)
-            self._start_live_updates(display_name)
+            # Hide depth panel if it was visible
+            if self.depth_panel.isVisible():
+                self.controls.set_depth_checked(False)
+                self.depth_panel.setVisible(False)
+                self.depth_panel.stop_updates()
 
-        except Exception as e:
-            CustomMessageBox.critical(self.theme_manager, self, "Load Error", str(e))
-            # Clear the equation parser cache on error
-            self.equation_parser.clear_cache()
+        self.render_from_cache()
+
+        # Start live updates for this ticker (WebSocket)
+        self._start_live_updates(display_name)
+
+    def _on_chart_load_failed(self, text: str, message: str) -> None:
+        """Report a failed load (only called for the current load)."""
+        CustomMessageBox.critical(self.theme_manager, self, "Load Error", message)
+        # Clear the equation parser cache on error
+        self.equation_parser.clear_cache()
 
     # =========================================================================
     # WebSocket Live Updates
@@ -654,7 +688,8 @@ class ChartModule(LazyThemeMixin, QWidget):
         """
         Start live updates for a ticker.
 
-        For stocks: Uses QTimer polling with Yahoo Finance (only during market hours)
+        For stocks: Uses QTimer polling with Yahoo Finance (only during market hours),
+        plus Massive WebSocket minute bars between polls (if an API key is set)
         For crypto: Uses QTimer polling with Yahoo Finance (24/7)
 
         Args:
@@ -667,6 +702,9 @@ class ChartModule(LazyThemeMixin, QWidget):
         if self.equation_parser.is_equation(ticker):
             return
 
+        # Minute bars are re-subscribed below for stocks during market hours
+        self._stop_websocket()
+
         # Check if this is a crypto ticker
         if is_crypto_ticker(ticker):
             # Use polling timer for crypto (Yahoo Finance, 24/7)
@@ -675,9 +713,54 @@ class ChartModule(LazyThemeMixin, QWidget):
             # Use polling timer for stocks (Yahoo Finance, only during market hours)
             if is_market_open_extended():
                 self._start_stock_polling(ticker)
+                self._start_websocket(ticker)
             else:
                 print(f"Market closed - not starting live updates for {ticker}")
 
+    def _start_websocket(self, ticker: str) -> None:
+        """
+        Stream minute bars for a stock ticker from Massive.
+
+        The service thread is created once and re-subscribed on ticker
+        changes. Bars go straight to the coalescer on the WebSocket thread
+        (DirectConnection); the chart sees at most one update per frame.
+        """
+        if self._ws_service is None:
+            ws = MassiveWebSocketService(parent=self)
+            ws.bar_received.connect(self._on_live_bar_received, Qt.DirectConnection)
+            ws.connection_status.connect(self._on_ws_status)
+            self._ws_service = ws
+            ws.subscribe(ticker)  # Subscribed on connect
+            ws.start()
+
+            # The service is a child of this module: stop its thread before
+            # the window is destroyed at exit
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._shutdown_websocket)
+        else:
+            self._ws_service.subscribe(ticker)
+
+    def _stop_websocket(self) -> None:
+        """Stop receiving minute bars (the connection stays open for reuse)."""
+        if self._ws_service is not None:
+            self._ws_service.unsubscribe()
+
+    def _shutdown_websocket(self) -> None:
+        """Close the WebSocket connection and wait for its thread."""
+        ws, self._ws_service = self._ws_service, None
+        if ws is None:
+            return
+        ws.stop()
+        if not ws.wait(3000):
+            print("WebSocket thread did not stop in time")
+
+    def _shutdown_data_loader(self) -> None:
+        """Cancel the current chart load and wait for the loader's threads."""
+        self._data_loader.cancel()
+        if not self._data_loader.wait_for_done(5000):
+            print("Chart loader threads did not stop in time")
+
     def _start_stock_polling(self, ticker: str) -> None:
         """Start polling timer for stock live updates via Yahoo Finance."""
         # Stop any existing timer
@@ -708,10 +791,6 @@ class ChartModule(LazyThemeMixin, QWidget):
             self._stop_stock_polling()
             return
 
-        # Only update for daily interval
-        if self.current_interval().lower() != "daily":
-            return
-
         print(f"Stock poll: Fetching {ticker}...")
 
         # Fetch in background thread to avoid blocking UI
@@ -757,10 +836,6 @@ class ChartModule(LazyThemeMixin, QWidget):
         if not ticker or not is_crypto_ticker(ticker):
             return
 
-        # Only update for daily interval
-        if self.current_interval().lower() != "daily":
-            return
-
         print(f"Crypto poll: Fetching {ticker}...")
 
         # Fetch in background thread to avoid blocking UI
@@ -784,83 +859,150 @@ class ChartModule(LazyThemeMixin, QWidget):
 
     def _update_crypto_bar(self, ticker: str, today_bar) -> None:
         """Update the chart with the latest bar from Yahoo (for both stocks and crypto)."""
-        import pandas as pd
-
         # Determine ticker type for logging
         ticker_type = "Crypto" if is_crypto_ticker(ticker) else "Stock"
 
+        row = today_bar.iloc[0]
+        bar = {
+            "Open": row["Open"],
+            "High": row["High"],
+            "Low": row["Low"],
+            "Close": row["Close"],
+            "Volume": row.get("Volume", 0),
+            "Date": today_bar.index[0].date(),
+        }
+        if self._apply_live_bar(ticker, bar, ticker_type):
+            print(f"{ticker_type} poll: Chart updated for {ticker}")
+
+    def _apply_live_bar(self, ticker: str, bar: dict, label: str) -> bool:
+        """
+        Apply a live daily bar to the chart incrementally.
+
+        Updates the last row of the DataFrame in place (same day) or appends
+        a row (new day), then patches the chart through update_last_bar /
+        append_new_bar and IndicatorService.update_multiple. Never rebuilds
+        the chart, so the user's zoom/scroll position is preserved.
+
+        Args:
+            ticker: Ticker symbol the bar is for
+            bar: Dict with Open, High, Low, Close, Volume and Date
+            label: Source label for logging (e.g. "Crypto", "Stock", "Live")
+
+        Returns:
+            True if the chart was updated
+        """
+        import pandas as pd
+
         # Verify this is still the current ticker
         current_ticker = self.state.get("ticker")
         if not current_ticker or ticker.upper() != current_ticker.upper():
-            print(f"{ticker_type} poll: Skipping update, ticker changed from {ticker} to {current_ticker}")
-            return
+            print(f"{label} update: Skipping, ticker changed from {ticker} to {current_ticker}")
+            return False
 
         df = self.state.get("df")
         if df is None or df.empty:
-            print(f"{ticker_type} poll: Skipping update, no DataFrame in state")
-            return
+            print(f"{label} update: Skipping, no DataFrame in state")
+            return False
 
-        # Get the bar data
-        bar_date = today_bar.index[0].date()
-        last_date = df.index[-1].date()
+        # Weekly/monthly/yearly: fold the daily bar into the trailing bucket
+        if self.current_interval().lower() != "daily":
+            return self._apply_live_bar_resampled(ticker, bar, label)
 
-        # Extract OHLCV from the fetched bar
-        bar_open = today_bar.iloc[0]["Open"]
-        bar_high = today_bar.iloc[0]["High"]
-        bar_low = today_bar.iloc[0]["Low"]
-        bar_close = today_bar.iloc[0]["Close"]
-        bar_volume = today_bar.iloc[0].get("Volume", 0)
+        bar_date = bar.get("Date")
+        last_date = df.index[-1].date()
+        bar_close = bar["Close"]
 
         # Store old close before updating (for change calculation and API)
         old_close = df.iloc[-1, df.columns.get_loc("Close")]
-        is_new_day = bar_date > last_date
+        is_new_day = bar_date is not None and bar_date > last_date
 
         if is_new_day:
             # New day - append a new row
             new_row = pd.DataFrame(
-                [{
-                    "Open": bar_open,
-                    "High": bar_high,
-                    "Low": bar_low,
-                    "Close": bar_close,
-                    "Volume": bar_volume,
-                }],
+                [{col: bar[col] for col in ("Open", "High", "Low", "Close", "Volume")}],
                 index=pd.DatetimeIndex([bar_date]),
             )
             self.state["df"] = pd.concat([df, new_row])
-            print(f"{ticker_type} {ticker}: New day {bar_date}, price ${bar_close:,.2f}")
+            print(f"{label} {ticker}: New day {bar_date}, price ${bar_close:,.2f}")
         else:
             # Same day - update last row in-place
-            df.iloc[-1, df.columns.get_loc("Open")] = bar_open
-            df.iloc[-1, df.columns.get_loc("High")] = bar_high
-            df.iloc[-1, df.columns.get_loc("Low")] = bar_low
-            df.iloc[-1, df.columns.get_loc("Close")] = bar_close
-            if "Volume" in df.columns:
-                df.iloc[-1, df.columns.get_loc("Volume")] = bar_volume
+            for col in ("Open", "High", "Low", "Close", "Volume"):
+                if col in df.columns:
+                    df.iloc[-1, df.columns.get_loc(col)] = bar[col]
 
             # Show price change
             change = bar_close - old_close
             change_pct = (change / old_close * 100) if old_close else 0
             arrow = "↑" if change > 0 else "↓" if change < 0 else "→"
-            print(f"{ticker_type} {ticker}: ${bar_close:,.2f} {arrow} ({change:+,.2f}, {change_pct:+.2f}%)")
+            print(f"{label} {ticker}: ${bar_close:,.2f} {arrow} ({change:+,.2f}, {change_pct:+.2f}%)")
 
         # INCREMENTAL UPDATE instead of full rebuild
         # This preserves the user's view (zoom/scroll position)
 
-        # Update indicators if any are active
-        if self.state["indicators"]:
-            indicators = IndicatorService.calculate_multiple(
-                self.state["df"], self.state["indicators"]
-            )
-            self.chart.update_indicator_lines(indicators)
-
         # Update chart incrementally (no view reset)
         if is_new_day:
             self.chart.append_new_bar(self.state["df"])
         else:
             self.chart.update_last_bar(self.state["df"], old_close)
 
-        print(f"{ticker_type} poll: Chart updated for {ticker}")
+        # Update indicators if any are active (O(1) per indicator: only the
+        # last bar's values are recomputed from the rolling state). Runs after
+        # the bar update so the chart already covers an appended bar.
+        if self.state["indicators"]:
+            indicators = IndicatorService.update_multiple(
+                self.state["df"],
+                self.state["indicators"],
+                appended=is_new_day,
+                streams=self._indicator_streams,
+            )
+            self.chart.update_indicator_lines(indicators)
+
+        return True
+
+    def _apply_live_bar_resampled(self, ticker: str, bar: dict, label: str) -> bool:
+        """
+        Apply a live daily bar on a weekly/monthly/yearly chart.
+
+        The bar is merged into the ticker's cached bar pyramid, which
+        re-aggregates only the trailing bucket, and the chart is patched the
+        same way as for daily bars.
+
+        Args:
+            ticker: Ticker symbol the bar is for
+            bar: Dict with Open, High, Low, Close, Volume and Date
+            label: Source label for logging (e.g. "Crypto", "Stock", "Live")
+
+        Returns:
+            True if the chart was updated
+        """
+        interval = self.current_interval()
+        if self.state.get("interval") != interval:
+            return False
+
+        updated = apply_live_bar_to_pyramid(ticker, bar, interval)
+        if updated is None:
+            return False
+        df, is_new_bucket = updated
+
+        old_close = self.state["df"].iloc[-1, self.state["df"].columns.get_loc("Close")]
+        self.state["df"] = df
+        print(f"{label} {ticker}: {interval} bar updated, price ${bar['Close']:,.2f}")
+
+        if is_new_bucket:
+            self.chart.append_new_bar(df)
+        else:
+            self.chart.update_last_bar(df, old_close)
+
+        if self.state["indicators"]:
+            indicators = IndicatorService.update_multiple(
+                df,
+                self.state["indicators"],
+                appended=is_new_bucket,
+                streams=self._indicator_streams,
+            )
+            self.chart.update_indicator_lines(indicators)
+
+        return True
 
     def _stop_live_updates(self) -> None:
         """Stop all live updates (polling timers)."""
@@ -870,63 +1012,56 @@ class ChartModule(LazyThemeMixin, QWidget):
         # Stop crypto polling timer
         self._stop_crypto_polling()
 
-        self._live_aggregator.reset()
+        # Stop WebSocket minute bars
+        self._stop_websocket()
+        self._live_coalescer.reset()
 
     def _on_live_bar_received(self, ticker: str, bar_data: dict) -> None:
         """
         Handle incoming minute bar from WebSocket.
 
+        Safe to call from the WebSocket thread (connect bar_received with
+        Qt.DirectConnection): the bar is only aggregated and buffered here.
+        The chart is updated from _on_live_bars_ready, at most once per
+        LIVE_CHART_FRAME_MS regardless of the tick rate.
+
         Args:
             ticker: Ticker symbol the bar is for
             bar_data: Dict with OHLCV data
         """
-        # Only process if this is the current ticker
-        current_ticker = self.state.get("ticker")
-        if not current_ticker or ticker.upper() != current_ticker.upper():
-            return
+        self._live_coalescer.submit(ticker, bar_data)
 
-        # Only update for daily interval (minute bars aggregate to daily)
-        if self.current_interval().lower() != "daily":
-            return
+    def _on_live_bars_ready(self, bars: dict) -> None:
+        """
+        Apply the latest coalesced daily bar for the current ticker.
+
+        The aggregate only covers minutes received since subscribing, so it
+        is merged into today's row (kept full-day by Yahoo polling) rather
+        than replacing it. Daily charts only; coarser intervals follow polling.
 
-        # Aggregate minute bar into daily bar
-        daily_bar = self._live_aggregator.add_minute_bar(bar_data)
+        Args:
+            bars: Dict mapping ticker to its latest aggregated daily bar
+        """
+        current_ticker = self.state.get("ticker")
+        if not current_ticker:
+            return
 
-        if daily_bar is None:
+        daily_bar = bars.get(current_ticker.upper())
+        if daily_bar is None or self.current_interval().lower() != "daily":
             return
 
-        # Update the last row of the DataFrame with aggregated daily bar
         df = self.state.get("df")
-        if df is not None and not df.empty:
-            import pandas as pd
-            from datetime import datetime
-
-            bar_date = daily_bar.get("Date")
-            last_date = df.index[-1].date()
-
-            if bar_date and bar_date > last_date:
-                # New day - append a new row
-                new_row = pd.DataFrame(
-                    [{
-                        "Open": daily_bar["Open"],
-                        "High": daily_bar["High"],
-                        "Low": daily_bar["Low"],
-                        "Close": daily_bar["Close"],
-                        "Volume": daily_bar["Volume"],
-                    }],
-                    index=pd.DatetimeIndex([bar_date]),
-                )
-                self.state["df"] = pd.concat([df, new_row])
-            else:
-                # Same day - update last row
-                df.iloc[-1, df.columns.get_loc("Open")] = daily_bar["Open"]
-                df.iloc[-1, df.columns.get_loc("High")] = daily_bar["High"]
-                df.iloc[-1, df.columns.get_loc("Low")] = daily_bar["Low"]
-                df.iloc[-1, df.columns.get_loc("Close")] = daily_bar["Close"]
-                df.iloc[-1, df.columns.get_loc("Volume")] = daily_bar["Volume"]
-
-            # Re-render chart
-            self.render_from_cache()
+        if df is not None and not df.empty and df.index[-1].date() == daily_bar.get("Date"):
+            last = df.iloc[-1]
+            daily_bar = dict(
+                daily_bar,
+                Open=last["Open"],
+                High=max(last["High"], daily_bar["High"]),
+                Low=min(last["Low"], daily_bar["Low"]),
+                Volume=max(last.get("Volume", 0), daily_bar["Volume"]),
+            )
+
+        self._apply_live_bar(current_ticker, daily_bar, "Live")
 
     def _on_ws_status(self, status: str) -> None:
         """Handle WebSocket connection status changes."""
@@ -3,13 +3,22 @@
 from .chart_settings_manager import ChartSettingsManager
 from .chart_theme_service import ChartThemeService
 from .indicator_service import IndicatorService
+from .order_book import BookView, OrderBook
 from .binance_data import BinanceOrderBook
+from .binance_depth_stream import BinanceDepthStream, DepthSnapshot
 from .ticker_equation_parser import TickerEquationParser
+from .chart_data_loader import ChartDataLoader, ChartLoadResult
 
 __all__ = [
     'ChartSettingsManager',
     'ChartThemeService',
     'IndicatorService',
+    'OrderBook',
+    'BookView',
     'BinanceOrderBook',
-    'TickerEquationParser'
+    'BinanceDepthStream',
+    'DepthSnapshot',
+    'TickerEquationParser',
+    'ChartDataLoader',
+    'ChartLoadResult',
 ]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import requests
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Optional
 from datetime import datetime, timedelta
 
+from .order_book import OrderBook
+
 
 class BinanceOrderBook:
     """
@@ -18,6 +20,10 @@ class BinanceOrderBook:
     
     BASE_URL_INTL = "https://api.binance.com"
     BASE_URL_US = "https://api.binance.us"
+
+    # Diff-depth WebSocket streams (see BinanceDepthStream)
+    STREAM_URL_INTL = "wss://stream.binance.com:9443/ws"
+    STREAM_URL_US = "wss://stream.binance.us:9443/ws"
     
     # Mapping from yfinance ticker format to Binance symbol format
     TICKER_MAP = {
@@ -87,7 +93,7 @@ class BinanceOrderBook:
     
     def fetch_order_book(
         self, ticker: str, limit: int = 100
-    ) -> Optional[Dict[str, List[Tuple[float, float]]]]:
+    ) -> Optional[Dict[str, any]]:
         """
         Fetch order book depth data from Binance.
         
@@ -98,7 +104,7 @@ class BinanceOrderBook:
             limit: Number of price levels (5, 10, 20, 50, 100, 500, 1000, 5000)
         
         Returns:
-            Dict with 'bids' and 'asks' as lists of (price, quantity) tuples,
+            Dict with 'book' (OrderBook), 'timestamp' and 'source',
             or None if fetch fails
         """
         # Check cache first
@@ -151,7 +157,7 @@ class BinanceOrderBook:
     
     def _fetch_from_url(
         self, base_url: str, symbol: str, limit: int
-    ) -> Optional[Dict[str, List[Tuple[float, float]]]]:
+    ) -> Optional[Dict[str, any]]:
         """
         Fetch order book from a specific Binance API URL.
         
@@ -173,14 +179,12 @@ class BinanceOrderBook:
             
             data = response.json()
             
-            # Parse bids and asks
+            # Parse bids and asks straight into arrays
             # Format: [["price", "quantity"], ...]
-            bids = [(float(price), float(qty)) for price, qty in data.get("bids", [])]
-            asks = [(float(price), float(qty)) for price, qty in data.get("asks", [])]
+            book = OrderBook.from_levels(data.get("bids", []), data.get("asks", []))
             
             return {
-                "bids": bids,  # Sorted descending by price
-                "asks": asks,  # Sorted ascending by price
+                "book": book,
                 "timestamp": datetime.now(),
                 "source": base_url,  # Track which API we used
             }
@@ -209,40 +213,20 @@ class BinanceOrderBook:
         if not data:
             return None
         
-        bids = data["bids"][:levels]
-        asks = data["asks"][:levels]
-        
-        # Calculate total volume at each side
-        bid_volume = sum(qty for _, qty in bids)
-        ask_volume = sum(qty for _, qty in asks)
-        
-        # Calculate weighted average prices
-        bid_weighted_price = (
-            sum(price * qty for price, qty in bids) / bid_volume if bid_volume > 0 else 0
-        )
-        ask_weighted_price = (
-            sum(price * qty for price, qty in asks) / ask_volume if ask_volume > 0 else 0
-        )
-        
-        # Get best bid/ask
-        best_bid = bids[0][0] if bids else 0
-        best_ask = asks[0][0] if asks else 0
-        
-        # Calculate spread
-        spread = best_ask - best_bid if best_bid and best_ask else 0
-        spread_pct = (spread / best_bid * 100) if best_bid else 0
+        view = data["book"].view(levels)
+        bid_weighted_price, ask_weighted_price = view.weighted_prices()
         
         return {
-            "best_bid": best_bid,
-            "best_ask": best_ask,
-            "spread": spread,
-            "spread_pct": spread_pct,
-            "bid_volume": bid_volume,
-            "ask_volume": ask_volume,
+            "best_bid": view.best_bid,
+            "best_ask": view.best_ask,
+            "spread": view.spread,
+            "spread_pct": view.spread_pct,
+            "bid_volume": float(view.bid_quantities.sum()),
+            "ask_volume": float(view.ask_quantities.sum()),
             "bid_weighted_price": bid_weighted_price,
             "ask_weighted_price": ask_weighted_price,
-            "bids": bids,
-            "asks": asks,
+            "imbalance": view.imbalance(),
+            "book": view,  # BookView of the top levels
             "timestamp": data["timestamp"],
             "source": data.get("source", "unknown"),  # Which API was used
         }
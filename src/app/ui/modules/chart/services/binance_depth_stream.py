@@ -0,0 +1,363 @@
+"""
+Binance diff-depth stream with a locally maintained order book.
+
+Replaces REST polling of /api/v3/depth. The stream thread keeps a local book
+in sync following Binance's procedure:
+
+1. Open the <symbol>@depth@100ms stream and buffer its events
+2. Fetch a REST snapshot (lastUpdateId)
+3. Drop buffered events with u <= lastUpdateId
+4. The first applied event must satisfy U <= lastUpdateId + 1 <= u, and
+   every later event must have U == previous u + 1; anything else is a gap
+   and triggers a resync from a fresh snapshot (events keep buffering)
+
+Snapshots of the book are published at most once per frame and only when
+something changed, together with the prices that changed since the last
+publish, so the GUI never handles more than one update per frame.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from app.core.config import ORDER_BOOK_FRAME_MS, ORDER_BOOK_LEVELS
+
+from .binance_data import BinanceOrderBook
+from .order_book import BookView, OrderBook
+
+_SNAPSHOT_LIMIT = 1000  # Levels per side in the REST snapshot
+_MAX_RECONNECTS = 5
+_MAX_RESYNCS = 8  # Gap resyncs per connection before reconnecting
+_RESYNC_RESET_S = 60.0  # Live this long and the resync backoff starts over
+
+
+class OrderBookGapError(Exception):
+    """Raised when a diff event does not follow the previous one."""
+
+
+@dataclass(frozen=True)
+class DepthSnapshot:
+    """Immutable view of the top of a local order book."""
+
+    ticker: str
+    book: BookView
+    changed_bids: np.ndarray  # Prices changed since the last snapshot
+    changed_asks: np.ndarray
+    full: bool  # True right after a (re)sync: every level may have changed
+    last_update_id: int
+    timestamp: datetime
+    source: str
+
+
+class LocalOrderBook:
+    """
+    Order book maintained from a snapshot plus diff events.
+
+    Not thread-safe: owned by the stream thread.
+    """
+
+    def __init__(self):
+        self.book = OrderBook()
+        self.last_update_id: Optional[int] = None
+        self._prev_final_id: Optional[int] = None
+        self._changed_bids: List[np.ndarray] = []
+        self._changed_asks: List[np.ndarray] = []
+        self._full = True
+
+    @property
+    def is_synced(self) -> bool:
+        return self.last_update_id is not None
+
+    @property
+    def dirty(self) -> bool:
+        return self._full or bool(self._changed_bids or self._changed_asks)
+
+    def reset(self) -> None:
+        """Drop all levels (the book is unsynced until the next snapshot)."""
+        self.book = OrderBook()
+        self.last_update_id = None
+        self._prev_final_id = None
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+        self._full = True
+
+    def load_snapshot(self, last_update_id: int, bids: list, asks: list) -> None:
+        """
+        Replace the book with a REST depth snapshot.
+
+        Args:
+            last_update_id: Snapshot's lastUpdateId
+            bids: [["price", "qty"], ...]
+            asks: [["price", "qty"], ...]
+        """
+        self.reset()
+        self.book.load(bids, asks)
+        self.last_update_id = int(last_update_id)
+
+    def apply_diff(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a depthUpdate event.
+
+        Args:
+            event: Event with "U" (first update ID), "u" (final update ID),
+                "b" and "a" ([["price", "qty"], ...], qty 0 removes the level)
+
+        Returns:
+            True if applied, False if it predates the snapshot and was dropped
+
+        Raises:
+            OrderBookGapError: If events were missed (the book must resync)
+        """
+        first_id = int(event["U"])
+        final_id = int(event["u"])
+
+        if final_id <= self.last_update_id:
+            return False
+
+        if self._prev_final_id is None:
+            if first_id > self.last_update_id + 1:
+                raise OrderBookGapError(
+                    f"first event U={first_id} is past snapshot {self.last_update_id}"
+                )
+        elif first_id != self._prev_final_id + 1:
+            raise OrderBookGapError(
+                f"expected U={self._prev_final_id + 1}, got U={first_id}"
+            )
+
+        changed_bids, changed_asks = self.book.apply(event.get("b", []), event.get("a", []))
+        if len(changed_bids):
+            self._changed_bids.append(changed_bids)
+        if len(changed_asks):
+            self._changed_asks.append(changed_asks)
+        self._prev_final_id = final_id
+        self.last_update_id = final_id
+        return True
+
+    def snapshot(self, ticker: str, levels: int, source: str) -> DepthSnapshot:
+        """Take a snapshot of the top levels and reset the change tracking."""
+        snap = DepthSnapshot(
+            ticker=ticker,
+            book=self.book.view(levels),
+            changed_bids=_merge_changes(self._changed_bids),
+            changed_asks=_merge_changes(self._changed_asks),
+            full=self._full,
+            last_update_id=self.last_update_id or 0,
+            timestamp=datetime.now(),
+            source=source,
+        )
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+        self._full = False
+        return snap
+
+
+def _merge_changes(changes: List[np.ndarray]) -> np.ndarray:
+    if not changes:
+        return np.empty(0, dtype=np.float64)
+    return np.unique(np.concatenate(changes))
+
+
+class BinanceDepthStream(QThread):
+    """
+    Background thread streaming one symbol's order book from Binance.
+
+    Usage:
+        stream = BinanceDepthStream("BTC-USD")
+        stream.book_updated.connect(on_snapshot)
+        stream.start()
+
+        # When done:
+        stream.stop()
+        stream.wait()
+
+    The endpoints can be overridden (e.g. with a local WebSocket stub):
+    stream_url is the WebSocket base ("ws://127.0.0.1:8765/ws") and rest_url
+    the base of /api/v3/depth.
+    """
+
+    book_updated = Signal(object)  # DepthSnapshot
+    status_changed = Signal(str)  # "connecting", "syncing", "live", "resyncing", "error:{msg}"
+
+    def __init__(
+        self,
+        ticker: str,
+        levels: int = ORDER_BOOK_LEVELS,
+        frame_ms: int = ORDER_BOOK_FRAME_MS,
+        prefer_us_api: bool = True,
+        stream_url: Optional[str] = None,
+        rest_url: Optional[str] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.ticker = ticker.strip().upper()
+        self.symbol = BinanceOrderBook.get_binance_symbol(self.ticker)
+        self.levels = levels
+        self.frame_ms = max(10, int(frame_ms))
+        self.book = LocalOrderBook()
+
+        if stream_url and rest_url:
+            self._endpoints = [(stream_url, rest_url)]
+        else:
+            us = (BinanceOrderBook.STREAM_URL_US, BinanceOrderBook.BASE_URL_US)
+            intl = (BinanceOrderBook.STREAM_URL_INTL, BinanceOrderBook.BASE_URL_INTL)
+            self._endpoints = [us, intl] if prefer_us_api else [intl, us]
+
+        self._source = ""
+        self._stop_event = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._main_task: Optional[asyncio.Task] = None
+
+    def run(self) -> None:
+        """Stream loop (runs in background thread)."""
+        if not self.symbol:
+            self.status_changed.emit(f"error:{self.ticker} is not available on Binance")
+            return
+        try:
+            asyncio.run(self._run_async())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Binance depth stream error: {e}")
+            self.status_changed.emit(f"error:{e}")
+
+    def stop(self) -> None:
+        """Stop streaming (safe to call from any thread)."""
+        self._stop_event.set()
+        loop, task = self._loop, self._main_task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def _run_async(self) -> None:
+        import aiohttp
+
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        if self._stop_event.is_set():
+            return
+
+        failures = 0
+        endpoint = 0
+        async with aiohttp.ClientSession() as session:
+            while not self._stop_event.is_set():
+                stream_url, rest_url = self._endpoints[endpoint]
+                try:
+                    await self._stream(session, stream_url, rest_url)
+                    failures = 0  # Server closed the stream: reconnect shortly
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    failures += 1
+                    print(f"Binance depth stream ({stream_url}) failed: {e}")
+                    if failures > _MAX_RECONNECTS:
+                        self.status_changed.emit(f"error:{e}")
+                        break
+                    # Try the other region next (geo-blocking), then back off
+                    endpoint = (endpoint + 1) % len(self._endpoints)
+                    try:
+                        await asyncio.sleep(min(2 ** (failures - 1), 30))
+                    except asyncio.CancelledError:
+                        break
+
+    async def _stream(self, session, stream_url: str, rest_url: str) -> None:
+        """Run one connection until it closes."""
+        self.status_changed.emit("connecting")
+        url = f"{stream_url.rstrip('/')}/{self.symbol.lower()}@depth@100ms"
+        events: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+
+        async with session.ws_connect(url, heartbeat=30) as ws:
+            self._source = rest_url
+            reader = asyncio.create_task(self._read(ws, events))
+            publisher = asyncio.create_task(self._publish())
+            try:
+                await self._maintain_book(session, rest_url, events)
+            finally:
+                reader.cancel()
+                publisher.cancel()
+
+    async def _read(self, ws, events: "asyncio.Queue[Optional[dict]]") -> None:
+        """Buffer incoming diff events (None marks the end of the stream)."""
+        import aiohttp
+
+        try:
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    data = json.loads(msg.data)
+                    if data.get("e") == "depthUpdate":
+                        events.put_nowait(data)
+                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+        finally:
+            events.put_nowait(None)
+
+    async def _maintain_book(
+        self, session, rest_url: str, events: "asyncio.Queue[Optional[dict]]"
+    ) -> None:
+        """
+        Sync the book from a snapshot and apply events until the stream ends.
+
+        Each snapshot costs weight 50, so repeated gaps back off (the first
+        resync is immediate) and too many on one connection reconnect.
+        """
+        loop = asyncio.get_running_loop()
+        resyncs = 0
+        while not self._stop_event.is_set():
+            self.status_changed.emit("syncing" if not self.book.is_synced else "resyncing")
+            snapshot = await self._fetch_snapshot(session, rest_url)
+            self.book.load_snapshot(
+                snapshot["lastUpdateId"], snapshot.get("bids", []), snapshot.get("asks", [])
+            )
+            announced = False
+            live_since = None
+
+            try:
+                while True:
+                    event = await events.get()
+                    if event is None:
+                        return
+                    if self.book.apply_diff(event) and not announced:
+                        self.status_changed.emit("live")
+                        announced = True
+                        live_since = loop.time()
+            except OrderBookGapError as e:
+                print(f"Binance depth gap for {self.symbol}, resyncing: {e}")
+
+            if live_since is not None and loop.time() - live_since >= _RESYNC_RESET_S:
+                resyncs = 0
+            resyncs += 1
+            if resyncs > _MAX_RESYNCS:
+                raise ConnectionError(f"{resyncs - 1} order book resyncs, reconnecting")
+            if resyncs > 1:
+                await asyncio.sleep(min(2 ** (resyncs - 2), 30))
+
+    async def _fetch_snapshot(self, session, rest_url: str) -> Dict[str, Any]:
+        import aiohttp
+
+        url = f"{rest_url.rstrip('/')}/api/v3/depth"
+        params = {"symbol": self.symbol, "limit": _SNAPSHOT_LIMIT}
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            if resp.status == 451:
+                raise ConnectionError(f"{rest_url} is geo-blocked (HTTP 451)")
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _publish(self) -> None:
+        """Emit a snapshot once per frame while the book is synced and changed."""
+        interval = self.frame_ms / 1000.0
+        while True:
+            await asyncio.sleep(interval)
+            if self.book.is_synced and self.book.dirty:
+                self.book_updated.emit(
+                    self.book.snapshot(self.ticker, self.levels, self._source)
+                )
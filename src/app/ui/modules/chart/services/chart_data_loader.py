@@ -0,0 +1,238 @@
+"""Background loader for chart tickers and equations.
+
+Runs ticker and equation loads on a QThreadPool so network I/O and parquet
+writes never block the GUI thread. Every load gets a generation token; a new
+load cancels the previous one and anything a superseded load emits is
+dropped, so typing a new ticker never shows stale data.
+
+For plain tickers, cached data (memory or parquet) is emitted first so the
+chart renders immediately, followed by the refreshed data once the
+backfill/incremental update finishes (only if it changed anything).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .ticker_equation_parser import TickerEquationParser
+
+
+@dataclass
+class ChartLoadResult:
+    """Data for one ticker/equation load."""
+
+    text: str
+    display_name: str
+    interval: str
+    df: "pd.DataFrame"
+    is_equation: bool = False
+    is_refresh: bool = False  # True for data replacing an earlier cached result
+
+
+class _LoadCancelled(Exception):
+    """Raised inside a task once a newer load has been requested."""
+
+
+class _TaskSignals(QObject):
+    """Signals for a single task, tagged with the load's generation."""
+
+    loaded = Signal(int, object)
+    failed = Signal(int, str)
+    finished = Signal(int)
+
+
+class _ChartLoadTask(QRunnable):
+    """Loads one ticker or equation on a pool thread."""
+
+    def __init__(
+        self,
+        text: str,
+        interval: str,
+        generation: int,
+        equation_parser: "TickerEquationParser",
+    ):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.text = text
+        self.interval = interval
+        self.generation = generation
+        self.equation_parser = equation_parser
+        self.signals = _TaskSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation (takes effect at the next checkpoint)."""
+        self._cancel_event.set()
+
+    def _checkpoint(self) -> None:
+        if self._cancel_event.is_set():
+            raise _LoadCancelled()
+
+    def run(self) -> None:
+        try:
+            self._checkpoint()
+            if self.equation_parser.is_equation(self.text):
+                self._load_equation()
+            else:
+                self._load_ticker()
+        except _LoadCancelled:
+            print(f"[ChartLoader] Cancelled load of '{self.text}'")
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                self.signals.failed.emit(self.generation, str(e))
+        finally:
+            self.signals.finished.emit(self.generation)
+
+    def _load_equation(self) -> None:
+        df, description = self.equation_parser.parse_and_evaluate(
+            self.text, period="max", interval=self.interval
+        )
+        self._checkpoint()
+        self.signals.loaded.emit(
+            self.generation,
+            ChartLoadResult(self.text, description, self.interval, df, is_equation=True),
+        )
+
+    def _load_ticker(self) -> None:
+        from app.services.market_data import (
+            fetch_price_history_yahoo,
+            peek_price_history_yahoo,
+        )
+
+        ticker = self.text.upper()
+
+        # Render cached data right away, then refresh
+        cached = peek_price_history_yahoo(ticker, interval=self.interval)
+        if cached is not None:
+            self._checkpoint()
+            self.signals.loaded.emit(
+                self.generation, ChartLoadResult(ticker, ticker, self.interval, cached)
+            )
+
+        self._checkpoint()
+        try:
+            df = fetch_price_history_yahoo(ticker, period="max", interval=self.interval)
+        except Exception as e:
+            if cached is None:
+                raise
+            # Keep showing the cached data rather than failing the load
+            print(f"[ChartLoader] Refresh failed for {ticker}, using cached data: {e}")
+            return
+        self._checkpoint()
+
+        if cached is not None and _same_data(cached, df):
+            return
+        self.signals.loaded.emit(
+            self.generation,
+            ChartLoadResult(ticker, ticker, self.interval, df, is_refresh=cached is not None),
+        )
+
+
+def _same_data(a: "pd.DataFrame", b: "pd.DataFrame") -> bool:
+    """Cheap check whether a refresh changed the data (length, dates, last row)."""
+    if a is b:
+        return True
+    if len(a) != len(b) or a.empty:
+        return len(a) == len(b)
+    return (
+        a.index[0] == b.index[0]
+        and a.index[-1] == b.index[-1]
+        and a.iloc[-1].equals(b.iloc[-1])
+    )
+
+
+class ChartDataLoader(QObject):
+    """Loads chart data in the background with stale-result suppression.
+
+    Signals:
+        data_loaded: Emitted with ChartLoadResult for the current load (may
+            fire twice: cached data first, then a refresh)
+        load_failed: Emitted with (text, message) if the current load fails
+    """
+
+    data_loaded = Signal(object)  # ChartLoadResult
+    load_failed = Signal(str, str)
+
+    def __init__(self, equation_parser: "TickerEquationParser", parent=None):
+        super().__init__(parent)
+        self._equation_parser = equation_parser
+        # Two threads so a new load can start while a cancelled one is still
+        # blocked in a network call
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._generation = 0
+        self._task: Optional[_ChartLoadTask] = None
+
+    @property
+    def generation(self) -> int:
+        """Token of the most recent load request."""
+        return self._generation
+
+    def is_loading(self) -> bool:
+        return self._task is not None
+
+    def load(self, text: str, interval: str) -> int:
+        """
+        Start loading a ticker or equation, superseding any load in flight.
+
+        Args:
+            text: Ticker symbol or equation as typed
+            interval: Chart interval (e.g., "Daily")
+
+        Returns:
+            Generation token of the new load
+        """
+        self.cancel()
+
+        self._generation += 1
+        task = _ChartLoadTask(text, interval, self._generation, self._equation_parser)
+        task.signals.loaded.connect(self._on_loaded)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.finished.connect(self._on_finished)
+        self._task = task
+        self._pool.start(task)
+        return self._generation
+
+    def cancel(self) -> None:
+        """Cancel the current load (no further signals are emitted for it)."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Block until all pool threads finish, including cancelled loads still
+        in a network call (ChartModule calls this on aboutToQuit).
+
+        Args:
+            msecs: Timeout in milliseconds (-1 waits indefinitely)
+
+        Returns:
+            True if all threads finished
+        """
+        return self._pool.waitForDone(msecs)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._task is not None and generation == self._generation
+
+    def _on_loaded(self, generation: int, result: object) -> None:
+        if self._is_current(generation):
+            self.data_loaded.emit(result)
+
+    def _on_finished(self, generation: int) -> None:
+        if self._is_current(generation):
+            self._task = None
+
+    def _on_failed(self, generation: int, message: str) -> None:
+        if self._is_current(generation):
+            text = self._task.text
+            self._task = None
+            self.load_failed.emit(text, message)
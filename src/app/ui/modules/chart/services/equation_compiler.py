@@ -0,0 +1,407 @@
+"""Equation compiler - AST compilation and vectorized evaluation of ticker equations.
+
+Equations are compiled once into a small AST and evaluated on an aligned
+panel: one float64 array of shape (tickers, dates, 4) holding Open, High,
+Low and Close for every referenced ticker on their common dates. Every node
+evaluates all four price fields at once, so an expression over dozens of
+symbols is a handful of NumPy operations.
+
+Grammar:
+    expr    := term (("+" | "-") term)*
+    term    := unary (("*" | "/") unary)*
+    unary   := "-" unary | primary
+    primary := NUMBER | TICKER | FUNC "(" expr ("," expr)* ")" | "(" expr ")"
+
+Functions:
+    log(x)       Natural log (non-positive values become NaN)
+    sma(x, n)    n-bar simple moving average
+    ratio(a, b)  a / b rebased so the first Close is 1.0
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import (
+    EQUATION_OPERATORS,
+    ERROR_INVALID_EXPRESSION,
+    ERROR_NO_OVERLAPPING_DATES,
+)
+
+PRICE_FIELDS = ("Open", "High", "Low", "Close")
+_CLOSE = PRICE_FIELDS.index("Close")
+
+# Function name -> number of arguments
+FUNCTIONS = {"log": 1, "sma": 2, "ratio": 2}
+
+Value = Union[np.ndarray, float]
+
+
+# ----------------------------------------------------------------------
+# AST
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Num:
+    value: float
+
+
+@dataclass(frozen=True)
+class Ticker:
+    symbol: str
+
+
+@dataclass(frozen=True)
+class Neg:
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class BinOp:
+    op: str
+    left: "Node"
+    right: "Node"
+
+
+@dataclass(frozen=True)
+class Call:
+    name: str
+    args: Tuple["Node", ...]
+
+
+Node = Union[Num, Ticker, Neg, BinOp, Call]
+
+
+@dataclass(frozen=True)
+class CompiledEquation:
+    """A parsed equation and the tickers it references (in first-use order)."""
+
+    expr: str
+    root: Node
+    tickers: Tuple[str, ...]
+
+
+# ----------------------------------------------------------------------
+# Tokenizer and parser
+# ----------------------------------------------------------------------
+
+
+def tokenize(expr: str) -> List[str]:
+    """
+    Split an expression into tickers, numbers, operators, parentheses and commas.
+
+    A "-" between a word and an alphanumeric character is part of the word
+    (BTC-USD), otherwise it is an operator. Anything else that is not
+    whitespace, an operator, a parenthesis or a comma builds up a word, so
+    tickers like ^GSPC, BRK.B and ES=F need no quoting.
+    """
+    tokens: List[str] = []
+    current = ""
+
+    for i, char in enumerate(expr):
+        if char == "-" and current and i + 1 < len(expr) and expr[i + 1].isalnum():
+            current += char
+            continue
+
+        if char.isspace() or char in "()," or char in EQUATION_OPERATORS:
+            if current:
+                tokens.append(current)
+                current = ""
+            if not char.isspace():
+                tokens.append(char)
+            continue
+
+        current += char
+
+    if current:
+        tokens.append(current)
+
+    return tokens
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.pos = 0
+        self.tickers: Dict[str, None] = {}
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: unexpected end of expression")
+        self.pos += 1
+        return token
+
+    def _expect(self, expected: str) -> None:
+        token = self._next()
+        if token != expected:
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: expected '{expected}', got '{token}'")
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: empty expression")
+        node = self._expr()
+        if self._peek() is not None:
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: unexpected '{self._peek()}'")
+        return node
+
+    def _expr(self) -> Node:
+        node = self._term()
+        while self._peek() in ("+", "-"):
+            op = self._next()
+            node = BinOp(op, node, self._term())
+        return node
+
+    def _term(self) -> Node:
+        node = self._unary()
+        while self._peek() in ("*", "/"):
+            op = self._next()
+            node = BinOp(op, node, self._unary())
+        return node
+
+    def _unary(self) -> Node:
+        if self._peek() == "-":
+            self._next()
+            return Neg(self._unary())
+        return self._primary()
+
+    def _primary(self) -> Node:
+        token = self._next()
+
+        if token == "(":
+            node = self._expr()
+            self._expect(")")
+            return node
+
+        if token in EQUATION_OPERATORS or token in "),":
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: unexpected '{token}'")
+
+        if _is_number(token):
+            return Num(float(token))
+
+        if self._peek() == "(" and token.lower() in FUNCTIONS:
+            return self._call(token.lower())
+
+        if not any(c.isalpha() for c in token):
+            raise ValueError(f"{ERROR_INVALID_EXPRESSION}: '{token}' is not a ticker")
+
+        symbol = token.upper()
+        self.tickers[symbol] = None
+        return Ticker(symbol)
+
+    def _call(self, name: str) -> Node:
+        self._expect("(")
+        args = [self._expr()]
+        while self._peek() == ",":
+            self._next()
+            args.append(self._expr())
+        self._expect(")")
+
+        if len(args) != FUNCTIONS[name]:
+            raise ValueError(
+                f"{ERROR_INVALID_EXPRESSION}: {name}() takes {FUNCTIONS[name]} "
+                f"argument(s), got {len(args)}"
+            )
+        if name == "sma":
+            window = args[1]
+            if not isinstance(window, Num) or window.value < 1 or window.value != int(window.value):
+                raise ValueError(f"{ERROR_INVALID_EXPRESSION}: sma() window must be a positive integer")
+
+        return Call(name, tuple(args))
+
+
+def compile_equation(expr: str) -> CompiledEquation:
+    """
+    Compile an equation (without the leading "=") into an AST.
+
+    Raises:
+        ValueError: If the expression is malformed or references no tickers
+    """
+    parser = _Parser(tokenize(expr))
+    root = parser.parse()
+    if not parser.tickers:
+        raise ValueError(f"{ERROR_INVALID_EXPRESSION}: no tickers in expression")
+    return CompiledEquation(expr, root, tuple(parser.tickers))
+
+
+# ----------------------------------------------------------------------
+# Aligned panel
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class AlignedPanel:
+    """OHLC data for several tickers on their common dates."""
+
+    index: pd.DatetimeIndex
+    tickers: Tuple[str, ...]
+    values: np.ndarray  # shape (len(tickers), len(index), 4)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes + self.index.nbytes)
+
+    def get(self, ticker: str) -> np.ndarray:
+        return self.values[self.tickers.index(ticker)]
+
+
+def align_panel(frames: Dict[str, pd.DataFrame]) -> AlignedPanel:
+    """
+    Inner-join ticker DataFrames on their dates and stack their OHLC columns.
+
+    Missing Open/High/Low columns fall back to Close.
+
+    Raises:
+        ValueError: If the tickers share no dates
+    """
+    tickers = tuple(frames)
+    common_index = None
+    for df in frames.values():
+        index = df.index[~df.index.duplicated(keep="last")]
+        common_index = index if common_index is None else common_index.intersection(index)
+
+    if common_index is None or len(common_index) == 0:
+        raise ValueError(ERROR_NO_OVERLAPPING_DATES)
+    common_index = common_index.sort_values()
+
+    values = np.empty((len(tickers), len(common_index), len(PRICE_FIELDS)), dtype=np.float64)
+    for i, ticker in enumerate(tickers):
+        df = frames[ticker]
+        df = df[~df.index.duplicated(keep="last")]
+        rows = df.index.get_indexer(common_index)
+        close = df["Close"].to_numpy(dtype=np.float64)[rows]
+        for j, field in enumerate(PRICE_FIELDS):
+            if field in df.columns:
+                values[i, :, j] = df[field].to_numpy(dtype=np.float64)[rows]
+            else:
+                values[i, :, j] = close
+
+    return AlignedPanel(pd.DatetimeIndex(common_index), tickers, values)
+
+
+# ----------------------------------------------------------------------
+# Evaluation
+# ----------------------------------------------------------------------
+
+
+def evaluate(compiled: CompiledEquation, panel: AlignedPanel) -> pd.DataFrame:
+    """
+    Evaluate a compiled equation over an aligned panel.
+
+    High and Low are re-derived as the max/min of the four evaluated fields,
+    since operations like division or negation can swap their order. Leading
+    rows without a value (e.g. the warm-up of an sma) are dropped; if no row
+    has a value (e.g. SPY/0), all rows are kept as NaN.
+
+    Returns:
+        DataFrame with Open, High, Low, Close columns
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = _eval(compiled.root, panel)
+
+    if not isinstance(result, np.ndarray):
+        result = np.full((len(panel.index), len(PRICE_FIELDS)), result, dtype=np.float64)
+    result = np.array(result, dtype=np.float64)
+    result[~np.isfinite(result)] = np.nan
+
+    high = np.max(np.where(np.isnan(result), -np.inf, result), axis=1)
+    low = np.min(np.where(np.isnan(result), np.inf, result), axis=1)
+    result[:, 1] = np.where(np.isfinite(high), high, np.nan)
+    result[:, 2] = np.where(np.isfinite(low), low, np.nan)
+
+    df = pd.DataFrame(result, index=panel.index, columns=list(PRICE_FIELDS))
+    valid = ~np.isnan(result).all(axis=1)
+    if valid.any() and not valid.all():
+        df = df.iloc[int(np.argmax(valid)):]
+    return df
+
+
+def _eval(node: Node, panel: AlignedPanel) -> Value:
+    if isinstance(node, Num):
+        return node.value
+    if isinstance(node, Ticker):
+        return panel.get(node.symbol)
+    if isinstance(node, Neg):
+        return -_eval(node.operand, panel)
+    if isinstance(node, BinOp):
+        a = _eval(node.left, panel)
+        b = _eval(node.right, panel)
+        if node.op == "+":
+            return a + b
+        if node.op == "-":
+            return a - b
+        if node.op == "*":
+            return a * b
+        return _divide(a, b)
+    if isinstance(node, Call):
+        return _call(node, panel)
+    raise ValueError(f"{ERROR_INVALID_EXPRESSION}: unknown node {node!r}")
+
+
+def _divide(a: Value, b: Value) -> Value:
+    """Divide with NaN instead of inf where the divisor is zero."""
+    if isinstance(b, np.ndarray):
+        a = np.broadcast_to(a, b.shape)
+        return np.divide(a, b, out=np.full(b.shape, np.nan), where=b != 0)
+    if b == 0:
+        return np.full_like(a, np.nan, dtype=float) if isinstance(a, np.ndarray) else np.nan
+    return a / b
+
+
+def _call(node: Call, panel: AlignedPanel) -> Value:
+    if node.name == "sma":
+        x = _eval(node.args[0], panel)
+        return _sma(x, int(node.args[1].value))  # type: ignore[union-attr]
+
+    args = [_eval(arg, panel) for arg in node.args]
+    if node.name == "log":
+        x = args[0]
+        if isinstance(x, np.ndarray):
+            return np.log(np.where(x > 0, x, np.nan))
+        return float(np.log(x)) if x > 0 else np.nan
+    if node.name == "ratio":
+        quotient = _divide(*args)
+        if not isinstance(quotient, np.ndarray):
+            return 1.0
+        closes = quotient[:, _CLOSE]
+        finite = np.flatnonzero(np.isfinite(closes) & (closes != 0))
+        if finite.size == 0:
+            return np.full_like(quotient, np.nan)
+        return quotient / closes[finite[0]]
+    raise ValueError(f"{ERROR_INVALID_EXPRESSION}: unknown function {node.name}()")
+
+
+def _sma(x: Value, window: int) -> Value:
+    """Rolling mean over the date axis via cumulative sums (NaN during warm-up)."""
+    if not isinstance(x, np.ndarray):
+        return x
+    out = np.full(x.shape, np.nan)
+    if window > len(x):
+        return out
+    # NaNs count as gaps so one bad bar only blanks the windows it falls in
+    valid = np.isfinite(x)
+    zeros = np.zeros((1, x.shape[1]))
+    csum = np.cumsum(np.vstack([zeros, np.where(valid, x, 0.0)]), axis=0)
+    count = np.cumsum(np.vstack([zeros, valid]), axis=0)
+    sums = csum[window:] - csum[:-window]
+    full = (count[window:] - count[:-window]) == window
+    out[window - 1:] = np.where(full, sums / window, np.nan)
+    return out
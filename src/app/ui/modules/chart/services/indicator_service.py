@@ -734,7 +734,10 @@ class IndicatorService:
 
     @classmethod
     def calculate_multiple(
-        cls, df: "pd.DataFrame", indicator_names: List[str]
+        cls,
+        df: "pd.DataFrame",
+        indicator_names: List[str],
+        streams: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Calculate multiple indicators.
@@ -742,6 +745,9 @@ class IndicatorService:
         Args:
             df: DataFrame with OHLCV data
             indicator_names: List of indicator names to calculate
+            streams: Optional caller-owned incremental state (indicator name ->
+                IndicatorStream) for one chart series; it is reset and seeded
+                from `df` for use by update_multiple
 
         Returns:
             Dictionary mapping indicator names to dicts containing:
@@ -764,8 +770,135 @@ class IndicatorService:
                     "data": result_df,
                     "per_line_appearance": per_line_appearance,  # Only this field
                 }
+
+        # A full calculation (new ticker, interval, data or settings) resets
+        # the incremental state used by update_multiple
+        if streams is not None:
+            streams.clear()
+            for name in indicator_names:
+                cls._seed_stream(df, name, streams)
+        return results
+
+    @classmethod
+    def update_multiple(
+        cls,
+        df: "pd.DataFrame",
+        indicator_names: List[str],
+        appended: bool,
+        streams: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Update indicators after the last bar changed or a bar was appended.
+
+        Built-in indicators advance their rolling state (running sums, EMA
+        carries, min/max deques, cumulative totals) in O(1) and return only
+        the last row. Plugin indicators, indicators whose state is out of
+        sync with `df` (length or live bar date), and non-finite bars fall
+        back to a full calculation.
+
+        Args:
+            df: DataFrame with OHLCV data, last row already updated/appended
+            indicator_names: List of indicator names to update
+            appended: True if the last row of `df` is a new bar
+            streams: The chart series' incremental state, as seeded by
+                calculate_multiple (updated in place)
+
+        Returns:
+            Same structure as calculate_multiple, plus "start": the row
+            position of the first row in "data" (len(df) - 1 for incremental
+            results, 0 for full recalculations)
+        """
+        import pandas as pd
+
+        cls._ensure_initialized()
+        results = {}
+        bar = cls._stream_bar(df)
+        expected = len(df) - 1 if appended else len(df)
+        # The stream's live bar is the previous row after an append
+        live_index = df.index[-2] if appended and len(df) > 1 else df.index[-1]
+        for name in indicator_names:
+            config = cls.ALL_INDICATORS.get(name, {})
+            stream = streams.get(name)
+
+            if (
+                bar is None
+                or stream is None
+                or stream.config != config
+                or stream.length != expected
+                or stream.index != live_index
+            ):
+                # Full recalculation, then continue incrementally from here
+                result_df = cls.calculate(df, name)
+                cls._seed_stream(df, name, streams)
+                start = 0
+            else:
+                values = stream.update(bar, append=appended)
+                stream.index = df.index[-1]
+                result_df = pd.DataFrame(
+                    {col: [values[col]] for col in stream.columns}, index=df.index[-1:]
+                )
+                start = len(df) - 1
+
+            if result_df is None:
+                continue
+
+            per_line_appearance = config.get("per_line_appearance", {})
+            if config.get("kind") == "plugin":
+                per_line_appearance = cls.get_plugin_appearance(name)
+
+            results[name] = {
+                "data": result_df,
+                "per_line_appearance": per_line_appearance,
+                "start": start,
+            }
         return results
 
+    @classmethod
+    def _seed_stream(
+        cls, df: "pd.DataFrame", indicator_name: str, streams: Dict[str, Any]
+    ) -> None:
+        """Rebuild the incremental state for one indicator (drop it if unsupported)."""
+        from .indicator_streams import STREAM_CLASSES
+
+        streams.pop(indicator_name, None)
+        config = cls.ALL_INDICATORS.get(indicator_name)
+        if config is None or config.get("kind") not in STREAM_CLASSES or df is None or df.empty:
+            return
+
+        stream_class, sources = STREAM_CLASSES[config["kind"]]
+        if any(col not in df.columns for col in sources):
+            return
+        # Streams assume finite input; histories with gaps are recomputed
+        # (NaN and inf both fail the comparison)
+        if not (df[list(sources)].astype(float).abs() < float("inf")).to_numpy().all():
+            return
+
+        try:
+            stream = stream_class(dict(config))
+            stream.seed(df.iloc[:-1])
+            stream.update(cls._stream_bar(df), append=True)
+        except Exception as e:
+            print(f"Error seeding live state for {indicator_name}: {e}")
+            return
+        stream.index = df.index[-1]
+        streams[indicator_name] = stream
+
+    @staticmethod
+    def _stream_bar(df: "pd.DataFrame"):
+        """Last row of df as an (open, high, low, close, volume) tuple, or None if not finite."""
+        import math
+
+        if df is None or df.empty:
+            return None
+        last = df.iloc[-1]
+        bar = tuple(
+            float(last[col]) if col in df.columns else 0.0
+            for col in ("Open", "High", "Low", "Close", "Volume")
+        )
+        if not all(math.isfinite(v) for v in bar):
+            return None
+        return bar
+
     # ========================
     # Indicator Implementations
     # ========================
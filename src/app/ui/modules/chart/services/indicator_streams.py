@@ -0,0 +1,491 @@
+"""Indicator Streams - O(1) incremental indicator state for live bars.
+
+Each stream holds the rolling state of one built-in indicator as of the last
+*settled* bar (running sums, EMA carries, monotonic min/max deques,
+cumulative OBV/VWAP totals) plus the current live bar. A live tick either
+replaces the live bar (same period) or settles it and starts a new one
+(appended bar); both cost O(1) per indicator instead of recomputing the
+whole history.
+
+Streams are seeded from the settled history with vectorized pandas code and
+reproduce IndicatorService's full calculations for the live bar. They require
+finite OHLCV input; callers fall back to a full recompute otherwise.
+"""
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Bar tuple layout used by the streams
+Bar = Tuple[float, float, float, float, float]  # open, high, low, close, volume
+
+_NAN = float("nan")
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Float division with NumPy semantics (x/0 -> +-inf, 0/0 -> NaN)."""
+    if denominator != 0:
+        return numerator / denominator
+    if numerator == 0 or math.isnan(numerator):
+        return _NAN
+    return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+
+
+def _ewm_last(values: "pd.Series", alpha: float) -> Optional[float]:
+    """Last value of ewm(alpha, adjust=False).mean(), or None if empty."""
+    if len(values) == 0:
+        return None
+    return float(values.ewm(alpha=alpha, adjust=False).mean().iloc[-1])
+
+
+# ========================
+# Rolling building blocks
+# ========================
+
+
+class _RollingMean:
+    """Rolling mean of `length` values via a running sum over a window deque."""
+
+    __slots__ = ("length", "window", "total", "nans")
+
+    def __init__(self, length: int):
+        self.length = int(length)
+        self.window: deque = deque()
+        self.total = 0.0
+        self.nans = 0
+
+    def seed(self, values) -> None:
+        """Load the last length - 1 settled values."""
+        self.window = deque()
+        self.total = 0.0
+        self.nans = 0
+        keep = self.length - 1
+        for x in (list(values[-keep:]) if keep > 0 else []):
+            self.push(float(x))
+
+    def value(self, x: float) -> float:
+        """Mean of the settled window plus `x` (NaN during warm-up)."""
+        if len(self.window) < self.length - 1 or self.nans or math.isnan(x):
+            return _NAN
+        return (self.total + x) / self.length
+
+    def push(self, x: float) -> Optional[float]:
+        """Settle `x` into the window; returns the evicted value, if any."""
+        self.window.append(x)
+        if math.isnan(x):
+            self.nans += 1
+        else:
+            self.total += x
+        if len(self.window) <= self.length - 1:
+            return None
+        old = self.window.popleft()
+        if math.isnan(old):
+            self.nans -= 1
+        else:
+            self.total -= old
+        return old
+
+
+class _RollingStd(_RollingMean):
+    """Rolling mean and sample std (ddof=1) from shifted running sums."""
+
+    __slots__ = ("shift", "total_sq")
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self.shift = 0.0
+        self.total_sq = 0.0
+
+    def seed(self, values) -> None:
+        # Shifting by a recent value keeps the sum-of-squares well conditioned
+        self.shift = float(values[-1]) if len(values) else 0.0
+        self.total_sq = 0.0
+        super().seed(values)
+
+    def mean_std(self, x: float) -> Tuple[float, float]:
+        """(mean, std) of the settled window plus `x`."""
+        mean = self.value(x)
+        if math.isnan(mean) or self.length < 2:
+            return mean, _NAN
+        d = x - self.shift
+        s1 = self.total - self.shift * len(self.window) + d
+        s2 = self.total_sq + d * d
+        var = (s2 - s1 * s1 / self.length) / (self.length - 1)
+        return mean, math.sqrt(max(var, 0.0))
+
+    def push(self, x: float) -> Optional[float]:
+        old = super().push(x)
+        if not math.isnan(x):
+            self.total_sq += (x - self.shift) ** 2
+        if old is not None and not math.isnan(old):
+            self.total_sq -= (old - self.shift) ** 2
+        return old
+
+
+class _Ema:
+    """Exponential moving average carry (pandas ewm with adjust=False)."""
+
+    __slots__ = ("alpha", "prev")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.prev: Optional[float] = None
+
+    def value(self, x: float) -> float:
+        if self.prev is None:
+            return x
+        return (1.0 - self.alpha) * self.prev + self.alpha * x
+
+    def push(self, x: float) -> None:
+        self.prev = self.value(x)
+
+
+class _RollingExtreme:
+    """Rolling min or max of `length` values via a monotonic deque."""
+
+    __slots__ = ("length", "is_max", "window", "seen")
+
+    def __init__(self, length: int, is_max: bool):
+        self.length = int(length)
+        self.is_max = is_max
+        self.window: deque = deque()  # (position, value), monotonic
+        self.seen = 0
+
+    def seed(self, values) -> None:
+        self.window = deque()
+        keep = self.length - 1
+        tail = list(values[-keep:]) if keep > 0 else []
+        self.seen = len(values) - len(tail)
+        for x in tail:
+            self.push(float(x))
+
+    def value(self, x: float) -> float:
+        """Extreme of the settled window plus `x` (NaN during warm-up)."""
+        if self.seen < self.length - 1:
+            return _NAN
+        if not self.window:
+            return x
+        best = self.window[0][1]
+        return max(best, x) if self.is_max else min(best, x)
+
+    def push(self, x: float) -> None:
+        pos = self.seen
+        self.seen += 1
+        while self.window and (
+            self.window[-1][1] <= x if self.is_max else self.window[-1][1] >= x
+        ):
+            self.window.pop()
+        self.window.append((pos, x))
+        while self.window and self.window[0][0] <= pos - (self.length - 1):
+            self.window.popleft()
+
+
+# ========================
+# Indicator streams
+# ========================
+
+
+class IndicatorStream(ABC):
+    """
+    Incremental state for one indicator.
+
+    Subclasses implement _seed (settled history -> state) and _step (one bar
+    -> output values, settling the bar into the state when commit is True).
+
+    Attributes:
+        config: Indicator config the state was built for
+        settled: Number of settled bars
+        index: Index label of the live bar (maintained by the caller, so a
+            different series of the same length is not continued)
+    """
+
+    columns: Tuple[str, ...] = ()
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.settled = 0
+        self.index: Any = None
+        self._live: Optional[Bar] = None
+
+    @property
+    def length(self) -> int:
+        """Number of bars covered, including the live bar."""
+        return self.settled + (1 if self._live is not None else 0)
+
+    def seed(self, history: "pd.DataFrame") -> None:
+        """
+        Rebuild the state from settled bars (vectorized, O(n)).
+
+        Args:
+            history: OHLCV DataFrame of settled bars (excluding the live bar)
+        """
+        self._seed(history)
+        self.settled = len(history)
+        self._live = None
+
+    def update(self, bar: Bar, append: bool) -> Dict[str, float]:
+        """
+        Apply a live bar in O(1).
+
+        Args:
+            bar: (open, high, low, close, volume) of the live bar
+            append: True if `bar` starts a new period (the previous live bar
+                is settled first), False if it replaces the live bar
+
+        Returns:
+            Dict mapping output column to the live bar's value
+        """
+        if append and self._live is not None:
+            self._step(self._live, commit=True)
+            self.settled += 1
+        self._live = bar
+        return self._step(bar, commit=False)
+
+    @abstractmethod
+    def _seed(self, history: "pd.DataFrame") -> None:
+        """Build the rolling state from settled bars."""
+        pass
+
+    @abstractmethod
+    def _step(self, bar: Bar, commit: bool) -> Dict[str, float]:
+        """Output values for one bar; settle it into the state if commit."""
+        pass
+
+
+class SmaStream(IndicatorStream):
+    columns = ("SMA",)
+
+    def _seed(self, history):
+        self._mean = _RollingMean(self.config["length"])
+        self._mean.seed(history["Close"].to_numpy(dtype=float))
+
+    def _step(self, bar, commit):
+        close = bar[3]
+        out = {"SMA": self._mean.value(close)}
+        if commit:
+            self._mean.push(close)
+        return out
+
+
+class EmaStream(IndicatorStream):
+    columns = ("EMA",)
+
+    def _seed(self, history):
+        alpha = 2.0 / (self.config["length"] + 1.0)
+        self._ema = _Ema(alpha)
+        self._ema.prev = _ewm_last(history["Close"], alpha)
+
+    def _step(self, bar, commit):
+        close = bar[3]
+        out = {"EMA": self._ema.value(close)}
+        if commit:
+            self._ema.push(close)
+        return out
+
+
+class BBandsStream(IndicatorStream):
+    columns = ("BB_Upper", "BB_Middle", "BB_Lower")
+
+    def _seed(self, history):
+        self._stats = _RollingStd(self.config["length"])
+        self._stats.seed(history["Close"].to_numpy(dtype=float))
+
+    def _step(self, bar, commit):
+        close = bar[3]
+        middle, std = self._stats.mean_std(close)
+        width = std * self.config["std"]
+        out = {"BB_Upper": middle + width, "BB_Middle": middle, "BB_Lower": middle - width}
+        if commit:
+            self._stats.push(close)
+        return out
+
+
+class RsiStream(IndicatorStream):
+    columns = ("RSI",)
+
+    def _seed(self, history):
+        alpha = 2.0 / (self.config["length"] + 1.0)
+        close = history["Close"]
+        delta = close.diff()
+        self._gain = _Ema(alpha)
+        self._loss = _Ema(alpha)
+        self._gain.prev = _ewm_last(delta.where(delta > 0, 0.0), alpha)
+        self._loss.prev = _ewm_last(-delta.where(delta < 0, 0.0), alpha)
+        self._prev_close = float(close.iloc[-1]) if len(close) else None
+
+    def _step(self, bar, commit):
+        close = bar[3]
+        delta = close - self._prev_close if self._prev_close is not None else 0.0
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        rs = _divide(self._gain.value(gain), self._loss.value(loss))
+        out = {"RSI": 100.0 - _divide(100.0, 1.0 + rs)}
+        if commit:
+            self._gain.push(gain)
+            self._loss.push(loss)
+            self._prev_close = close
+        return out
+
+
+class MacdStream(IndicatorStream):
+    columns = ("MACD", "MACDs", "MACDh")
+
+    def _seed(self, history):
+        close = history["Close"]
+        self._fast = _Ema(2.0 / (self.config["fast"] + 1.0))
+        self._slow = _Ema(2.0 / (self.config["slow"] + 1.0))
+        self._signal = _Ema(2.0 / (self.config["signal"] + 1.0))
+        if len(close):
+            fast = close.ewm(alpha=self._fast.alpha, adjust=False).mean()
+            slow = close.ewm(alpha=self._slow.alpha, adjust=False).mean()
+            self._fast.prev = float(fast.iloc[-1])
+            self._slow.prev = float(slow.iloc[-1])
+            self._signal.prev = _ewm_last(fast - slow, self._signal.alpha)
+
+    def _step(self, bar, commit):
+        close = bar[3]
+        macd = self._fast.value(close) - self._slow.value(close)
+        signal = self._signal.value(macd)
+        out = {"MACD": macd, "MACDs": signal, "MACDh": macd - signal}
+        if commit:
+            self._fast.push(close)
+            self._slow.push(close)
+            self._signal.push(macd)
+        return out
+
+
+class StochasticStream(IndicatorStream):
+    columns = ("STOCHk", "STOCHd")
+
+    def _seed(self, history):
+        k, d, smooth_k = self.config["k"], self.config["d"], self.config["smooth_k"]
+        self._lowest = _RollingExtreme(k, is_max=False)
+        self._highest = _RollingExtreme(k, is_max=True)
+        self._lowest.seed(history["Low"].to_numpy(dtype=float))
+        self._highest.seed(history["High"].to_numpy(dtype=float))
+
+        # The live bar's %K/%D only depend on the last few settled bars
+        tail = history.iloc[-(k + smooth_k + d):]
+        lowest_low = tail["Low"].rolling(window=k).min()
+        highest_high = tail["High"].rolling(window=k).max()
+        k_fast = 100 * (tail["Close"] - lowest_low) / (highest_high - lowest_low)
+        k_slow = k_fast.rolling(window=smooth_k).mean()
+
+        self._k_smooth = _RollingMean(smooth_k)
+        self._k_smooth.seed(k_fast.to_numpy(dtype=float))
+        self._d_mean = _RollingMean(d)
+        self._d_mean.seed(k_slow.to_numpy(dtype=float))
+
+    def _step(self, bar, commit):
+        high, low, close = bar[1], bar[2], bar[3]
+        lowest = self._lowest.value(low)
+        highest = self._highest.value(high)
+        k_fast = 100 * _divide(close - lowest, highest - lowest)
+        k_slow = self._k_smooth.value(k_fast)
+        out = {"STOCHk": k_slow, "STOCHd": self._d_mean.value(k_slow)}
+        if commit:
+            self._lowest.push(low)
+            self._highest.push(high)
+            self._k_smooth.push(k_fast)
+            self._d_mean.push(k_slow)
+        return out
+
+
+class AtrStream(IndicatorStream):
+    columns = ("ATR",)
+
+    def _seed(self, history):
+        import pandas as pd
+
+        alpha = 2.0 / (self.config["length"] + 1.0)
+        high, low, close = history["High"], history["Low"], history["Close"]
+        tr = pd.concat(
+            [high - low, abs(high - close.shift()), abs(low - close.shift())], axis=1
+        ).max(axis=1)
+        self._atr = _Ema(alpha)
+        self._atr.prev = _ewm_last(tr, alpha)
+        self._prev_close = float(close.iloc[-1]) if len(close) else None
+
+    def _step(self, bar, commit):
+        high, low, close = bar[1], bar[2], bar[3]
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        out = {"ATR": self._atr.value(tr)}
+        if commit:
+            self._atr.push(tr)
+            self._prev_close = close
+        return out
+
+
+class ObvStream(IndicatorStream):
+    columns = ("OBV",)
+
+    def _seed(self, history):
+        import numpy as np
+
+        close = history["Close"]
+        flow = (np.sign(close.diff()) * history["Volume"]).fillna(0)
+        self._total = float(flow.sum())
+        self._prev_close = float(close.iloc[-1]) if len(close) else None
+
+    def _step(self, bar, commit):
+        close, volume = bar[3], bar[4]
+        flow = 0.0
+        if self._prev_close is not None:
+            change = close - self._prev_close
+            flow = volume * ((change > 0) - (change < 0))
+        out = {"OBV": self._total + flow}
+        if commit:
+            self._total += flow
+            self._prev_close = close
+        return out
+
+
+class VwapStream(IndicatorStream):
+    columns = ("VWAP",)
+
+    def _seed(self, history):
+        typical = (history["High"] + history["Low"] + history["Close"]) / 3
+        self._pv = float((typical * history["Volume"]).sum())
+        self._volume = float(history["Volume"].sum())
+
+    def _step(self, bar, commit):
+        _, high, low, close, volume = bar
+        pv = (high + low + close) / 3 * volume
+        out = {"VWAP": _divide(self._pv + pv, self._volume + volume)}
+        if commit:
+            self._pv += pv
+            self._volume += volume
+        return out
+
+
+class VolumeStream(IndicatorStream):
+    columns = ("Volume", "Volume_Direction")
+
+    def _seed(self, history):
+        pass
+
+    def _step(self, bar, commit):
+        open_, close, volume = bar[0], bar[3], bar[4]
+        return {"Volume": volume, "Volume_Direction": (close > open_) - (close < open_)}
+
+
+# Indicator kind -> (stream class, required source columns)
+STREAM_CLASSES: Dict[str, Tuple[type, Tuple[str, ...]]] = {
+    "sma": (SmaStream, ("Close",)),
+    "ema": (EmaStream, ("Close",)),
+    "bbands": (BBandsStream, ("Close",)),
+    "rsi": (RsiStream, ("Close",)),
+    "macd": (MacdStream, ("Close",)),
+    "stochastic": (StochasticStream, ("High", "Low", "Close")),
+    "atr": (AtrStream, ("High", "Low", "Close")),
+    "obv": (ObvStream, ("Close", "Volume")),
+    "vwap": (VwapStream, ("High", "Low", "Close", "Volume")),
+    "volume": (VolumeStream, ("Open", "Close", "Volume")),
+}
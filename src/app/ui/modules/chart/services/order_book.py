@@ -0,0 +1,230 @@
+"""
+Array-backed order book.
+
+Each side keeps its price levels in sorted NumPy arrays. Updates locate
+levels with a binary search (np.searchsorted) and apply a whole diff event
+at once: quantities are changed in place, and removed and new levels are
+handled with a single np.delete / np.insert per event. Readers get a
+BookView of the top levels as arrays, so cumulative depth, bucketing,
+spread and imbalance are all vectorized and no per-level Python objects
+are created.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+def _to_levels(levels: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert [["price", "qty"], ...] (strings or numbers) to float arrays."""
+    arr = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+    return arr[:, 0], arr[:, 1]
+
+
+class OrderBookSide:
+    """
+    One side of the book: prices stored ascending, quantities aligned.
+
+    Bids are best at the high end, asks at the low end; top() always
+    returns levels best-first.
+    """
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.prices = np.empty(0, dtype=np.float64)
+        self.quantities = np.empty(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def load(self, prices: np.ndarray, quantities: np.ndarray) -> None:
+        """Replace all levels (zero quantities are dropped)."""
+        keep = quantities > 0
+        order = np.argsort(prices[keep], kind="stable")
+        self.prices = prices[keep][order]
+        self.quantities = quantities[keep][order]
+
+    def apply(self, prices: np.ndarray, quantities: np.ndarray) -> np.ndarray:
+        """
+        Apply level updates (quantity 0 removes the level).
+
+        Args:
+            prices: Updated prices (if a price repeats, its last update wins)
+            quantities: New absolute quantities
+
+        Returns:
+            Prices whose quantity actually changed
+        """
+        if len(prices) == 0:
+            return prices
+
+        # Last update wins for repeated prices
+        _, last = np.unique(prices[::-1], return_index=True)
+        pick = len(prices) - 1 - last
+        prices, quantities = prices[pick], quantities[pick]
+
+        n = len(self.prices)
+        pos = np.searchsorted(self.prices, prices)
+        if n:
+            safe = np.minimum(pos, n - 1)
+            found = (pos < n) & (self.prices[safe] == prices)
+            modify = found & (quantities > 0) & (self.quantities[safe] != quantities)
+        else:
+            found = modify = np.zeros(len(prices), dtype=bool)
+        remove = found & (quantities == 0)
+        insert = ~found & (quantities > 0)
+
+        if modify.any():
+            self.quantities[pos[modify]] = quantities[modify]
+        if remove.any():
+            self.prices = np.delete(self.prices, pos[remove])
+            self.quantities = np.delete(self.quantities, pos[remove])
+        if insert.any():
+            new_prices = prices[insert]  # Sorted: np.unique output order
+            at = np.searchsorted(self.prices, new_prices)
+            self.prices = np.insert(self.prices, at, new_prices)
+            self.quantities = np.insert(self.quantities, at, quantities[insert])
+
+        return prices[remove | modify | insert]
+
+    def best(self) -> Optional[float]:
+        if not len(self.prices):
+            return None
+        return float(self.prices[-1] if self.is_bid else self.prices[0])
+
+    def top(self, levels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Copies of the best `levels` prices and quantities, best first."""
+        if self.is_bid:
+            start = max(len(self.prices) - levels, 0)
+            return self.prices[start:][::-1].copy(), self.quantities[start:][::-1].copy()
+        return self.prices[:levels].copy(), self.quantities[:levels].copy()
+
+
+class OrderBook:
+    """Bid and ask sides with vectorized level updates."""
+
+    def __init__(self):
+        self.bids = OrderBookSide(is_bid=True)
+        self.asks = OrderBookSide(is_bid=False)
+
+    @classmethod
+    def from_levels(cls, bids: Iterable, asks: Iterable) -> "OrderBook":
+        """Build a book from [["price", "qty"], ...] lists (e.g. a REST snapshot)."""
+        book = cls()
+        book.load(bids, asks)
+        return book
+
+    def load(self, bids: Iterable, asks: Iterable) -> None:
+        """Replace both sides with snapshot levels."""
+        self.bids.load(*_to_levels(bids))
+        self.asks.load(*_to_levels(asks))
+
+    def apply(self, bids: Iterable, asks: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply a diff of [["price", "qty"], ...] updates per side.
+
+        Returns:
+            (changed bid prices, changed ask prices)
+        """
+        return self.bids.apply(*_to_levels(bids)), self.asks.apply(*_to_levels(asks))
+
+    def view(self, levels: int) -> "BookView":
+        """Snapshot of the top `levels` per side."""
+        bid_prices, bid_qty = self.bids.top(levels)
+        ask_prices, ask_qty = self.asks.top(levels)
+        return BookView(bid_prices, bid_qty, ask_prices, ask_qty)
+
+
+@dataclass(frozen=True)
+class BookView:
+    """Top of the book as arrays, best level first on each side."""
+
+    bid_prices: np.ndarray  # Descending
+    bid_quantities: np.ndarray
+    ask_prices: np.ndarray  # Ascending
+    ask_quantities: np.ndarray
+
+    def __post_init__(self):
+        for arr in (self.bid_prices, self.bid_quantities, self.ask_prices, self.ask_quantities):
+            arr.flags.writeable = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not len(self.bid_prices) and not len(self.ask_prices)
+
+    @property
+    def best_bid(self) -> float:
+        return float(self.bid_prices[0]) if len(self.bid_prices) else 0
+
+    @property
+    def best_ask(self) -> float:
+        return float(self.ask_prices[0]) if len(self.ask_prices) else 0
+
+    @property
+    def spread(self) -> float:
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return 0
+        return self.best_ask - self.best_bid
+
+    @property
+    def spread_pct(self) -> float:
+        return self.spread / self.best_bid * 100 if self.best_bid else 0
+
+    @property
+    def mid(self) -> float:
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return 0
+        return (self.best_bid + self.best_ask) / 2
+
+    def cumulative_bids(self) -> np.ndarray:
+        """Running bid quantity from the best bid outward."""
+        return np.cumsum(self.bid_quantities)
+
+    def cumulative_asks(self) -> np.ndarray:
+        """Running ask quantity from the best ask outward."""
+        return np.cumsum(self.ask_quantities)
+
+    def imbalance(self, levels: Optional[int] = None) -> float:
+        """
+        Bid/ask volume imbalance over the top levels.
+
+        Returns:
+            (bid volume - ask volume) / (bid volume + ask volume), in [-1, 1]
+        """
+        bid_volume = float(self.bid_quantities[:levels].sum())
+        ask_volume = float(self.ask_quantities[:levels].sum())
+        total = bid_volume + ask_volume
+        return (bid_volume - ask_volume) / total if total else 0
+
+    def weighted_prices(self) -> Tuple[float, float]:
+        """Volume-weighted average (bid, ask) prices."""
+        bid_volume = self.bid_quantities.sum()
+        ask_volume = self.ask_quantities.sum()
+        bid = float(self.bid_prices @ self.bid_quantities / bid_volume) if bid_volume else 0
+        ask = float(self.ask_prices @ self.ask_quantities / ask_volume) if ask_volume else 0
+        return bid, ask
+
+    def aggregate(self, tick_size: float) -> "BookView":
+        """
+        Group levels into price buckets of `tick_size`.
+
+        Bids are floored and asks ceiled to the bucket edge, so buckets never
+        cross the spread.
+        """
+        if tick_size <= 0:
+            return self
+        bid_prices, bid_qty = _bucket(self.bid_prices, self.bid_quantities, tick_size, np.floor)
+        ask_prices, ask_qty = _bucket(self.ask_prices, self.ask_quantities, tick_size, np.ceil)
+        return BookView(bid_prices, bid_qty, ask_prices, ask_qty)
+
+
+def _bucket(prices: np.ndarray, quantities: np.ndarray, tick: float, rounding) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum quantities per bucket (input sorted best-first, so buckets are contiguous)."""
+    if not len(prices):
+        return prices.copy(), quantities.copy()
+    buckets = rounding(np.round(prices / tick, 9)) * tick
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    return buckets[starts], np.add.reduceat(quantities, starts)
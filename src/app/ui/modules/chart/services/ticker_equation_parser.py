@@ -1,20 +1,32 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Tuple
 
-import numpy as np
 import pandas as pd
 
-from app.services.market_data import fetch_price_history
+from app.services.market_data import fetch_price_history_batch, resample_price_history
+from app.services.memory_cache import get_memory_cache
 from app.core.config import (
-    EQUATION_OPERATORS,
     EQUATION_PREFIX,
+    EQUATION_COMPILE_CACHE_SIZE,
     DEFAULT_PERIOD,
-    ERROR_INVALID_EXPRESSION,
-    ERROR_NO_OVERLAPPING_DATES,
+    ERROR_NO_DATA,
 )
 
+from .equation_compiler import (
+    AlignedPanel,
+    CompiledEquation,
+    align_panel,
+    compile_equation,
+    evaluate,
+)
+
+# Aligned panels live in the shared byte-budgeted LRU under this namespace
+_PANEL_NAMESPACE = "equation_panels"
+
 
 class TickerEquationParser:
     """
@@ -25,10 +37,20 @@ class TickerEquationParser:
         =BTC-USD/SPX
         =BTC-USD + ETH-USD
         =(BTC-USD + ETH-USD)/2
+        =log(BTC-USD)
+        =sma(XLE/SPY, 50)
+        =ratio(QQQ, SPY)
+
+    Equations are compiled once (LRU of EQUATION_COMPILE_CACHE_SIZE) and
+    evaluated on NumPy arrays. All tickers of an equation are fetched in one
+    batch, and their aligned OHLC panel is cached in the shared memory cache
+    until any of the underlying series changes.
     """
 
     def __init__(self):
-        self._ticker_cache = {}
+        self._compiled: "OrderedDict[str, CompiledEquation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._panels = get_memory_cache()
 
     def is_equation(self, text: str) -> bool:
         """
@@ -72,9 +94,18 @@ class TickerEquationParser:
     ) -> Tuple[pd.DataFrame, str]:
         """
         Parse and evaluate a ticker equation.
-        
+
+        Args:
+            equation: Equation text (leading "=" optional)
+            period: Kept for compatibility; full cached history is always used
+            interval: Chart interval (e.g., "Daily", "weekly")
+
         Returns:
             (result_dataframe, description)
+
+        Raises:
+            ValueError: If the expression is invalid, a ticker has no data, or
+                the tickers share no dates
         """
         equation = equation.strip()
         
@@ -84,272 +115,66 @@ class TickerEquationParser:
         else:
             expr = equation
 
-        # Tokenize the expression
-        tokens = self._tokenize(expr)
-
-        # Extract all tickers from tokens
-        tickers = [t for t in tokens if self._is_ticker(t)]
-
-        # Fetch all ticker data
-        ticker_data = {}
-        for ticker in tickers:
-            # Create cache key with ticker, period, and interval
-            cache_key = (ticker, period, interval)
-            if cache_key not in self._ticker_cache:
-                self._ticker_cache[cache_key] = fetch_price_history(ticker, period, interval)
-            ticker_data[ticker] = self._ticker_cache[cache_key]
-
-        # Align dates - find common date range
-        aligned_data = self._align_dates(ticker_data)
-
-        # Evaluate the expression
-        result = self._evaluate_expression(tokens, aligned_data)
+        compiled = self.compile(expr)
+        panel = self._get_panel(compiled.tickers, interval)
+        result = evaluate(compiled, panel)
 
         # Create description
         description = f"{EQUATION_PREFIX}{expr}"
 
         return result, description
 
-    def _tokenize(self, expr: str) -> List[str]:
+    def compile(self, expr: str) -> CompiledEquation:
         """
-        Tokenize the expression into tickers, operators, numbers, and parentheses.
-        
-        Strategy: 
-        - Numbers: integers or floats
-        - Operators: +, -, *, /
-        - Parentheses: (, )
-        - Tickers: everything else (uppercase alphanumeric with hyphens)
-        """
-        tokens = []
-        current = ""
-
-        i = 0
-        while i < len(expr):
-            char = expr[i]
+        Get the compiled form of an expression, compiling it on first use.
 
-            # Skip whitespace
-            if char.isspace():
-                if current:
-                    tokens.append(current)
-                    current = ""
-                i += 1
-                continue
-
-            # Parentheses
-            if char in "()":
-                if current:
-                    tokens.append(current)
-                    current = ""
-                tokens.append(char)
-                i += 1
-                continue
-
-            # Operators - but be careful with minus in ticker names
-            if char in EQUATION_OPERATORS:
-                # Look ahead and behind to determine if this is an operator
-                # or part of a ticker name
-                if char == "-":
-                    # If we have a current token and next char is alphanumeric,
-                    # this might be part of a ticker like BTC-USD
-                    if current and i + 1 < len(expr) and expr[i + 1].isalnum():
-                        current += char
-                        i += 1
-                        continue
-
-                # It's an operator
-                if current:
-                    tokens.append(current)
-                    current = ""
-                tokens.append(char)
-                i += 1
-                continue
-
-            # Build up the current token
-            current += char
-            i += 1
-
-        if current:
-            tokens.append(current)
-
-        return tokens
-
-    def _is_ticker(self, token: str) -> bool:
-        """Check if a token is a ticker symbol."""
-        if not token:
-            return False
-        # Tickers are uppercase with possible hyphens
-        # and not operators or parentheses
-        if token in EQUATION_OPERATORS or token in "()":
-            return False
-        # Check if it's a number
-        try:
-            float(token)
-            return False
-        except ValueError:
-            pass
-        # Must contain at least one letter
-        return any(c.isalpha() for c in token)
-
-    def _is_number(self, token: str) -> bool:
-        """Check if token is a number."""
-        try:
-            float(token)
-            return True
-        except ValueError:
-            return False
-
-    def _align_dates(self, ticker_data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
-        """
-        Align all tickers to common date range AND common timestamps.
-        Uses inner join to ensure all tickers have exactly the same dates.
+        Raises:
+            ValueError: If the expression is invalid
         """
-        if not ticker_data:
-            return {}
-
-        if len(ticker_data) == 1:
-            # Only one ticker, no alignment needed
-            return ticker_data
-
-        # Get the intersection of all indices
-        common_index = None
-        for df in ticker_data.values():
-            if common_index is None:
-                common_index = df.index
-            else:
-                # Get intersection of indices
-                common_index = common_index.intersection(df.index)
-
-        if len(common_index) == 0:
-            raise ValueError(ERROR_NO_OVERLAPPING_DATES)
-
-        # Reindex all dataframes to common index
-        aligned = {}
-        for ticker, df in ticker_data.items():
-            aligned[ticker] = df.loc[common_index].copy()
-
-        return aligned
-
-    def _evaluate_expression(
-        self, tokens: List[str], ticker_data: dict[str, pd.DataFrame]
-    ) -> pd.DataFrame:
-        """
-        Evaluate the tokenized expression.
-        Computes OHLC values by evaluating the expression for each price type.
-        """
-        # Get sample dataframe for index
-        sample_df = next(iter(ticker_data.values()))
-        result_df = pd.DataFrame(index=sample_df.index)
-
-        # Evaluate expression for each OHLC component
-        for price_type in ["Open", "High", "Low", "Close"]:
-            # Convert to RPN
-            rpn = self._infix_to_rpn(tokens)
-            
-            # Evaluate RPN for this price type
-            stack = []
-            
-            for token in rpn:
-                if self._is_ticker(token):
-                    # Push ticker data for this price type
-                    df = ticker_data[token]
-                    if price_type in df.columns:
-                        stack.append(df[price_type].values)
-                    else:
-                        # Fallback to Close if price type doesn't exist
-                        stack.append(df["Close"].values)
-
-                elif self._is_number(token):
-                    # Push number as constant
-                    stack.append(float(token))
-
-                elif token in EQUATION_OPERATORS:
-                    # Pop two operands and apply operator
-                    if len(stack) < 2:
-                        raise ValueError(f"{ERROR_INVALID_EXPRESSION}: not enough operands for {token}")
-
-                    b = stack.pop()
-                    a = stack.pop()
-
-                    if token == "+":
-                        result = self._add(a, b)
-                    elif token == "-":
-                        result = self._subtract(a, b)
-                    elif token == "*":
-                        result = self._multiply(a, b)
-                    elif token == "/":
-                        result = self._divide(a, b)
-                    else:
-                        raise ValueError(f"Unknown operator: {token}")
-
-                    stack.append(result)
-
-            if len(stack) != 1:
-                raise ValueError(ERROR_INVALID_EXPRESSION)
-
-            # Get the result for this price type
-            result_values = stack[0]
-            
-            # Handle both array and scalar results
-            if isinstance(result_values, np.ndarray):
-                result_df[price_type] = result_values
-            else:
-                result_df[price_type] = result_values
-
-        return result_df
-
-    def _infix_to_rpn(self, tokens: List[str]) -> List[str]:
-        """Convert infix notation to Reverse Polish Notation (RPN)."""
-        output = []
-        operator_stack = []
-
-        precedence = {"+": 1, "-": 1, "*": 2, "/": 2}
-
-        for token in tokens:
-            if self._is_ticker(token) or self._is_number(token):
-                output.append(token)
-            elif token == "(":
-                operator_stack.append(token)
-            elif token == ")":
-                while operator_stack and operator_stack[-1] != "(":
-                    output.append(operator_stack.pop())
-                if operator_stack and operator_stack[-1] == "(":
-                    operator_stack.pop()
-            elif token in EQUATION_OPERATORS:
-                while (
-                    operator_stack
-                    and operator_stack[-1] != "("
-                    and operator_stack[-1] in precedence
-                    and precedence[operator_stack[-1]] >= precedence[token]
-                ):
-                    output.append(operator_stack.pop())
-                operator_stack.append(token)
-
-        while operator_stack:
-            output.append(operator_stack.pop())
-
-        return output
-
-    # Arithmetic operations that handle both arrays and scalars
-    def _add(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a + b
-
-    def _subtract(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a - b
-
-    def _multiply(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a * b
-
-    def _divide(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        # Handle division by zero
-        if isinstance(b, np.ndarray):
-            return np.divide(a, b, out=np.full_like(a, np.nan, dtype=float), where=b != 0)
-        else:
-            if b == 0:
-                if isinstance(a, np.ndarray):
-                    return np.full_like(a, np.nan, dtype=float)
-                return np.nan
-            return a / b
+        with self._lock:
+            compiled = self._compiled.get(expr)
+            if compiled is not None:
+                self._compiled.move_to_end(expr)
+                return compiled
+
+        compiled = compile_equation(expr)
+
+        with self._lock:
+            self._compiled[expr] = compiled
+            while len(self._compiled) > EQUATION_COMPILE_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def _get_panel(self, tickers: Tuple[str, ...], interval: str) -> AlignedPanel:
+        """Fetch all tickers in one batch and return their aligned panel."""
+        frames = fetch_price_history_batch(list(tickers))
+
+        missing = [t for t in tickers if frames.get(t) is None or frames[t].empty]
+        if missing:
+            raise ValueError(ERROR_NO_DATA.format(ticker=missing[0]))
+
+        # Keyed by each source series' length and last bar (date and values),
+        # so appended bars and intraday revisions of the last bar both miss.
+        # Values go in as a repr so a NaN in the last bar still compares equal.
+        key = (
+            (interval or "1d").strip().lower(),
+            tuple(
+                (t, len(frames[t]), frames[t].index[-1], repr(frames[t].iloc[-1].tolist()))
+                for t in tickers
+            ),
+        )
+        panel = self._panels.get(_PANEL_NAMESPACE, key)
+        if panel is not None:
+            return panel
+
+        panel = align_panel(
+            {t: resample_price_history(frames[t], interval) for t in tickers}
+        )
+        self._panels.put(_PANEL_NAMESPACE, key, panel)
+        return panel
 
     def clear_cache(self):
-        """Clear the ticker data cache."""
-        self._ticker_cache.clear()
\ No newline at end of file
+        """Clear compiled expressions and cached panels."""
+        with self._lock:
+            self._compiled.clear()
+        self._panels.clear(_PANEL_NAMESPACE)
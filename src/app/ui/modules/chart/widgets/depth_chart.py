@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import Optional
 import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QCoreApplication, Qt
 from PySide6.QtGui import QFont
 
 from app.ui.widgets.common.lazy_theme_mixin import LazyThemeMixin
-from ..services import BinanceOrderBook
+from ..services import BinanceDepthStream, BinanceOrderBook, BookView, DepthSnapshot
 from .order_book_ladder import OrderBookLadderWidget
 
 class DepthChartWidget(pg.PlotWidget):
@@ -74,96 +74,67 @@ class DepthChartWidget(pg.PlotWidget):
             except:
                 pass
             self.legend = None
-    
-    def plot_depth(
-        self,
-        bids: List[Tuple[float, float]],
-        asks: List[Tuple[float, float]],
-    ):
-        """
-        Plot order book depth.
-        
-        Args:
-            bids: List of (price, quantity) tuples, sorted descending
-            asks: List of (price, quantity) tuples, sorted ascending
-        """
-        self.clear_depth()
-        
-        if not bids and not asks:
+
+    def _ensure_items(self):
+        """Create the bid/ask curves once; later updates only call setData."""
+        if self.bid_line is not None:
             return
-        
-        # Calculate cumulative volumes
-        bid_prices = [price for price, _ in bids]
-        bid_volumes = [qty for _, qty in bids]
-        bid_cumulative = np.cumsum(bid_volumes[::-1])[::-1]  # Cumulative from best bid down
-        
-        ask_prices = [price for price, _ in asks]
-        ask_volumes = [qty for _, qty in asks]
-        ask_cumulative = np.cumsum(ask_volumes)  # Cumulative from best ask up
-        
+
         # Colors (green for bids, red for asks)
         bid_color = (76, 175, 80, 150)  # Green with transparency
         ask_color = (244, 67, 54, 150)  # Red with transparency
         bid_line_color = (76, 175, 80, 255)
         ask_line_color = (244, 67, 54, 255)
-        
-        # Plot bid area (filled)
-        if bid_prices and bid_cumulative.size > 0:
-            # Create step plot for bids
-            bid_x = []
-            bid_y = []
-            for i in range(len(bid_prices)):
-                bid_x.append(bid_prices[i])
-                bid_y.append(bid_cumulative[i])
-                if i < len(bid_prices) - 1:
-                    bid_x.append(bid_prices[i+1])
-                    bid_y.append(bid_cumulative[i])
-            
-            # Add area fill
-            self.bid_area = pg.FillBetweenItem(
-                pg.PlotCurveItem(bid_x, bid_y),
-                pg.PlotCurveItem(bid_x, [0] * len(bid_x)),
-                brush=pg.mkBrush(bid_color)
-            )
-            self.addItem(self.bid_area)
-            
-            # Add line
-            self.bid_line = self.plot(
-                bid_x, bid_y,
-                pen=pg.mkPen(color=bid_line_color, width=2),
-                name="Bids"
-            )
-        
-        # Plot ask area (filled)
-        if ask_prices and ask_cumulative.size > 0:
-            # Create step plot for asks
-            ask_x = []
-            ask_y = []
-            for i in range(len(ask_prices)):
-                ask_x.append(ask_prices[i])
-                ask_y.append(ask_cumulative[i])
-                if i < len(ask_prices) - 1:
-                    ask_x.append(ask_prices[i+1])
-                    ask_y.append(ask_cumulative[i])
-            
-            # Add area fill
-            self.ask_area = pg.FillBetweenItem(
-                pg.PlotCurveItem(ask_x, ask_y),
-                pg.PlotCurveItem(ask_x, [0] * len(ask_x)),
-                brush=pg.mkBrush(ask_color)
-            )
-            self.addItem(self.ask_area)
-            
-            # Add line
-            self.ask_line = self.plot(
-                ask_x, ask_y,
-                pen=pg.mkPen(color=ask_line_color, width=2),
-                name="Asks"
-            )
-        
-        # Add legend
+
         self.legend = self.addLegend(offset=(10, 10))
+
+        self.bid_line = self.plot([], [], pen=pg.mkPen(color=bid_line_color, width=2), name="Bids")
+        self._bid_base = pg.PlotCurveItem([], [])
+        self.bid_area = pg.FillBetweenItem(self.bid_line.curve, self._bid_base, brush=pg.mkBrush(bid_color))
+        self.addItem(self.bid_area)
+
+        self.ask_line = self.plot([], [], pen=pg.mkPen(color=ask_line_color, width=2), name="Asks")
+        self._ask_base = pg.PlotCurveItem([], [])
+        self.ask_area = pg.FillBetweenItem(self.ask_line.curve, self._ask_base, brush=pg.mkBrush(ask_color))
+        self.addItem(self.ask_area)
+
+    @staticmethod
+    def _step_xy(prices: np.ndarray, cumulative: np.ndarray):
+        """Step-plot vertices: each level's volume held until the next price."""
+        n = len(prices)
+        if n == 0:
+            return np.empty(0), np.empty(0)
+        x = np.empty(2 * n - 1)
+        y = np.empty(2 * n - 1)
+        x[0::2] = prices
+        y[0::2] = cumulative
+        x[1::2] = prices[1:]
+        y[1::2] = cumulative[:-1]
+        return x, y
+
+    def plot_depth(self, book: BookView):
+        """
+        Plot order book depth.
         
+        Args:
+            book: BookView with best-first bid and ask arrays
+        """
+        if book.is_empty:
+            self.clear_depth()
+            return
+
+        self._ensure_items()
+
+        bid_cumulative = np.cumsum(book.bid_quantities[::-1])[::-1]  # Cumulative from best bid down
+        ask_cumulative = book.cumulative_asks()  # Cumulative from best ask up
+        bid_x, bid_y = self._step_xy(book.bid_prices, bid_cumulative)
+        ask_x, ask_y = self._step_xy(book.ask_prices, ask_cumulative)
+
+        self.bid_line.setData(bid_x, bid_y)
+        self._bid_base.setData(bid_x, np.zeros_like(bid_y))
+        self.ask_line.setData(ask_x, ask_y)
+        self._ask_base.setData(ask_x, np.zeros_like(ask_y))
+
         # Auto-range to fit data
         self.autoRange()
 
@@ -177,16 +148,24 @@ class OrderBookPanel(LazyThemeMixin, QWidget):
         super().__init__(parent)
         self.theme_manager = theme_manager
         self._theme_dirty = False  # For lazy theme application
-        self.binance_api = BinanceOrderBook()
         self.current_ticker = None
 
-        # Update timer
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._refresh_data)
+        # Diff-depth stream for the current ticker (runs on its own thread)
+        self._stream: Optional[BinanceDepthStream] = None
+        # Stopped streams whose threads are still winding down; referenced until
+        # `finished` so the QThread is never destroyed while running
+        self._stopping_streams: set = set()
+        self._last_snapshot: Optional[DepthSnapshot] = None
 
         self._setup_ui()
         self._apply_theme()
 
+        # Streams are children of the panel: make sure none is still running
+        # when the window (and with it the panel) is destroyed at exit
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._wait_for_streams)
+
         # Connect to theme changes (lazy - only apply when visible)
         self.theme_manager.theme_changed.connect(self._on_theme_changed_lazy_panel)
 
@@ -271,6 +250,10 @@ class OrderBookPanel(LazyThemeMixin, QWidget):
             self.view_stack.setCurrentIndex(1)
             self.ladder_btn.setChecked(False)
             self.chart_btn.setChecked(True)
+
+        # Only the visible view is kept current; catch up the other one now
+        if self._last_snapshot is not None:
+            self._render_snapshot(self._last_snapshot, full=True)
     
     def _apply_theme(self):
         """Apply theme styling to panel and child widgets."""
@@ -421,57 +404,82 @@ class OrderBookPanel(LazyThemeMixin, QWidget):
             self.status_label.setText(f"{ticker} is not available on Binance")
             self.stop_updates()
             return
-        
+
+        self.stop_updates()
+        self.clear_depth()
         self.status_label.setText("Loading...")
-        self._refresh_data()
         self.start_updates()
-    
-    def _refresh_data(self):
-        """Refresh order book data."""
-        if not self.current_ticker:
+
+    def start_updates(self):
+        """Start streaming the current ticker's order book."""
+        if self._stream is not None or not self.current_ticker:
             return
-        
         if not BinanceOrderBook.is_binance_ticker(self.current_ticker):
             return
-        
-        # Fetch order book with more levels for ladder view
-        summary = self.binance_api.get_depth_summary(self.current_ticker, levels=500)
-        
-        if not summary:
-            self.status_label.setText("Failed to fetch depth data")
-            return
-        
-        # Update ladder widget
-        self.ladder_widget.update_order_book(
-            summary["bids"],
-            summary["asks"],
-            summary["spread"],
-            summary["spread_pct"],
-        )
-        
-        # Update depth chart
-        self.depth_chart.plot_depth(summary["bids"], summary["asks"])
-        
-        # Update status
-        timestamp = summary["timestamp"].strftime("%H:%M:%S")
-        source = "Binance.US" if "binance.us" in summary.get("source", "") else "Binance"
-        self.status_label.setText(f"Updated: {timestamp} • {source}")
-    
-    def start_updates(self, interval_ms: int = 500):
-        """Start automatic updates (500 ms for ladder view)."""
-        self.update_timer.start(interval_ms)
-    
+
+        stream = BinanceDepthStream(self.current_ticker, parent=self)
+        stream.book_updated.connect(self._on_book_updated)
+        stream.status_changed.connect(self._on_stream_status)
+        stream.finished.connect(lambda s=stream: self._on_stream_finished(s))
+        self._stream = stream
+        stream.start()
+
     def stop_updates(self):
-        """Stop automatic updates."""
-        self.update_timer.stop()
-    
+        """Stop streaming (the thread winds down in the background)."""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        stream.book_updated.disconnect(self._on_book_updated)
+        stream.status_changed.disconnect(self._on_stream_status)
+        self._stopping_streams.add(stream)
+        stream.stop()
+
+    def _on_stream_finished(self, stream: BinanceDepthStream):
+        """Release a stream once its thread has exited."""
+        self._stopping_streams.discard(stream)
+        if stream is self._stream:
+            self._stream = None  # Ended on its own (e.g. error)
+        stream.deleteLater()
+
+    def _on_book_updated(self, snapshot: DepthSnapshot):
+        """Render a coalesced snapshot from the stream (GUI thread)."""
+        if snapshot.ticker != (self.current_ticker or "").upper():
+            return
+        self._last_snapshot = snapshot
+        self._render_snapshot(snapshot, full=snapshot.full)
+
+        timestamp = snapshot.timestamp.strftime("%H:%M:%S")
+        source = "Binance.US" if "binance.us" in snapshot.source else "Binance"
+        self.status_label.setText(f"Live: {timestamp} • {source}")
+
+    def _render_snapshot(self, snapshot: DepthSnapshot, full: bool):
+        """Update the visible view from a snapshot."""
+        if self.view_stack.currentIndex() == 0:
+            self.ladder_widget.apply_snapshot(snapshot, full=full)
+        else:
+            self.depth_chart.plot_depth(snapshot.book)
+
+    def _on_stream_status(self, status: str):
+        """Show stream state until live data arrives."""
+        if status.startswith("error:"):
+            self.status_label.setText(f"Order book unavailable: {status[6:]}")
+        elif status in ("connecting", "syncing", "resyncing"):
+            self.status_label.setText(f"{status.capitalize()}...")
+
     def clear_depth(self):
         """Clear the depth chart and ladder."""
+        self._last_snapshot = None
         self.depth_chart.clear_depth()
         self.ladder_widget.clear_order_book()
         self.status_label.setText("")
     
     def closeEvent(self, event):
         """Stop updates when widget is closed."""
+        self._wait_for_streams()
+        super().closeEvent(event)
+
+    def _wait_for_streams(self):
+        """Stop streaming and block until stream threads have exited (close/app quit)."""
         self.stop_updates()
-        super().closeEvent(event)
\ No newline at end of file
+        for stream in list(self._stopping_streams):
+            stream.wait(2000)
@@ -1,114 +1,260 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
-from PySide6.QtCore import Qt, QTimer, QRect
-from PySide6.QtGui import QFont, QColor, QPalette, QPainter
+from typing import Tuple
 
+import numpy as np
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView, QHeaderView,
+    QStyledItemDelegate, QStyleOptionViewItem,
+)
+from PySide6.QtCore import Qt, QRect, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QPainter
 
-class UnifiedOrderBookTable(QTableWidget):
+from ..services.order_book import BookView
+
+
+# Data role carrying a row's volume bar width (percent of the bar's max width)
+BAR_ROLE = Qt.UserRole
+
+_ASK_FOREGROUND = {
+    "dark": QColor(255, 180, 180),  # Light red/pink
+    "bloomberg": QColor(255, 160, 150),  # Warm light red
+    "light": QColor(180, 60, 70),  # Dark red for light theme
+}
+_BID_FOREGROUND = {
+    "dark": QColor(160, 220, 170),  # Light green
+    "bloomberg": QColor(140, 220, 160),  # Bloomberg green
+    "light": QColor(40, 130, 60),  # Dark green for light theme
+}
+_ASK_PRICE_FOREGROUND = {
+    "dark": QColor(241, 108, 119),
+    "bloomberg": QColor(255, 100, 100),
+    "light": QColor(200, 0, 0),
+}
+_BID_PRICE_FOREGROUND = {
+    "dark": QColor(106, 188, 127),
+    "bloomberg": QColor(80, 200, 120),
+    "light": QColor(0, 128, 0),
+}
+# Bar colors with reduced opacity for better text contrast
+_ASK_BAR_COLOR = {
+    "dark": QColor(80, 35, 45, 100),
+    "bloomberg": QColor(100, 40, 30, 90),
+    "light": QColor(255, 180, 180, 70),
+}
+_BID_BAR_COLOR = {
+    "dark": QColor(30, 70, 45, 100),
+    "bloomberg": QColor(30, 80, 50, 90),
+    "light": QColor(180, 255, 180, 70),
+}
+
+
+def _theme_key(theme: str) -> str:
+    return theme if theme in ("dark", "bloomberg") else "light"
+
+
+class OrderBookLadderModel(QAbstractTableModel):
     """
-    Unified order book table with asks on top, bids on bottom, and one central price column.
-    Volume bars extend from the center price column outward.
+    Ladder rows backed by NumPy arrays.
+
+    Rows 0..n-1 hold asks (best ask at the bottom), rows n..2n-1 hold bids
+    (best bid at the top). Columns: Bid Total, Bid Qty, Price, Ask Qty,
+    Ask Total. Text is formatted on demand in data(), so only rows the view
+    paints are formatted, and set_book() emits dataChanged only for rows
+    whose values moved.
     """
-    
-    def __init__(self, parent=None):
+
+    HEADERS = ["Total", "Quantity", "Price", "Quantity", "Total"]
+
+    def __init__(self, num_levels: int, parent=None):
         super().__init__(parent)
-        self._ask_volume_data = {}  # {row: bar_width_percent}
-        self._bid_volume_data = {}  # {row: bar_width_percent}
+        self._num_levels = num_levels
         self._theme = "dark"
-        self._num_levels = 15  # Number of levels to show on each side
-    
+        self._values = self._empty_values()  # Rows of (price, qty, total, bar %)
+
+        self._font = QFont()
+        self._font.setPointSize(10)
+        self._font.setBold(True)
+        self._price_font = QFont()
+        self._price_font.setPointSize(11)
+        self._price_font.setBold(True)
+
+    def _empty_values(self) -> np.ndarray:
+        values = np.full((4, self._num_levels * 2), np.nan)
+        values[3] = 0
+        return values
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._num_levels * 2
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        is_ask = row < self._num_levels
+
+        if role == BAR_ROLE:
+            return int(self._values[3, row])
+
+        # Ask rows fill columns 2-4, bid rows columns 0-2
+        if (is_ask and col < 2) or (not is_ask and col > 2):
+            return None
+        price, qty, total = self._values[:3, row]
+
+        if role == Qt.DisplayRole:
+            if np.isnan(price):
+                return ""
+            if col == 2:
+                return f"{price:,.2f}"
+            if col in (1, 3):
+                return f"{qty:.4f}"
+            return f"{total:.4f}"
+        if role == Qt.TextAlignmentRole:
+            if col == 2:
+                return Qt.AlignCenter
+            # Bids right-aligned (left side of table), asks left-aligned (right side)
+            return (Qt.AlignLeft if is_ask else Qt.AlignRight) | Qt.AlignVCenter
+        if role == Qt.FontRole:
+            return self._price_font if col == 2 else self._font
+        if role == Qt.ForegroundRole:
+            key = _theme_key(self._theme)
+            if col == 2:
+                return (_ASK_PRICE_FOREGROUND if is_ask else _BID_PRICE_FOREGROUND)[key]
+            return (_ASK_FOREGROUND if is_ask else _BID_FOREGROUND)[key]
+        return None
+
+    def set_theme(self, theme: str):
+        """Set the theme (text colors depend on it)."""
+        self._theme = theme
+        self._emit_rows(np.ones(self.rowCount(), dtype=bool))
+
+    def set_book(self, book: BookView) -> Tuple[float, float]:
+        """
+        Load the top levels of a book.
+
+        Args:
+            book: BookView with best-first bid and ask arrays
+
+        Returns:
+            (ask volume, bid volume) over the displayed levels
+        """
+        n = self._num_levels
+
+        # Only the levels we're DISPLAYING count, otherwise bars are scaled
+        # to off-screen data
+        ask_prices, ask_qty = book.ask_prices[:n], book.ask_quantities[:n]
+        bid_prices, bid_qty = book.bid_prices[:n], book.bid_quantities[:n]
+        ask_totals = np.cumsum(ask_qty)
+        bid_totals = np.cumsum(bid_qty)
+
+        # Bars share one maximum: the largest displayed total spans 100%
+        max_ask = float(ask_totals[-1]) if len(ask_totals) else 0
+        max_bid = float(bid_totals[-1]) if len(bid_totals) else 0
+        unified_max_volume = max(max_ask, max_bid)
+
+        values = self._empty_values()
+        # Asks fill the top rows reversed, so the best ask sits just above the bids
+        num_asks, num_bids = len(ask_prices), len(bid_prices)
+        values[:3, :num_asks] = np.vstack([ask_prices, ask_qty, ask_totals])[:, ::-1]
+        values[:3, n:n + num_bids] = np.vstack([bid_prices, bid_qty, bid_totals])
+        if unified_max_volume > 0:
+            values[3, :num_asks] = (ask_totals / unified_max_volume * 100).astype(int)[::-1]
+            values[3, n:n + num_bids] = (bid_totals / unified_max_volume * 100).astype(int)
+
+        old = self._values
+        same = (old == values) | (np.isnan(old) & np.isnan(values))
+        self._values = values
+        self._emit_rows(~same.all(axis=0))
+        return max_ask, max_bid
+
+    def clear(self):
+        """Remove all levels."""
+        changed = ~np.isnan(self._values[0])
+        self._values = self._empty_values()
+        self._emit_rows(changed)
+
+    def _emit_rows(self, changed: np.ndarray):
+        """Emit dataChanged once per contiguous run of changed rows."""
+        if not changed.any():
+            return
+        edges = np.flatnonzero(np.diff(np.r_[0, changed.astype(np.int8), 0]))
+        last_col = self.columnCount() - 1
+        for start, stop in zip(edges[::2], edges[1::2]):
+            self.dataChanged.emit(self.index(int(start), 0), self.index(int(stop) - 1, last_col))
+
+
+class VolumeBarDelegate(QStyledItemDelegate):
+    """
+    Paints the ladder's volume bars behind the cell text.
+
+    Bars extend from the center of the price column outward (bids to the
+    left, asks to the right). Each cell paints only its own slice of the
+    row's bar, so repainting a changed row never touches other rows.
+    """
+
+    def __init__(self, view: QTableView, num_levels: int):
+        super().__init__(view)
+        self._view = view
+        self._num_levels = num_levels
+        self._theme = "dark"
+
     def set_theme(self, theme: str):
         """Set the theme."""
         self._theme = theme
-        self.viewport().update()
-    
-    def set_volume_data(self, ask_volume_data: dict, bid_volume_data: dict):
-        """Set volume data for bar rendering."""
-        self._ask_volume_data = ask_volume_data
-        self._bid_volume_data = bid_volume_data
-        self.viewport().update()
-    
-    def paintEvent(self, event):
-        """Paint volume bars in background, then paint cells on top."""
-        # First paint the volume bars
-        painter = QPainter(self.viewport())
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Theme-specific bar colors with reduced opacity for better text contrast
-        if self._theme == "dark":
-            ask_bar_color = QColor(80, 35, 45, 100)  # Darker red, less opacity
-            bid_bar_color = QColor(30, 70, 45, 100)  # Darker green, less opacity
-        elif self._theme == "bloomberg":
-            ask_bar_color = QColor(100, 40, 30, 90)  # Bloomberg red tone
-            bid_bar_color = QColor(30, 80, 50, 90)  # Bloomberg green tone
-        else:
-            ask_bar_color = QColor(255, 180, 180, 70)  # Light theme red
-            bid_bar_color = QColor(180, 255, 180, 70)  # Light theme green
 
-        # Paint ask bars (rows 0 to spread_row-1)
-        for row, bar_width_percent in self._ask_volume_data.items():
-            if bar_width_percent > 0 and row < self.rowCount():
-                self._paint_bar(painter, row, bar_width_percent, ask_bar_color, "ask")
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        """Paint the cell's slice of the volume bar, then the cell text."""
+        bar_width_percent = index.data(BAR_ROLE) or 0
+        if bar_width_percent > 0:
+            view = self._view
+            # Columns: 0=Bid Total, 1=Bid Qty, 2=Price, 3=Ask Qty, 4=Ask Total
+            price_x = view.columnViewportPosition(2)
+            price_center_x = price_x + (view.columnWidth(2) // 2)
+            key = _theme_key(self._theme)
 
-        # Paint bid bars (rows spread_row+1 to end)
-        for row, bar_width_percent in self._bid_volume_data.items():
-            if bar_width_percent > 0 and row < self.rowCount():
-                self._paint_bar(painter, row, bar_width_percent, bid_bar_color, "bid")
+            if index.row() < self._num_levels:
+                # Ask bars: extend from center of price column to the RIGHT
+                ask_right = view.columnViewportPosition(4) + view.columnWidth(4)
+                bar_width = int((ask_right - price_center_x) * bar_width_percent / 100.0)
+                bar_left, color = price_center_x, _ASK_BAR_COLOR[key]
+            else:
+                # Bid bars: extend from center of price column to the LEFT
+                max_width = price_center_x - view.columnViewportPosition(0)
+                bar_width = int(max_width * bar_width_percent / 100.0)
+                bar_left, color = price_center_x - bar_width, _BID_BAR_COLOR[key]
 
-        painter.end()
+            bar_rect = QRect(bar_left, option.rect.top(), bar_width, option.rect.height())
+            painter.fillRect(bar_rect.intersected(option.rect), color)
+
+        super().paint(painter, option, index)
 
-        # Now paint the normal table content on top
-        super().paintEvent(event)
-    
-    def _paint_bar(self, painter, row, bar_width_percent, color, side):
-        """Paint a volume bar for a specific row extending from center of price column."""
-        # Get row position
-        row_y = self.rowViewportPosition(row)
-        row_height = self.rowHeight(row)
-        
-        # Calculate positions of columns
-        # Columns: 0=Bid Total, 1=Bid Qty, 2=Price, 3=Ask Qty, 4=Ask Total
-        bid_total_w = self.columnWidth(0)
-        bid_qty_w = self.columnWidth(1)
-        price_x = bid_total_w + bid_qty_w
-        price_w = self.columnWidth(2)
-        ask_qty_w = self.columnWidth(3)
-        ask_total_w = self.columnWidth(4)
-        
-        # Calculate the CENTER of the price column
-        price_center_x = price_x + (price_w // 2)
-        
-        # Calculate bar width based on the relevant side's columns
-        if side == "bid":
-            # Bid bars: extend from center of price column to the LEFT
-            # Maximum width = bid_total + bid_qty columns + half of price column
-            max_width = bid_total_w + bid_qty_w + (price_w // 2)
-            bar_width = int(max_width * bar_width_percent / 100.0)
-            
-            # Bar starts at center of price column and extends left
-            bar_rect = QRect(
-                price_center_x - bar_width,
-                row_y,
-                bar_width,
-                row_height
-            )
-        else:
-            # Ask bars: extend from center of price column to the RIGHT
-            # Maximum width = ask_qty + ask_total columns + half of price column
-            max_width = ask_qty_w + ask_total_w + (price_w // 2)
-            bar_width = int(max_width * bar_width_percent / 100.0)
-            
-            # Bar starts at center of price column and extends right
-            bar_rect = QRect(
-                price_center_x,
-                row_y,
-                bar_width,
-                row_height
-            )
-        
-        painter.fillRect(bar_rect, color)
+
+class UnifiedOrderBookTable(QTableView):
+    """
+    Unified order book table with asks on top, bids on bottom, and one central price column.
+    Volume bars extend from the center price column outward.
+    """
+
+    def __init__(self, num_levels: int, parent=None):
+        super().__init__(parent)
+        self.ladder_model = OrderBookLadderModel(num_levels, self)
+        self.setModel(self.ladder_model)
+        self._bar_delegate = VolumeBarDelegate(self, num_levels)
+        self.setItemDelegate(self._bar_delegate)
+
+    def set_theme(self, theme: str):
+        """Set the theme."""
+        self._bar_delegate.set_theme(theme)
+        self.ladder_model.set_theme(theme)
+        self.viewport().update()
 
 
 class OrderBookLadderWidget(QWidget):
@@ -122,7 +268,9 @@ class OrderBookLadderWidget(QWidget):
         self._theme = theme
         self._max_bid_volume = 0
         self._max_ask_volume = 0
-        self._num_levels = 14  # Show 10 levels on each side
+        self._num_levels = 14  # Levels shown on each side
+        self._displayed_asks = np.empty(0)  # Displayed ask prices, best first
+        self._displayed_bids = np.empty(0)
         
         self._setup_ui()
         self._apply_theme()
@@ -150,7 +298,7 @@ class OrderBookLadderWidget(QWidget):
         layout.addWidget(self.spread_header)
         
         # Unified order book table
-        self.order_table = UnifiedOrderBookTable(self)
+        self.order_table = UnifiedOrderBookTable(self._num_levels, self)
         self.order_table.setObjectName("orderTable")
         self._configure_table()
         layout.addWidget(self.order_table)
@@ -159,16 +307,10 @@ class OrderBookLadderWidget(QWidget):
         """Configure the unified order book table."""
         table = self.order_table
         
-        # 5 columns: Bid Total, Bid Qty, Price, Ask Qty, Ask Total
-        table.setColumnCount(5)
-        
-        # Rows: num_levels (asks) + num_levels (bids) - NO spread row
-        total_rows = self._num_levels * 2
-        table.setRowCount(total_rows)
-        
-        # Set headers
-        table.setHorizontalHeaderLabels(["Total", "Quantity", "Price", "Quantity", "Total"])
-        
+        # 5 columns (Bid Total, Bid Qty, Price, Ask Qty, Ask Total) and
+        # num_levels (asks) + num_levels (bids) rows come from the model
+        table.set_theme(self._theme)
+
         # Configure header
         header = table.horizontalHeader()
         header.setStretchLastSection(False)
@@ -183,18 +325,18 @@ class OrderBookLadderWidget(QWidget):
         
         # Table properties
         table.verticalHeader().setVisible(False)
-        table.setSelectionMode(QTableWidget.NoSelection)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionMode(QTableView.NoSelection)
+        table.setEditTriggers(QTableView.NoEditTriggers)
         table.setFocusPolicy(Qt.NoFocus)
         table.setShowGrid(False)
         
-        # Row heights - all same now (no spread row)
-        for i in range(table.rowCount()):
-            table.setRowHeight(i, 28)
+        # Uniform fixed row heights: the view lays out rows without measuring them
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(28)
         
         # Style
         table.setStyleSheet("""
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px 8px;
                 border: none;
             }
@@ -232,12 +374,12 @@ class OrderBookLadderWidget(QWidget):
                 color: #8b92ab;
                 background-color: transparent;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #1a1d2e;
                 border: none;
                 gridline-color: transparent;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border: none;
                 padding: 4px 8px;
                 background-color: transparent;
@@ -270,12 +412,12 @@ class OrderBookLadderWidget(QWidget):
                 color: #666666;
                 background-color: transparent;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 border: none;
                 gridline-color: transparent;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border: none;
                 padding: 4px 8px;
                 background-color: transparent;
@@ -308,12 +450,12 @@ class OrderBookLadderWidget(QWidget):
                 color: #FF8000;
                 background-color: transparent;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #0d1420;
                 border: none;
                 gridline-color: transparent;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border: none;
                 padding: 4px 8px;
                 background-color: transparent;
@@ -331,205 +473,55 @@ class OrderBookLadderWidget(QWidget):
             }
         """
     
-    def update_order_book(
-        self,
-        bids: List[Tuple[float, float]],
-        asks: List[Tuple[float, float]],
-        spread: float,
-        spread_pct: float,
-    ):
+    def update_order_book(self, book: BookView):
         """
         Update the order book display.
         
         Args:
-            bids: List of (price, quantity) tuples, sorted descending
-            asks: List of (price, quantity) tuples, sorted ascending
-            spread: Absolute spread value
-            spread_pct: Spread percentage
+            book: BookView with best-first bid and ask arrays
         """
-        # Update spread
-        self.spread_label.setText(f"Spread: {spread:.2f} ({spread_pct:.3f}%)")
-        
-        # Calculate cumulative totals
-        ask_totals = self._calculate_cumulative(asks)
-        bid_totals = self._calculate_cumulative(bids)
-        
-        # IMPORTANT: Only consider the levels we're DISPLAYING for the maximum
-        # Otherwise bars are scaled to off-screen data!
-        displayed_ask_totals = ask_totals[:self._num_levels] if ask_totals else []
-        displayed_bid_totals = bid_totals[:self._num_levels] if bid_totals else []
-        
-        # Find the UNIFIED maximum across displayed levels only
-        max_ask = max(displayed_ask_totals) if displayed_ask_totals else 0
-        max_bid = max(displayed_bid_totals) if displayed_bid_totals else 0
-        unified_max_volume = max(max_ask, max_bid)
-        
-        # Store for reference
-        self._max_ask_volume = max_ask
-        self._max_bid_volume = max_bid
-        
-        # Calculate volume bar widths using UNIFIED maximum
-        # The largest displayed bar will now take 100% of space!
-        ask_volume_data = {}
-        bid_volume_data = {}
-        
-        for i in range(min(len(asks), self._num_levels)):
-            bar_percent = int((ask_totals[i] / unified_max_volume * 100)) if unified_max_volume > 0 else 0
-            ask_volume_data[i] = bar_percent
-        
-        for i in range(min(len(bids), self._num_levels)):
-            row_index = self._num_levels + i  # No spread row, so bids start at row 10
-            bar_percent = int((bid_totals[i] / unified_max_volume * 100)) if unified_max_volume > 0 else 0
-            bid_volume_data[row_index] = bar_percent
-        
-        # Update table with volume data
-        self.order_table.set_volume_data(ask_volume_data, bid_volume_data)
-        
-        # Populate asks (top section, reversed so best ask is at bottom)
-        # Asks are sorted ascending, so we want to reverse them for display
-        asks_display = list(reversed(asks[:self._num_levels]))
-        for i in range(len(asks_display)):
-            price, qty = asks_display[i]
-            total = ask_totals[len(asks_display) - 1 - i]
-            
-            row = i
-            
-            # Bid side (left): empty for ask rows
-            empty_total = QTableWidgetItem("")
-            empty_qty = QTableWidgetItem("")
-            
-            # Price (center)
-            price_item = self._create_price_item(f"{price:,.2f}", is_ask=True)
-            
-            # Ask side (right): Quantity, Total
-            qty_item = self._create_ask_item(f"{qty:.4f}")
-            total_item = self._create_ask_item(f"{total:.4f}")
-            
-            self.order_table.setItem(row, 0, empty_total)
-            self.order_table.setItem(row, 1, empty_qty)
-            self.order_table.setItem(row, 2, price_item)
-            self.order_table.setItem(row, 3, qty_item)
-            self.order_table.setItem(row, 4, total_item)
-        
-        # Populate bids (bottom section - no spread row)
-        for i in range(min(len(bids), self._num_levels)):
-            price, qty = bids[i]
-            total = bid_totals[i]
-            
-            row = self._num_levels + i
-            
-            # Bid side (left): Total, Quantity
-            total_item = self._create_bid_item(f"{total:.4f}")
-            qty_item = self._create_bid_item(f"{qty:.4f}")
-            
-            # Price (center)
-            price_item = self._create_price_item(f"{price:,.2f}", is_ask=False)
-            
-            # Ask side (right): empty for bid rows
-            empty_qty = QTableWidgetItem("")
-            empty_total = QTableWidgetItem("")
-            
-            self.order_table.setItem(row, 0, total_item)
-            self.order_table.setItem(row, 1, qty_item)
-            self.order_table.setItem(row, 2, price_item)
-            self.order_table.setItem(row, 3, empty_qty)
-            self.order_table.setItem(row, 4, empty_total)
-        
-        # Clear remaining rows
-        for i in range(len(asks_display), self._num_levels):
-            for j in range(5):
-                self.order_table.setItem(i, j, QTableWidgetItem(""))
-        
-        for i in range(len(bids), self._num_levels):
-            row = self._num_levels + i
-            for j in range(5):
-                self.order_table.setItem(row, j, QTableWidgetItem(""))
-    
-    def _calculate_cumulative(self, orders: List[Tuple[float, float]]) -> List[float]:
-        """Calculate cumulative totals."""
-        cumulative = []
-        total = 0
-        for _, qty in orders:
-            total += qty
-            cumulative.append(total)
-        return cumulative
-    
-    def _create_ask_item(self, text: str) -> QTableWidgetItem:
-        """Create a table item for ask side (now on right)."""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # Left align (right side of table)
-
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        item.setFont(font)
-
-        # Use themed red tones that contrast well with the bar background
-        if self._theme == "dark":
-            item.setForeground(QColor(255, 180, 180))  # Light red/pink
-        elif self._theme == "bloomberg":
-            item.setForeground(QColor(255, 160, 150))  # Warm light red
-        else:
-            item.setForeground(QColor(180, 60, 70))  # Dark red for light theme
+        n = self._num_levels
+
+        # Update spread and top-of-book imbalance
+        self.spread_label.setText(
+            f"Spread: {book.spread:.2f} ({book.spread_pct:.3f}%)"
+            f"  •  Imbalance: {book.imbalance(n) * 100:+.1f}%"
+        )
 
-        return item
+        # Only changed rows are repainted (see OrderBookLadderModel.set_book)
+        self._max_ask_volume, self._max_bid_volume = self.order_table.ladder_model.set_book(book)
+        self._displayed_asks = book.ask_prices[:n]
+        self._displayed_bids = book.bid_prices[:n]
 
-    def _create_bid_item(self, text: str) -> QTableWidgetItem:
-        """Create a table item for bid side (now on left)."""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)  # Right align (left side of table)
+    def apply_snapshot(self, snapshot, full: bool = False):
+        """
+        Update the ladder from a streamed DepthSnapshot.
 
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        item.setFont(font)
+        Skipped entirely when none of the changed price levels are on screen
+        (deeper levels do not affect displayed quantities or totals).
 
-        # Use themed green tones that contrast well with the bar background
-        if self._theme == "dark":
-            item.setForeground(QColor(160, 220, 170))  # Light green
-        elif self._theme == "bloomberg":
-            item.setForeground(QColor(140, 220, 160))  # Bloomberg green
-        else:
-            item.setForeground(QColor(40, 130, 60))  # Dark green for light theme
+        Args:
+            snapshot: DepthSnapshot from BinanceDepthStream
+            full: Force an update (e.g. after a resync or view switch)
+        """
+        if not full and not self._touches_display(snapshot):
+            return
+        self.update_order_book(snapshot.book)
 
-        return item
-    
-    def _create_price_item(self, text: str, is_ask: bool) -> QTableWidgetItem:
-        """Create a price item (center column) with appropriate color."""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-
-        font = QFont()
-        font.setPointSize(11)
-        font.setBold(True)
-        item.setFont(font)
-
-        if self._theme == "dark":
-            if is_ask:
-                item.setForeground(QColor(241, 108, 119))  # Red for asks
-            else:
-                item.setForeground(QColor(106, 188, 127))  # Green for bids
-        elif self._theme == "bloomberg":
-            if is_ask:
-                item.setForeground(QColor(255, 100, 100))  # Bloomberg red
-            else:
-                item.setForeground(QColor(80, 200, 120))  # Bloomberg green
-        else:
-            if is_ask:
-                item.setForeground(QColor(200, 0, 0))
-            else:
-                item.setForeground(QColor(0, 128, 0))
+    def _touches_display(self, snapshot) -> bool:
+        """Whether any changed level falls inside the displayed price range."""
+        asks, bids = self._displayed_asks, self._displayed_bids
+        if len(asks) < self._num_levels or len(bids) < self._num_levels:
+            return True
+        return bool(
+            (snapshot.changed_asks <= asks[-1]).any()
+            or (snapshot.changed_bids >= bids[-1]).any()
+        )
 
-        return item
-    
     def clear_order_book(self):
         """Clear the order book display."""
         self.spread_label.setText("Spread: --")
         
-        # Clear volume data
-        self.order_table.set_volume_data({}, {})
-        
-        # Clear all cells
-        for i in range(self.order_table.rowCount()):
-            for j in range(self.order_table.columnCount()):
-                self.order_table.setItem(i, j, QTableWidgetItem(""))
\ No newline at end of file
+        self.order_table.ladder_model.clear()
+        self._displayed_asks = np.empty(0)
+        self._displayed_bids = np.empty(0)
\ No newline at end of file
@@ -117,6 +117,10 @@ class PriceChart(pg.GraphicsLayoutWidget):
         # Indicator line tracking for incremental updates
         # Dict[indicator_name, Dict[column_name, PlotCurveItem]]
         self._indicator_lines = {}
+        # Plotted y-values per line (log-transformed for overlays in log
+        # mode), patched in place by update_indicator_lines
+        # Dict[indicator_name, Dict[column_name, np.ndarray]]
+        self._indicator_buffers = {}
 
         # Price label (rightmost visible price)
         self._price_label = None  # Will be created when enabled
@@ -1552,15 +1556,23 @@ class PriceChart(pg.GraphicsLayoutWidget):
         Update indicator lines with new data (incremental update).
 
         This updates the y-data of existing indicator lines without
-        recreating them, preserving view state.
+        recreating them, preserving view state. Results from
+        IndicatorService.update_multiple() carry a "start" row position and
+        only their rows are written into the line's y-buffer (transformed
+        to log scale on their own); results without "start" replace the
+        whole line.
 
         Args:
-            indicators: Dict from IndicatorService.calculate_multiple()
+            indicators: Dict from IndicatorService.calculate_multiple() or
+                IndicatorService.update_multiple()
         """
+        from ..services import IndicatorService
+
         if not indicators or not self._indicator_lines:
             return
 
-        x = np.arange(len(self.data), dtype=float)
+        n = len(self.data)
+        x = np.arange(n, dtype=float)
 
         for indicator_name, indicator_info in indicators.items():
             if indicator_name not in self._indicator_lines:
@@ -1570,18 +1582,31 @@ class PriceChart(pg.GraphicsLayoutWidget):
             if indicator_df is None:
                 continue
 
+            start = indicator_info.get("start", 0)
+            log_scale = self._scale_mode == "log" and IndicatorService.is_overlay(indicator_name)
+            buffers = self._indicator_buffers.setdefault(indicator_name, {})
+
             for col, line_item in self._indicator_lines[indicator_name].items():
                 if col not in indicator_df.columns:
                     continue
 
-                y = indicator_df[col].to_numpy()
+                y_new = indicator_df[col].to_numpy(dtype=float)
+                if log_scale:
+                    y_new = np.log10(np.clip(y_new, 1e-12, None))
 
-                # Apply log scale for overlay indicators (not oscillators)
-                is_overlay = indicator_info.get("is_overlay", True)
-                if self._scale_mode == "log" and is_overlay:
-                    y = np.log10(np.clip(y, 1e-12, None))
+                buffer = buffers.get(col)
+                if start == 0 or buffer is None or len(buffer) < start:
+                    buffer = y_new.copy()
+                else:
+                    end = start + len(y_new)
+                    if end > len(buffer):
+                        buffer = np.concatenate([buffer[:start], y_new])
+                    else:
+                        buffer[start:end] = y_new
+                buffers[col] = buffer
 
-                line_item.setData(x, y)
+                m = min(len(buffer), n)
+                line_item.setData(x[:m], buffer[:m])
 
     # -------------------------
     # Oscillator Pane Management
@@ -1693,6 +1718,7 @@ class PriceChart(pg.GraphicsLayoutWidget):
 
         # Reset indicator line tracking for incremental updates
         self._indicator_lines = {}
+        self._indicator_buffers = {}
 
         color_idx = 0
         has_oscillators = False
@@ -1883,6 +1909,9 @@ class PriceChart(pg.GraphicsLayoutWidget):
 
                     # Track line for incremental updates
                     self._indicator_lines[indicator_name][col] = line
+                    self._indicator_buffers.setdefault(indicator_name, {})[col] = np.array(
+                        y, dtype=float
+                    )
 
                     # Add to appropriate legend
                     if label:
@@ -1,6 +1,8 @@
 """Portfolio Construction Services"""
 
 from .portfolio_service import PortfolioService
+from .transaction_ledger import TransactionLedger
+from .portfolio_journal import PortfolioJournal
 from .portfolio_persistence import PortfolioPersistence
 from .portfolio_settings_manager import PortfolioSettingsManager
 from .row_index_mapper import RowIndexMapper
@@ -9,6 +11,8 @@ from .focus_manager import FocusManager
 
 __all__ = [
     "PortfolioService",
+    "TransactionLedger",
+    "PortfolioJournal",
     "PortfolioPersistence",
     "PortfolioSettingsManager",
     "RowIndexMapper",
@@ -0,0 +1,287 @@
+"""Portfolio Journal - Append-only transaction storage with snapshot compaction
+
+A portfolio's transactions are stored as a Parquet snapshot plus a JSONL
+journal. Each save appends one journal line holding only the transactions
+added, edited or deleted since the previous save, so a save costs
+O(changes) on disk. Loading replays the journal tail over the snapshot.
+
+Atomicity:
+- One save = one journal line, written with a single write + fsync. A torn
+  last line (crash mid-write) fails to parse and is truncated on replay.
+- Compaction writes the snapshot to a temp file and os.replace()s it. The
+  snapshot records the last journal sequence it contains, so journal lines
+  it already covers are skipped if the journal was not yet removed.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Stored transaction fields and their defaults
+TRANSACTION_FIELDS: Dict[str, Any] = {
+    "id": "",
+    "date": "",
+    "ticker": "",
+    "transaction_type": "Buy",
+    "quantity": 0.0,
+    "entry_price": 0.0,
+    "fees": 0.0,
+    "sequence": 0,
+    "notes": "",
+}
+
+# Compact once the journal holds more changes than this or than the ledger
+# has transactions (amortized O(1) rewrite cost per change)
+_COMPACT_MIN_CHANGES = 256
+
+
+def normalize_transaction(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a transaction dict to the stored fields with their stored types."""
+    tx = {}
+    for name, default in TRANSACTION_FIELDS.items():
+        value = transaction.get(name, default)
+        if value is None:
+            value = default
+        tx[name] = type(default)(value)
+    return tx
+
+
+@dataclass
+class JournalState:
+    """Replayed state of one portfolio's journal."""
+
+    transactions: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # id -> tx, in stored order
+    last_seq: int = 0  # Sequence of the last applied journal record
+    journal_changes: int = 0  # Changes in the journal since the snapshot
+    last_time: Optional[str] = None  # Time of the last journal record
+    signature: Tuple = ()  # File stats the state was read at
+
+
+class PortfolioJournal:
+    """
+    Snapshot + journal files of one portfolio.
+
+    Usage:
+        journal = PortfolioJournal(directory, "My Portfolio")
+        state = journal.load()
+        changes, earliest = PortfolioJournal.diff(state.transactions, transactions)
+        journal.append(state, changes, earliest, timestamp)
+        if journal.needs_compaction(state):
+            journal.compact(state)
+    """
+
+    def __init__(self, directory: Path, name: str):
+        self.directory = directory
+        self.snapshot_path = directory / f"{name}.snapshot.parquet"
+        self.journal_path = directory / f"{name}.journal.jsonl"
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def signature(self) -> Tuple:
+        """File stats identifying the on-disk state (changes when either file does)."""
+        stats = []
+        for path in (self.snapshot_path, self.journal_path):
+            try:
+                st = path.stat()
+                stats.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append(None)
+        return tuple(stats)
+
+    def delete(self) -> None:
+        """Remove the snapshot and journal."""
+        for path in (self.snapshot_path, self.journal_path):
+            if path.exists():
+                path.unlink()
+
+    # -------------------------------------------------------------------------
+    # Load
+    # -------------------------------------------------------------------------
+
+    def load(self) -> JournalState:
+        """
+        Replay the snapshot and journal tail.
+
+        Returns:
+            JournalState with transactions in stored order
+        """
+        transactions, snapshot_seq = self._read_snapshot()
+        state = JournalState(transactions=transactions, last_seq=snapshot_seq)
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+
+            pos = 0
+            while pos < len(data):
+                end = data.find(b"\n", pos)
+                if end == -1:
+                    break  # Torn last line
+                try:
+                    record = json.loads(data[pos:end])
+                except ValueError:
+                    break
+                pos = end + 1
+                if record["seq"] <= snapshot_seq:
+                    continue  # Already in the snapshot (crash during compaction)
+                self.apply(state.transactions, record["changes"])
+                state.last_seq = record["seq"]
+                state.journal_changes += len(record["changes"])
+                state.last_time = record.get("time")
+
+            if pos < len(data):
+                # Drop the partial record so the next append starts on a clean line
+                print(f"Warning: Dropping torn journal record in {self.journal_path.name}")
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(pos)
+
+        state.signature = self.signature()
+        return state
+
+    def _read_snapshot(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Read the snapshot's transactions and the journal sequence it covers."""
+        if not self.snapshot_path.exists():
+            return {}, 0
+
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(self.snapshot_path)
+        metadata = table.schema.metadata or {}
+        snapshot_seq = int(metadata.get(b"journal_seq", b"0"))
+
+        names = list(TRANSACTION_FIELDS)
+        columns = [
+            table.column(name).to_pylist() if name in table.column_names
+            else [TRANSACTION_FIELDS[name]] * table.num_rows
+            for name in names
+        ]
+        transactions = {}
+        for values in zip(*columns):
+            tx = dict(zip(names, values))
+            transactions[tx["id"]] = tx
+        return transactions, snapshot_seq
+
+    # -------------------------------------------------------------------------
+    # Changes
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def diff(
+        current: Dict[str, Dict[str, Any]],
+        transactions: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Changes turning the stored transactions into a new transaction list.
+
+        Args:
+            current: Stored transactions (id -> normalized tx)
+            transactions: New transaction list
+
+        Returns:
+            (changes, earliest affected date or None if nothing changed)
+        """
+        changes: List[Dict[str, Any]] = []
+        dates: List[str] = []
+        seen = set()
+
+        for tx in transactions:
+            tx = normalize_transaction(tx)
+            tx_id = tx["id"]
+            seen.add(tx_id)
+            old = current.get(tx_id)
+            if old is None:
+                changes.append({"op": "add", "transaction": tx})
+                dates.append(tx["date"])
+            elif old != tx:
+                changes.append({"op": "edit", "transaction": tx})
+                dates.extend((old["date"], tx["date"]))
+
+        for tx_id, old in current.items():
+            if tx_id not in seen:
+                changes.append({"op": "delete", "id": tx_id})
+                dates.append(old["date"])
+
+        dates = [d for d in dates if d]
+        return changes, (min(dates) if dates else None)
+
+    @staticmethod
+    def apply(transactions: Dict[str, Dict[str, Any]], changes: List[Dict[str, Any]]) -> None:
+        """Apply journal changes to stored transactions in place."""
+        for change in changes:
+            if change["op"] == "delete":
+                transactions.pop(change["id"], None)
+            else:
+                tx = change["transaction"]
+                transactions[tx["id"]] = tx
+
+    # -------------------------------------------------------------------------
+    # Write
+    # -------------------------------------------------------------------------
+
+    def append(
+        self,
+        state: JournalState,
+        changes: List[Dict[str, Any]],
+        earliest_date: Optional[str],
+        timestamp: str,
+    ) -> None:
+        """
+        Append one save's changes as a single journal line and apply them to state.
+
+        Args:
+            state: Current state (updated in place)
+            changes: Changes from diff()
+            earliest_date: Earliest date the changes affect
+            timestamp: Save time (ISO format)
+        """
+        record = {
+            "seq": state.last_seq + 1,
+            "time": timestamp,
+            "earliest_date": earliest_date,
+            "changes": changes,
+        }
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.apply(state.transactions, changes)
+        state.last_seq = record["seq"]
+        state.journal_changes += len(changes)
+        state.last_time = timestamp
+        state.signature = self.signature()
+
+    def needs_compaction(self, state: JournalState) -> bool:
+        """Whether the journal has grown enough to fold into the snapshot."""
+        return state.journal_changes > max(_COMPACT_MIN_CHANGES, len(state.transactions))
+
+    def compact(self, state: JournalState) -> None:
+        """Write all transactions to a new snapshot and drop the journal."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        transactions = list(state.transactions.values())
+        types = {int: pa.int64(), float: pa.float64(), str: pa.string()}
+        table = pa.table({
+            name: pa.array([tx[name] for tx in transactions], type=types[type(default)])
+            for name, default in TRANSACTION_FIELDS.items()
+        })
+        table = table.replace_schema_metadata({"journal_seq": str(state.last_seq)})
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Lines up to last_seq are now in the snapshot (and skipped if this fails)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+        state.journal_changes = 0
+        state.signature = self.signature()
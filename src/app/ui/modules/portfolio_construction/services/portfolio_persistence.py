@@ -1,21 +1,36 @@
-"""Portfolio Persistence Service - Save/Load Portfolio JSON Files"""
+"""Portfolio Persistence Service - Save/Load Portfolio Files"""
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from .portfolio_journal import JournalState, PortfolioJournal
 
 
 class PortfolioPersistence:
     """
-    Singleton service for saving/loading portfolio JSON files.
+    Singleton service for saving/loading portfolios.
     Handles all file I/O operations for portfolios.
+
+    Each portfolio is a <name>.json manifest (name, dates) plus its
+    transactions in data/<name>.snapshot.parquet and an append-only
+    data/<name>.journal.jsonl (see PortfolioJournal). Saves append only the
+    changed transactions. Manifests that still hold a "transactions" list
+    (older format) are converted on their next save.
     """
 
     _PORTFOLIOS_DIR = Path.home() / ".quant_terminal" / "portfolios"
+    _DATA_DIR = _PORTFOLIOS_DIR / "data"
     _RECENT_FILE = Path.home() / ".quant_terminal" / "recent_portfolios.json"
     _DEFAULT_PORTFOLIO = "Default"
 
+    # Replayed journal state per portfolio: name -> (manifest, manifest mtime_ns, JournalState)
+    _states: Dict[str, Tuple[Dict[str, Any], int, JournalState]] = {}
+    _lock = threading.RLock()
+
     @classmethod
     def initialize(cls) -> None:
         """Create portfolios directory if it doesn't exist."""
@@ -49,6 +64,17 @@ class PortfolioPersistence:
             return None
 
         try:
+            with cls._lock:
+                loaded = cls._get_state(name)
+            if loaded is not None:
+                manifest, state = loaded
+                portfolio = dict(manifest)
+                if state.last_time:
+                    portfolio["last_modified"] = state.last_time
+                portfolio["transactions"] = [dict(tx) for tx in state.transactions.values()]
+                return portfolio
+
+            # Older format: transactions inline in the JSON file
             with open(path, "r", encoding="utf-8") as f:
                 portfolio = json.load(f)
 
@@ -65,7 +91,7 @@ class PortfolioPersistence:
                 cls.save_portfolio(portfolio)
 
             return portfolio
-        except (json.JSONDecodeError, IOError) as e:
+        except Exception as e:
             print(f"Error loading portfolio {name}: {e}")
             return None
 
@@ -74,6 +100,11 @@ class PortfolioPersistence:
         """
         Save portfolio to disk.
 
+        Appends the transactions added, edited or deleted since the last save
+        to the portfolio's journal, compacting it into a new snapshot once it
+        has grown past the ledger size. Downstream caches are invalidated from
+        the earliest affected transaction date.
+
         Args:
             portfolio: Portfolio dict with "name" and "transactions"
 
@@ -81,30 +112,164 @@ class PortfolioPersistence:
             True if saved successfully, False otherwise
         """
         name = portfolio.get("name", cls._DEFAULT_PORTFOLIO)
-        path = cls._PORTFOLIOS_DIR / f"{name}.json"
 
         try:
             # Update last_modified timestamp
-            portfolio["last_modified"] = datetime.now().isoformat()
+            timestamp = datetime.now().isoformat()
+            portfolio["last_modified"] = timestamp
 
             # Ensure directory exists
             cls._PORTFOLIOS_DIR.mkdir(parents=True, exist_ok=True)
 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(portfolio, f, indent=2, ensure_ascii=False)
+            with cls._lock:
+                saved, earliest_date = cls._save_locked(name, portfolio, timestamp)
+            if not saved:
+                return True  # Nothing changed
 
             # Invalidate returns cache (lazy import to avoid circular dependency)
             try:
                 from app.services.returns_data_service import ReturnsDataService
-                ReturnsDataService.invalidate_cache(name)
+                ReturnsDataService.invalidate_cache(name, since=earliest_date)
             except ImportError:
                 pass  # Service not available
 
             return True
-        except IOError as e:
+        except Exception as e:
             print(f"Error saving portfolio {name}: {e}")
             return False
 
+    @classmethod
+    def _save_locked(
+        cls, name: str, portfolio: Dict[str, Any], timestamp: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Write a save (caller holds _lock).
+
+        Returns:
+            (whether anything was written, earliest affected date or None
+            if unknown)
+        """
+        transactions = portfolio.get("transactions", [])
+        manifest = cls._manifest_for(portfolio)
+        journal = cls._journal(name)
+
+        loaded = cls._get_state(name)
+        if loaded is None:
+            # New portfolio or older inline format: write a full snapshot
+            state = JournalState()
+            PortfolioJournal.apply(
+                state.transactions,
+                PortfolioJournal.diff({}, transactions)[0],
+            )
+            journal.compact(state)
+            cls._states[name] = (manifest, cls._write_manifest(name, manifest), state)
+            return True, None
+
+        stored_manifest, state = loaded
+        manifest_mtime = cls._states[name][1]
+        changes, earliest_date = PortfolioJournal.diff(state.transactions, transactions)
+        manifest_changed = cls._without_timestamp(manifest) != cls._without_timestamp(stored_manifest)
+        if not changes and not manifest_changed:
+            return False, None
+
+        if changes:
+            journal.append(state, changes, earliest_date, timestamp)
+        if journal.needs_compaction(state):
+            journal.compact(state)
+            manifest_changed = True  # Record last_modified (journal times are gone)
+        if manifest_changed:
+            manifest_mtime = cls._write_manifest(name, manifest)
+            stored_manifest = manifest
+        cls._states[name] = (stored_manifest, manifest_mtime, state)
+        return True, earliest_date
+
+    @classmethod
+    def _get_state(cls, name: str) -> Optional[Tuple[Dict[str, Any], JournalState]]:
+        """
+        Get the replayed state of a journaled portfolio (caller holds _lock).
+
+        Replays from disk only when the files changed since the cached
+        state was read.
+
+        Returns:
+            (manifest, JournalState), or None if the portfolio doesn't exist or
+            still uses the inline format
+        """
+        path = cls._PORTFOLIOS_DIR / f"{name}.json"
+        journal = cls._journal(name)
+        try:
+            manifest_mtime = path.stat().st_mtime_ns
+        except OSError:
+            cls._states.pop(name, None)
+            return None
+
+        cached = cls._states.get(name)
+        if cached is not None:
+            manifest, cached_mtime, state = cached
+            if cached_mtime == manifest_mtime and state.signature == journal.signature():
+                return manifest, state
+
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if "transactions" in manifest:
+            cls._states.pop(name, None)
+            return None
+
+        state = journal.load()
+        cls._states[name] = (manifest, manifest_mtime, state)
+        return manifest, state
+
+    @classmethod
+    def _journal(cls, name: str) -> PortfolioJournal:
+        return PortfolioJournal(cls._DATA_DIR, name)
+
+    @staticmethod
+    def _manifest_for(portfolio: Dict[str, Any]) -> Dict[str, Any]:
+        """Portfolio fields stored in the manifest (everything but transactions)."""
+        return {k: v for k, v in portfolio.items() if k != "transactions"}
+
+    @staticmethod
+    def _without_timestamp(manifest: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in manifest.items() if k != "last_modified"}
+
+    @classmethod
+    def _write_manifest(cls, name: str, manifest: Dict[str, Any]) -> int:
+        """
+        Atomically write a portfolio manifest (caller holds _lock).
+
+        Returns:
+            The manifest's new mtime_ns
+        """
+        path = cls._PORTFOLIOS_DIR / f"{name}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path.stat().st_mtime_ns
+
+    @classmethod
+    def get_modified_time(cls, name: str) -> Optional[datetime]:
+        """
+        Get when a portfolio's files were last written.
+
+        Args:
+            name: Portfolio name
+
+        Returns:
+            Latest modification time of the manifest, snapshot and journal,
+            or None if the portfolio doesn't exist
+        """
+        path = cls._PORTFOLIOS_DIR / f"{name}.json"
+        journal = cls._journal(name)
+        mtimes = []
+        for p in (path, journal.snapshot_path, journal.journal_path):
+            try:
+                mtimes.append(p.stat().st_mtime)
+            except OSError:
+                if p is path:
+                    return None
+        return datetime.fromtimestamp(max(mtimes))
+
     @classmethod
     def delete_portfolio(cls, name: str) -> bool:
         """
@@ -119,7 +284,10 @@ class PortfolioPersistence:
         path = cls._PORTFOLIOS_DIR / f"{name}.json"
         if path.exists():
             try:
-                path.unlink()
+                with cls._lock:
+                    path.unlink()
+                    cls._journal(name).delete()
+                    cls._states.pop(name, None)
                 return True
             except OSError as e:
                 print(f"Error deleting portfolio {name}: {e}")
@@ -183,25 +351,26 @@ class PortfolioPersistence:
             return False  # Target name already exists
 
         try:
-            # Load portfolio
-            with open(old_path, "r", encoding="utf-8") as f:
-                portfolio = json.load(f)
-
-            # Update name and timestamp
-            portfolio["name"] = new_name
-            portfolio["last_modified"] = datetime.now().isoformat()
-
-            # Save with new name
-            with open(new_path, "w", encoding="utf-8") as f:
-                json.dump(portfolio, f, indent=2, ensure_ascii=False)
-
-            # Delete old file
-            old_path.unlink()
+            with cls._lock:
+                # Load portfolio
+                portfolio = cls.load_portfolio(old_name)
+                if portfolio is None:
+                    return False
+
+                # Save with new name (writes a fresh snapshot)
+                portfolio["name"] = new_name
+                if not cls.save_portfolio(portfolio):
+                    return False
+
+                # Delete old files
+                old_path.unlink()
+                cls._journal(old_name).delete()
+                cls._states.pop(old_name, None)
 
             # Update recent visits to use new name
             cls._rename_recent_entry(old_name, new_name)
             return True
-        except (json.JSONDecodeError, IOError, OSError) as e:
+        except (IOError, OSError) as e:
             print(f"Error renaming portfolio {old_name} to {new_name}: {e}")
             return False
 
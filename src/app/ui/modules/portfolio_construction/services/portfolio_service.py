@@ -1,12 +1,14 @@
 """Portfolio Service - Business Logic and Calculations"""
 
 import uuid
-from typing import Dict, List, Any, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Optional
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.services.market_data import fetch_price_history
 
+if TYPE_CHECKING:
+    from .transaction_ledger import TransactionLedger
+
 
 class PortfolioService:
     """
@@ -268,12 +270,12 @@ class PortfolioService:
     @staticmethod
     def fetch_current_prices(tickers: List[str]) -> Dict[str, Optional[float]]:
         """
-        Fetch current prices for tickers using MarketDataService with parallel fetching.
+        Fetch current prices (latest daily close) for tickers.
 
-        Uses period="max" to leverage parquet caching for efficiency.
-        Cache stored at ~/.quant_terminal/cache/{TICKER}.parquet
+        Reads the latest-quote store, so tickers whose cached bars are current
+        cost no history load; stale or unknown tickers are refreshed through
+        the parquet cache in parallel.
         FREE CASH ticker always returns $1.00 (no Yahoo fetch).
-        Fetches multiple tickers in parallel using ThreadPoolExecutor.
 
         Args:
             tickers: List of ticker symbols
@@ -281,6 +283,8 @@ class PortfolioService:
         Returns:
             Dict mapping ticker -> price (or None if fetch failed)
         """
+        from app.services.market_data import get_latest_quotes
+
         if not tickers:
             return {}
 
@@ -299,22 +303,10 @@ class PortfolioService:
         if not real_tickers:
             return prices
 
-        def fetch_single_price(ticker: str) -> Tuple[str, Optional[float]]:
-            try:
-                # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
-                df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
-                if df is not None and not df.empty:
-                    return ticker, float(df["Close"].iloc[-1])
-            except Exception as e:
-                print(f"Error fetching price for {ticker}: {e}")
-            return ticker, None
-
-        # Parallel fetch using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(fetch_single_price, t) for t in real_tickers]
-            for future in as_completed(futures):
-                ticker, price = future.result()
-                prices[ticker] = price
+        quotes = get_latest_quotes(real_tickers)
+        for ticker in real_tickers:
+            quote = quotes.get(ticker)
+            prices[ticker] = quote.close if quote is not None else None
 
         return prices
 
@@ -417,7 +409,7 @@ class PortfolioService:
             Tuple of (is_valid, error_message)
         """
         import pandas as pd
-        from datetime import datetime
+        from app.services.price_lookup import lookup_closes_asof
 
         if not ticker or not date_str:
             return True, None  # Skip validation if missing data
@@ -440,11 +432,12 @@ class PortfolioService:
                 day_name = "Saturday" if target_date.weekday() == 5 else "Sunday"
                 return False, f"{date_str} is a {day_name}. Stock markets are closed on weekends."
 
-            # Fetch historical data to check if it's a trading day
-            # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
-            df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
+            # Look up the date in the ticker's trading days
+            lookup = lookup_closes_asof([ticker], [target_date])
+            first_date = lookup.first_date[0]
+            last_date = lookup.last_date[0]
 
-            if df is None or df.empty:
+            if pd.isna(first_date):
                 # Can't validate without data, allow it
                 return True, None
 
@@ -455,22 +448,19 @@ class PortfolioService:
                 return False, f"{date_str} is in the future."
 
             # Check if this date exists in the trading data
-            if target_date in df.index:
+            if lookup.exact[0]:
                 return True, None
 
             # Date not found - could be a holiday
             # Check if there are trading days before and after this date
-            prior_dates = df.index[df.index < target_date]
-            future_dates = df.index[df.index > target_date]
-
-            if len(prior_dates) > 0 and len(future_dates) > 0:
+            if first_date < target_date < last_date:
                 # There's data before and after, so this was likely a holiday
                 return False, f"{date_str} appears to be a market holiday. Please select a valid trading day."
 
             # If date is before the first available data point
-            if len(prior_dates) == 0 and len(future_dates) > 0:
-                first_date = df.index.min().strftime("%Y-%m-%d")
-                return False, f"No trading data available before {first_date} for '{ticker}'."
+            if target_date < first_date:
+                first_date_str = pd.Timestamp(first_date).strftime("%Y-%m-%d")
+                return False, f"No trading data available before {first_date_str} for '{ticker}'."
 
             return True, None
 
@@ -492,7 +482,8 @@ class PortfolioService:
         Returns:
             Closing price on that date, or None if not available
         """
-        import pandas as pd
+        import math
+        from app.services.price_lookup import lookup_closes_asof
 
         if not ticker or not date_str:
             return None
@@ -502,27 +493,9 @@ class PortfolioService:
             return 1.0
 
         try:
-            # Fetch full history (uses cache if current)
-            # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
-            df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
-
-            if df is None or df.empty:
-                return None
-
-            # Convert date string to datetime for lookup
-            target_date = pd.to_datetime(date_str)
-
-            # Find the exact date or the closest previous trading day
-            if target_date in df.index:
-                return float(df.loc[target_date, "Close"])
-
-            # If exact date not found, find closest previous date
-            prior_dates = df.index[df.index <= target_date]
-            if len(prior_dates) > 0:
-                closest_date = prior_dates.max()
-                return float(df.loc[closest_date, "Close"])
-
-            return None
+            # Exact date or the closest previous trading day
+            close = float(lookup_closes_asof([ticker], [date_str]).close[0])
+            return None if math.isnan(close) else close
 
         except Exception as e:
             print(f"Error fetching historical price for {ticker} on {date_str}: {e}")
@@ -535,80 +508,40 @@ class PortfolioService:
         """
         Batch fetch historical closing prices for multiple ticker/date pairs.
         FREE CASH ticker always returns $1.00 for any date.
-        Fetches multiple tickers in parallel using ThreadPoolExecutor.
+        Each ticker's history is fetched once (in parallel) and all of its
+        dates are resolved in one vectorized as-of lookup.
 
         Args:
             ticker_dates: List of (ticker, date_str) tuples
 
         Returns:
-            Dict of ticker -> {date -> close_price}
+            Dict of ticker -> {date -> close_price} (exact date or the
+            closest previous trading day)
         """
-        import pandas as pd
+        from app.services.price_lookup import lookup_close_map
 
         if not ticker_dates:
             return {}
 
         results: Dict[str, Dict[str, Optional[float]]] = {}
 
-        # Group by ticker to minimize fetches
-        ticker_groups: Dict[str, List[str]] = {}
-        for ticker, date_str in ticker_dates:
-            if ticker not in ticker_groups:
-                ticker_groups[ticker] = []
-            if date_str not in ticker_groups[ticker]:
-                ticker_groups[ticker].append(date_str)
-
         # Handle FREE CASH separately (no API call needed)
-        real_ticker_groups: Dict[str, List[str]] = {}
-        for ticker, dates in ticker_groups.items():
+        real_ticker_dates: List[Tuple[str, str]] = []
+        for ticker, date_str in ticker_dates:
             if ticker.upper() == PortfolioService.FREE_CASH_TICKER:
-                results[ticker] = {d: 1.0 for d in dates}
+                results.setdefault(ticker, {})[date_str] = 1.0
             else:
-                real_ticker_groups[ticker] = dates
+                real_ticker_dates.append((ticker, date_str))
 
-        if not real_ticker_groups:
+        if not real_ticker_dates:
             return results
 
-        def fetch_ticker_dates(
-            ticker: str, dates: List[str]
-        ) -> Tuple[str, Dict[str, Optional[float]]]:
-            """Fetch all needed dates for a single ticker."""
-            date_prices: Dict[str, Optional[float]] = {}
-            try:
-                # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
-                df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
-
-                if df is None or df.empty:
-                    return ticker, {d: None for d in dates}
-
-                for date_str in dates:
-                    target_date = pd.to_datetime(date_str)
-
-                    if target_date in df.index:
-                        date_prices[date_str] = float(df.loc[target_date, "Close"])
-                    else:
-                        prior_dates = df.index[df.index <= target_date]
-                        if len(prior_dates) > 0:
-                            closest_date = prior_dates.max()
-                            date_prices[date_str] = float(df.loc[closest_date, "Close"])
-                        else:
-                            date_prices[date_str] = None
-
-            except Exception as e:
-                print(f"Error fetching historical prices for {ticker}: {e}")
-                return ticker, {d: None for d in dates}
-
-            return ticker, date_prices
-
-        # Parallel fetch using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                executor.submit(fetch_ticker_dates, ticker, dates)
-                for ticker, dates in real_ticker_groups.items()
-            ]
-            for future in as_completed(futures):
-                ticker, date_prices = future.result()
-                results[ticker] = date_prices
+        try:
+            results.update(lookup_close_map(real_ticker_dates))
+        except Exception as e:
+            print(f"Error fetching historical prices: {e}")
+            for ticker, date_str in real_ticker_dates:
+                results.setdefault(ticker, {})[date_str] = None
 
         return results
 
@@ -623,12 +556,14 @@ class PortfolioService:
         Returns:
             Date string in YYYY-MM-DD format, or None if no data available
         """
+        import pandas as pd
+        from app.services.price_lookup import get_close_arrays
+
         try:
-            # skip_live_bar=True to avoid Polygon rate limiting for portfolio ops
-            df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
-            if df is None or df.empty:
+            arrays = get_close_arrays(ticker)
+            if arrays is None:
                 return None
-            return df.index.min().strftime("%Y-%m-%d")
+            return pd.Timestamp(arrays.dates[0]).strftime("%Y-%m-%d")
         except Exception:
             return None
 
@@ -891,6 +826,24 @@ class PortfolioService:
             "market_value": free_cash_balance
         }
 
+    @staticmethod
+    def build_ledger(transactions) -> "TransactionLedger":
+        """
+        Build a TransactionLedger for fast point-in-time queries.
+
+        Args:
+            transactions: List of transaction dicts, or an existing ledger
+                (returned as is)
+
+        Returns:
+            TransactionLedger
+        """
+        from .transaction_ledger import TransactionLedger
+
+        if isinstance(transactions, TransactionLedger):
+            return transactions
+        return TransactionLedger(transactions)
+
     @staticmethod
     def calculate_free_cash_at_date(
         transactions: List[Dict[str, Any]],
@@ -901,50 +854,15 @@ class PortfolioService:
         Calculate FREE CASH balance at a specific date.
 
         Args:
-            transactions: List of all transactions
+            transactions: List of all transactions (or a TransactionLedger)
             target_date: Date string (YYYY-MM-DD) - include transactions on/before this date
             exclude_transaction_id: Optional transaction ID to exclude (for edit validation)
 
         Returns:
             FREE CASH balance as float (can be negative)
         """
-        free_cash_balance = 0.0
-
-        # Sort by date then sequence to ensure correct processing order
-        sorted_txs = sorted(
-            transactions,
-            key=lambda t: (t.get("date", ""), t.get("sequence", 0))
-        )
-
-
-        for tx in sorted_txs:
-            # Skip excluded transaction
-            if exclude_transaction_id and tx.get("id") == exclude_transaction_id:
-                continue
-
-            # Only include transactions on or before target date
-            tx_date = tx.get("date", "")
-            if tx_date > target_date:
-                continue
-
-            ticker = tx.get("ticker", "").upper()
-            tx_type = tx.get("transaction_type", "")
-            qty = float(tx.get("quantity", 0))
-            price = float(tx.get("entry_price", 0))
-            fees = float(tx.get("fees", 0))
-
-            if ticker == PortfolioService.FREE_CASH_TICKER:
-                if tx_type == "Buy":  # Deposit
-                    free_cash_balance += qty - fees
-                else:  # Sell = Withdrawal
-                    free_cash_balance -= (qty + fees)
-            else:
-                if tx_type == "Buy":
-                    free_cash_balance -= (qty * price + fees)
-                else:  # Sell
-                    free_cash_balance += (qty * price - fees)
-
-        return free_cash_balance
+        ledger = PortfolioService.build_ledger(transactions)
+        return ledger.cash_at(target_date, exclude_id=exclude_transaction_id)
 
     @staticmethod
     def calculate_position_at_date(
@@ -957,7 +875,7 @@ class PortfolioService:
         Calculate share position for a ticker at a specific date.
 
         Args:
-            transactions: List of all transactions
+            transactions: List of all transactions (or a TransactionLedger)
             ticker: Ticker symbol to calculate position for
             target_date: Date string (YYYY-MM-DD) - include transactions on/before this date
             exclude_transaction_id: Optional transaction ID to exclude (for edit validation)
@@ -965,38 +883,8 @@ class PortfolioService:
         Returns:
             Net share position (can be negative for validation)
         """
-        position = 0.0
-        ticker_upper = ticker.upper()
-
-        # Sort by date then sequence to ensure correct processing order
-        sorted_txs = sorted(
-            transactions,
-            key=lambda t: (t.get("date", ""), t.get("sequence", 0))
-        )
-
-        for tx in sorted_txs:
-            # Skip excluded transaction
-            if exclude_transaction_id and tx.get("id") == exclude_transaction_id:
-                continue
-
-            # Only include transactions for this ticker
-            if tx.get("ticker", "").upper() != ticker_upper:
-                continue
-
-            # Only include transactions on or before target date
-            tx_date = tx.get("date", "")
-            if tx_date > target_date:
-                continue
-
-            qty = float(tx.get("quantity", 0))
-            tx_type = tx.get("transaction_type", "")
-
-            if tx_type == "Buy":
-                position += qty
-            else:  # Sell
-                position -= qty
-
-        return position
+        ledger = PortfolioService.build_ledger(transactions)
+        return ledger.position_at(ticker, target_date, exclude_id=exclude_transaction_id)
 
     @staticmethod
     def get_transaction_priority(ticker: str, transaction_type: str) -> int:
@@ -1143,7 +1031,8 @@ class PortfolioService:
         Validate transaction safeguards (cash balance, position, chain).
 
         Args:
-            transactions: List of all existing transactions
+            transactions: List of all existing transactions (or a TransactionLedger,
+                which avoids re-sorting them for every validation)
             transaction: Transaction to validate (new or edited)
             is_new: True if this is a new transaction
             original_date: Original date before edit (for detecting date adjustments)
@@ -1151,6 +1040,7 @@ class PortfolioService:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        ledger = PortfolioService.build_ledger(transactions)
         tx_id = transaction.get("id")
         tx_date = transaction.get("date", "")
         ticker = transaction.get("ticker", "").upper()
@@ -1159,17 +1049,11 @@ class PortfolioService:
         price = float(transaction.get("entry_price", 0))
         fees = float(transaction.get("fees", 0))
 
-        # Build transaction list for validation
         # Exclude current transaction if editing, we'll add the new version
-        if is_new:
-            test_transactions = list(transactions)
-        else:
-            test_transactions = [tx for tx in transactions if tx.get("id") != tx_id]
+        exclude_id = None if is_new else tx_id
 
         # Calculate cash before this transaction
-        cash_before = PortfolioService.calculate_free_cash_at_date(
-            test_transactions, tx_date
-        )
+        cash_before = ledger.cash_at(tx_date, exclude_id=exclude_id)
 
         # Validate based on transaction type
         if ticker == PortfolioService.FREE_CASH_TICKER:
@@ -1185,9 +1069,7 @@ class PortfolioService:
             # Regular security transaction
             if tx_type == "Sell":
                 # Check position before this transaction
-                position_before = PortfolioService.calculate_position_at_date(
-                    test_transactions, ticker, tx_date
-                )
+                position_before = ledger.position_at(ticker, tx_date, exclude_id=exclude_id)
                 if position_before < qty:
                     return (
                         False,
@@ -1233,7 +1115,7 @@ class PortfolioService:
             validation_start_date = original_date if is_free_cash_deposit_moving_forward else ""
 
             chain_valid, chain_error = PortfolioService.validate_transaction_chain(
-                transactions, transaction, is_free_cash_deposit_moving_back, validation_start_date
+                ledger, transaction, is_free_cash_deposit_moving_back, validation_start_date
             )
             if not chain_valid:
                 return (False, chain_error)
@@ -1250,8 +1132,12 @@ class PortfolioService:
         """
         Validate that editing a transaction doesn't break subsequent transactions.
 
+        Only the running balances after the edit point are checked: the edit
+        shifts them by a constant per range, so the ledger compares that shift
+        with the minimum balance in each range instead of replaying history.
+
         Args:
-            transactions: List of all transactions (with edited transaction already updated)
+            transactions: List of all transactions (or a TransactionLedger)
             edited_transaction: The transaction that was edited
             skip_validation: True to skip chain validation entirely (e.g., FREE CASH deposit
                 moving to an earlier date)
@@ -1269,73 +1155,36 @@ class PortfolioService:
             return (True, "")
 
         edit_date = edited_transaction.get("date", "")
-        edit_id = edited_transaction.get("id")
 
         # Use validation_start_date if provided (for FREE CASH deposit moving forward)
         # This ensures we validate transactions between old and new dates
         check_from_date = validation_start_date if validation_start_date else edit_date
 
-        # Build list: remove old version, add edited version
-        # This ensures the edited transaction is at its NEW date, not OLD date
-        filtered_transactions = [tx for tx in transactions if tx.get("id") != edit_id]
-        all_transactions = filtered_transactions + [edited_transaction]
-
-        # Sort by date, then sequence for same-day ordering
-        sorted_txs = sorted(all_transactions, key=lambda x: (x.get("date", ""), x.get("sequence", 0)))
-
-        # Track running balances
-        cash_balance = 0.0
-        positions: Dict[str, float] = {}  # ticker -> position
-
-        for tx in sorted_txs:
-            tx_date = tx.get("date", "")
-            ticker = tx.get("ticker", "").upper()
-            tx_type = tx.get("transaction_type", "")
-            qty = float(tx.get("quantity", 0))
-            price = float(tx.get("entry_price", 0))
-            fees = float(tx.get("fees", 0))
-
-            if ticker == PortfolioService.FREE_CASH_TICKER:
-                if tx_type == "Buy":  # Deposit
-                    cash_balance += qty - fees
-                else:  # Sell = Withdrawal
-                    # Validate before applying
-                    withdrawal = qty + fees
-                    if cash_balance < withdrawal and tx_date >= check_from_date:
-                        return (
-                            False,
-                            f"This change would cause insufficient cash for withdrawal on {tx_date}.\n"
-                            f"Available: ${max(0, cash_balance):,.2f}, Needed: ${withdrawal:,.2f}"
-                        )
-                    cash_balance -= withdrawal
-            else:
-                if ticker not in positions:
-                    positions[ticker] = 0.0
-
-                if tx_type == "Buy":
-                    cost = qty * price + fees
-                    # Validate cash before applying
-                    if cash_balance < cost and tx_date >= check_from_date:
-                        return (
-                            False,
-                            f"This change would cause insufficient cash for {ticker} purchase on {tx_date}.\n"
-                            f"Available: ${max(0, cash_balance):,.2f}, Needed: ${cost:,.2f}"
-                        )
-                    cash_balance -= cost
-                    positions[ticker] += qty
-                else:  # Sell
-                    # Validate position before applying
-                    if positions[ticker] < qty and tx_date >= check_from_date:
-                        return (
-                            False,
-                            f"This change would cause insufficient shares for {ticker} sale on {tx_date}.\n"
-                            f"Available: {max(0, positions[ticker]):,.4f}, Needed: {qty:,.4f}"
-                        )
-                    positions[ticker] -= qty
-                    proceeds = qty * price - fees
-                    cash_balance += proceeds
+        # The old version is replaced, so the edited transaction sits at its NEW date
+        ledger = PortfolioService.build_ledger(transactions)
+        violation = ledger.find_violation(
+            edited_transaction,
+            replace_id=edited_transaction.get("id"),
+            check_from=check_from_date,
+        )
+        if violation is None:
+            return (True, "")
 
-        return (True, "")
+        v = violation
+        if v.kind == "withdrawal":
+            message = f"This change would cause insufficient cash for withdrawal on {v.date}.\n"
+        elif v.kind == "buy":
+            message = f"This change would cause insufficient cash for {v.ticker} purchase on {v.date}.\n"
+        else:
+            return (
+                False,
+                f"This change would cause insufficient shares for {v.ticker} sale on {v.date}.\n"
+                f"Available: {max(0, v.available):,.4f}, Needed: {v.needed:,.4f}"
+            )
+        return (
+            False,
+            message + f"Available: ${max(0, v.available):,.2f}, Needed: ${v.needed:,.2f}"
+        )
 
     @staticmethod
     def validate_transaction_deletion(
@@ -1349,83 +1198,41 @@ class PortfolioService:
         could leave subsequent transactions without sufficient funds.
 
         Args:
-            transactions: List of all current transactions
+            transactions: List of all current transactions (or a TransactionLedger)
             transaction_to_delete: The transaction being deleted
 
         Returns:
             Tuple of (can_delete, error_message)
         """
-        delete_id = transaction_to_delete.get("id")
-        delete_ticker = transaction_to_delete.get("ticker", "").upper()
-        delete_type = transaction_to_delete.get("transaction_type", "")
-        delete_date = transaction_to_delete.get("date", "")
-
-        # Build list without the transaction to delete
-        remaining_transactions = [
-            tx for tx in transactions if tx.get("id") != delete_id
-        ]
-
-        # If no remaining transactions, deletion is always valid
-        if not remaining_transactions:
+        ledger = PortfolioService.build_ledger(transactions)
+        violation = ledger.find_violation(
+            replace_id=transaction_to_delete.get("id"),
+            check_from=transaction_to_delete.get("date", ""),
+        )
+        if violation is None:
             return (True, "")
 
-        # Sort by date
-        sorted_txs = sorted(remaining_transactions, key=lambda x: x.get("date", ""))
-
-        # Track running balances
-        cash_balance = 0.0
-        positions: Dict[str, float] = {}
-
-        # Find first problem after the deletion date
-        for tx in sorted_txs:
-            tx_date = tx.get("date", "")
-            ticker = tx.get("ticker", "").upper()
-            tx_type = tx.get("transaction_type", "")
-            qty = float(tx.get("quantity", 0))
-            price = float(tx.get("entry_price", 0))
-            fees = float(tx.get("fees", 0))
-
-            if ticker == PortfolioService.FREE_CASH_TICKER:
-                if tx_type == "Buy":  # Deposit
-                    cash_balance += qty - fees
-                else:  # Sell = Withdrawal
-                    withdrawal = qty + fees
-                    if cash_balance < withdrawal and tx_date >= delete_date:
-                        return (
-                            False,
-                            f"Cannot delete this deposit. It would cause insufficient cash "
-                            f"for withdrawal on {tx_date}.\n\n"
-                            f"Available: ${max(0, cash_balance):,.2f}, Needed: ${withdrawal:,.2f}\n\n"
-                            f"Please delete or modify transactions that depend on this cash first."
-                        )
-                    cash_balance -= withdrawal
-            else:
-                if ticker not in positions:
-                    positions[ticker] = 0.0
-
-                if tx_type == "Buy":
-                    cost = qty * price + fees
-                    if cash_balance < cost and tx_date >= delete_date:
-                        return (
-                            False,
-                            f"Cannot delete this deposit. It would cause insufficient cash "
-                            f"for {ticker} purchase on {tx_date}.\n\n"
-                            f"Available: ${max(0, cash_balance):,.2f}, Needed: ${cost:,.2f}\n\n"
-                            f"Please delete or modify transactions that depend on this cash first."
-                        )
-                    cash_balance -= cost
-                    positions[ticker] += qty
-                else:  # Sell
-                    if positions[ticker] < qty and tx_date >= delete_date:
-                        return (
-                            False,
-                            f"Cannot delete this transaction. It would cause insufficient shares "
-                            f"for {ticker} sale on {tx_date}.\n\n"
-                            f"Available: {max(0, positions[ticker]):,.4f}, Needed: {qty:,.4f}\n\n"
-                            f"Please delete or modify transactions that depend on this position first."
-                        )
-                    positions[ticker] -= qty
-                    proceeds = qty * price - fees
-                    cash_balance += proceeds
-
-        return (True, "")
+        v = violation
+        if v.kind == "withdrawal":
+            return (
+                False,
+                f"Cannot delete this deposit. It would cause insufficient cash "
+                f"for withdrawal on {v.date}.\n\n"
+                f"Available: ${max(0, v.available):,.2f}, Needed: ${v.needed:,.2f}\n\n"
+                f"Please delete or modify transactions that depend on this cash first."
+            )
+        if v.kind == "buy":
+            return (
+                False,
+                f"Cannot delete this deposit. It would cause insufficient cash "
+                f"for {v.ticker} purchase on {v.date}.\n\n"
+                f"Available: ${max(0, v.available):,.2f}, Needed: ${v.needed:,.2f}\n\n"
+                f"Please delete or modify transactions that depend on this cash first."
+            )
+        return (
+            False,
+            f"Cannot delete this transaction. It would cause insufficient shares "
+            f"for {v.ticker} sale on {v.date}.\n\n"
+            f"Available: {max(0, v.available):,.4f}, Needed: {v.needed:,.4f}\n\n"
+            f"Please delete or modify transactions that depend on this position first."
+        )
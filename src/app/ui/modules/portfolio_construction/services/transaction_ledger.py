@@ -0,0 +1,439 @@
+"""Transaction Ledger - Indexed running balances for point-in-time queries"""
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .portfolio_service import PortfolioService
+
+# Per-transaction columns
+_CASH = 0        # Change in FREE CASH balance
+_CASH_NEED = 1   # Cash required before the transaction (NaN if not checked)
+_TICKER = 2      # Ticker code
+_QTY = 3         # Change in share position
+_QTY_NEED = 4    # Shares required before the transaction (NaN if not a sale)
+_NUM_COLUMNS = 5
+
+# Allowed shortfall from floating-point error when balances are shifted by an edit
+_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class ChainViolation:
+    """First transaction an edit would leave without enough cash or shares."""
+
+    kind: str  # "withdrawal", "buy" or "sell"
+    date: str
+    ticker: str
+    available: float
+    needed: float
+
+
+class _MinTree:
+    """Segment tree answering "first index in [lo, hi) below a threshold"."""
+
+    def __init__(self, values: np.ndarray):
+        self._size = 1
+        while self._size < len(values):
+            self._size *= 2
+        tree = np.full(2 * self._size, np.inf)
+        tree[self._size:self._size + len(values)] = values
+        lo = self._size // 2
+        while lo >= 1:
+            tree[lo:2 * lo] = np.minimum(tree[2 * lo:4 * lo:2], tree[2 * lo + 1:4 * lo:2])
+            lo //= 2
+        self._tree = tree
+
+    def first_below(self, lo: int, hi: int, threshold: float) -> int:
+        """Index of the first value below threshold in [lo, hi), or -1."""
+        tree, size = self._tree, self._size
+        left: List[int] = []
+        right: List[int] = []
+        lo += size
+        hi += size
+        while lo < hi:
+            if lo & 1:
+                left.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right.append(hi)
+            lo //= 2
+            hi //= 2
+
+        for node in left + right[::-1]:
+            if tree[node] < threshold:
+                while node < size:
+                    node = 2 * node if tree[2 * node] < threshold else 2 * node + 1
+                return node - size
+        return -1
+
+
+class TransactionLedger:
+    """
+    Transactions kept in (date, sequence) order with running balances.
+
+    The running FREE CASH balance and per-ticker positions are prefix sums
+    over the ordered transactions, so balances at a date are found with a
+    binary search. Chain validation looks at the minimum running balance
+    after the edit point (segment tree), shifted by the amount the edit
+    changes it, instead of replaying the whole history.
+
+    Adding or removing a transaction costs one array insert/delete; the
+    prefix sums are rebuilt (vectorized) on the next query.
+    """
+
+    def __init__(self, transactions: Iterable[Dict[str, Any]] = ()):
+        self._counter = 0  # Tie-breaker: equal (date, sequence) keep insertion order
+        self._ticker_codes: Dict[str, int] = {}
+        self._tickers: List[str] = []
+
+        entries = sorted(
+            (self._make_key(tx), tx.get("id"), self._make_row(tx))
+            for tx in transactions
+        )
+        self._keys: List[Tuple[str, int, int]] = [key for key, _, _ in entries]
+        self._dates: List[str] = [key[0] for key in self._keys]
+        self._rows = (
+            np.array([row for _, _, row in entries], dtype=np.float64)
+            if entries else np.empty((0, _NUM_COLUMNS))
+        )
+        self._key_by_id = {tx_id: key for key, tx_id, _ in entries if tx_id}
+        self._invalidate()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, transaction_id: str) -> bool:
+        return transaction_id in self._key_by_id
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, transaction: Dict[str, Any]) -> None:
+        """Insert a transaction at its (date, sequence) position."""
+        key = self._make_key(transaction)
+        pos = bisect.bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._dates.insert(pos, key[0])
+        self._rows = np.insert(self._rows, pos, self._make_row(transaction), axis=0)
+        if transaction.get("id"):
+            self._key_by_id[transaction["id"]] = key
+        self._invalidate()
+
+    def remove(self, transaction_id: str) -> bool:
+        """
+        Remove a transaction.
+
+        Returns:
+            True if the transaction was in the ledger
+        """
+        pos = self._index_of(transaction_id)
+        if pos is None:
+            return False
+        del self._keys[pos]
+        del self._dates[pos]
+        del self._key_by_id[transaction_id]
+        self._rows = np.delete(self._rows, pos, axis=0)
+        self._invalidate()
+        return True
+
+    def replace(self, transaction: Dict[str, Any]) -> None:
+        """Replace the stored version of a transaction (or add it)."""
+        self.remove(transaction.get("id"))
+        self.add(transaction)
+
+    # ------------------------------------------------------------------
+    # Point-in-time queries
+    # ------------------------------------------------------------------
+
+    def cash_at(self, target_date: str, exclude_id: Optional[str] = None) -> float:
+        """
+        FREE CASH balance including all transactions on or before a date.
+
+        Args:
+            target_date: Date string (YYYY-MM-DD)
+            exclude_id: Optional transaction ID to leave out (for edit validation)
+
+        Returns:
+            Balance as float (can be negative)
+        """
+        self._ensure_balances()
+        end = bisect.bisect_right(self._dates, target_date)
+        balance = float(self._cash_after[end - 1]) if end else 0.0
+        excluded = self._index_of(exclude_id)
+        if excluded is not None and excluded < end:
+            balance -= float(self._rows[excluded, _CASH])
+        return balance
+
+    def position_at(
+        self, ticker: str, target_date: str, exclude_id: Optional[str] = None
+    ) -> float:
+        """
+        Share position for a ticker including all transactions on or before a date.
+
+        Args:
+            ticker: Ticker symbol
+            target_date: Date string (YYYY-MM-DD)
+            exclude_id: Optional transaction ID to leave out (for edit validation)
+
+        Returns:
+            Net position (can be negative)
+        """
+        code = self._ticker_codes.get(ticker.upper())
+        if code is None:
+            return 0.0
+        indices, after, _ = self._ticker_chain(code)
+        global_end = bisect.bisect_right(self._dates, target_date)
+        end = int(np.searchsorted(indices, global_end))
+        position = float(after[end - 1]) if end else 0.0
+        excluded = self._index_of(exclude_id)
+        if (
+            excluded is not None
+            and excluded < global_end
+            and int(self._rows[excluded, _TICKER]) == code
+        ):
+            position -= float(self._rows[excluded, _QTY])
+        return position
+
+    # ------------------------------------------------------------------
+    # Chain validation
+    # ------------------------------------------------------------------
+
+    def find_violation(
+        self,
+        transaction: Optional[Dict[str, Any]] = None,
+        replace_id: Optional[str] = None,
+        check_from: str = ""
+    ) -> Optional[ChainViolation]:
+        """
+        Find the first transaction that would lack cash or shares after a change.
+
+        The change removes `replace_id` (if given) and inserts `transaction`
+        (if given): an edit passes both, a deletion only `replace_id`. Cash is
+        checked across all transactions; positions for the ticker(s) the
+        change touches. Only transactions dated on/after `check_from` count.
+
+        Args:
+            transaction: New or edited transaction
+            replace_id: ID of the transaction being replaced or deleted
+            check_from: Earliest date to report violations for
+
+        Returns:
+            First violation in (date, sequence) order, or None if the chain holds
+        """
+        self._ensure_balances()
+        removed = self._index_of(replace_id)
+        removed_row = self._rows[removed] if removed is not None else None
+        new_row = self._make_row(transaction) if transaction else None
+        new_date = (transaction.get("date") or "") if transaction else ""
+        insert_at = None
+        if transaction:
+            key = self._make_key(transaction, counter=math.inf)
+            insert_at = bisect.bisect_right(self._keys, key)
+        start = bisect.bisect_left(self._dates, check_from) if check_from else 0
+
+        # (order, chain index or None for the inserted transaction, balance after, column)
+        found: List[Tuple[float, Optional[int], float, int]] = []
+
+        # Cash chain (all transactions)
+        hit = self._scan_chain(
+            self._cash_tree, self._cash_after, start,
+            removed, removed_row[_CASH] if removed_row is not None else 0.0,
+            insert_at, new_row[_CASH] if new_row is not None else 0.0,
+            new_row is not None and not np.isnan(new_row[_CASH_NEED]) and new_date >= check_from,
+        )
+        if hit is not None:
+            k, value = hit
+            found.append((insert_at - 0.5 if k is None else k, k, value, _CASH_NEED))
+
+        # Position chains for the tickers the change touches
+        codes = set()
+        if removed_row is not None:
+            codes.add(int(removed_row[_TICKER]))
+        if new_row is not None:
+            codes.add(int(new_row[_TICKER]))
+        for code in codes:
+            if self._tickers[code] == PortfolioService.FREE_CASH_TICKER:
+                continue
+            indices, after, tree = self._ticker_chain(code)
+            chain_removed = None
+            if removed_row is not None and int(removed_row[_TICKER]) == code:
+                chain_removed = int(np.searchsorted(indices, removed))
+            chain_insert = None
+            if new_row is not None and int(new_row[_TICKER]) == code:
+                chain_insert = int(np.searchsorted(indices, insert_at))
+            hit = self._scan_chain(
+                tree, after, int(np.searchsorted(indices, start)),
+                chain_removed, removed_row[_QTY] if chain_removed is not None else 0.0,
+                chain_insert, new_row[_QTY] if chain_insert is not None else 0.0,
+                chain_insert is not None and not np.isnan(new_row[_QTY_NEED]) and new_date >= check_from,
+            )
+            if hit is not None:
+                k, value = hit
+                if k is None:
+                    found.append((insert_at - 0.5, None, value, _QTY_NEED))
+                else:
+                    found.append((int(indices[k]), int(indices[k]), value, _QTY_NEED))
+
+        if not found:
+            return None
+
+        _, index, value, need_column = min(found, key=lambda item: item[0])
+        if index is None:
+            row, date = new_row, new_date
+            ticker = transaction.get("ticker", "").upper()
+        else:
+            row, date, ticker = self._rows[index], self._dates[index], self._tickers[int(self._rows[index, _TICKER])]
+        needed = float(row[need_column])
+        if need_column == _QTY_NEED:
+            kind = "sell"
+        elif ticker == PortfolioService.FREE_CASH_TICKER:
+            kind = "withdrawal"
+        else:
+            kind = "buy"
+        return ChainViolation(kind, date, ticker, value + needed, needed)
+
+    def _scan_chain(
+        self,
+        tree: _MinTree,
+        after: np.ndarray,
+        start: int,
+        removed: Optional[int],
+        removed_delta: float,
+        insert_at: Optional[int],
+        inserted_delta: float,
+        check_inserted: bool
+    ) -> Optional[Tuple[Optional[int], float]]:
+        """
+        First entry of one running-balance chain that goes negative after a change.
+
+        Entries after the removed one lose its delta and entries after the
+        insertion point gain the inserted delta, so the chain splits into at
+        most three ranges with a constant shift each; every range is searched
+        with the min tree.
+
+        Returns:
+            (chain index, or None for the inserted entry; balance after it),
+            or None if no checked entry goes negative
+        """
+        n = len(after)
+
+        def shift(k: int) -> float:
+            value = 0.0
+            if removed is not None and k > removed:
+                value -= removed_delta
+            if insert_at is not None and k >= insert_at:
+                value += inserted_delta
+            return value
+
+        def inserted_balance() -> float:
+            before = float(after[insert_at - 1]) if insert_at else 0.0
+            if removed is not None and removed < insert_at:
+                before -= removed_delta
+            return before + inserted_delta
+
+        cuts = {start, n}
+        for cut in (removed, None if removed is None else removed + 1, insert_at):
+            if cut is not None and start < cut < n:
+                cuts.add(cut)
+        cuts = sorted(cuts)
+
+        inserted_done = insert_at is None or not check_inserted
+        for lo, hi in zip(cuts, cuts[1:]):
+            if not inserted_done and insert_at <= lo:
+                inserted_done = True
+                value = inserted_balance()
+                if value < -_TOLERANCE:
+                    return None, value
+            if lo == removed:
+                continue
+            offset = shift(lo)
+            k = tree.first_below(lo, hi, -offset - _TOLERANCE)
+            if k >= 0:
+                return k, float(after[k]) + offset
+
+        if not inserted_done:
+            value = inserted_balance()
+            if value < -_TOLERANCE:
+                return None, value
+        return None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _make_key(self, transaction: Dict[str, Any], counter=None) -> Tuple[str, int, Any]:
+        if counter is None:
+            counter = self._counter
+            self._counter += 1
+        return (transaction.get("date") or "", transaction.get("sequence") or 0, counter)
+
+    def _make_row(self, transaction: Dict[str, Any]) -> List[float]:
+        """Cash and position effects of one transaction."""
+        ticker = transaction.get("ticker", "").upper()
+        tx_type = transaction.get("transaction_type", "")
+        qty = float(transaction.get("quantity", 0))
+        price = float(transaction.get("entry_price", 0))
+        fees = float(transaction.get("fees", 0))
+
+        code = self._ticker_codes.get(ticker)
+        if code is None:
+            code = self._ticker_codes[ticker] = len(self._tickers)
+            self._tickers.append(ticker)
+
+        if ticker == PortfolioService.FREE_CASH_TICKER:
+            if tx_type == "Buy":  # Deposit
+                return [qty - fees, np.nan, code, 0.0, np.nan]
+            # Sell = Withdrawal
+            return [-(qty + fees), qty + fees, code, 0.0, np.nan]
+        if tx_type == "Buy":
+            cost = qty * price + fees
+            return [-cost, cost, code, qty, np.nan]
+        # Sell
+        return [qty * price - fees, np.nan, code, -qty, qty]
+
+    def _index_of(self, transaction_id: Optional[str]) -> Optional[int]:
+        key = self._key_by_id.get(transaction_id) if transaction_id else None
+        if key is None:
+            return None
+        return bisect.bisect_left(self._keys, key)
+
+    def _invalidate(self) -> None:
+        self._cash_after: Optional[np.ndarray] = None
+        self._cash_tree: Optional[_MinTree] = None
+        self._ticker_indices: Optional[Dict[int, np.ndarray]] = None
+        self._ticker_chains: Dict[int, Tuple[np.ndarray, np.ndarray, _MinTree]] = {}
+
+    def _ensure_balances(self) -> None:
+        """Rebuild the cash prefix sums and min tree after a mutation."""
+        if self._cash_after is not None:
+            return
+        self._cash_after = np.cumsum(self._rows[:, _CASH])
+        checked = ~np.isnan(self._rows[:, _CASH_NEED])
+        self._cash_tree = _MinTree(np.where(checked, self._cash_after, np.inf))
+
+    def _ticker_chain(self, code: int) -> Tuple[np.ndarray, np.ndarray, _MinTree]:
+        """(global indices, running position, min tree over sales) for one ticker."""
+        chain = self._ticker_chains.get(code)
+        if chain is not None:
+            return chain
+
+        if self._ticker_indices is None:
+            codes = self._rows[:, _TICKER].astype(np.int64)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.flatnonzero(np.diff(codes[order])) + 1
+            self._ticker_indices = {
+                int(codes[group[0]]): group for group in np.split(order, bounds) if len(group)
+            }
+
+        indices = self._ticker_indices.get(code, np.empty(0, dtype=np.int64))
+        after = np.cumsum(self._rows[indices, _QTY])
+        sells = ~np.isnan(self._rows[indices, _QTY_NEED])
+        chain = (indices, after, _MinTree(np.where(sells, after, np.inf)))
+        self._ticker_chains[code] = chain
+        return chain
@@ -1,6 +1,7 @@
 """Portfolio Construction Widgets"""
 
 from .transaction_log_table import TransactionLogTable
+from .transaction_log_model import TransactionLogModel, TransactionEditDelegate
 from .aggregate_portfolio_table import AggregatePortfolioTable
 from .portfolio_controls import PortfolioControls
 from .portfolio_dialogs import (
@@ -16,6 +17,8 @@ from .mixins import FieldRevertMixin, SortingMixin
 
 __all__ = [
     "TransactionLogTable",
+    "TransactionLogModel",
+    "TransactionEditDelegate",
     "AggregatePortfolioTable",
     "PortfolioControls",
     "NewPortfolioDialog",
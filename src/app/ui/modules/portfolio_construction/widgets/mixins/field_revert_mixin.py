@@ -4,54 +4,25 @@ This mixin provides a generic field revert system that consolidates
 6+ individual revert methods into a single unified implementation.
 """
 
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+from typing import Any, Dict, Optional
 
-from PySide6.QtCore import QDate
-from PySide6.QtWidgets import QComboBox, QLineEdit, QWidget
-
-from app.ui.widgets.common import DateInputWidget, ValidatedNumericLineEdit
+from ..transaction_log_model import COLUMN_FIELDS
 
 
 class FieldRevertMixin:
     """
     Mixin for reverting editable fields to original values.
 
-    Provides a generic _revert_field() method that handles different
-    widget types and updates both the widget and stored transaction.
+    Provides a generic _revert_field() method that writes the value to the
+    table's model; an editor open on the cell is refreshed by the view.
 
     Requirements:
-    - Host class must have _get_inner_widget(row, col) method
-    - Host class must have _get_transaction_for_row(row) method
-    - Host class must have _transactions_by_id dict
+    - Host class must have a transaction_model property (TransactionLogModel)
     """
 
-    # Field configuration: column -> (field_name, widget_type, setter_method)
+    # Field configuration: column -> field_name
     # Subclasses can override this to customize field handling
-    REVERT_FIELD_CONFIG: Dict[int, Tuple[str, Type, str]] = {
-        0: ("date", DateInputWidget, "setDate"),
-        1: ("ticker", QLineEdit, "setText"),
-        3: ("quantity", ValidatedNumericLineEdit, "setValue"),
-        4: ("entry_price", ValidatedNumericLineEdit, "setValue"),
-        5: ("fees", ValidatedNumericLineEdit, "setValue"),
-        6: ("transaction_type", QComboBox, "setCurrentText"),
-    }
-
-    def _convert_value_for_widget(self, col: int, value: Any) -> Any:
-        """
-        Convert a value for the appropriate widget type.
-
-        Args:
-            col: Column index
-            value: Raw value from original data
-
-        Returns:
-            Converted value suitable for the widget
-        """
-        if col == 0:  # Date column - convert string to QDate
-            if isinstance(value, str):
-                return QDate.fromString(value, "yyyy-MM-dd")
-            return value
-        return value
+    REVERT_FIELD_CONFIG: Dict[int, str] = COLUMN_FIELDS
 
     def _revert_field(
         self,
@@ -72,49 +43,11 @@ class FieldRevertMixin:
         Returns:
             True if reverted successfully, False otherwise
         """
-        # Get field config
-        config = self.REVERT_FIELD_CONFIG.get(col)
-        if not config and not field_name:
+        fname = field_name or self.REVERT_FIELD_CONFIG.get(col)
+        if fname is None:
             return False
 
-        if config:
-            fname, widget_type, setter_name = config
-        else:
-            fname = field_name
-            widget_type = None
-            setter_name = None
-
-        # Use provided field_name if given
-        if field_name:
-            fname = field_name
-
-        # Get and update widget
-        inner_widget = self._get_inner_widget(row, col)
-        if inner_widget:
-            # Convert value for widget if needed
-            converted_value = self._convert_value_for_widget(col, value)
-
-            # Block signals and set value
-            inner_widget.blockSignals(True)
-            try:
-                if setter_name and hasattr(inner_widget, setter_name):
-                    getattr(inner_widget, setter_name)(converted_value)
-                elif hasattr(inner_widget, "setText"):
-                    inner_widget.setText(str(value))
-                elif hasattr(inner_widget, "setValue"):
-                    inner_widget.setValue(value)
-            finally:
-                inner_widget.blockSignals(False)
-
-        # Update stored transaction
-        transaction = self._get_transaction_for_row(row)
-        if transaction:
-            transaction[fname] = value
-            tx_id = transaction.get("id")
-            if tx_id and hasattr(self, "_transactions_by_id"):
-                if tx_id in self._transactions_by_id:
-                    self._transactions_by_id[tx_id][fname] = value
-
+        self.transaction_model.set_field(row, fname, value)
         return True
 
     def _revert_all_fields(self, row: int, original: Dict[str, Any]) -> None:
@@ -128,17 +61,7 @@ class FieldRevertMixin:
         if not original:
             return
 
-        # Map field names to columns
-        field_to_col = {
-            "date": 0,
-            "ticker": 1,
-            "quantity": 3,
-            "entry_price": 4,
-            "fees": 5,
-            "transaction_type": 6,
-        }
-
-        for field_name, col in field_to_col.items():
+        for col, field_name in self.REVERT_FIELD_CONFIG.items():
             if field_name in original:
                 self._revert_field(row, col, original[field_name], field_name)
 
@@ -0,0 +1,746 @@
+"""Transaction Log Model - Columnar transaction storage for the transaction log view.
+
+Transactions are stored column by column (one list per field) in display
+order. Cells are formatted on demand in data(), so loading, sorting and
+scrolling cost no per-row widgets or items, and TransactionEditDelegate
+creates an editor only for the cell being edited.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from app.ui.widgets.common import (
+    AutoSelectLineEdit,
+    DateInputWidget,
+    NoScrollComboBox,
+    ValidatedNumericLineEdit,
+)
+from ..services.portfolio_service import PortfolioService
+
+COLUMNS = [
+    "Date",                # col 0 - DateInputWidget editor
+    "Ticker",              # col 1 - AutoSelectLineEdit editor
+    "Name",                # col 2 - Read-only (auto-populated from Yahoo Finance)
+    "Quantity",            # col 3 - ValidatedNumericLineEdit editor
+    "Execution Price",     # col 4 - ValidatedNumericLineEdit editor
+    "Fees",                # col 5 - ValidatedNumericLineEdit editor
+    "Type",                # col 6 - NoScrollComboBox editor (Buy/Sell)
+    "Daily Closing Price", # col 7 - Read-only (historical close on tx date)
+    "Live Price",          # col 8 - Read-only (last daily close)
+    "Principal",           # col 9 - Read-only (calculated)
+    "Market Value"         # col 10 - Read-only (calculated)
+]
+
+# Editable column -> transaction field
+COLUMN_FIELDS = {
+    0: "date",
+    1: "ticker",
+    3: "quantity",
+    4: "entry_price",
+    5: "fees",
+    6: "transaction_type",
+}
+FIELD_COLUMNS = {field: col for col, field in COLUMN_FIELDS.items()}
+EDITABLE_COLUMNS = list(COLUMN_FIELDS)
+
+# Numeric editor settings: column -> (min, max, decimals)
+NUMERIC_COLUMNS = {
+    3: (0.0001, 999999999, 4),
+    4: (0, 1000000, 2),
+    5: (0, 10000, 2),
+}
+
+# Columns styled as editable fields (the editable ones plus the auto-filled Name)
+HIGHLIGHT_COLUMNS = range(7)
+
+# Stored fields, one column list each
+FIELDS = ("id", "date", "ticker", "quantity", "entry_price", "fees", "transaction_type", "sequence")
+FIELD_DEFAULTS = {
+    "id": "",
+    "date": "",
+    "ticker": "",
+    "quantity": 0.0,
+    "entry_price": 0.0,
+    "fees": 0.0,
+    "transaction_type": "Buy",
+    "sequence": 0,
+}
+
+# Pinned rows: blank entry row (row 0) and FREE CASH summary (row 1)
+BLANK_ROW_ID = "BLANK_ROW"
+FREE_CASH_SUMMARY_ID = "FREE_CASH_SUMMARY"
+PINNED_ROW_COUNT = 2
+
+_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+
+def _normalize(field: str, value: Any) -> Any:
+    """Coerce a field value to the type stored in its column."""
+    if field in ("quantity", "entry_price", "fees"):
+        return float(value or 0)
+    if field == "sequence":
+        return int(value or 0)
+    if field == "ticker":
+        return str(value or "").strip().upper()
+    return str(value or "")
+
+
+def _format_number(value: float, decimals: int) -> str:
+    """Format like ValidatedNumericLineEdit: "--" for zero, trailing zeros stripped."""
+    if value == 0.0:
+        return "--"
+    return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+
+
+def _format_money(value: Optional[float]) -> str:
+    return "--" if value is None else f"${value:,.2f}"
+
+
+class TransactionLogModel(QAbstractTableModel):
+    """
+    Transaction log rows backed by one list per field.
+
+    Rows 0 and 1 are pinned (blank entry row and FREE CASH summary) once
+    set_blank_row() has been called; transactions follow in display order.
+    Row identity is O(1) both ways: id_at() indexes the id column and
+    row_of() uses an id -> position dict that is rebuilt lazily after rows
+    move.
+
+    Edits made through setData() (the delegate) keep a snapshot of the
+    row's committed values until the table accepts or reverts them, so only
+    rows with pending edits hold extra state.
+    """
+
+    cell_edited = Signal(int, int)  # (row, column) after an edit through setData()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns: Dict[str, List[Any]] = {field: [] for field in FIELDS}
+        self._row_of_id: Optional[Dict[str, int]] = {}  # id -> position; None = stale
+        self._blank: Optional[Dict[str, Any]] = None
+        self._summary_quantity = 0.0
+        self._summary_market_value = 0.0
+        self._snapshots: Dict[str, Dict[str, Any]] = {}  # id -> committed values
+
+        self._current_prices: Dict[str, float] = {}
+        self._historical_prices: Dict[str, Dict[str, float]] = {}
+        self._names: Dict[str, str] = {}
+
+        self._editable_background: Optional[QBrush] = None
+        self._editable_foreground: Optional[QBrush] = None
+        self._placeholder_foreground: Optional[QBrush] = None
+
+    # -------------------------------------------------------------------------
+    # Qt model interface
+    # -------------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.pinned_count + len(self._columns["id"])
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return COLUMNS[section]
+            # Row numbers skip the pinned rows
+            pinned = self.pinned_count
+            return "" if section < pinned else str(section - pinned + 1)
+        if role == Qt.TextAlignmentRole and orientation == Qt.Horizontal:
+            return _ALIGNMENT
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in COLUMN_FIELDS and not self.is_summary_row(index.row()):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if self.is_summary_row(row):
+            if role == Qt.DisplayRole:
+                return self._summary_text(col)
+            if role == Qt.TextAlignmentRole:
+                return _ALIGNMENT
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._display_text(row, col)
+        if role == Qt.EditRole:
+            field = COLUMN_FIELDS.get(col)
+            return self._value(row, field) if field else None
+        if role == Qt.TextAlignmentRole:
+            return _ALIGNMENT
+        if role == Qt.BackgroundRole and col in HIGHLIGHT_COLUMNS:
+            return self._editable_background
+        if role == Qt.ForegroundRole and col in HIGHLIGHT_COLUMNS:
+            if self._is_placeholder(row, col):
+                return self._placeholder_foreground
+            return self._editable_foreground
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        field = COLUMN_FIELDS.get(col)
+        if field is None or self.is_summary_row(row):
+            return False
+
+        value = _normalize(field, value)
+        if value == self._value(row, field):
+            return False
+
+        if self.is_blank_row(row):
+            self._blank[field] = value
+            if field == "ticker":
+                self._blank["name"] = ""  # Stale until auto-filled again
+        else:
+            position = row - self.pinned_count
+            tx_id = self._columns["id"][position]
+            if tx_id not in self._snapshots:
+                self._snapshots[tx_id] = self._row_values(position)
+            self._columns[field][position] = value
+            self._drop_snapshot_if_clean(position)
+
+        self._emit_field(row, field)
+        self.cell_edited.emit(row, col)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Row identity
+    # -------------------------------------------------------------------------
+
+    @property
+    def pinned_count(self) -> int:
+        """Number of pinned rows at the top (0 until the blank row exists)."""
+        return PINNED_ROW_COUNT if self._blank is not None else 0
+
+    @property
+    def has_blank_row(self) -> bool:
+        return self._blank is not None
+
+    def transaction_count(self) -> int:
+        """Number of transaction rows (excluding pinned rows)."""
+        return len(self._columns["id"])
+
+    def is_blank_row(self, row: int) -> bool:
+        return self._blank is not None and row == 0
+
+    def is_summary_row(self, row: int) -> bool:
+        return self._blank is not None and row == 1
+
+    def id_at(self, row: int) -> Optional[str]:
+        """Transaction ID shown at a row, or None if the row doesn't exist."""
+        if row < 0 or row >= self.rowCount():
+            return None
+        pinned = self.pinned_count
+        if row < pinned:
+            return BLANK_ROW_ID if row == 0 else FREE_CASH_SUMMARY_ID
+        return self._columns["id"][row - pinned]
+
+    def row_of(self, tx_id: str) -> Optional[int]:
+        """Row currently showing a transaction ID, or None."""
+        if self._blank is not None:
+            if tx_id == BLANK_ROW_ID:
+                return 0
+            if tx_id == FREE_CASH_SUMMARY_ID:
+                return 1
+        if self._row_of_id is None:
+            self._row_of_id = {value: i for i, value in enumerate(self._columns["id"])}
+        position = self._row_of_id.get(tx_id)
+        return None if position is None else position + self.pinned_count
+
+    # -------------------------------------------------------------------------
+    # Row access
+    # -------------------------------------------------------------------------
+
+    def transaction_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """
+        Copy of the transaction shown at a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Transaction dict (with is_blank / is_free_cash_summary flags for
+            pinned rows), or None if the row doesn't exist
+        """
+        if row < 0 or row >= self.rowCount():
+            return None
+        if self.is_blank_row(row):
+            return dict(self._blank)
+        if self.is_summary_row(row):
+            return {
+                "id": FREE_CASH_SUMMARY_ID,
+                "is_free_cash_summary": True,
+                "date": "",
+                "ticker": PortfolioService.FREE_CASH_TICKER,
+                "transaction_type": "",
+                "quantity": 0.0,
+                "entry_price": 0.0,
+                "fees": 0.0
+            }
+        return self._row_values(row - self.pinned_count)
+
+    def transactions(self) -> List[Dict[str, Any]]:
+        """All transactions in display order (excluding pinned rows)."""
+        columns = [self._columns[field] for field in FIELDS]
+        return [dict(zip(FIELDS, values)) for values in zip(*columns)]
+
+    def committed_transactions(self) -> List[Dict[str, Any]]:
+        """All transactions with pending (not yet validated) edits left out."""
+        return [
+            dict(self._snapshots.get(tx["id"], tx)) for tx in self.transactions()
+        ]
+
+    def field(self, row: int, field: str) -> Any:
+        """Value of one field at a row."""
+        return self._value(row, field)
+
+    def set_field(self, row: int, field: str, value: Any) -> None:
+        """
+        Set a field programmatically (auto-fill, revert, resequence).
+
+        Unlike setData(), this neither starts a pending edit nor emits
+        cell_edited. The blank row also accepts "name" (its auto-filled Name).
+        """
+        if row < 0 or row >= self.rowCount() or self.is_summary_row(row):
+            return
+        if self.is_blank_row(row):
+            self._blank[field] = value if field == "name" else _normalize(field, value)
+        else:
+            position = row - self.pinned_count
+            self._columns[field][position] = _normalize(field, value)
+            self._drop_snapshot_if_clean(position)
+        self._emit_field(row, field)
+
+    # -------------------------------------------------------------------------
+    # Pending edits
+    # -------------------------------------------------------------------------
+
+    def has_pending_edits(self, row: int) -> bool:
+        """Whether a transaction row was edited since its last commit."""
+        return self.id_at(row) in self._snapshots
+
+    def original_values(self, row: int) -> Dict[str, Any]:
+        """Committed values of a transaction row (before pending edits)."""
+        snapshot = self._snapshots.get(self.id_at(row))
+        if snapshot is not None:
+            return dict(snapshot)
+        return self.transaction_at(row) or {}
+
+    def accept_edits(self, row: int) -> None:
+        """Mark a row's current values as committed."""
+        self._snapshots.pop(self.id_at(row), None)
+
+    # -------------------------------------------------------------------------
+    # Structure changes
+    # -------------------------------------------------------------------------
+
+    def set_blank_row(self, transaction: Dict[str, Any]) -> None:
+        """Set the blank entry row, inserting both pinned rows if missing."""
+        if self._blank is None:
+            self.beginInsertRows(QModelIndex(), 0, PINNED_ROW_COUNT - 1)
+            self._blank = dict(transaction)
+            self.endInsertRows()
+        else:
+            self._blank = dict(transaction)
+            self._emit_row(0)
+
+    def set_free_cash_summary(self, quantity: float, market_value: float) -> None:
+        """Set the FREE CASH summary row values."""
+        self._summary_quantity = quantity
+        self._summary_market_value = market_value
+        if self._blank is not None:
+            self._emit_row(1)
+
+    def append_transactions(self, transactions: Sequence[Dict[str, Any]]) -> int:
+        """
+        Append transactions after the existing rows in one insertion.
+
+        Args:
+            transactions: Transaction dicts
+
+        Returns:
+            Row index of the first appended transaction
+        """
+        start = len(self._columns["id"])
+        first_row = start + self.pinned_count
+        if not transactions:
+            return first_row
+
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(transactions) - 1)
+        for field in FIELDS:
+            default = FIELD_DEFAULTS[field]
+            self._columns[field].extend(_normalize(field, tx.get(field, default)) for tx in transactions)
+        if self._row_of_id is not None:
+            for offset, tx_id in enumerate(self._columns["id"][start:]):
+                self._row_of_id[tx_id] = start + offset
+        self.endInsertRows()
+        return first_row
+
+    def insert_transaction(self, row: int, transaction: Dict[str, Any]) -> int:
+        """
+        Insert a transaction at a row (clamped to the transaction rows).
+
+        Returns:
+            Row index the transaction was inserted at
+        """
+        pinned = self.pinned_count
+        position = min(max(row - pinned, 0), len(self._columns["id"]))
+        self.beginInsertRows(QModelIndex(), position + pinned, position + pinned)
+        for field in FIELDS:
+            value = _normalize(field, transaction.get(field, FIELD_DEFAULTS[field]))
+            self._columns[field].insert(position, value)
+        self._row_of_id = None
+        self.endInsertRows()
+        return position + pinned
+
+    def remove_transaction(self, row: int) -> Optional[str]:
+        """
+        Remove a transaction row.
+
+        Returns:
+            Removed transaction ID, or None if the row is not a transaction
+        """
+        position = row - self.pinned_count
+        if position < 0 or position >= len(self._columns["id"]):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        tx_id = self._columns["id"][position]
+        for values in self._columns.values():
+            del values[position]
+        self._row_of_id = None
+        self._snapshots.pop(tx_id, None)
+        self.endRemoveRows()
+        return tx_id
+
+    def clear(self) -> None:
+        """Remove all rows, including the pinned rows."""
+        self.beginResetModel()
+        for values in self._columns.values():
+            values.clear()
+        self._row_of_id = {}
+        self._blank = None
+        self._snapshots.clear()
+        self.endResetModel()
+
+    # -------------------------------------------------------------------------
+    # Sorting
+    # -------------------------------------------------------------------------
+
+    def sort_by_date_descending(self) -> None:
+        """
+        Sort by date descending, then priority and sequence ascending.
+
+        Same order as sorted(key=(date, -priority, -sequence), reverse=True),
+        computed with one np.lexsort over the columns.
+        """
+        columns = self._columns
+        count = len(columns["id"])
+        if count < 2:
+            return
+        _, date_codes = np.unique(np.asarray(columns["date"], dtype=str), return_inverse=True)
+        priority = np.fromiter(
+            (
+                PortfolioService.get_transaction_priority(ticker, tx_type)
+                for ticker, tx_type in zip(columns["ticker"], columns["transaction_type"])
+            ),
+            dtype=np.int64,
+            count=count,
+        )
+        sequence = np.asarray(columns["sequence"], dtype=np.int64)
+        # lexsort's last key is the primary one
+        self._apply_order(np.lexsort((sequence, priority, -date_codes.ravel())))
+
+    def sort_transactions(self, key: Callable[[Dict[str, Any]], Any], reverse: bool = False) -> None:
+        """Sort transaction rows by a key on transaction dicts (stable)."""
+        transactions = self.transactions()
+        order = sorted(range(len(transactions)), key=lambda i: key(transactions[i]), reverse=reverse)
+        self._apply_order(order)
+
+    def _apply_order(self, order: Sequence[int]) -> None:
+        """Reorder transaction rows; persistent indexes (editors, selection) follow their rows."""
+        order = np.asarray(order, dtype=np.int64).tolist()
+        pinned = self.pinned_count
+
+        self.layoutAboutToBeChanged.emit()
+        for field, values in self._columns.items():
+            self._columns[field] = [values[i] for i in order]
+        self._row_of_id = None
+
+        new_position = [0] * len(order)
+        for new, old in enumerate(order):
+            new_position[old] = new
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_position[index.row() - pinned] + pinned, index.column())
+            if index.row() >= pinned else index
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    # -------------------------------------------------------------------------
+    # Market data and styling
+    # -------------------------------------------------------------------------
+
+    def set_market_data(
+        self,
+        current_prices: Dict[str, float],
+        historical_prices: Dict[str, Dict[str, float]],
+        names: Dict[str, str],
+    ) -> None:
+        """Set the price and name lookups used by calculated cells (shared, not copied)."""
+        self._current_prices = current_prices
+        self._historical_prices = historical_prices
+        self._names = names
+        self.refresh_market_data()
+
+    def refresh_market_data(self) -> None:
+        """Repaint the Name and calculated columns after the lookups changed."""
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 2), self.index(self.rowCount() - 1, len(COLUMNS) - 1))
+
+    def set_editable_colors(self, background: Optional[QColor], foreground: Optional[QColor]) -> None:
+        """Set (or clear, with None) the highlight colors of editable cells."""
+        self._editable_background = QBrush(background) if background is not None else None
+        self._editable_foreground = QBrush(foreground) if foreground is not None else None
+        self._placeholder_foreground = None
+        if foreground is not None:
+            placeholder = QColor(foreground)
+            placeholder.setAlpha(140)
+            self._placeholder_foreground = QBrush(placeholder)
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, len(COLUMNS) - 1))
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _value(self, row: int, field: str) -> Any:
+        pinned = self.pinned_count
+        if row < pinned:
+            return self._blank.get(field, FIELD_DEFAULTS.get(field, ""))
+        return self._columns[field][row - pinned]
+
+    def _row_values(self, position: int) -> Dict[str, Any]:
+        return {field: self._columns[field][position] for field in FIELDS}
+
+    def _drop_snapshot_if_clean(self, position: int) -> None:
+        """Forget a row's snapshot once its values match it again."""
+        tx_id = self._columns["id"][position]
+        snapshot = self._snapshots.get(tx_id)
+        if snapshot is not None and snapshot == self._row_values(position):
+            del self._snapshots[tx_id]
+
+    def _is_placeholder(self, row: int, col: int) -> bool:
+        return self.is_blank_row(row) and col in (1, 6) and not self._value(row, COLUMN_FIELDS[col])
+
+    def _display_text(self, row: int, col: int) -> str:
+        value = self._value
+        ticker = value(row, "ticker")
+        is_free_cash = ticker == PortfolioService.FREE_CASH_TICKER
+
+        if col == 0:
+            return value(row, "date")
+        if col == 1:
+            if not ticker and self.is_blank_row(row):
+                return "Enter ticker..."
+            return ticker
+        if col == 2:
+            if is_free_cash:
+                return "FREE CASH"
+            if self.is_blank_row(row):
+                return self._blank.get("name", "")
+            return self._names.get(ticker) or ""
+        if col in NUMERIC_COLUMNS:
+            return _format_number(value(row, COLUMN_FIELDS[col]), NUMERIC_COLUMNS[col][2])
+        if col == 6:
+            tx_type = value(row, "transaction_type")
+            if not tx_type and self.is_blank_row(row):
+                return "Buy/Sell"
+            return tx_type
+
+        # Calculated columns (FREE CASH price is always $1, so prices are left blank)
+        quantity = value(row, "quantity")
+        if col == 7:
+            if is_free_cash:
+                return ""
+            tx_date = value(row, "date")
+            if not ticker or not tx_date:
+                return "--"
+            return _format_money(self._historical_prices.get(ticker, {}).get(tx_date))
+        if col == 8:
+            return "" if is_free_cash else _format_money(self._current_prices.get(ticker))
+        if col == 9:
+            if is_free_cash:
+                return ""
+            principal = PortfolioService.calculate_principal({
+                "quantity": quantity,
+                "entry_price": value(row, "entry_price"),
+                "fees": value(row, "fees"),
+                "transaction_type": value(row, "transaction_type"),
+            })
+            if principal == 0:
+                return "--"
+            # Negative for buys, positive for sells
+            return f"-${abs(principal):,.2f}" if principal < 0 else f"${principal:,.2f}"
+        if col == 10:
+            if is_free_cash:
+                # Market value = quantity (since price is $1)
+                return f"${quantity:,.2f}" if quantity > 0 else "--"
+            live_price = self._current_prices.get(ticker)
+            if live_price is None or quantity <= 0:
+                return "--"
+            return f"${live_price * quantity:,.2f}"
+        return ""
+
+    def _summary_text(self, col: int) -> str:
+        if col in (1, 2):
+            return "FREE CASH"
+        if col == 3:
+            qty = self._summary_quantity
+            return f"${qty:,.2f}" if qty != 0 else "--"
+        if col == 10:
+            mv = self._summary_market_value
+            return f"${mv:,.2f}" if mv != 0 else "--"
+        return ""
+
+    def _emit_row(self, row: int) -> None:
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+
+    def _emit_field(self, row: int, field: str) -> None:
+        # A single-cell change refreshes an open editor on that cell; the row
+        # change repaints the dependent calculated cells
+        col = FIELD_COLUMNS.get(field)
+        if col is not None:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index)
+        self._emit_row(row)
+
+
+class TransactionEditDelegate(QStyledItemDelegate):
+    """
+    Creates an editor only for the cell being edited.
+
+    Editors are the same widgets the table used to keep in every cell
+    (DateInputWidget, AutoSelectLineEdit, ValidatedNumericLineEdit,
+    NoScrollComboBox). Values are written back only when the editor's
+    value differs from what it was loaded with.
+    """
+
+    date_validation_error = Signal(str, str)  # (title, message) from DateInputWidget
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._line_edit_style = ""
+        self._combo_style = ""
+        self._editing = QPersistentModelIndex()
+
+    def set_stylesheets(self, line_edit_style: str, combo_style: str) -> None:
+        """Set the stylesheets applied to new editors."""
+        self._line_edit_style = line_edit_style
+        self._combo_style = combo_style
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index) -> Optional[QWidget]:
+        col = index.column()
+        if col == 0:
+            editor = DateInputWidget(parent)
+            editor.validation_error.connect(self.date_validation_error)
+        elif col == 1:
+            editor = AutoSelectLineEdit("", parent)
+        elif col in NUMERIC_COLUMNS:
+            min_value, max_value, decimals = NUMERIC_COLUMNS[col]
+            editor = ValidatedNumericLineEdit(
+                min_value=min_value, max_value=max_value, decimals=decimals,
+                prefix="", show_dash_for_zero=True, parent=parent
+            )
+        elif col == 6:
+            editor = NoScrollComboBox(parent)
+            editor.addItems(["Buy", "Sell"])
+            editor.setPlaceholderText("Buy/Sell")
+            # Commit as soon as a type is picked
+            editor.activated.connect(lambda _index, e=editor: self.commitData.emit(e))
+        else:
+            return None
+
+        editor.setStyleSheet(self._combo_style if col == 6 else self._line_edit_style)
+        self._editing = QPersistentModelIndex(index)
+        return editor
+
+    def destroyEditor(self, editor: QWidget, index) -> None:
+        self._editing = QPersistentModelIndex()
+        super().destroyEditor(editor, index)
+
+    def setEditorData(self, editor: QWidget, index) -> None:
+        col = index.column()
+        value = index.data(Qt.EditRole)
+        if col == 0:
+            editor.setDate(QDate.fromString(value or "", "yyyy-MM-dd"))
+        elif col == 6:
+            editor.setCurrentIndex(editor.findText(value) if value else -1)
+        elif col in NUMERIC_COLUMNS:
+            editor.setValue(float(value or 0))
+        else:
+            editor.setText(value or "")
+        editor.setProperty("_initial_value", self._editor_value(editor, col))
+
+    def setModelData(self, editor: QWidget, model, index) -> None:
+        col = index.column()
+        value = self._editor_value(editor, col)
+        if value is None or value == editor.property("_initial_value"):
+            return
+        if col == 0 and QDate.fromString(value, "yyyy-MM-dd") > QDate.currentDate():
+            return  # DateInputWidget reports future dates
+        model.setData(index, value, Qt.EditRole)
+
+    def paint(self, painter, option: QStyleOptionViewItem, index) -> None:
+        # The editor is transparent over its cell: paint the background only
+        editing = self._editing
+        if editing.isValid() and editing.row() == index.row() and editing.column() == index.column():
+            opt = QStyleOptionViewItem(option)
+            self.initStyleOption(opt, index)
+            opt.text = ""
+            widget = opt.widget
+            style = widget.style() if widget else QApplication.style()
+            style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+            return
+        super().paint(painter, option, index)
+
+    @staticmethod
+    def _editor_value(editor: QWidget, col: int) -> Any:
+        """Current editor value in model form (None for an incomplete date)."""
+        if col == 0:
+            date = QDate.fromString(editor.text().strip(), "yyyy-MM-dd")
+            return date.toString("yyyy-MM-dd") if date.isValid() else None
+        if col == 6:
+            return editor.currentText()
+        if col in NUMERIC_COLUMNS:
+            return editor.value()
+        return editor.text()
@@ -9,6 +9,11 @@ from .fama_french_data_service import FamaFrenchDataService
 from .constructed_factor_service import ConstructedFactorService
 from .factor_model_service import FactorModelService, FactorRegressionResult
 from .factor_risk_service import FactorRiskService
+from .risk_analysis_worker import (
+    RiskAnalysisPipeline,
+    RiskAnalysisRequest,
+    RiskAnalysisResult,
+)
 
 __all__ = [
     "TickerMetadataService",
@@ -21,4 +26,7 @@ __all__ = [
     "FactorModelService",
     "FactorRegressionResult",
     "FactorRiskService",
+    "RiskAnalysisPipeline",
+    "RiskAnalysisRequest",
+    "RiskAnalysisResult",
 ]
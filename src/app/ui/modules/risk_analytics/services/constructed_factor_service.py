@@ -25,20 +25,20 @@ class ConstructedFactorService:
 
     @staticmethod
     def calculate_volatility_factor(
-        returns: "pd.Series",
+        returns: "pd.Series | pd.DataFrame",
         window: int = 60,
-    ) -> "pd.Series":
+    ) -> "pd.Series | pd.DataFrame":
         """
         Calculate rolling volatility factor for a security.
 
         Higher volatility = higher factor exposure.
 
         Args:
-            returns: Daily returns series
+            returns: Daily returns series, or DataFrame (columns = tickers)
             window: Rolling window in trading days (default 60 = ~3 months)
 
         Returns:
-            Series of rolling volatility values (annualized)
+            Rolling volatility values (annualized), same shape as returns
         """
         import numpy as np
 
@@ -95,9 +95,9 @@ class ConstructedFactorService:
 
     @staticmethod
     def calculate_reversal_factor(
-        returns: "pd.Series",
+        returns: "pd.Series | pd.DataFrame",
         window: int = 21,
-    ) -> "pd.Series":
+    ) -> "pd.Series | pd.DataFrame":
         """
         Calculate short-term reversal factor.
 
@@ -105,27 +105,21 @@ class ConstructedFactorService:
         Short-term reversal effect: losers tend to rebound, winners regress.
 
         Args:
-            returns: Daily returns series
+            returns: Daily returns series, or DataFrame (columns = tickers)
+                to compute every security in one pass
             window: Lookback window in trading days (default 21 = ~1 month)
 
         Returns:
-            Series of prior period cumulative returns
+            Prior period cumulative returns, same shape as returns
         """
-        import numpy as np
+        from app.utils.return_kernels import rolling_compound_returns
 
         if returns is None or len(returns) < window:
             import pandas as pd
             return pd.Series(dtype=float)
 
-        # Rolling cumulative return over window
-        # Using product of (1 + r) - 1
-        rolling_cum_return = (
-            (1 + returns)
-            .rolling(window=window)
-            .apply(lambda x: np.prod(x) - 1, raw=True)
-        )
-
-        return rolling_cum_return
+        # Rolling cumulative return over window: product of (1 + r) - 1
+        return rolling_compound_returns(returns, window)
 
     @staticmethod
     def get_security_factors(
@@ -190,19 +184,34 @@ class ConstructedFactorService:
         Returns:
             Dict mapping ticker to factor DataFrame
         """
+        import pandas as pd
+
         result: Dict[str, "pd.DataFrame"] = {}
 
+        # Volatility and reversal for the whole universe in one pass each
+        volatility = ConstructedFactorService.calculate_volatility_factor(
+            ticker_returns, vol_window
+        )
+        reversal = ConstructedFactorService.calculate_reversal_factor(
+            ticker_returns, rev_window
+        )
+
         for ticker in ticker_returns.columns:
-            returns = ticker_returns[ticker]
             price_data = ticker_price_data.get(ticker)
 
             if price_data is None:
                 continue
 
-            factors = ConstructedFactorService.get_security_factors(
-                returns, price_data, vol_window, liq_window, rev_window
+            liquidity = ConstructedFactorService.calculate_liquidity_factor(
+                price_data, liq_window
             )
 
+            factors = pd.DataFrame({
+                "Volatility": volatility[ticker] if ticker in volatility else None,
+                "Liquidity": liquidity,
+                "Reversal": reversal[ticker] if ticker in reversal else None,
+            })
+
             if not factors.empty:
                 result[ticker] = factors
 
@@ -13,9 +13,7 @@ included as dummy variables in the regression to avoid multicollinearity.
 
 from __future__ import annotations
 
-import json
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -93,49 +91,303 @@ class FactorModelService:
     """
 
     _CACHE_DIR = Path.home() / ".quant_terminal" / "cache" / "regressions"
+    _TABLE_DIR = _CACHE_DIR / "results"
     _lock = threading.Lock()
 
+    # Cached results table (all tickers, one row each) and the part files it
+    # was read from, so external changes trigger a reload
+    _table: Optional["pd.DataFrame"] = None
+    _table_parts: Tuple[str, ...] = ()
+
     # Core Fama-French factors (no dummies to avoid multicollinearity)
     CORE_FACTORS = ["Mkt-RF", "SMB", "HML", "RMW", "CMA", "UMD"]
 
     # Minimum observations required for regression
     MIN_OBSERVATIONS = 126  # ~6 months of data
 
+    # Cached results older than this are recomputed
+    CACHE_MAX_AGE_DAYS = 7
+
+    # Appended part files are merged back into one once there are this many
+    _MAX_TABLE_PARTS = 16
+
     @classmethod
     def _ensure_dir(cls) -> None:
         """Create cache directory if needed."""
-        cls._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cls._TABLE_DIR.mkdir(parents=True, exist_ok=True)
 
     @classmethod
-    def _get_cache_path(cls, ticker: str) -> Path:
-        """Get cache file path for a ticker."""
-        return cls._CACHE_DIR / f"{ticker.upper()}_regression.json"
+    def _coef_names(cls) -> List[str]:
+        """Coefficient names in regression order (intercept first)."""
+        return ["const"] + cls.CORE_FACTORS
 
     @classmethod
-    def _load_cached_result(cls, ticker: str) -> Optional[FactorRegressionResult]:
-        """Load cached regression result if exists and not stale."""
-        cache_path = cls._get_cache_path(ticker)
-        if not cache_path.exists():
-            return None
+    def _input_fingerprints(
+        cls, excess_returns: "pd.DataFrame", ff_factors: "pd.DataFrame"
+    ) -> Dict[str, str]:
+        """
+        Fingerprint the inputs each ticker's regression is run against.
 
-        try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
-            return FactorRegressionResult.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[FactorModel] Error loading cache for {ticker}: {e}")
-            return None
+        Covers the factor window (dates and values) and the ticker's own
+        returns window on the factor dates (observed dates and values), so a
+        cached result is only reused when neither changed, e.g. not after a
+        new month of factors lands or a backfill/split adjustment rewrites
+        the ticker's history.
+
+        Args:
+            excess_returns: DataFrame of excess returns (columns = tickers)
+            ff_factors: Fama-French factors DataFrame
+
+        Returns:
+            Dict mapping uppercase ticker to a short hex digest
+        """
+        import hashlib
+
+        import numpy as np
+
+        factors = ff_factors[cls.CORE_FACTORS]
+        factor_digest = hashlib.sha1()
+        factor_digest.update(",".join(cls.CORE_FACTORS).encode())
+        factor_digest.update(np.asarray(factors.index, dtype="datetime64[ns]").tobytes())
+        factor_digest.update(np.ascontiguousarray(factors.to_numpy(dtype=float)).tobytes())
+
+        # Only returns on factor dates enter the regression
+        dates = excess_returns.index.intersection(factors.index)
+        stamps = np.asarray(dates, dtype="datetime64[ns]")
+        values = excess_returns.loc[dates].to_numpy(dtype=float)
+
+        fingerprints: Dict[str, str] = {}
+        for j, ticker in enumerate(excess_returns.columns):
+            column = values[:, j]
+            observed = np.isfinite(column)
+            digest = factor_digest.copy()
+            digest.update(np.int64(observed.sum()).tobytes())
+            digest.update(stamps[observed].tobytes())
+            digest.update(np.ascontiguousarray(column[observed]).tobytes())
+            fingerprints[str(ticker).upper()] = digest.hexdigest()[:16]
+        return fingerprints
+
+    @classmethod
+    def _list_table_parts(cls) -> List[Path]:
+        """List the parquet part files making up the results table."""
+        if not cls._TABLE_DIR.exists():
+            return []
+        return sorted(cls._TABLE_DIR.glob("part-*.parquet"))
+
+    @classmethod
+    def _load_table(cls) -> "pd.DataFrame":
+        """
+        Load the cached results table (one row per ticker, index = ticker).
+
+        All part files are read in one dataset read; when a ticker appears in
+        several parts the most recent regression wins. Must hold cls._lock.
+        """
+        import pandas as pd
+
+        parts = cls._list_table_parts()
+        signature = tuple(p.name for p in parts)
+        if cls._table is not None and signature == cls._table_parts:
+            return cls._table
+
+        table = pd.DataFrame()
+        if parts:
+            try:
+                table = pd.read_parquet(cls._TABLE_DIR)
+            except Exception as e:
+                print(f"[FactorModel] Error loading regression cache: {e}")
+                table = pd.DataFrame()
+
+        if not table.empty:
+            table = (
+                table.sort_values("regression_date", kind="stable")
+                .drop_duplicates("ticker", keep="last")
+                .set_index("ticker")
+            )
+
+        cls._table = table
+        cls._table_parts = signature
+        return table
+
+    @classmethod
+    def _results_to_frame(
+        cls, results: List[FactorRegressionResult], fingerprints: Dict[str, str]
+    ) -> "pd.DataFrame":
+        """Convert results to cache table rows (residual series are not stored)."""
+        import pandas as pd
+
+        names = cls._coef_names()
+        columns: Dict[str, Any] = {
+            "ticker": [r.ticker for r in results],
+            "alpha": [r.alpha for r in results],
+            "r_squared": [r.r_squared for r in results],
+            "adj_r_squared": [r.adj_r_squared for r in results],
+            "n_observations": [r.n_observations for r in results],
+            "regression_date": pd.to_datetime([r.regression_date for r in results]),
+            "sector": [r.sector for r in results],
+            "country": [r.country for r in results],
+            "idio_vol": [r.idio_vol for r in results],
+            "factor_vol": [r.factor_vol for r in results],
+            "fingerprint": [fingerprints.get(r.ticker, "") for r in results],
+        }
+        for prefix, attr in (("beta", "betas"), ("tstat", "t_stats"), ("pvalue", "p_values")):
+            for name in names:
+                columns[f"{prefix}:{name}"] = [
+                    getattr(r, attr).get(name, 0.0) for r in results
+                ]
+        return pd.DataFrame(columns)
+
+    @classmethod
+    def _frame_to_results(cls, rows: "pd.DataFrame") -> Dict[str, FactorRegressionResult]:
+        """Convert cache table rows (index = ticker) back to results."""
+        names = cls._coef_names()
+        betas = rows[[f"beta:{n}" for n in names]].to_numpy().tolist()
+        t_stats = rows[[f"tstat:{n}" for n in names]].to_numpy().tolist()
+        p_values = rows[[f"pvalue:{n}" for n in names]].to_numpy().tolist()
+        dates = [d.isoformat() for d in rows["regression_date"]]
+
+        results: Dict[str, FactorRegressionResult] = {}
+        for i, (ticker, row) in enumerate(
+            zip(
+                rows.index,
+                rows[
+                    [
+                        "alpha", "r_squared", "adj_r_squared", "n_observations",
+                        "sector", "country", "idio_vol", "factor_vol",
+                    ]
+                ].itertuples(index=False),
+            )
+        ):
+            results[ticker] = FactorRegressionResult(
+                ticker=ticker,
+                betas=dict(zip(names, betas[i])),
+                alpha=float(row.alpha),
+                r_squared=float(row.r_squared),
+                adj_r_squared=float(row.adj_r_squared),
+                t_stats=dict(zip(names, t_stats[i])),
+                p_values=dict(zip(names, p_values[i])),
+                n_observations=int(row.n_observations),
+                regression_date=dates[i],
+                sector=row.sector,
+                country=row.country,
+                idio_vol=float(row.idio_vol),
+                factor_vol=float(row.factor_vol),
+            )
+        return results
+
+    @classmethod
+    def get_stale_tickers(
+        cls,
+        tickers: List[str],
+        fingerprints: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Find tickers whose cached regression is missing or stale.
+
+        A cached row is stale if it is older than CACHE_MAX_AGE_DAYS or was
+        computed against different factor or return data (fingerprint
+        mismatch).
+
+        Args:
+            tickers: Ticker symbols to check
+            fingerprints: Current input fingerprints by uppercase ticker, from
+                _input_fingerprints (None skips the check)
+
+        Returns:
+            Uppercase tickers that need a fresh regression, in input order
+        """
+        import numpy as np
+        import pandas as pd
+
+        keys = pd.Index([t.upper() for t in tickers])
+        with cls._lock:
+            table = cls._load_table()
+
+        if table.empty:
+            return list(keys)
+
+        rows = table.reindex(keys)
+        cutoff = pd.Timestamp.now() - pd.Timedelta(days=cls.CACHE_MAX_AGE_DAYS)
+        fresh = (rows["regression_date"] > cutoff).to_numpy(dtype=bool, na_value=False)
+        if fingerprints is not None:
+            expected = np.array([fingerprints.get(k) for k in keys], dtype=object)
+            fresh = fresh & (rows["fingerprint"].to_numpy(dtype=object) == expected)
+        return list(keys[~fresh])
+
+    @classmethod
+    def _load_cached_results(cls, tickers: List[str]) -> Dict[str, FactorRegressionResult]:
+        """Load cached regression results for tickers (missing ones omitted)."""
+        keys = [t.upper() for t in tickers]
+        with cls._lock:
+            table = cls._load_table()
+        if table.empty:
+            return {}
+        rows = table.loc[table.index.intersection(keys)]
+        return cls._frame_to_results(rows)
 
     @classmethod
-    def _save_cached_result(cls, result: FactorRegressionResult) -> None:
-        """Save regression result to cache."""
-        cls._ensure_dir()
-        cache_path = cls._get_cache_path(result.ticker)
+    def _save_cached_results(
+        cls, results: List[FactorRegressionResult], fingerprints: Dict[str, str]
+    ) -> None:
+        """
+        Append fresh regression results to the cache.
+
+        Only the new rows are written (as one new part file); superseded rows
+        are dropped when parts are compacted.
+
+        Args:
+            results: Freshly computed results
+            fingerprints: Input fingerprints (by ticker) the results were
+                computed against
+        """
+        import time
+
+        import pandas as pd
+
+        if not results:
+            return
+
+        rows = cls._results_to_frame(results, fingerprints)
+        with cls._lock:
+            table = cls._load_table()
+            cls._ensure_dir()
+            part_path = cls._TABLE_DIR / f"part-{time.time_ns()}.parquet"
+            try:
+                rows.to_parquet(part_path, index=False)
+            except Exception as e:
+                print(f"[FactorModel] Error saving regression cache: {e}")
+                return
+
+            # Keep the in-memory table in sync without re-reading every part
+            new_rows = rows.set_index("ticker")
+            if not table.empty:
+                table = pd.concat(
+                    [table.loc[~table.index.isin(new_rows.index)], new_rows]
+                )
+            else:
+                table = new_rows
+            cls._table = table
+
+            parts = cls._list_table_parts()
+            if len(parts) > cls._MAX_TABLE_PARTS:
+                cls._compact_table(table, parts)
+            cls._table_parts = tuple(p.name for p in cls._list_table_parts())
+
+    @classmethod
+    def _compact_table(cls, table: "pd.DataFrame", parts: List[Path]) -> None:
+        """Rewrite all part files as a single part. Must hold cls._lock."""
+        import time
+
+        compacted = cls._TABLE_DIR / f"part-{time.time_ns()}.parquet"
         try:
-            with open(cache_path, "w") as f:
-                json.dump(result.to_dict(), f, indent=2)
-        except IOError as e:
-            print(f"[FactorModel] Error saving cache for {result.ticker}: {e}")
+            table.reset_index().to_parquet(compacted, index=False)
+        except Exception as e:
+            print(f"[FactorModel] Error compacting regression cache: {e}")
+            return
+        for part in parts:
+            try:
+                part.unlink()
+            except OSError:
+                pass
 
     @classmethod
     def run_factor_regression(
@@ -163,144 +415,172 @@ class FactorModelService:
         Returns:
             FactorRegressionResult or None if insufficient data
         """
-        import numpy as np
-        import pandas as pd
-        from scipy import stats
-
         ticker_upper = ticker.upper()
+        returns = excess_returns.to_frame(ticker_upper)
+        fingerprints = cls._input_fingerprints(returns, ff_factors)
 
         # Check cache first
-        if use_cache:
-            cached = cls._load_cached_result(ticker_upper)
+        if use_cache and not cls.get_stale_tickers([ticker_upper], fingerprints):
+            cached = cls._load_cached_results([ticker_upper]).get(ticker_upper)
             if cached is not None:
-                # Check if cache is recent (within 7 days)
-                if cached.regression_date:
-                    try:
-                        cache_date = datetime.fromisoformat(cached.regression_date)
-                        if (datetime.now() - cache_date).days < 7:
-                            return cached
-                    except ValueError:
-                        pass
-
-        # Clean the returns - drop NaN and infinite values
-        excess_returns = excess_returns.replace([np.inf, -np.inf], np.nan).dropna()
-
-        # Validate minimum observations
-        if len(excess_returns) < cls.MIN_OBSERVATIONS:
-            return None  # Silent skip for insufficient data
-
-        # Align factors with returns dates
-        common_dates = excess_returns.index.intersection(ff_factors.index)
-        if len(common_dates) < cls.MIN_OBSERVATIONS:
-            return None
-
-        # Get aligned data
-        y = excess_returns.loc[common_dates].values
-        X_factors = ff_factors.loc[common_dates, cls.CORE_FACTORS].values
-
-        # Check for NaN in factors
-        if np.isnan(X_factors).any() or np.isnan(y).any():
-            # Try to clean up
-            valid_mask = ~(np.isnan(X_factors).any(axis=1) | np.isnan(y))
-            if valid_mask.sum() < cls.MIN_OBSERVATIONS:
-                return None
-            y = y[valid_mask]
-            X_factors = X_factors[valid_mask]
-            common_dates = common_dates[valid_mask]
-
-        # Add constant for intercept
-        X = np.column_stack([np.ones(len(y)), X_factors])
-        factor_names = ["const"] + cls.CORE_FACTORS
+                return cached
 
-        n = len(y)
-        k = X.shape[1]
+        results = cls._run_batch_ols(
+            returns,
+            ff_factors,
+            {ticker_upper: {"sector": sector, "country": country}},
+        )
+        result = results.get(ticker_upper)
 
-        if n <= k:
-            return None  # Not enough observations for regression
+        # Cache result
+        if use_cache and result is not None:
+            cls._save_cached_results([result], fingerprints)
 
-        try:
-            # Use pseudo-inverse for numerical stability
-            XtX = X.T @ X
-
-            # Check condition number
-            cond = np.linalg.cond(XtX)
-            if cond > 1e10:
-                # Matrix is ill-conditioned, use pseudo-inverse
-                XtX_inv = np.linalg.pinv(XtX)
-            else:
-                XtX_inv = np.linalg.inv(XtX)
+        return result
+
+    @classmethod
+    def _run_batch_ols(
+        cls,
+        excess_returns: "pd.DataFrame",
+        ff_factors: "pd.DataFrame",
+        metadata: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, FactorRegressionResult]:
+        """
+        Solve the factor regression for every column of a T x N return matrix.
+
+        Tickers are grouped by their missing-data pattern; each group shares
+        one design matrix X, so X'X is factored once and all of the group's
+        betas, standard errors and t-stats come from matrix products instead
+        of a per-ticker solve.
+
+        Args:
+            excess_returns: DataFrame of excess returns (columns = tickers)
+            ff_factors: Fama-French factors DataFrame
+            metadata: Dict mapping ticker to metadata (sector, country, etc.)
 
-            Xty = X.T @ y
-            betas = XtX_inv @ Xty
+        Returns:
+            Dict mapping uppercase ticker to FactorRegressionResult (tickers with
+            insufficient data are omitted)
+        """
+        import numpy as np
+        import pandas as pd
+        from scipy import linalg, special
+
+        results: Dict[str, FactorRegressionResult] = {}
+        if excess_returns.empty:
+            return results
+
+        # Align on dates where every factor is present
+        factors = ff_factors[cls.CORE_FACTORS]
+        common_dates = excess_returns.index.intersection(factors.index)
+        X_factors = factors.loc[common_dates].to_numpy(dtype=float)
+        factor_valid = ~np.isnan(X_factors).any(axis=1)
+        dates = common_dates[factor_valid]
+        if len(dates) < cls.MIN_OBSERVATIONS:
+            return results
+
+        X_all = np.column_stack([np.ones(len(dates)), X_factors[factor_valid]])
+        Y_all = excess_returns.loc[dates].to_numpy(dtype=float, copy=True)
+        Y_all[~np.isfinite(Y_all)] = np.nan
+
+        tickers = [str(t).upper() for t in excess_returns.columns]
+        factor_names = ["const"] + cls.CORE_FACTORS
+        k = X_all.shape[1]
+
+        # Drop tickers that can never reach the minimum, then group the rest
+        # by identical observation masks
+        valid = ~np.isnan(Y_all)
+        counts = valid.sum(axis=0)
+        eligible = np.flatnonzero((counts >= cls.MIN_OBSERVATIONS) & (counts > k))
+        if len(eligible) == 0:
+            return results
+
+        packed = np.ascontiguousarray(np.packbits(valid[:, eligible], axis=0).T)
+        groups: Dict[bytes, List[int]] = {}
+        for col, mask_bytes in zip(eligible.tolist(), packed):
+            groups.setdefault(mask_bytes.tobytes(), []).append(col)
+
+        regression_date = datetime.now().isoformat()
+        sqrt_252 = np.sqrt(252)
+
+        for cols in groups.values():
+            row_mask = valid[:, cols[0]]
+            X = X_all[row_mask]
+            Y = Y_all[np.ix_(row_mask, cols)]
+            n = X.shape[0]
+            group_dates = dates[row_mask]
+
+            try:
+                XtX = X.T @ X
+                XtY = X.T @ Y
+
+                # Cholesky for well-conditioned systems, pseudo-inverse otherwise
+                if np.linalg.cond(XtX) > 1e10:
+                    XtX_inv = np.linalg.pinv(XtX)
+                    betas = XtX_inv @ XtY
+                else:
+                    chol = linalg.cho_factor(XtX)
+                    betas = linalg.cho_solve(chol, XtY)
+                    XtX_inv = linalg.cho_solve(chol, np.eye(k))
+            except (np.linalg.LinAlgError, ValueError):
+                continue
 
-            # Fitted values and residuals
             fitted = X @ betas
-            residuals = y - fitted
+            residuals = Y - fitted
 
             # R-squared
-            ss_res = np.sum(residuals ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
-            r_squared = max(0.0, min(1.0, r_squared))  # Clamp to [0, 1]
+            ss_res = np.sum(residuals ** 2, axis=0)
+            ss_tot = np.sum((Y - Y.mean(axis=0)) ** 2, axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r_squared = np.where(ss_tot > 0, 1 - ss_res / ss_tot, 0.0)
+            r_squared = np.clip(r_squared, 0.0, 1.0)
 
             # Adjusted R-squared
             if n > k + 1:
                 adj_r_squared = 1 - (1 - r_squared) * (n - 1) / (n - k - 1)
-                adj_r_squared = max(0.0, min(1.0, adj_r_squared))
+                adj_r_squared = np.clip(adj_r_squared, 0.0, 1.0)
             else:
                 adj_r_squared = r_squared
 
             # Standard errors and t-statistics
-            mse = ss_res / (n - k) if n > k else 1.0
-            var_betas = np.diag(XtX_inv) * mse
-            # Ensure non-negative variances
-            var_betas = np.maximum(var_betas, 1e-10)
-            se_betas = np.sqrt(var_betas)
-            t_stats = betas / se_betas
+            mse = ss_res / (n - k)
+            var_betas = np.maximum(np.outer(np.diag(XtX_inv), mse), 1e-10)
+            t_stats = betas / np.sqrt(var_betas)
 
             # P-values (two-tailed)
-            df = max(n - k, 1)
-            p_values = 2 * (1 - stats.t.cdf(np.abs(t_stats), df=df))
-
-            # Build result
-            betas_dict = {name: float(betas[i]) for i, name in enumerate(factor_names)}
-            t_stats_dict = {name: float(t_stats[i]) for i, name in enumerate(factor_names)}
-            p_values_dict = {name: float(p_values[i]) for i, name in enumerate(factor_names)}
-
-            # Extract alpha (constant term)
-            alpha = betas_dict.get("const", 0.0)
-
-            # Compute annualized volatilities (stored in cache)
-            idio_vol_ann = float(np.std(residuals) * np.sqrt(252))
-            factor_vol_ann = float(np.std(fitted) * np.sqrt(252))
-
-            result = FactorRegressionResult(
-                ticker=ticker_upper,
-                betas=betas_dict,
-                alpha=alpha,
-                r_squared=float(r_squared),
-                adj_r_squared=float(adj_r_squared),
-                residuals=pd.Series(residuals, index=common_dates),
-                fitted_values=pd.Series(fitted, index=common_dates),
-                t_stats=t_stats_dict,
-                p_values=p_values_dict,
-                n_observations=n,
-                regression_date=datetime.now().isoformat(),
-                sector=sector,
-                country=country,
-                idio_vol=idio_vol_ann,
-                factor_vol=factor_vol_ann,
-            )
-
-            # Cache result
-            if use_cache:
-                cls._save_cached_result(result)
+            p_values = 2 * special.stdtr(max(n - k, 1), -np.abs(t_stats))
+
+            # Annualized volatilities (stored in cache)
+            idio_vol = residuals.std(axis=0) * sqrt_252
+            factor_vol = fitted.std(axis=0) * sqrt_252
+
+            # Row-major copies so each ticker's Series wraps a contiguous view
+            residuals_t = np.ascontiguousarray(residuals.T)
+            fitted_t = np.ascontiguousarray(fitted.T)
+
+            for j, col in enumerate(cols):
+                ticker = tickers[col]
+                ticker_meta = metadata.get(ticker, {})
+                betas_dict = dict(zip(factor_names, betas[:, j].tolist()))
+                results[ticker] = FactorRegressionResult(
+                    ticker=ticker,
+                    betas=betas_dict,
+                    alpha=betas_dict["const"],
+                    r_squared=float(r_squared[j]),
+                    adj_r_squared=float(adj_r_squared[j]),
+                    residuals=pd.Series(residuals_t[j], index=group_dates, copy=False),
+                    fitted_values=pd.Series(fitted_t[j], index=group_dates, copy=False),
+                    t_stats=dict(zip(factor_names, t_stats[:, j].tolist())),
+                    p_values=dict(zip(factor_names, p_values[:, j].tolist())),
+                    n_observations=n,
+                    regression_date=regression_date,
+                    sector=ticker_meta.get("sector", "Not Classified"),
+                    country=ticker_meta.get("country", "US"),
+                    idio_vol=float(idio_vol[j]),
+                    factor_vol=float(factor_vol[j]),
+                )
 
-            return result
-
-        except Exception as e:
-            # Silent failure - don't spam console
-            return None
+        return results
 
     @classmethod
     def run_portfolio_regressions(
@@ -308,17 +588,17 @@ class FactorModelService:
         ticker_excess_returns: "pd.DataFrame",
         ff_factors: "pd.DataFrame",
         metadata: Dict[str, Dict[str, Any]],
-        max_workers: int = 10,
         use_cache: bool = True,
     ) -> Dict[str, FactorRegressionResult]:
         """
         Run factor regressions for all securities in portfolio.
 
+        Uncached tickers are solved together by the batched OLS engine.
+
         Args:
             ticker_excess_returns: DataFrame with excess returns (columns = tickers)
             ff_factors: Fama-French factors DataFrame
             metadata: Dict mapping ticker to metadata (sector, country, etc.)
-            max_workers: Max parallel workers for regression
             use_cache: Whether to use cached results
 
         Returns:
@@ -329,50 +609,25 @@ class FactorModelService:
 
         print(f"[FactorModel] Running regressions for {len(tickers)} securities...")
 
-        def run_single_regression(ticker: str) -> Tuple[str, Optional[FactorRegressionResult]]:
-            """Run regression for a single ticker."""
-            excess_returns = ticker_excess_returns[ticker]
-
-            # Get metadata
-            ticker_meta = metadata.get(ticker.upper(), {})
-            sector = ticker_meta.get("sector", "Not Classified")
-            country = ticker_meta.get("country", "US")
+        to_solve = tickers
+        if use_cache:
+            fingerprints = cls._input_fingerprints(ticker_excess_returns, ff_factors)
+            stale = set(cls.get_stale_tickers(tickers, fingerprints))
+            to_solve = [t for t in tickers if t.upper() in stale]
+            results.update(
+                cls._load_cached_results([t for t in tickers if t.upper() not in stale])
+            )
 
-            result = cls.run_factor_regression(
-                ticker=ticker,
-                excess_returns=excess_returns,
-                ff_factors=ff_factors,
-                sector=sector,
-                country=country,
-                use_cache=use_cache,
+        if to_solve:
+            solved = cls._run_batch_ols(
+                ticker_excess_returns[to_solve], ff_factors, metadata
             )
+            results.update(solved)
+
+            if use_cache:
+                cls._save_cached_results(list(solved.values()), fingerprints)
 
-            return ticker, result
-
-        # Run regressions in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(run_single_regression, ticker): ticker
-                for ticker in tickers
-            }
-
-            completed = 0
-            successful = 0
-            for future in as_completed(futures):
-                ticker = futures[future]
-                try:
-                    ticker, result = future.result()
-                    if result is not None:
-                        results[ticker.upper()] = result
-                        successful += 1
-                except Exception:
-                    pass  # Silent failure
-
-                completed += 1
-                if completed % 500 == 0:
-                    print(f"[FactorModel] Progress: {completed}/{len(tickers)} ({successful} successful)")
-
-        print(f"[FactorModel] Completed {successful}/{len(tickers)} successful regressions")
+        print(f"[FactorModel] Completed {len(results)}/{len(tickers)} successful regressions")
 
         return results
 
@@ -385,14 +640,26 @@ class FactorModelService:
             ticker: Specific ticker to clear, or None to clear all
         """
         with cls._lock:
+            parts = cls._list_table_parts()
             if ticker:
-                cache_path = cls._get_cache_path(ticker)
-                if cache_path.exists():
-                    cache_path.unlink()
+                table = cls._load_table()
+                ticker = ticker.upper()
+                if ticker in table.index:
+                    cls._table = table.drop(index=ticker)
+                    if cls._table.empty:
+                        for part in parts:
+                            part.unlink()
+                    else:
+                        cls._compact_table(cls._table, parts)
+                    cls._table_parts = tuple(p.name for p in cls._list_table_parts())
                     print(f"[FactorModel] Cleared cache for {ticker}")
             else:
-                # Clear all caches
+                # Clear all caches (including legacy per-ticker JSON files)
+                for part in parts:
+                    part.unlink()
                 if cls._CACHE_DIR.exists():
                     for cache_file in cls._CACHE_DIR.glob("*_regression.json"):
                         cache_file.unlink()
-                    print("[FactorModel] Cleared all regression caches")
+                cls._table = None
+                cls._table_parts = ()
+                print("[FactorModel] Cleared all regression caches")
@@ -0,0 +1,785 @@
+"""Background pipeline for risk analysis.
+
+Runs the risk analysis off the GUI thread on a QThreadPool, split into
+stages (data load -> returns -> regressions -> attribution -> risk
+decomposition). Each stage emits progress and its partial results as it
+finishes, a run is cancelled when a new portfolio/benchmark is analyzed, and
+a request for inputs that are already being analyzed is not started twice.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .risk_analytics_service import RiskAnalyticsService
+
+
+# Stage identifiers in execution order, with overlay labels
+STAGES: Tuple[str, ...] = (
+    "data",
+    "returns",
+    "regressions",
+    "attribution",
+    "decomposition",
+)
+
+STAGE_LABELS: Dict[str, str] = {
+    "data": "Loading holdings and prices",
+    "returns": "Calculating returns",
+    "regressions": "Running factor regressions",
+    "attribution": "Attributing active risk",
+    "decomposition": "Decomposing security risk",
+}
+
+
+@dataclass(frozen=True)
+class RiskAnalysisRequest:
+    """Inputs for one risk analysis run (hashable, used for deduplication)."""
+
+    portfolio_name: str
+    benchmark: str
+    lookback_days: Optional[int] = None
+    custom_start_date: Optional[str] = None
+    custom_end_date: Optional[str] = None
+    portfolio_universe_sectors: Optional[Tuple[str, ...]] = None
+    benchmark_universe_sectors: Optional[Tuple[str, ...]] = None
+
+
+@dataclass
+class RiskAnalysisResult:
+    """Final output of a risk analysis run plus the state the module keeps."""
+
+    analysis: Dict[str, Any]
+    weights: Dict[str, float]
+    benchmark_weights: Dict[str, float]
+    benchmark_holdings: Optional[Dict[str, Any]]
+    ticker_returns: "pd.DataFrame"
+    period_start: str = ""
+    period_end: str = ""
+
+
+class RiskAnalysisAbort(Exception):
+    """Analysis cannot continue; shown to the user as a warning."""
+
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+
+
+class RiskAnalysisCancelled(Exception):
+    """Raised inside a task once cancellation has been requested."""
+
+
+class _TaskSignals(QObject):
+    """Signals for a single task (QRunnable cannot define signals itself).
+
+    Every signal carries the run's generation so the pipeline can drop
+    anything emitted by a run that has since been cancelled or replaced.
+    """
+
+    stage_started = Signal(int, str)
+    stage_progress = Signal(int, str, int, int)
+    stage_finished = Signal(int, str, object)
+    finished = Signal(int, object)
+    failed = Signal(int, str, str)
+
+
+@dataclass
+class _RunState:
+    """Intermediate data handed from one stage to the next."""
+
+    tickers: List[str] = field(default_factory=list)
+    weights: Dict[str, float] = field(default_factory=dict)
+    portfolio_prices: Dict[str, "pd.DataFrame"] = field(default_factory=dict)
+    benchmark_closes: Optional["pd.DataFrame"] = None
+    benchmark_holdings: Optional[Dict[str, Any]] = None
+    benchmark_weights: Dict[str, float] = field(default_factory=dict)
+    portfolio_returns: Optional["pd.Series"] = None
+    benchmark_returns: Optional["pd.Series"] = None
+    ticker_returns: Optional["pd.DataFrame"] = None
+    regression_results: Optional[Dict[str, Any]] = None
+    attribution: Optional[Dict[str, Any]] = None
+    analysis: Optional[Dict[str, Any]] = None
+
+
+class _RiskAnalysisTask(QRunnable):
+    """Runs every pipeline stage for one request on a pool thread."""
+
+    def __init__(self, request: RiskAnalysisRequest, generation: int):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.request = request
+        self.generation = generation
+        self.signals = _TaskSignals()
+        self._cancel_event = threading.Event()
+        self._stage = ""
+
+    def cancel(self) -> None:
+        """Request cancellation (takes effect at the next checkpoint)."""
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """Execute the stages in order, emitting results as they complete."""
+        state = _RunState()
+        stage_funcs: Dict[str, Callable[[_RunState], Any]] = {
+            "data": self._load_data,
+            "returns": self._compute_returns,
+            "regressions": self._run_regressions,
+            "attribution": self._run_attribution,
+            "decomposition": self._decompose_risk,
+        }
+        try:
+            for stage in STAGES:
+                self._checkpoint()
+                self._stage = stage
+                self.signals.stage_started.emit(self.generation, stage)
+                partial = stage_funcs[stage](state)
+                self._checkpoint()
+                self.signals.stage_finished.emit(self.generation, stage, partial)
+
+            self.signals.finished.emit(self.generation, self._build_result(state))
+        except RiskAnalysisCancelled:
+            print(f"[RiskAnalysis] Cancelled analysis of '{self.request.portfolio_name}'")
+        except RiskAnalysisAbort as e:
+            self.signals.failed.emit(self.generation, e.title, e.message)
+        except Exception as e:
+            self.signals.failed.emit(
+                self.generation, "Analysis Error", f"Error running risk analysis: {str(e)}"
+            )
+
+    def _checkpoint(self) -> None:
+        """Stop the run if cancellation has been requested."""
+        if self._cancel_event.is_set():
+            raise RiskAnalysisCancelled()
+
+    def _progress(self, completed: int, total: int) -> None:
+        """Report progress within the current stage and honor cancellation."""
+        self._checkpoint()
+        self.signals.stage_progress.emit(self.generation, self._stage, completed, total)
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _load_data(self, state: _RunState) -> Dict[str, Any]:
+        """Holdings, portfolio and benchmark prices, metadata, universe filter."""
+        from app.services.ishares_holdings_service import ISharesHoldingsService
+        from app.services.market_data import (
+            fetch_close_panel_polygon_first,
+            fetch_price_history_batch_polygon_first,
+        )
+        from app.services.portfolio_data_service import PortfolioDataService
+        from app.services.ticker_metadata_service import TickerMetadataService
+
+        from .sector_override_service import SectorOverrideService
+
+        request = self.request
+        total_steps = 4
+
+        # Get portfolio tickers first to fetch current prices
+        tickers_list = PortfolioDataService.get_tickers(request.portfolio_name)
+        if not tickers_list:
+            raise RiskAnalysisAbort(
+                "No Holdings", f"Portfolio '{request.portfolio_name}' has no holdings."
+            )
+
+        # Batch fetch current prices for weight calculation (Polygon-first for speed)
+        state.portfolio_prices = fetch_price_history_batch_polygon_first(tickers_list)
+        self._progress(1, total_steps)
+
+        current_prices = {}
+        for ticker in tickers_list:
+            df = state.portfolio_prices.get(ticker)
+            if df is not None and not df.empty:
+                current_prices[ticker] = df["Close"].iloc[-1]
+
+        # Get portfolio data with current prices
+        holdings = PortfolioDataService.get_holdings(request.portfolio_name, current_prices)
+        if not holdings:
+            raise RiskAnalysisAbort(
+                "No Holdings", f"Portfolio '{request.portfolio_name}' has no holdings."
+            )
+
+        # Extract tickers and weights (normalize to uppercase for consistent lookups)
+        tickers = [h.ticker.upper() for h in holdings if h.ticker != "FREE CASH"]
+        weights = {h.ticker.upper(): h.weight for h in holdings if h.ticker != "FREE CASH"}
+
+        if not tickers:
+            raise RiskAnalysisAbort(
+                "No Holdings", f"Portfolio '{request.portfolio_name}' has no holdings."
+            )
+
+        # Prefetch metadata for all tickers (parallel fetch)
+        TickerMetadataService.get_metadata_batch(tickers)
+        self._progress(2, total_steps)
+
+        # Filter by portfolio universe sectors if specified
+        if request.portfolio_universe_sectors:
+            allowed_sectors = set(request.portfolio_universe_sectors)
+            filtered_tickers = [
+                ticker
+                for ticker in tickers
+                if SectorOverrideService.get_effective_sector(ticker) in allowed_sectors
+            ]
+            if not filtered_tickers:
+                raise RiskAnalysisAbort(
+                    "No Holdings in Universe",
+                    f"No holdings in '{request.portfolio_name}' match the selected "
+                    f"portfolio universe sectors.",
+                )
+
+            # Renormalize weights to sum to 1.0
+            filtered_weights = {t: weights[t] for t in filtered_tickers}
+            total_weight = sum(filtered_weights.values())
+            if total_weight > 0:
+                filtered_weights = {
+                    t: w / total_weight for t, w in filtered_weights.items()
+                }
+
+            tickers = filtered_tickers
+            weights = filtered_weights
+
+        state.tickers = tickers
+        state.weights = weights
+
+        # Fetch ETF holdings (e.g., IWV has ~3000 constituents)
+        benchmark = request.benchmark
+        print(f"[Benchmark] Fetching {benchmark} holdings for constituent-weighted returns...")
+        benchmark_holdings = ISharesHoldingsService.fetch_holdings(benchmark)
+        if not benchmark_holdings:
+            print(f"[Benchmark] Could not fetch holdings for {benchmark}")
+            raise _no_benchmark_data(benchmark)
+
+        print(f"[Benchmark] Got {len(benchmark_holdings)} constituents")
+
+        # Cache metadata from ETF holdings (sector, name, etc.)
+        TickerMetadataService.cache_from_etf_holdings(benchmark_holdings)
+
+        # Apply benchmark universe sector filter if set
+        if request.benchmark_universe_sectors:
+            sector_set = set(request.benchmark_universe_sectors)
+            benchmark_holdings = {
+                ticker: holding
+                for ticker, holding in benchmark_holdings.items()
+                if holding.sector in sector_set
+            }
+            if not benchmark_holdings:
+                print("[Benchmark] No holdings match selected benchmark universe sectors")
+                raise _no_benchmark_data(benchmark)
+            print(f"[Benchmark] Filtered to {len(benchmark_holdings)} constituents in selected sectors")
+
+        state.benchmark_holdings = benchmark_holdings
+
+        # Renormalized benchmark weights (sum to 1.0)
+        total_benchmark_weight = sum(h.weight for h in benchmark_holdings.values())
+        if total_benchmark_weight > 0:
+            state.benchmark_weights = {
+                ticker.upper(): holding.weight / total_benchmark_weight
+                for ticker, holding in benchmark_holdings.items()
+            }
+        self._progress(3, total_steps)
+
+        # Aligned close matrix for all constituents (one pruned store read)
+        constituent_tickers = list(benchmark_holdings.keys())
+        print(f"[Benchmark] Fetching price data for {len(constituent_tickers)} constituents...")
+        state.benchmark_closes = fetch_close_panel_polygon_first(constituent_tickers)
+        self._progress(4, total_steps)
+
+        return {
+            "tickers": list(tickers),
+            "weights": dict(weights),
+            "benchmark_weights": dict(state.benchmark_weights),
+        }
+
+    def _compute_returns(self, state: _RunState) -> Dict[str, Any]:
+        """Portfolio, benchmark and per-ticker returns over the analysis period."""
+        import pandas as pd
+
+        from app.services.returns_data_service import ReturnsDataService
+
+        request = self.request
+        period = (request.lookback_days, request.custom_start_date, request.custom_end_date)
+
+        # Get portfolio returns using TIME-VARYING weights from transaction history
+        # This correctly accounts for when each holding was actually purchased/sold
+        portfolio_returns = ReturnsDataService.get_time_varying_portfolio_returns(
+            request.portfolio_name, include_cash=False
+        )
+        if portfolio_returns is None or portfolio_returns.empty:
+            raise RiskAnalysisAbort(
+                "No Returns Data",
+                f"Could not calculate returns for '{request.portfolio_name}'.",
+            )
+
+        portfolio_returns = filter_returns_by_period(portfolio_returns, *period)
+
+        # Clip any extreme portfolio returns (>50% daily is extreme)
+        extreme_port = (portfolio_returns.abs() > 0.5).sum()
+        if extreme_port > 0:
+            print(f"[RiskAnalysis] Clipping {extreme_port} extreme portfolio return days")
+            portfolio_returns = portfolio_returns.clip(lower=-0.5, upper=0.5)
+
+        benchmark_returns = compute_benchmark_returns(
+            state.benchmark_holdings, state.benchmark_closes, *period
+        )
+        if benchmark_returns is None or benchmark_returns.empty:
+            raise _no_benchmark_data(request.benchmark)
+        self._progress(1, 3)
+
+        # Normalize indices to date-only (remove time component) to ensure alignment
+        # This fixes timezone mismatches between portfolio and benchmark data sources
+        portfolio_returns.index = portfolio_returns.index.normalize()
+        benchmark_returns.index = benchmark_returns.index.normalize()
+
+        # Remove any duplicate indices created by normalization (keep last value)
+        if portfolio_returns.index.duplicated().any():
+            portfolio_returns = portfolio_returns[~portfolio_returns.index.duplicated(keep="last")]
+        if benchmark_returns.index.duplicated().any():
+            benchmark_returns = benchmark_returns[~benchmark_returns.index.duplicated(keep="last")]
+
+        common_dates = portfolio_returns.index.intersection(benchmark_returns.index)
+        print(f"[RiskAnalysis] Portfolio returns: {len(portfolio_returns)} days, "
+              f"benchmark returns: {len(benchmark_returns)} days, common: {len(common_dates)}")
+
+        # Individual ticker returns for CTEV calculation
+        portfolio_closes = {
+            ticker: df["Close"] for ticker, df in state.portfolio_prices.items()
+        }
+        ticker_returns = compute_ticker_returns(state.tickers, portfolio_closes, *period)
+
+        # Also include returns for ALL benchmark tickers NOT in portfolio
+        # These are needed to show underweight positions (negative active weight)
+        portfolio_set = set(t.upper() for t in state.tickers)
+        benchmark_only_tickers = [
+            ticker
+            for ticker in state.benchmark_holdings.keys()
+            if ticker.upper() not in portfolio_set
+        ]
+        if benchmark_only_tickers:
+            print(f"[RiskAnalysis] Calculating returns for {len(benchmark_only_tickers)} benchmark-only tickers")
+            benchmark_ticker_returns = compute_ticker_returns(
+                benchmark_only_tickers, state.benchmark_closes, *period
+            )
+            if not benchmark_ticker_returns.empty:
+                if not ticker_returns.empty:
+                    ticker_returns = pd.concat(
+                        [ticker_returns, benchmark_ticker_returns], axis=1
+                    )
+                    # Remove any duplicate columns
+                    ticker_returns = ticker_returns.loc[:, ~ticker_returns.columns.duplicated()]
+                else:
+                    ticker_returns = benchmark_ticker_returns
+        self._progress(2, 3)
+
+        # If universe filtering is active, recalculate portfolio returns from filtered tickers
+        if request.portfolio_universe_sectors and not ticker_returns.empty:
+            held = [t for t in state.tickers if t in ticker_returns.columns]
+            held_weights = pd.Series({t: state.weights.get(t, 0.0) for t in held}, dtype=float)
+            portfolio_returns = (
+                ticker_returns[held].mul(held_weights, axis=1).sum(axis=1, min_count=1)
+                if held
+                else pd.Series(0.0, index=ticker_returns.index)
+            ).dropna()
+
+            if portfolio_returns.empty:
+                raise RiskAnalysisAbort(
+                    "No Returns Data",
+                    "Could not calculate returns for the filtered portfolio universe.",
+                )
+
+        if ticker_returns.empty:
+            raise RiskAnalysisAbort(
+                "No Returns Data",
+                f"Could not calculate ticker returns for '{request.portfolio_name}'.",
+            )
+
+        state.portfolio_returns = portfolio_returns
+        state.benchmark_returns = benchmark_returns
+        state.ticker_returns = ticker_returns
+        self._progress(3, 3)
+
+        print(f"[RiskAnalysis] Returns matrix shape {ticker_returns.shape}")
+        return {
+            "portfolio_returns": portfolio_returns,
+            "benchmark_returns": benchmark_returns,
+            "period_start": portfolio_returns.index.min().strftime("%Y-%m-%d"),
+            "period_end": portfolio_returns.index.max().strftime("%Y-%m-%d"),
+        }
+
+    def _run_regressions(self, state: _RunState) -> Dict[str, Any]:
+        """Factor regressions for every portfolio and benchmark ticker."""
+        factor_inputs = RiskAnalyticsService.prepare_factor_inputs(state.ticker_returns)
+        self._progress(1, 2)
+
+        if factor_inputs is not None:
+            ticker_excess_returns, ff_factors = factor_inputs
+            state.regression_results = RiskAnalyticsService.run_factor_regressions(
+                ticker_excess_returns, ff_factors, state.tickers, state.benchmark_weights
+            )
+
+        if not state.regression_results:
+            # Factor model unavailable - the heuristic analysis covers all
+            # remaining stages at once
+            state.analysis = RiskAnalyticsService.get_fallback_analysis(
+                state.portfolio_returns,
+                state.benchmark_returns,
+                state.ticker_returns,
+                state.tickers,
+                state.weights,
+                state.benchmark_weights,
+            )
+        self._progress(2, 2)
+
+        return {"regression_results": state.regression_results or {}}
+
+    def _run_attribution(self, state: _RunState) -> Dict[str, Any]:
+        """Summary, CTEV by factor group and per-factor contributions."""
+        if state.analysis is not None:
+            state.attribution = {
+                key: state.analysis.get(key)
+                for key in ("summary", "ctev_by_factor", "factor_contributions")
+            }
+        else:
+            state.attribution = RiskAnalyticsService.calculate_factor_attribution(
+                state.regression_results,
+                state.weights,
+                state.benchmark_weights,
+                state.portfolio_returns,
+                state.benchmark_returns,
+            )
+        return state.attribution
+
+    def _decompose_risk(self, state: _RunState) -> Dict[str, Any]:
+        """Per-security and per-sector risk; assembles the full analysis."""
+        if state.analysis is None:
+            state.analysis = RiskAnalyticsService.decompose_security_risk(
+                state.regression_results,
+                state.weights,
+                state.benchmark_weights,
+                state.attribution,
+            )
+        return state.analysis
+
+    def _build_result(self, state: _RunState) -> RiskAnalysisResult:
+        """Bundle the final analysis with the state the module keeps."""
+        portfolio_returns = state.portfolio_returns
+        return RiskAnalysisResult(
+            analysis=state.analysis,
+            weights=state.weights,
+            benchmark_weights=state.benchmark_weights,
+            benchmark_holdings=state.benchmark_holdings,
+            ticker_returns=state.ticker_returns,
+            period_start=portfolio_returns.index.min().strftime("%Y-%m-%d"),
+            period_end=portfolio_returns.index.max().strftime("%Y-%m-%d"),
+        )
+
+
+class RiskAnalysisPipeline(QObject):
+    """Runs risk analysis requests in the background, one at a time.
+
+    Submitting a request cancels the run in progress unless it is for the
+    same inputs, in which case the running analysis is reused. Signals are
+    only emitted for the current run; output from cancelled runs is dropped.
+
+    Signals:
+        stage_started: Emitted with the stage id when a stage begins
+        stage_progress: Emitted with (stage, completed, total) within a stage
+        partial_result: Emitted with (stage, result dict) when a stage ends
+        analysis_complete: Emitted with RiskAnalysisResult on success
+        analysis_error: Emitted with (title, message) on failure
+        analysis_cancelled: Emitted when the current run is cancelled
+    """
+
+    stage_started = Signal(str)
+    stage_progress = Signal(str, int, int)
+    partial_result = Signal(str, object)
+    analysis_complete = Signal(object)  # RiskAnalysisResult
+    analysis_error = Signal(str, str)
+    analysis_cancelled = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Two threads so a new run can start while a cancelled one is still
+        # finishing a blocking step (e.g. a batch price fetch)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._generation = 0
+        self._task: Optional[_RiskAnalysisTask] = None
+
+    @property
+    def current_request(self) -> Optional[RiskAnalysisRequest]:
+        """Request being analyzed, or None when idle."""
+        return self._task.request if self._task is not None else None
+
+    def is_running(self) -> bool:
+        """Check whether an analysis is in progress."""
+        return self._task is not None
+
+    def submit(self, request: RiskAnalysisRequest) -> bool:
+        """
+        Start analyzing a request.
+
+        Args:
+            request: Analysis inputs
+
+        Returns:
+            True if a new run was started, False if the same request is
+            already running (its results will be emitted as usual)
+        """
+        if self._task is not None and self._task.request == request:
+            return False
+
+        self.cancel()
+
+        self._generation += 1
+        task = _RiskAnalysisTask(request, self._generation)
+        task.signals.stage_started.connect(self._on_stage_started)
+        task.signals.stage_progress.connect(self._on_stage_progress)
+        task.signals.stage_finished.connect(self._on_stage_finished)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self._task = task
+        self._pool.start(task)
+        return True
+
+    def cancel(self) -> None:
+        """Cancel the current run (no further signals are emitted for it)."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        self.analysis_cancelled.emit()
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Block until all pool threads finish, including cancelled runs still
+        in a blocking step (RiskAnalyticsModule calls this on aboutToQuit).
+
+        Args:
+            msecs: Timeout in milliseconds (-1 waits indefinitely)
+
+        Returns:
+            True if all threads finished
+        """
+        return self._pool.waitForDone(msecs)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._task is not None and generation == self._generation
+
+    def _on_stage_started(self, generation: int, stage: str) -> None:
+        if self._is_current(generation):
+            self.stage_started.emit(stage)
+
+    def _on_stage_progress(self, generation: int, stage: str, completed: int, total: int) -> None:
+        if self._is_current(generation):
+            self.stage_progress.emit(stage, completed, total)
+
+    def _on_stage_finished(self, generation: int, stage: str, partial: object) -> None:
+        if self._is_current(generation):
+            self.partial_result.emit(stage, partial)
+
+    def _on_finished(self, generation: int, result: object) -> None:
+        if self._is_current(generation):
+            self._task = None
+            self.analysis_complete.emit(result)
+
+    def _on_failed(self, generation: int, title: str, message: str) -> None:
+        if self._is_current(generation):
+            self._task = None
+            self.analysis_error.emit(title, message)
+
+
+# ----------------------------------------------------------------------
+# Returns helpers (thread-safe; no widget state)
+# ----------------------------------------------------------------------
+
+
+def _no_benchmark_data(benchmark: str) -> RiskAnalysisAbort:
+    return RiskAnalysisAbort(
+        "No Benchmark Data", f"Could not fetch returns for benchmark '{benchmark}'."
+    )
+
+
+def filter_returns_by_period(
+    returns: "pd.Series",
+    lookback_days: Optional[int],
+    custom_start_date: Optional[str],
+    custom_end_date: Optional[str],
+) -> "pd.Series":
+    """
+    Filter returns by either lookback period or custom date range.
+
+    Args:
+        returns: Series of returns with DatetimeIndex
+        lookback_days: Number of trading days to look back (or None for custom)
+        custom_start_date: Start date string (YYYY-MM-DD) for custom range
+        custom_end_date: End date string (YYYY-MM-DD) for custom range
+
+    Returns:
+        Filtered returns series
+    """
+    if returns is None or returns.empty:
+        return returns
+
+    if lookback_days is None and custom_start_date and custom_end_date:
+        # Custom date range - filter by dates
+        import pandas as pd
+
+        start = pd.Timestamp(custom_start_date)
+        end = pd.Timestamp(custom_end_date)
+        return returns[(returns.index >= start) & (returns.index <= end)]
+    elif lookback_days is not None:
+        # Standard lookback period - take last N days
+        if len(returns) > lookback_days:
+            return returns.iloc[-lookback_days:]
+    return returns
+
+
+def compute_benchmark_returns(
+    holdings: Dict[str, Any],
+    closes: Mapping[str, "pd.Series"],
+    lookback_days: Optional[int],
+    custom_start_date: Optional[str] = None,
+    custom_end_date: Optional[str] = None,
+) -> Optional["pd.Series"]:
+    """
+    Calculate constituent-weighted benchmark returns.
+
+    Args:
+        holdings: ETF holdings (ticker -> holding with a weight attribute)
+        closes: Ticker -> Close series (a dict, or a wide dates x tickers DataFrame)
+        lookback_days: Number of trading days to look back (or None for custom)
+        custom_start_date: Start date string (YYYY-MM-DD) for custom range
+        custom_end_date: End date string (YYYY-MM-DD) for custom range
+
+    Returns:
+        Series of weighted daily benchmark returns, or None if unavailable
+    """
+    import pandas as pd
+
+    # Calculate individual returns for each constituent
+    # Filter out extreme returns (>100% or <-100%) which are likely data errors
+    constituent_returns = {}
+    outlier_count = 0
+    for ticker in holdings:
+        close = closes.get(ticker)
+        if close is not None and not close.empty:
+            returns = close.dropna().pct_change().dropna()
+            if not returns.empty:
+                # Clip extreme returns - daily moves >100% are almost certainly data errors
+                extreme_mask = (returns > 1.0) | (returns < -1.0)
+                if extreme_mask.any():
+                    outlier_count += extreme_mask.sum()
+                    returns = returns.clip(lower=-1.0, upper=1.0)
+                constituent_returns[ticker] = returns
+
+    if outlier_count > 0:
+        print(f"[Benchmark] Clipped {outlier_count} extreme return values (>100% daily)")
+
+    if not constituent_returns:
+        print("[Benchmark] No valid returns data for constituents")
+        return None
+
+    print(f"[Benchmark] Got returns for {len(constituent_returns)} constituents")
+
+    # Create DataFrame of constituent returns
+    returns_df = pd.DataFrame(constituent_returns)
+
+    # Normalize index to date-only and remove duplicates
+    returns_df.index = returns_df.index.normalize()
+    if returns_df.index.duplicated().any():
+        returns_df = returns_df[~returns_df.index.duplicated(keep="last")]
+
+    # Weights renormalized to sum to 1.0 (in case some constituents are missing)
+    weights = pd.Series(
+        {ticker: holdings[ticker].weight for ticker in returns_df.columns}, dtype=float
+    )
+    total_weight = weights.sum()
+    if total_weight > 0:
+        weights = weights / total_weight
+
+    # Weighted daily returns in one matrix-vector product
+    benchmark_returns = returns_df.fillna(0).mul(weights, axis=1).sum(axis=1).dropna()
+
+    if benchmark_returns.empty:
+        print("[Benchmark] Weighted returns calculation produced empty result")
+        return None
+
+    # Final sanity check - clip any remaining extreme values in weighted returns
+    extreme_weighted = (benchmark_returns.abs() > 0.5).sum()  # >50% daily is extreme for an index
+    if extreme_weighted > 0:
+        print(f"[Benchmark] Warning: {extreme_weighted} days with >50% weighted return, clipping")
+        benchmark_returns = benchmark_returns.clip(lower=-0.5, upper=0.5)
+
+    print(f"[Benchmark] Calculated constituent-weighted returns: {len(benchmark_returns)} days")
+
+    return filter_returns_by_period(
+        benchmark_returns, lookback_days, custom_start_date, custom_end_date
+    )
+
+
+def compute_ticker_returns(
+    tickers: List[str],
+    closes: Mapping[str, "pd.Series"],
+    lookback_days: Optional[int],
+    custom_start_date: Optional[str] = None,
+    custom_end_date: Optional[str] = None,
+) -> "pd.DataFrame":
+    """
+    Calculate aligned daily returns for individual tickers.
+
+    Args:
+        tickers: Ticker symbols
+        closes: Ticker -> Close series (a dict, or a wide dates x tickers DataFrame)
+        lookback_days: Number of trading days to look back (or None for custom)
+        custom_start_date: Start date string (YYYY-MM-DD) for custom range
+        custom_end_date: End date string (YYYY-MM-DD) for custom range
+
+    Returns:
+        DataFrame of returns (one column per ticker), gaps filled
+    """
+    import pandas as pd
+
+    returns_dict = {}
+    outlier_count = 0
+    for ticker in tickers:
+        close = closes.get(ticker)
+        if close is not None and not close.empty:
+            returns = close.dropna().pct_change().dropna()
+            # Clip extreme returns (>100% daily is likely data error)
+            extreme_mask = (returns > 1.0) | (returns < -1.0)
+            if extreme_mask.any():
+                outlier_count += extreme_mask.sum()
+                returns = returns.clip(lower=-1.0, upper=1.0)
+            # Apply date filtering
+            returns = filter_returns_by_period(
+                returns, lookback_days, custom_start_date, custom_end_date
+            )
+            if returns is not None and not returns.empty:
+                returns_dict[ticker] = returns
+
+    if outlier_count > 0:
+        print(f"[RiskAnalysis] Clipped {outlier_count} extreme ticker return values")
+
+    if not returns_dict:
+        return pd.DataFrame()
+
+    # Combine into DataFrame, aligning by date
+    df = pd.DataFrame(returns_dict)
+
+    # Normalize index to date-only and remove duplicates
+    df.index = df.index.normalize()
+    if df.index.duplicated().any():
+        df = df[~df.index.duplicated(keep="last")]
+
+    df = df.dropna(how='all')  # Remove rows with all NaN
+    df = df.ffill().bfill()    # Forward/backward fill remaining NaN
+    return df
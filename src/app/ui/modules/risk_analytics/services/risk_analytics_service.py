@@ -194,6 +194,10 @@ class RiskAnalyticsService:
         """
         Run complete risk analysis using factor model.
 
+        Runs the same stages as the background risk analysis pipeline
+        (factor inputs -> regressions -> attribution -> risk decomposition)
+        back to back.
+
         Args:
             portfolio_returns: Series of portfolio returns
             benchmark_returns: Series of benchmark returns
@@ -206,20 +210,60 @@ class RiskAnalyticsService:
         Returns:
             Dict with all analysis results
         """
-        import numpy as np
+        benchmark_weights = benchmark_weights or {}
+
+        factor_inputs = RiskAnalyticsService.prepare_factor_inputs(ticker_returns)
+        if factor_inputs is None:
+            return RiskAnalyticsService.get_fallback_analysis(
+                portfolio_returns, benchmark_returns, ticker_returns,
+                tickers, weights, benchmark_weights
+            )
+
+        ticker_excess_returns, ff_factors = factor_inputs
+        regression_results = RiskAnalyticsService.run_factor_regressions(
+            ticker_excess_returns, ff_factors, tickers, benchmark_weights
+        )
+        if not regression_results:
+            # Fall back if no regressions succeeded
+            return RiskAnalyticsService.get_fallback_analysis(
+                portfolio_returns, benchmark_returns, ticker_returns,
+                tickers, weights, benchmark_weights
+            )
+
+        attribution = RiskAnalyticsService.calculate_factor_attribution(
+            regression_results,
+            weights,
+            benchmark_weights,
+            portfolio_returns,
+            benchmark_returns,
+        )
+        return RiskAnalyticsService.decompose_security_risk(
+            regression_results, weights, benchmark_weights, attribution
+        )
+
+    @staticmethod
+    def prepare_factor_inputs(
+        ticker_returns: "pd.DataFrame",
+    ) -> Optional[Tuple["pd.DataFrame", "pd.DataFrame"]]:
+        """
+        Load Fama-French factors and compute ticker excess returns (R - RF).
+
+        Args:
+            ticker_returns: DataFrame with individual ticker returns
+
+        Returns:
+            Tuple of (ticker_excess_returns, ff_factors), or None if the
+            factor data could not be loaded (use the fallback analysis)
+        """
         import pandas as pd
 
         from .fama_french_data_service import FamaFrenchDataService
-        from .factor_model_service import FactorModelService
-        from .factor_risk_service import FactorRiskService
-
-        benchmark_weights = benchmark_weights or {}
 
         # Get date range from returns
         start_date = ticker_returns.index.min().strftime("%Y-%m-%d")
         end_date = ticker_returns.index.max().strftime("%Y-%m-%d")
 
-        print(f"[RiskAnalytics] Running factor model analysis for {len(tickers)} tickers")
+        print(f"[RiskAnalytics] Running factor model analysis for {ticker_returns.shape[1]} tickers")
         print(f"[RiskAnalytics] Date range: {start_date} to {end_date}")
 
         # Step 1: Fetch Fama-French factors
@@ -229,11 +273,7 @@ class RiskAnalyticsService:
             print(f"[RiskAnalytics] Loaded {len(ff_factors)} days of Fama-French data")
         except Exception as e:
             print(f"[RiskAnalytics] Error loading Fama-French data: {e}")
-            # Fall back to simple analysis
-            return RiskAnalyticsService._get_fallback_analysis(
-                portfolio_returns, benchmark_returns, ticker_returns,
-                tickers, weights, benchmark_weights
-            )
+            return None
 
         # Step 2: Calculate excess returns (R - RF)
         # Normalize ticker_returns index to match FF data (timezone-naive dates)
@@ -252,6 +292,29 @@ class RiskAnalyticsService:
         print(f"[RiskAnalytics] FF factors shape: {ff_factors.shape}")
         print(f"[RiskAnalytics] Date overlap: {len(ticker_excess_returns.index.intersection(ff_factors.index))} days")
 
+        return ticker_excess_returns, ff_factors
+
+    @staticmethod
+    def run_factor_regressions(
+        ticker_excess_returns: "pd.DataFrame",
+        ff_factors: "pd.DataFrame",
+        tickers: List[str],
+        benchmark_weights: Dict[str, float],
+    ) -> Dict[str, Any]:
+        """
+        Run factor regressions for portfolio and benchmark tickers.
+
+        Args:
+            ticker_excess_returns: Excess returns from prepare_factor_inputs
+            ff_factors: Factor returns from prepare_factor_inputs
+            tickers: Portfolio ticker symbols
+            benchmark_weights: Dict mapping ticker to benchmark weight (decimal)
+
+        Returns:
+            Dict mapping ticker -> FactorRegressionResult
+        """
+        from .factor_model_service import FactorModelService
+
         # Step 3: Get metadata for all tickers
         all_tickers = list(set(tickers) | set(benchmark_weights.keys()))
         metadata = TickerMetadataService.get_metadata_batch(all_tickers)
@@ -264,50 +327,95 @@ class RiskAnalyticsService:
             ticker_excess_returns,
             ff_factors,
             metadata,
-            max_workers=10,
             use_cache=False,
         )
         print(f"[RiskAnalytics] Completed {len(regression_results)} regressions")
+        return regression_results
+
+    @staticmethod
+    def calculate_factor_attribution(
+        regression_results: Dict[str, Any],
+        weights: Dict[str, float],
+        benchmark_weights: Dict[str, float],
+        portfolio_returns: "pd.Series",
+        benchmark_returns: "pd.Series",
+    ) -> Dict[str, Any]:
+        """
+        Attribute active risk to factor groups and individual factors.
+
+        Args:
+            regression_results: Output from run_factor_regressions
+            weights: Dict mapping ticker to portfolio weight (decimal)
+            benchmark_weights: Dict mapping ticker to benchmark weight (decimal)
+            portfolio_returns: Series of portfolio returns
+            benchmark_returns: Series of benchmark returns
+
+        Returns:
+            Dict with summary, ctev_by_factor and factor_contributions
+        """
+        from .factor_risk_service import FactorRiskService
 
         # Step 6: Calculate risk metrics
-        if len(regression_results) > 0:
-            # Calculate summary using factor model
-            summary = FactorRiskService.calculate_risk_summary(
-                regression_results,
-                weights,
-                benchmark_weights,
-                portfolio_returns,
-                benchmark_returns,
-            )
+        summary = FactorRiskService.calculate_risk_summary(
+            regression_results,
+            weights,
+            benchmark_weights,
+            portfolio_returns,
+            benchmark_returns,
+        )
 
-            # Calculate CTEV by factor group
-            ctev_by_factor = FactorRiskService.calculate_factor_ctev_by_group(
-                regression_results,
-                weights,
-                benchmark_weights,
-                summary["total_active_risk"],
-            )
+        # Calculate CTEV by factor group
+        ctev_by_factor = FactorRiskService.calculate_factor_ctev_by_group(
+            regression_results,
+            weights,
+            benchmark_weights,
+            summary["total_active_risk"],
+        )
 
-            # Calculate per-factor contributions with top securities
-            factor_contributions = FactorRiskService.calculate_factor_contributions(
-                regression_results,
-                weights,
-                benchmark_weights,
-                summary["total_active_risk"],
-            )
+        # Calculate per-factor contributions with top securities
+        factor_contributions = FactorRiskService.calculate_factor_contributions(
+            regression_results,
+            weights,
+            benchmark_weights,
+            summary["total_active_risk"],
+        )
 
-            # Calculate per-security risks
-            security_risks = FactorRiskService.calculate_all_security_risks(
-                regression_results,
-                weights,
-                benchmark_weights,
-            )
-        else:
-            # Fall back if no regressions succeeded
-            return RiskAnalyticsService._get_fallback_analysis(
-                portfolio_returns, benchmark_returns, ticker_returns,
-                tickers, weights, benchmark_weights
-            )
+        return {
+            "summary": summary,
+            "ctev_by_factor": ctev_by_factor,
+            "factor_contributions": factor_contributions,
+        }
+
+    @staticmethod
+    def decompose_security_risk(
+        regression_results: Dict[str, Any],
+        weights: Dict[str, float],
+        benchmark_weights: Dict[str, float],
+        attribution: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Decompose risk by security and sector and assemble the full analysis.
+
+        Args:
+            regression_results: Output from run_factor_regressions
+            weights: Dict mapping ticker to portfolio weight (decimal)
+            benchmark_weights: Dict mapping ticker to benchmark weight (decimal)
+            attribution: Output from calculate_factor_attribution
+
+        Returns:
+            Dict with all analysis results
+        """
+        from .factor_risk_service import FactorRiskService
+
+        summary = attribution["summary"]
+        ctev_by_factor = attribution["ctev_by_factor"]
+
+        # Calculate per-security risks
+        security_risks = FactorRiskService.calculate_all_security_risks(
+            regression_results,
+            weights,
+            benchmark_weights,
+        )
 
         # Step 7: Calculate CTEV by sector
         ctev_by_sector = RiskAnalyticsService._calculate_ctev_by_sector(security_risks)
@@ -337,7 +445,7 @@ class RiskAnalyticsService:
             "security_risks": security_risks,
             "top_securities": top_securities,
             "regression_results": regression_results,  # Include for debugging
-            "factor_contributions": factor_contributions,  # Per-factor breakdown with top securities
+            "factor_contributions": attribution["factor_contributions"],  # Per-factor breakdown with top securities
         }
 
     @staticmethod
@@ -364,7 +472,7 @@ class RiskAnalyticsService:
         return dict(sorted(sector_ctev.items(), key=lambda x: x[1], reverse=True))
 
     @staticmethod
-    def _get_fallback_analysis(
+    def get_fallback_analysis(
         portfolio_returns: "pd.Series",
         benchmark_returns: "pd.Series",
         ticker_returns: "pd.DataFrame",
@@ -376,6 +484,17 @@ class RiskAnalyticsService:
         Fallback analysis when factor model fails.
 
         Uses simpler heuristic-based calculations.
+
+        Args:
+            portfolio_returns: Portfolio daily returns
+            benchmark_returns: Benchmark daily returns
+            ticker_returns: Per-ticker daily returns (columns = tickers)
+            tickers: Portfolio ticker symbols
+            weights: Dict mapping ticker to portfolio weight (decimal)
+            benchmark_weights: Dict mapping ticker to benchmark weight (decimal)
+
+        Returns:
+            Analysis dict with the same keys as a factor-model analysis
         """
         import numpy as np
         import pandas as pd
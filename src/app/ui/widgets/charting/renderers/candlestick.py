@@ -2,35 +2,144 @@
 
 import numpy as np
 import pyqtgraph as pg
-from pyqtgraph.Qt import QtCore, QtGui
+from pyqtgraph.Qt import QtCore
 from app.core.config import CANDLE_BAR_WIDTH
 
+# Minimum on-screen spacing per drawn candle; narrower candles are merged
+# into OHLC buckets of 2**level bars
+_MIN_PIXELS_PER_CANDLE = 3.0
+
+# Buckets beyond the cached geometry that are drawn fresh on each paint
+# (the live tail) before the cache is rebuilt instead
+_MAX_TAIL_BUCKETS = 64
+
+# Point pattern per candle: wick (2 points) + closed body outline (5 points)
+_POINTS_PER_CANDLE = 7
+_CONNECT_PATTERN = np.array([1, 0, 1, 1, 1, 1, 0], dtype=np.int32)
+
+
+def _aggregate_ohlc(rows: np.ndarray, bucket: int) -> np.ndarray:
+    """
+    Merge consecutive candles into OHLC buckets of `bucket` bars.
+
+    Args:
+        rows: Array of [x, open, close, low, high] rows, starting on a
+            bucket boundary
+        bucket: Bars per bucket
+
+    Returns:
+        Array of [x, open, close, low, high] rows, one per bucket; x is the
+        bucket's center
+    """
+    n = len(rows)
+    if n == 0:
+        return np.empty((0, 5))
+    starts = np.arange(0, n, bucket)
+    ends = np.minimum(starts + bucket, n) - 1
+
+    lows = np.where(np.isnan(rows[:, 3]), np.inf, rows[:, 3])
+    highs = np.where(np.isnan(rows[:, 4]), -np.inf, rows[:, 4])
+
+    out = np.empty((len(starts), 5))
+    out[:, 0] = (rows[starts, 0] + rows[ends, 0]) / 2.0
+    out[:, 1] = rows[starts, 1]
+    out[:, 2] = rows[ends, 2]
+    out[:, 3] = np.minimum.reduceat(lows, starts)
+    out[:, 4] = np.maximum.reduceat(highs, starts)
+    return out
+
+
+def _candle_paths(rows: np.ndarray, width: float):
+    """
+    Build one QPainterPath per color for a block of candles.
+
+    All wicks and body outlines of one color go into a single path built
+    from flat coordinate arrays, so drawing costs two drawPath calls.
+
+    Args:
+        rows: Array of [x, open, close, low, high] rows
+        width: Body width in x units
+
+    Returns:
+        (up_path, down_path) - None for a color with no candles
+    """
+    finite = np.isfinite(rows).all(axis=1)
+    rows = rows[finite]
+    is_up = rows[:, 2] >= rows[:, 1]
+
+    paths = []
+    for mask in (is_up, ~is_up):
+        block = rows[mask]
+        if len(block) == 0:
+            paths.append(None)
+            continue
+
+        x, o, c, lo, hi = block.T
+        left = x - width / 2
+        right = x + width / 2
+        top = np.maximum(o, c)
+        bot = np.minimum(o, c)
+
+        # wick, then body rect (a doji body collapses to a horizontal line)
+        xs = np.empty((len(block), _POINTS_PER_CANDLE))
+        ys = np.empty((len(block), _POINTS_PER_CANDLE))
+        xs[:, 0:2] = x[:, None]
+        xs[:, [2, 5, 6]] = left[:, None]
+        xs[:, [3, 4]] = right[:, None]
+        ys[:, 0] = lo
+        ys[:, 1] = hi
+        ys[:, [2, 3, 6]] = bot[:, None]
+        ys[:, [4, 5]] = top[:, None]
+        connect = np.tile(_CONNECT_PATTERN, len(block))
+        paths.append(pg.arrayToQPath(xs.ravel(), ys.ravel(), connect=connect))
+
+    return paths[0], paths[1]
+
 
 class CandlestickItem(pg.GraphicsObject):
     """
     data rows: [x, open, close, low, high]
     x is an integer index (0..N-1) for uniform spacing
+
+    Rendering is viewport-culled and level-of-detail aware: only candles in
+    the visible x-range are drawn, and when candles get narrower than a few
+    pixels they are merged into OHLC buckets of 2**level bars (precomputed
+    per level with NumPy). Geometry for the visible span is cached as one
+    path per color; live updates only invalidate the last bucket of each
+    level, which is drawn separately, so panning and live ticks never
+    rebuild the full history.
     """
 
     def __init__(self, data, bar_width: float = CANDLE_BAR_WIDTH, up_color=None, down_color=None):
         super().__init__()
-        self.data = np.array(data, dtype=float)
         self.bar_width = float(bar_width)
         self.up_color = up_color or (76, 153, 0)
         self.down_color = down_color or (200, 50, 50)
-        self._picture = None
-        self._generate_picture()
+        self._buffer = np.empty((0, 5))
+        self._size = 0
+        self._make_pens()
+        self._reset(data)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Candle rows [x, open, close, low, high] (view into the buffer)."""
+        return self._buffer[: self._size]
+
+    @data.setter
+    def data(self, value) -> None:
+        self._reset(value)
 
     def setData(self, data):
-        self.data = np.array(data, dtype=float)
-        self._generate_picture()
+        self.prepareGeometryChange()
+        self._reset(data)
+        self.informViewBoundsChanged()
         self.update()
 
     def setColors(self, up_color, down_color):
-        """Update candle colors and regenerate picture."""
+        """Update candle colors (cached geometry is kept, only pens change)."""
         self.up_color = up_color
         self.down_color = down_color
-        self._generate_picture()
+        self._make_pens()
         self.update()
 
     def update_last_candle(self, o: float, c: float, lo: float, hi: float) -> None:
@@ -38,8 +147,8 @@ class CandlestickItem(pg.GraphicsObject):
         Update only the last candle's OHLC values.
 
         This is used for incremental live updates to avoid full chart rebuild.
-        The QPicture is regenerated, but this is still faster than recreating
-        all chart objects via set_prices().
+        Only the last bucket of each level-of-detail is invalidated; cached
+        geometry for the rest of the history is reused.
 
         Args:
             o: Open price
@@ -47,19 +156,21 @@ class CandlestickItem(pg.GraphicsObject):
             lo: Low price
             hi: High price
         """
-        if self.data.size == 0:
+        if self._size == 0:
             return
-        last_idx = len(self.data) - 1
-        x = self.data[last_idx, 0]
-        self.data[last_idx] = [x, o, c, lo, hi]
-        self._generate_picture()
+        last_idx = self._size - 1
+        x = self._buffer[last_idx, 0]
+        self._buffer[last_idx] = [x, o, c, lo, hi]
+        self._mark_tail_dirty(last_idx)
+        self._refresh_bounds()
         self.update()
 
     def append_candle(self, x: float, o: float, c: float, lo: float, hi: float) -> None:
         """
         Append a new candle to the data array.
 
-        Used when a new trading day starts during live updates.
+        Used when a new trading day starts during live updates. The buffer
+        grows geometrically, so appends are amortized O(1).
 
         Args:
             x: X-coordinate (index position)
@@ -68,71 +179,206 @@ class CandlestickItem(pg.GraphicsObject):
             lo: Low price
             hi: High price
         """
-        new_row = np.array([[x, o, c, lo, hi]], dtype=float)
-        if self.data.size == 0:
-            self.data = new_row
-        else:
-            self.data = np.vstack([self.data, new_row])
-        self._generate_picture()
+        if self._size == len(self._buffer):
+            grown = np.empty((max(16, 2 * len(self._buffer)), 5))
+            grown[: self._size] = self._buffer[: self._size]
+            self._buffer = grown
+
+        # The previous last candle becomes part of the settled prefix
+        if self._size > 0:
+            self._prefix_bounds = self._combine_bounds(
+                self._prefix_bounds, self._row_bounds(self._buffer[self._size - 1])
+            )
+
+        self._buffer[self._size] = [x, o, c, lo, hi]
+        self._size += 1
+        self._mark_tail_dirty(self._size - 1)
+        self._refresh_bounds()
         self.update()
 
-    def _generate_picture(self):
-        picture = QtGui.QPicture()
-        p = QtGui.QPainter(picture)
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
 
-        if self.data.size == 0:
-            p.end()
-            self._picture = picture
-            return
+    def _reset(self, data) -> None:
+        """Replace all candles and drop every cache."""
+        rows = np.array(data, dtype=float).reshape(-1, 5)
+        self._buffer = rows
+        self._size = len(rows)
+
+        # Level -> aggregated buckets, and how many leading rows they are
+        # still valid for (levels are built lazily)
+        self._levels = {}
+        self._levels_valid = {}
+        self._cache = None
+
+        self._prefix_bounds = self._bounds_of(rows[:-1]) if self._size > 1 else None
+        self._bounds = None
+        self._refresh_bounds()
+
+    def _make_pens(self) -> None:
+        self._up_pen = pg.mkPen(color=self.up_color, width=1)
+        self._down_pen = pg.mkPen(color=self.down_color, width=1)
+        self._up_brush = pg.mkBrush(self.up_color)
+        self._down_brush = pg.mkBrush(self.down_color)
+
+    def _mark_tail_dirty(self, first_row: int) -> None:
+        """Invalidate aggregated buckets from `first_row` onward."""
+        for level in self._levels_valid:
+            self._levels_valid[level] = min(self._levels_valid[level], first_row)
 
-        up_color = self.up_color
-        down_color = self.down_color
-        up_pen = pg.mkPen(color=up_color, width=1)
-        down_pen = pg.mkPen(color=down_color, width=1)
-        up_brush = pg.mkBrush(up_color)
-        down_brush = pg.mkBrush(down_color)
+    def _level_rows(self, level: int) -> np.ndarray:
+        """Get candle rows for an LOD level, rebuilding only stale buckets."""
+        if level == 0:
+            return self.data
 
-        w = self.bar_width  # in "index units"
+        bucket = 1 << level
+        rows = self._levels.get(level)
+        valid = self._levels_valid.get(level, 0)
+        if rows is not None and valid >= self._size:
+            return rows
+
+        # Recompute from the first bucket touching a stale row
+        first_bucket = valid // bucket
+        fresh = _aggregate_ohlc(self.data[first_bucket * bucket:], bucket)
+        if rows is None or first_bucket == 0:
+            rows = fresh
+        else:
+            rows = np.concatenate([rows[:first_bucket], fresh])
+
+        self._levels[level] = rows
+        self._levels_valid[level] = self._size
+        return rows
+
+    # ------------------------------------------------------------------
+    # Bounds
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bounds_of(rows: np.ndarray):
+        """(x_min, x_max, low_min, high_max) over finite rows, or None."""
+        if len(rows) == 0:
+            return None
+        finite = rows[np.isfinite(rows).all(axis=1)]
+        if len(finite) == 0:
+            return None
+        return (
+            float(finite[:, 0].min()),
+            float(finite[:, 0].max()),
+            float(finite[:, 3].min()),
+            float(finite[:, 4].max()),
+        )
 
-        for x, o, c, lo, hi in self.data:
-            if not np.isfinite([x, o, c, lo, hi]).all():
-                continue
+    @classmethod
+    def _row_bounds(cls, row: np.ndarray):
+        return cls._bounds_of(row.reshape(1, 5))
 
-            is_up = c >= o
-            p.setPen(up_pen if is_up else down_pen)
-            p.setBrush(up_brush if is_up else down_brush)
+    @staticmethod
+    def _combine_bounds(a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return (min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3]))
 
-            # wick
-            p.drawLine(QtCore.QPointF(x, lo), QtCore.QPointF(x, hi))
+    def _refresh_bounds(self) -> None:
+        """Bounds = settled prefix + last candle (O(1) on live updates)."""
+        last = self._row_bounds(self._buffer[self._size - 1]) if self._size else None
+        bounds = self._combine_bounds(self._prefix_bounds, last)
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+            self.informViewBoundsChanged()
 
-            # body
-            top = max(o, c)
-            bot = min(o, c)
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
 
-            if top == bot:
-                p.drawLine(QtCore.QPointF(x - w / 2, top), QtCore.QPointF(x + w / 2, top))
-            else:
-                rect = QtCore.QRectF(x - w / 2, bot, w, top - bot)
-                p.drawRect(rect)
+    def _visible_level(self) -> int:
+        """Pick the LOD level so each drawn bucket is a few pixels wide."""
+        px = self.pixelWidth()  # x units per screen pixel
+        if not px or not np.isfinite(px):
+            return 0
+        bars_per_candle = _MIN_PIXELS_PER_CANDLE * px
+        if bars_per_candle <= 1.0:
+            return 0
+        return int(np.ceil(np.log2(bars_per_candle)))
 
-        p.end()
-        self._picture = picture
+    def _visible_bucket_range(self, rows: np.ndarray, view: QtCore.QRectF):
+        """Indices [start, stop) of buckets overlapping the view's x-range."""
+        x = rows[:, 0]
+        half = self.bar_width * (x[1] - x[0] if len(x) > 1 else 1.0)
+        start = int(np.searchsorted(x, view.left() - half, side="left"))
+        stop = int(np.searchsorted(x, view.right() + half, side="right"))
+        return start, stop
 
     def paint(self, painter, *args):
-        if self._picture is not None:
-            painter.drawPicture(0, 0, self._picture)
+        if self._size == 0:
+            return
+
+        level = self._visible_level()
+        rows = self._level_rows(level)
+        if len(rows) == 0:
+            return
+
+        view = self.viewRect()
+        if view is None:
+            start, stop = 0, len(rows)
+        else:
+            start, stop = self._visible_bucket_range(rows, view)
+        if stop <= start:
+            return
+
+        width = self.bar_width * (1 << level)
+
+        # The last bucket can still change (live updates); only buckets
+        # before it go into the cached geometry
+        settled = len(rows) - 1
+        cache = self._cache
+        if (
+            cache is None
+            or cache["level"] != level
+            or cache["width"] != width
+            or start < cache["start"]
+            or min(stop, settled) > cache["stop"] + _MAX_TAIL_BUCKETS
+        ):
+            # Pad the cached span by one screen on each side so panning
+            # reuses it
+            span = stop - start
+            cache_start = max(0, start - span)
+            cache_stop = min(settled, stop + span)
+            up_path, down_path = _candle_paths(rows[cache_start:cache_stop], width)
+            cache = {
+                "level": level,
+                "width": width,
+                "start": cache_start,
+                "stop": max(cache_start, cache_stop),
+                "up": up_path,
+                "down": down_path,
+            }
+            self._cache = cache
+
+        self._draw_paths(painter, cache["up"], cache["down"])
+
+        # Tail: buckets after the cached span (the live candle and any
+        # appended since the cache was built)
+        tail_start = max(cache["stop"], start)
+        if stop > tail_start:
+            self._draw_paths(painter, *_candle_paths(rows[tail_start:stop], width))
+
+    def _draw_paths(self, painter, up_path, down_path) -> None:
+        if up_path is not None:
+            painter.setPen(self._up_pen)
+            painter.setBrush(self._up_brush)
+            painter.drawPath(up_path)
+        if down_path is not None:
+            painter.setPen(self._down_pen)
+            painter.setBrush(self._down_brush)
+            painter.drawPath(down_path)
 
     def boundingRect(self):
-        if self.data.size == 0:
+        if self._bounds is None:
             return QtCore.QRectF()
 
-        x = self.data[:, 0]
-        lo = self.data[:, 3]
-        hi = self.data[:, 4]
-
-        return QtCore.QRectF(
-            float(x.min()),
-            float(lo.min()),
-            float(x.max() - x.min()),
-            float(hi.max() - lo.min()),
-        )
+        x_min, x_max, lo, hi = self._bounds
+        return QtCore.QRectF(x_min, lo, x_max - x_min, hi - lo)
@@ -20,6 +20,11 @@ from app.utils.market_hours import (
     is_stock_cache_current,
     get_last_expected_trading_date,
 )
+from app.utils.return_kernels import (
+    drawdown_episodes,
+    rolling_compound_returns,
+    time_under_water,
+)
 
 __all__ = [
     "format_price_usd",
@@ -36,4 +41,7 @@ __all__ = [
     "is_nyse_trading_day",
     "is_stock_cache_current",
     "get_last_expected_trading_date",
+    "rolling_compound_returns",
+    "time_under_water",
+    "drawdown_episodes",
 ]
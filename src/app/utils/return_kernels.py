@@ -0,0 +1,206 @@
+"""Vectorized return kernels shared by the analytics services.
+
+All kernels accept a Series, a DataFrame (T x N, one column per asset) or a
+1-D/2-D ndarray and return the same shape and type (drawdown_episodes returns
+one table row per episode), so a single security and a whole benchmark
+universe go through the same code path.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    ReturnsLike = Union["pd.Series", "pd.DataFrame", np.ndarray]
+
+
+def rolling_compound_returns(returns: "ReturnsLike", window: int) -> "ReturnsLike":
+    """
+    Rolling compounded return: (1 + r_{t-w+1}) * ... * (1 + r_t) - 1.
+
+    O(T) per column via a prefix sum of log1p(r), instead of a Python callback
+    per window. Matches ``rolling(window).apply(prod)`` semantics: the first
+    window - 1 rows are NaN and any window containing a NaN is NaN. A return
+    of -100% or worse zeroes the product, so windows containing one are -1.
+
+    Args:
+        returns: Simple returns (decimals), Series/DataFrame/ndarray
+        window: Window length in rows
+
+    Returns:
+        Rolling compounded returns with the same shape and index as input
+    """
+    values = np.asarray(returns, dtype=float)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, None]
+
+    n_rows = values.shape[0]
+    result = np.full(values.shape, np.nan)
+
+    if window >= 1 and n_rows >= window:
+        missing = np.isnan(values)
+        wiped = values <= -1.0
+        logs = np.log1p(np.where(missing | wiped, 0.0, values))
+
+        def window_sums(x: np.ndarray) -> np.ndarray:
+            prefix = np.zeros((n_rows + 1, x.shape[1]), dtype=x.dtype)
+            np.cumsum(x, axis=0, out=prefix[1:])
+            return prefix[window:] - prefix[:-window]
+
+        log_sum = window_sums(logs)
+        n_missing = window_sums(missing.astype(np.int64))
+        n_wiped = window_sums(wiped.astype(np.int64))
+
+        compounded = np.expm1(log_sum)
+        compounded[n_wiped > 0] = -1.0
+        compounded[n_missing > 0] = np.nan
+        result[window - 1:] = compounded
+
+    if squeeze:
+        result = result[:, 0]
+
+    return _wrap_like(returns, result)
+
+
+def _wrap_like(template: "ReturnsLike", values: np.ndarray) -> "ReturnsLike":
+    """Wrap a result array in the same pandas type/index as the input."""
+    import pandas as pd
+
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(values, index=template.index, columns=template.columns)
+    if isinstance(template, pd.Series):
+        return pd.Series(values, index=template.index, name=template.name)
+    return values
+
+
+def _wealth_and_peak(values: np.ndarray):
+    """Wealth index and running peak; NaN returns leave wealth unchanged."""
+    wealth = np.cumprod(1.0 + np.where(np.isnan(values), 0.0, values), axis=0)
+    peak = np.maximum.accumulate(wealth, axis=0)
+    return wealth, peak
+
+
+def time_under_water(returns: "ReturnsLike") -> "ReturnsLike":
+    """
+    Periods since the last all-time high of the wealth index.
+
+    Vectorized replacement for walking the wealth series in a loop: the
+    count is the row number minus the row of the most recent at-peak
+    observation, computed with a running maximum per column. NaN returns are
+    treated as missing observations (wealth carried forward).
+
+    Args:
+        returns: Simple returns (decimals), Series/DataFrame/ndarray
+
+    Returns:
+        Integer periods under water with the same shape and index as input
+    """
+    values = np.asarray(returns, dtype=float)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, None]
+
+    if values.shape[0] == 0:
+        result = np.zeros(values.shape, dtype=np.int64)
+    else:
+        wealth, peak = _wealth_and_peak(values)
+        underwater = wealth < peak
+        rows = np.arange(values.shape[0])[:, None]
+        last_peak = np.maximum.accumulate(np.where(underwater, -1, rows), axis=0)
+        result = np.where(underwater, rows - last_peak, 0)
+
+    if squeeze:
+        result = result[:, 0]
+
+    return _wrap_like(returns, result)
+
+
+def drawdown_episodes(returns: "ReturnsLike") -> "pd.DataFrame":
+    """
+    Identify every drawdown episode for one series or a whole T x N matrix.
+
+    An episode runs from the last all-time high (start) through the periods
+    under water until the wealth index regains that high (recovery). All
+    columns are processed together: episodes are found from the flattened
+    underwater mask and troughs with one segmented reduction, so ranking thousands of
+    tickers by depth or duration needs no per-element Python loop.
+
+    Args:
+        returns: Simple returns (decimals), Series/DataFrame/ndarray. Dates
+            come from the index; ndarray inputs use row numbers.
+
+    Returns:
+        DataFrame with one row per episode and columns:
+        - ticker: column label (Series name for a Series input)
+        - start: date of the peak the episode is measured from
+        - trough: date of the lowest point
+        - recovery: first date back at the peak (NaT if not yet recovered)
+        - depth: drawdown at the trough (negative decimal, e.g. -0.25)
+        - duration: periods under water (start excluded, recovery excluded)
+    """
+    import pandas as pd
+
+    values = np.asarray(returns, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_rows, n_cols = values.shape
+
+    if isinstance(returns, pd.DataFrame):
+        labels = np.asarray(returns.columns, dtype=object)
+    elif isinstance(returns, pd.Series):
+        labels = np.array([returns.name], dtype=object)
+    else:
+        labels = np.arange(n_cols, dtype=object)
+    index = returns.index if isinstance(returns, (pd.Series, pd.DataFrame)) else pd.RangeIndex(n_rows)
+
+    columns = ["ticker", "start", "trough", "recovery", "depth", "duration"]
+    if n_rows == 0 or n_cols == 0:
+        return pd.DataFrame(columns=columns)
+
+    wealth, peak = _wealth_and_peak(values)
+    drawdown = wealth / peak - 1.0
+    underwater = wealth < peak
+
+    # Column-major flattening keeps each column's rows contiguous and ordered
+    uw_flat = underwater.T.ravel()
+    dd_flat = drawdown.T.ravel()
+    prev = np.concatenate([[False], uw_flat[:-1]])
+    nxt = np.concatenate([uw_flat[1:], [False]])
+    row_of = np.tile(np.arange(n_rows), n_cols)
+    # A new column always starts a new episode (row 0 is never under water)
+    starts = np.flatnonzero(uw_flat & ~prev)
+    ends = np.flatnonzero(uw_flat & (~nxt | (row_of == n_rows - 1)))
+
+    if len(starts) == 0:
+        return pd.DataFrame(columns=columns)
+
+    # Trough: earliest position of the lowest drawdown per episode. At-peak
+    # rows have drawdown 0, so reducing from one start to the next is safe.
+    depth = np.minimum.reduceat(dd_flat, starts)
+    episode_id = np.cumsum(uw_flat & ~prev) - 1
+    uw_pos = np.flatnonzero(uw_flat)
+    at_trough = uw_pos[dd_flat[uw_pos] == depth[episode_id[uw_pos]]]
+    _, first = np.unique(episode_id[at_trough], return_index=True)
+    trough_pos = at_trough[first]
+
+    col = starts // n_rows
+    start_row = starts % n_rows
+    end_row = ends % n_rows
+    recovery_row = end_row + 1
+    recovered = recovery_row < n_rows
+
+    recovery = pd.Series(index.take(np.minimum(recovery_row, n_rows - 1)))
+    recovery[~recovered] = pd.NaT if isinstance(index, pd.DatetimeIndex) else None
+
+    return pd.DataFrame({
+        "ticker": labels[col],
+        "start": index.take(np.maximum(start_row - 1, 0)),
+        "trough": index.take(trough_pos % n_rows),
+        "recovery": recovery.to_numpy(),
+        "depth": depth,
+        "duration": end_row - start_row + 1,
+    })
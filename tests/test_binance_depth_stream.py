@@ -0,0 +1,198 @@
+"""BinanceDepthStream against a local WebSocket/REST stub (no network)."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from app.ui.modules.chart.services import binance_depth_stream  # noqa: E402
+from app.ui.modules.chart.services.binance_depth_stream import BinanceDepthStream  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _event(first_id, final_id, bids=(), asks=()):
+    return {"e": "depthUpdate", "U": first_id, "u": final_id, "b": list(bids), "a": list(asks)}
+
+
+class DepthStub:
+    """
+    Binance stub: GET /api/v3/depth returns snapshots in order; the
+    WebSocket sends `initial` events on connect and `after_resync` events
+    once the second snapshot has been served.
+    """
+
+    def __init__(self, snapshots, initial, after_resync=()):
+        self.snapshots = list(snapshots)
+        self.initial = list(initial)
+        self.after_resync = list(after_resync)
+        self.snapshot_requests = 0
+        self.port = None
+        self._loop = None
+        self._runner = None
+        self._resynced = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        assert self._ready.wait(5), "stub server did not start"
+        return self
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    @property
+    def stream_url(self):
+        return f"ws://127.0.0.1:{self.port}/ws"
+
+    @property
+    def rest_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def _serve(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._resynced = asyncio.Event()
+
+        app = web.Application()
+        app.router.add_get("/api/v3/depth", self._depth)
+        app.router.add_get("/ws/{stream}", self._ws)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _depth(self, request):
+        index = min(self.snapshot_requests, len(self.snapshots) - 1)
+        self.snapshot_requests += 1
+        if self.snapshot_requests == 2:
+            self._resynced.set()
+        return web.json_response(self.snapshots[index])
+
+    async def _ws(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        for event in self.initial:
+            await ws.send_str(json.dumps(event))
+        if self.after_resync:
+            await self._resynced.wait()
+            for event in self.after_resync:
+                await ws.send_str(json.dumps(event))
+        async for _ in ws:
+            pass
+        return ws
+
+
+def _run_stream(stub, stop_when):
+    """Run a stream until stop_when(statuses, snapshots) holds (or 10s pass)."""
+    stream = BinanceDepthStream(
+        "BTC-USD", levels=10, frame_ms=10,
+        stream_url=stub.stream_url, rest_url=stub.rest_url,
+    )
+    statuses, snapshots = [], []
+
+    def check():
+        if stop_when(statuses, snapshots):
+            stream.stop()
+
+    stream.status_changed.connect(lambda s: (statuses.append(s), check()))
+    stream.book_updated.connect(lambda s: (snapshots.append(s), check()))
+
+    timeout = threading.Timer(10, stream.stop)
+    timeout.start()
+    try:
+        stream.run()  # Blocks in this thread until stopped
+    finally:
+        timeout.cancel()
+    return statuses, snapshots
+
+
+def test_stream_connects_syncs_and_goes_live(qapp):
+    snapshot = {
+        "lastUpdateId": 100,
+        "bids": [["100.0", "1.0"], ["99.0", "2.0"]],
+        "asks": [["101.0", "1.5"]],
+    }
+    events = [
+        _event(95, 100, bids=[["100.0", "9.0"]]),  # Already in the snapshot: dropped
+        _event(100, 102, bids=[["100.5", "3.0"]]),
+        _event(103, 104, asks=[["101.0", "0"], ["102.0", "4.0"]]),
+    ]
+
+    with DepthStub([snapshot], events) as stub:
+        statuses, snapshots = _run_stream(
+            stub,
+            lambda st, sn: bool(sn) and sn[-1].last_update_id == 104,
+        )
+
+    assert statuses[:3] == ["connecting", "syncing", "live"]
+    assert stub.snapshot_requests == 1
+
+    book = snapshots[-1].book
+    assert book.bid_prices.tolist() == [100.5, 100.0, 99.0]
+    assert book.bid_quantities.tolist() == [3.0, 1.0, 2.0]
+    assert book.ask_prices.tolist() == [102.0]
+    assert snapshots[0].full
+
+
+def test_stream_resyncs_on_gap(qapp):
+    snapshots_served = [
+        {"lastUpdateId": 100, "bids": [["100.0", "1.0"]], "asks": [["101.0", "1.0"]]},
+        {"lastUpdateId": 111, "bids": [["98.0", "5.0"]], "asks": [["103.0", "2.0"]]},
+    ]
+    initial = [
+        _event(101, 102, bids=[["100.0", "2.0"]]),
+        _event(110, 111, bids=[["99.0", "1.0"]]),  # Gap: 103..109 missing
+    ]
+    after_resync = [_event(112, 113, asks=[["103.5", "1.0"]])]
+
+    with DepthStub(snapshots_served, initial, after_resync) as stub:
+        statuses, snapshots = _run_stream(
+            stub,
+            lambda st, sn: bool(sn) and sn[-1].last_update_id == 113,
+        )
+
+    assert statuses[:3] == ["connecting", "syncing", "live"]
+    assert "resyncing" in statuses
+    assert statuses[statuses.index("resyncing") + 1] == "live"
+    assert stub.snapshot_requests == 2
+
+    book = snapshots[-1].book
+    assert book.bid_prices.tolist() == [98.0]  # Rebuilt from the second snapshot
+    assert book.ask_prices.tolist() == [103.0, 103.5]
+
+
+def test_stream_backs_off_and_reconnects_on_repeated_gaps(qapp, monkeypatch):
+    monkeypatch.setattr(binance_depth_stream, "_MAX_RESYNCS", 2)
+
+    # The snapshot never catches up with the buffered events, so every
+    # resync hits another gap
+    snapshot = {"lastUpdateId": 100, "bids": [["100.0", "1.0"]], "asks": [["101.0", "1.0"]]}
+    initial = [_event(101, 102)] + [_event(200 + 10 * i, 201 + 10 * i) for i in range(10)]
+
+    with DepthStub([snapshot], initial) as stub:
+        started = time.monotonic()
+        statuses, _ = _run_stream(stub, lambda st, sn: st.count("connecting") == 2)
+        elapsed = time.monotonic() - started
+
+    # Initial sync, an immediate resync, one delayed resync, then a reconnect
+    # instead of another snapshot
+    assert statuses.count("resyncing") == 2
+    assert stub.snapshot_requests == 3
+    assert elapsed >= 1.0